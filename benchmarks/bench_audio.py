@@ -0,0 +1,64 @@
+"""Benchmark the exact audio sample conversions.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/bench_audio.py [N_SAMPLES]
+
+Converts N_SAMPLES (default 1,000,000) 48 kHz sample offsets spread over 24
+hours to 29.97 DF frame counts and back with ``timecode.audio`` and prints the
+throughput. The same frame counts are converted with the float seconds of
+``Timecode.to_realtime()`` to show the number of frames it puts on the wrong
+sample.
+"""
+
+import math
+import sys
+import time
+from array import array
+
+from timecode import Timecode
+from timecode.audio import frames_to_samples, samples_to_frames
+
+SAMPLE_RATE = 48000
+
+
+def main() -> None:
+    """Run the benchmark."""
+    n_samples = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    day = 24 * 3600 * SAMPLE_RATE
+    step = day // n_samples
+    samples = array("q", range(0, day, step))
+
+    start = time.perf_counter()
+    frames, remainders = samples_to_frames(samples, "29.97", SAMPLE_RATE)
+    elapsed = time.perf_counter() - start
+    print(
+        f"samples_to_frames samples={len(samples)} time={elapsed:.2f}s "
+        f"samples/s={len(samples) / elapsed / 1e6:.1f}M"
+    )
+
+    start = time.perf_counter()
+    firsts = frames_to_samples(frames, "29.97", SAMPLE_RATE)
+    elapsed = time.perf_counter() - start
+    print(
+        f"frames_to_samples frames={len(frames)} time={elapsed:.2f}s "
+        f"frames/s={len(frames) / elapsed / 1e6:.1f}M"
+    )
+
+    n_float = min(len(frames), 100_000)
+    wrong = 0
+    start = time.perf_counter()
+    for frame, first in zip(frames[:n_float], firsts[:n_float]):
+        tc = Timecode("29.97", frames=frame)
+        # the first sample at or after the start of the frame
+        seconds = tc.to_realtime(True) - tc.rate.denominator / tc.rate.numerator
+        wrong += math.ceil(seconds * SAMPLE_RATE) != first
+    elapsed = time.perf_counter() - start
+    print(
+        f"Timecode.to_realtime frames={n_float} time={elapsed:.2f}s "
+        f"wrong samples={wrong}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Benchmark timecode.batch throughput against the number of worker processes.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/bench_batch.py [N_FRAMES] [FRAMERATE]
+
+Converts N_FRAMES (default 2,000,000) frame counts to labels with 1, 2, 4, ...
+up to ``os.cpu_count()`` workers and prints the throughput and the speed up
+relative to a single worker.
+"""
+
+import os
+import sys
+import time
+
+from timecode.batch import map_frames_to_labels
+
+
+def main() -> None:
+    """Run the benchmark."""
+    n_frames = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    framerate = sys.argv[2] if len(sys.argv) > 2 else "29.97"
+    cpu_count = os.cpu_count() or 1
+
+    worker_counts = []
+    workers = 1
+    while workers < cpu_count:
+        worker_counts.append(workers)
+        workers *= 2
+    worker_counts.append(cpu_count)
+
+    baseline = None
+    for workers in worker_counts:
+        start = time.perf_counter()
+        count = 0
+        for _ in map_frames_to_labels(range(1, n_frames + 1), framerate, workers):
+            count += 1
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(
+            f"workers={workers:3d} frames={count} time={elapsed:.3f}s "
+            f"rate={count / elapsed / 1e6:.2f}M/s speedup={baseline / elapsed:.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
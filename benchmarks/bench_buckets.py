@@ -0,0 +1,77 @@
+"""Benchmark the per-second bucketing aggregator.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/bench_buckets.py [N_EVENTS]
+
+Feeds N_EVENTS (default 100,000,000) 29.97 DF frame counts with a value each,
+in chunks of 1M events, to ``timecode.buckets.BucketAggregator`` and prints
+the throughput for ascending and for shuffled chunks. A baseline of a loop
+creating a ``Timecode`` per event and keying a dict by the seconds of its
+label is measured on 1M events.
+"""
+
+import random
+import sys
+import time
+from array import array
+
+from timecode import Timecode
+from timecode.buckets import BucketAggregator
+
+CHUNK_SIZE = 1_000_000
+
+
+def main() -> None:
+    """Run the benchmark."""
+    n_events = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000_000
+    values = array("d", (random.random() for _ in range(CHUNK_SIZE)))
+    day = Timecode("29.97").rate.frames_per_24_hours
+
+    aggregator = BucketAggregator("29.97")
+    start = time.perf_counter()
+    frame = 1
+    for _ in range(n_events // CHUNK_SIZE):
+        frames = array("q", range(frame, frame + CHUNK_SIZE))
+        aggregator.add_many(frames, values)
+        frame = (frame + CHUNK_SIZE) % day
+    elapsed = time.perf_counter() - start
+    total = sum(aggregator.counts)
+    print(
+        f"BucketAggregator ascending events={total} time={elapsed:.2f}s "
+        f"events/min={total / elapsed * 60 / 1e6:.0f}M"
+    )
+
+    shuffled = list(range(1, CHUNK_SIZE + 1))
+    random.shuffle(shuffled)
+    shuffled = array("q", shuffled)
+    aggregator = BucketAggregator("29.97")
+    start = time.perf_counter()
+    aggregator.add_many(shuffled, values)
+    elapsed = time.perf_counter() - start
+    print(
+        f"BucketAggregator shuffled events={CHUNK_SIZE} time={elapsed:.2f}s "
+        f"events/min={CHUNK_SIZE / elapsed * 60 / 1e6:.0f}M"
+    )
+
+    start = time.perf_counter()
+    buckets = {}
+    for frames, value in zip(range(1, CHUNK_SIZE + 1), values):
+        key = str(Timecode("29.97", frames=frames))[:8]
+        bucket = buckets.get(key)
+        if bucket is None:
+            buckets[key] = [1, value, value, value]
+        else:
+            bucket[0] += 1
+            bucket[1] += value
+            bucket[2] = min(bucket[2], value)
+            bucket[3] = max(bucket[3], value)
+    elapsed = time.perf_counter() - start
+    print(
+        f"Timecode loop events={CHUNK_SIZE} time={elapsed:.2f}s "
+        f"events/min={CHUNK_SIZE / elapsed * 60 / 1e6:.1f}M"
+    )
+
+
+if __name__ == "__main__":
+    main()
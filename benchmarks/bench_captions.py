@@ -0,0 +1,87 @@
+"""Benchmark the streaming caption retimer.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/bench_captions.py [N_CUES]
+
+Writes synthetic SCC, SRT and WebVTT files with N_CUES (default 1,000,000)
+cues to a temporary folder, retimes them with ``timecode.captions.retime_file``
+by a zero and a non zero offset and prints the throughput. The zero offset
+output is checked to be byte identical with the input.
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from timecode.captions import retime_file
+from timecode.core import get_rate
+from timecode.labels import iter_labels
+
+
+def write_scc(path, n_cues):
+    """Write a synthetic SCC file."""
+    with open(path, "w", newline="") as f:
+        f.write("Scenarist_SCC V1.0\r\n\r\n")
+        labels = iter_labels(get_rate("29.97"), 1)
+        for i, label in enumerate(labels):
+            if i == n_cues:
+                break
+            f.write(f"{label}\t9420 9420 94ae 94ae 9452 9452 97a1 97a1\r\n\r\n")
+
+
+def _ms(ms):
+    hrs, ms = divmod(ms, 3600000)
+    mins, ms = divmod(ms, 60000)
+    secs, ms = divmod(ms, 1000)
+    return hrs, mins, secs, ms
+
+
+def write_srt(path, n_cues, vtt=False):
+    """Write a synthetic SRT or WebVTT file."""
+    sep = "." if vtt else ","
+    with open(path, "w", newline="") as f:
+        if vtt:
+            f.write("WEBVTT\n\n")
+        for i in range(n_cues):
+            start = _ms(i * 1501)
+            end = _ms(i * 1501 + 1200)
+            if not vtt:
+                f.write(f"{i + 1}\n")
+            f.write(
+                "{:02d}:{:02d}:{:02d}{}{:03d} --> ".format(*start[:3], sep, start[3])
+                + "{:02d}:{:02d}:{:02d}{}{:03d}\n".format(*end[:3], sep, end[3])
+            )
+            f.write(f"Caption number {i}\n\n")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    n_cues = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    with tempfile.TemporaryDirectory() as tmp:
+        for fmt, writer in [
+            ("scc", write_scc),
+            ("srt", write_srt),
+            ("vtt", lambda p, n: write_srt(p, n, vtt=True)),
+        ]:
+            src = os.path.join(tmp, f"in.{fmt}")
+            dst = os.path.join(tmp, f"out.{fmt}")
+            writer(src, n_cues)
+            size = os.path.getsize(src)
+            for offset in [0, 300]:
+                start = time.perf_counter()
+                retime_file(src, dst, framerate="29.97", offset=offset)
+                elapsed = time.perf_counter() - start
+                if offset == 0:
+                    with open(src, "rb") as a, open(dst, "rb") as b:
+                        assert a.read() == b.read()
+                print(
+                    f"{fmt} cues={n_cues} offset={offset} time={elapsed:.3f}s "
+                    f"cues/s={n_cues / elapsed / 1e3:.0f}k "
+                    f"MB/s={size / elapsed / 1e6:.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
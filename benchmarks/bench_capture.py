@@ -0,0 +1,62 @@
+"""Benchmark the capture log writer and the range queries of the reader.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/bench_capture.py [HOURS]
+
+Writes HOURS (default 1) of 119.88 drop frame records, 431,568 records per
+hour, crossing midnight, to a temporary ``timecode.capture`` log one record at
+a time, then runs 10,000 one second range queries and prints the throughputs
+against the size of the log.
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+from timecode import Timecode
+from timecode.capture import CaptureLogReader, CaptureLogWriter
+
+
+def main() -> None:
+    """Run the benchmark."""
+    hours = float(sys.argv[1]) if len(sys.argv) > 1 else 1
+    start = Timecode("119.88", "23:30:00;00")
+    rate = start.framerate
+    n_records = int(hours * 3600 * 120000 / 1001)
+    day = Timecode("119.88", "23:59:59;119").frames
+    frames = [(start.frames - 1 + i) % day + 1 for i in range(n_records)]
+    step = 1001 * 10**9 // 120000
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "take.tclog")
+        begin = time.perf_counter()
+        with CaptureLogWriter(path, rate) as log:
+            for i, frame in enumerate(frames):
+                log.write(frame, i * step, i)
+        elapsed = time.perf_counter() - begin
+        print(
+            f"write records={n_records} size={os.path.getsize(path) / 1e6:.1f}MB "
+            f"time={elapsed:.2f}s records/s={n_records / elapsed / 1e6:.2f}M"
+        )
+
+        rng = random.Random(0)
+        n_queries = 10_000
+        with CaptureLogReader(path) as log:
+            first, last = log[0].frames, log[-1].frames
+            begin = time.perf_counter()
+            found = 0
+            for _ in range(n_queries):
+                low = rng.randrange(first, last)
+                found += len(log.query(low, low + 119))
+            elapsed = time.perf_counter() - begin
+        print(
+            f"query queries={n_queries} records={found} time={elapsed:.2f}s "
+            f"queries/s={n_queries / elapsed:,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Benchmark the streaming continuity analyzer.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/bench_continuity.py [N_SAMPLES]
+
+Feeds N_SAMPLES (default 100,000,000) 29.97 frame counts, in chunks of 1M
+samples with a jump every 100k samples and a few repeated frames, to
+``timecode.continuity.ContinuityAnalyzer`` and prints the throughput. A
+baseline of a loop creating a ``Timecode`` per sample is measured on 1M
+samples.
+"""
+
+import sys
+import time
+from array import array
+
+from timecode import Timecode
+from timecode.continuity import ContinuityAnalyzer
+
+CHUNK_SIZE = 1_000_000
+
+
+def make_chunk(start):
+    """Return a chunk of frame counts with breaks."""
+    chunk = array("q")
+    frame = start
+    for _ in range(CHUNK_SIZE // 100_000):
+        chunk.extend(range(frame, frame + 99_990))
+        frame += 99_990
+        chunk.extend([frame - 1] * 10)
+        frame += 250
+    return chunk, frame
+
+
+def main() -> None:
+    """Run the benchmark."""
+    n_samples = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000_000
+    chunks = []
+    frame = 1
+    for _ in range(4):
+        chunk, frame = make_chunk(frame)
+        chunks.append(chunk)
+
+    analyzer = ContinuityAnalyzer("29.97")
+    n_segments = 0
+    start = time.perf_counter()
+    for i in range(n_samples // CHUNK_SIZE):
+        n_segments += len(analyzer.feed_frames(chunks[i % len(chunks)]))
+    n_segments += len(analyzer.finish())
+    elapsed = time.perf_counter() - start
+    print(
+        f"ContinuityAnalyzer samples={analyzer.stats.samples} "
+        f"segments={n_segments} time={elapsed:.2f}s "
+        f"samples/s={analyzer.stats.samples / elapsed / 1e6:.1f}M"
+    )
+    print(analyzer.stats)
+
+    start = time.perf_counter()
+    previous = None
+    breaks = 0
+    for frames in chunks[0]:
+        tc = Timecode("29.97", frames=frames)
+        if previous is not None and tc.frames - previous.frames != 1:
+            breaks += 1
+        previous = tc
+    elapsed = time.perf_counter() - start
+    print(
+        f"Timecode loop samples={len(chunks[0])} time={elapsed:.2f}s "
+        f"samples/s={len(chunks[0]) / elapsed / 1e6:.2f}M"
+    )
+
+
+if __name__ == "__main__":
+    main()
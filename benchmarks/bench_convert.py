@@ -0,0 +1,62 @@
+"""Benchmark the frame rate conversion of frame count columns.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/bench_convert.py [N_FRAMES]
+
+Converts N_FRAMES (default 172,800, a two hour feature at 24 fps) 23.976 frame
+counts to 25 and 29.97 with each rounding mode of
+``timecode.convert.convert_frames()``, and through the 2:3 pulldown cadence,
+and prints the time taken. A baseline of a ``Fraction`` based conversion per
+frame is measured too.
+"""
+
+import sys
+import time
+from array import array
+from fractions import Fraction
+
+from timecode.convert import (
+    FLOOR,
+    HOLD,
+    NEAREST,
+    convert_frames,
+    pulldown_frames,
+    pullup_frames,
+)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    n_frames = int(sys.argv[1]) if len(sys.argv) > 1 else 172_800
+    frames = array("q", range(1, n_frames + 1))
+
+    for target in ["25", "29.97"]:
+        for rounding in [FLOOR, NEAREST, HOLD]:
+            start = time.perf_counter()
+            convert_frames(frames, "23.976", target, rounding=rounding)
+            elapsed = time.perf_counter() - start
+            print(
+                f"convert_frames 23.976 -> {target} {rounding} frames={n_frames} "
+                f"time={elapsed * 1000:.1f}ms"
+            )
+
+    start = time.perf_counter()
+    video = pulldown_frames(frames)
+    elapsed = time.perf_counter() - start
+    print(f"pulldown_frames frames={n_frames} time={elapsed * 1000:.1f}ms")
+
+    start = time.perf_counter()
+    pullup_frames(video)
+    elapsed = time.perf_counter() - start
+    print(f"pullup_frames frames={len(video)} time={elapsed * 1000:.1f}ms")
+
+    ratio = Fraction(25) / Fraction(24000, 1001)
+    start = time.perf_counter()
+    [round((f - 1) * ratio) + 1 for f in frames]
+    elapsed = time.perf_counter() - start
+    print(f"Fraction loop frames={n_frames} time={elapsed * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
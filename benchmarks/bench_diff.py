@@ -0,0 +1,55 @@
+"""Benchmark the sort-merge diff engine.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/bench_diff.py [N_ENTRIES]
+
+Builds two shuffled lists of N_ENTRIES (default 1,000,000) 23.976 timecode
+ranges, where the right list has some entries dropped, duplicated and slipped
+by a frame, diffs them with ``timecode.diff.diff_timecodes`` and prints the
+timing and the number of records of each kind.
+"""
+
+import random
+import sys
+import time
+from collections import Counter
+
+from timecode import Timecode
+from timecode.diff import diff_timecodes
+
+
+def main() -> None:
+    """Run the benchmark."""
+    n_entries = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = random.Random(0)
+    left = []
+    right = []
+    for i in range(n_entries):
+        start = Timecode("23.976", frames=i * 48 + 1)
+        end = Timecode("23.976", frames=i * 48 + 25)
+        left.append((start, end))
+        roll = rng.random()
+        if roll < 0.01:
+            continue
+        if roll < 0.02:
+            right.append((start + 1, end + 1))
+        else:
+            right.append((start, end))
+            if roll < 0.03:
+                right.append((start, end))
+    rng.shuffle(left)
+    rng.shuffle(right)
+
+    start_time = time.perf_counter()
+    counts = Counter(entry.kind for entry in diff_timecodes(left, right, max_slip=2))
+    elapsed = time.perf_counter() - start_time
+    print(
+        f"diff left={len(left)} right={len(right)} time={elapsed:.3f}s "
+        f"entries/s={(len(left) + len(right)) / elapsed / 1e6:.2f}M"
+    )
+    print(", ".join(f"{kind}={count}" for kind, count in sorted(counts.items())))
+
+
+if __name__ == "__main__":
+    main()
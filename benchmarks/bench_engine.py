@@ -0,0 +1,92 @@
+"""Benchmark the integer conversion engine against the former float one.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/bench_engine.py [N_FRAMES]
+
+Converts N_FRAMES (default 1,000,000) frame counts to components and back at
+every drop frame NTSC rate, with the integer engine in ``timecode.core`` and
+with a copy of the float based calculation it replaced, and checks that both
+give the same results.
+"""
+
+import sys
+import time
+
+from timecode.core import components_to_frames, frames_to_components, get_rate
+
+
+def float_frames_to_tc(framerate, int_framerate, frames):
+    """The float based drop frame calculation formerly in Timecode.frames_to_tc."""
+    ffps = float(framerate)
+    drop_frames = round(ffps * 0.066666)
+    frames_per_10_minutes = round(ffps * 60 * 10)
+    frames_per_24_hours = round(ffps * 60 * 60 * 24)
+    frames_per_minute = int(round(ffps) * 60) - drop_frames
+    frame_number = (frames - 1) % frames_per_24_hours
+    d = frame_number // frames_per_10_minutes
+    m = frame_number % frames_per_10_minutes
+    if m > drop_frames:
+        frame_number += (drop_frames * 9 * d) + drop_frames * (
+            (m - drop_frames) // frames_per_minute
+        )
+    else:
+        frame_number += drop_frames * 9 * d
+    ifps = int_framerate
+    frs = frame_number % ifps
+    secs = int((frame_number // ifps) % 60)
+    mins = int(((frame_number // ifps) // 60) % 60)
+    hrs = int(((frame_number // ifps) // 60) // 60)
+    return hrs, mins, secs, frs
+
+
+def float_tc_to_frames(framerate, int_framerate, hours, minutes, seconds, frames):
+    """The float based drop frame calculation formerly in Timecode.tc_to_frames."""
+    ffps = float(framerate)
+    drop_frames = round(ffps * 0.066666)
+    ifps = int_framerate
+    hour_frames = ifps * 60 * 60
+    minute_frames = ifps * 60
+    total_minutes = (60 * hours) + minutes
+    frame_number = (
+        (hour_frames * hours) + (minute_frames * minutes) + (ifps * seconds) + frames
+    ) - (drop_frames * (total_minutes - (total_minutes // 10)))
+    return frame_number + 1
+
+
+def main() -> None:
+    """Run the benchmark."""
+    n_frames = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    for framerate in ["29.97", "59.94", "89.91", "119.88"]:
+        rate = get_rate(framerate)
+        ifps = rate.int_framerate
+        frames = range(1, n_frames + 1)
+
+        start = time.perf_counter()
+        float_labels = [float_frames_to_tc(framerate, ifps, f) for f in frames]
+        float_decode = time.perf_counter() - start
+
+        start = time.perf_counter()
+        int_labels = [frames_to_components(rate, f) for f in frames]
+        int_decode = time.perf_counter() - start
+
+        start = time.perf_counter()
+        float_frames = [float_tc_to_frames(framerate, ifps, *c) for c in int_labels]
+        float_encode = time.perf_counter() - start
+
+        start = time.perf_counter()
+        int_frames = [components_to_frames(rate, *c) for c in int_labels]
+        int_encode = time.perf_counter() - start
+
+        assert float_labels == int_labels
+        assert float_frames == int_frames == list(frames)
+        print(
+            f"{framerate:>6} frames_to_components: float={float_decode:.3f}s "
+            f"int={int_decode:.3f}s ({float_decode / int_decode:.2f}x) "
+            f"components_to_frames: float={float_encode:.3f}s "
+            f"int={int_encode:.3f}s ({float_encode / int_encode:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Benchmark the external merge sort of timecoded logs.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/bench_extsort.py [SIZE_MB] [MEMORY_MB] [WORKERS]
+
+Writes a synthetic per-frame log of SIZE_MB megabytes (default 10240, i.e.
+10 GB) to a temporary folder, made of blocks of consecutive 29.97 timecodes
+from several recorders in random order. The log is then sorted with
+``timecode.extsort.sort_log`` using a memory budget of MEMORY_MB megabytes
+(default 512) and WORKERS processes (default the number of CPUs), and the
+throughput is printed.
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+from timecode.core import get_rate
+from timecode.extsort import sort_log
+from timecode.labels import iter_labels
+
+BLOCK_SIZE = 10000
+
+
+def write_log(path, size):
+    """Write a synthetic log of about the given size in bytes."""
+    rate = get_rate("29.97")
+    rng = random.Random(0)
+    written = 0
+    with open(path, "w") as f:
+        while written < size:
+            recorder = rng.randrange(8)
+            start = rng.randrange(1, rate.frames_per_24_hours - BLOCK_SIZE)
+            block = "".join(
+                [
+                    f"{label} recorder{recorder} status=ok temperature=41.5 "
+                    f"dropped=0 buffer=0.75\n"
+                    for label in iter_labels(rate, start, BLOCK_SIZE)
+                ]
+            )
+            f.write(block)
+            written += len(block)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10240
+    memory = int(sys.argv[2]) if len(sys.argv) > 2 else 512
+    workers = int(sys.argv[3]) if len(sys.argv) > 3 else os.cpu_count() or 1
+    with tempfile.TemporaryDirectory() as tmp:
+        src = os.path.join(tmp, "capture.log")
+        dst = os.path.join(tmp, "sorted.log")
+        write_log(src, size * 1024 * 1024)
+        size = os.path.getsize(src)
+
+        start = time.perf_counter()
+        count = sort_log(
+            src,
+            dst,
+            "29.97",
+            memory_budget=memory * 1024 * 1024,
+            workers=workers,
+            tmp_dir=tmp,
+        )
+        elapsed = time.perf_counter() - start
+        print(
+            f"sort_log size={size / 1e9:.2f}GB lines={count} memory={memory}MB "
+            f"workers={workers} time={elapsed:.1f}s "
+            f"MB/s={size / elapsed / 1e6:.1f} lines/s={count / elapsed / 1e3:.0f}k"
+        )
+
+
+if __name__ == "__main__":
+    main()
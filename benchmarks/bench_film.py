@@ -0,0 +1,67 @@
+"""Benchmark the feet and frames conversion.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/bench_film.py [N_FRAMES]
+
+Formats N_FRAMES (default 500,000) frame counts as feet and frames with
+``timecode.film.format_footages()`` and parses them back with
+``timecode.film.parse_footages()`` for each gauge, and prints the throughput
+next to the timecode labels of ``timecode.labels.format_labels()`` and
+``timecode.batch.labels_to_frames()`` at 24 fps.
+"""
+
+import sys
+import time
+
+from timecode.batch import labels_to_frames
+from timecode.core import get_rate
+from timecode.film import (
+    GAUGE_16MM,
+    GAUGE_35MM,
+    GAUGE_35MM_3PERF,
+    GAUGE_65MM,
+    format_footages,
+    parse_footages,
+)
+from timecode.labels import format_labels
+
+
+def report(name: str, count: int, elapsed: float) -> None:
+    """Print the throughput of a conversion.
+
+    Args:
+        name (str): The name of the conversion.
+        count (int): The number of converted values.
+        elapsed (float): The time it took in seconds.
+    """
+    print(
+        f"{name} values={count} time={elapsed:.2f}s values/s={count / elapsed / 1e6:.2f}M"
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    n_frames = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    frames = range(1, n_frames + 1)
+
+    for gauge in (GAUGE_35MM, GAUGE_35MM_3PERF, GAUGE_16MM, GAUGE_65MM):
+        start = time.perf_counter()
+        footages = format_footages(frames, gauge)
+        report(f"format_footages {gauge.name}", n_frames, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        parse_footages(footages, gauge)
+        report(f"parse_footages {gauge.name}", n_frames, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    labels = format_labels(get_rate("24"), frames)
+    report("format_labels 24", n_frames, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    labels_to_frames(labels, "24")
+    report("labels_to_frames 24", n_frames, time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Benchmark the frame rate inference.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/bench_infer.py [N_FILES]
+
+Infers the frame rate of N_FILES (default 10,000) samples of 10,000
+consecutive labels and of 10,000 millisecond timestamps, cycling through a few
+frame rates, with ``timecode.infer`` and prints the number of inferences per
+second and the mean number of samples looked at.
+"""
+
+import sys
+import time
+
+from timecode import Timecode
+from timecode.core import get_rate
+from timecode.infer import infer_from_labels, infer_from_timestamps
+
+FRAMERATES = ["23.976", "25", "29.97", "59.94", "30"]
+SAMPLE_SIZE = 10_000
+
+
+def main() -> None:
+    """Run the benchmark."""
+    n_files = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    label_samples = []
+    timestamp_samples = []
+    for framerate in FRAMERATES:
+        tc = Timecode(framerate, "10:00:00:00")
+        labels = []
+        for _ in range(SAMPLE_SIZE):
+            labels.append(str(tc))
+            tc += 1
+        label_samples.append(labels)
+        rate = get_rate(framerate)
+        timestamp_samples.append(
+            [
+                round(1e9 + i * rate.denominator / rate.numerator, 3)
+                for i in range(SAMPLE_SIZE)
+            ]
+        )
+
+    for name, infer, samples in [
+        ("labels", infer_from_labels, label_samples),
+        ("timestamps", infer_from_timestamps, timestamp_samples),
+    ]:
+        n_samples = 0
+        start = time.perf_counter()
+        for i in range(n_files):
+            n_samples += infer(samples[i % len(samples)]).samples
+        elapsed = time.perf_counter() - start
+        print(
+            f"infer_from_{name} files={n_files} time={elapsed:.2f}s "
+            f"files/s={n_files / elapsed:.0f} "
+            f"samples/file={n_samples / n_files:.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Benchmark the sequential label generator against the Timecode.next() loop.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/bench_labels.py [N_LABELS] [FRAMERATE]
+
+Writes N_LABELS (default 1,000,000) consecutive labels at FRAMERATE (default
+59.94) to an in memory text stream with ``timecode.labels.write_labels()`` and
+with the ``Timecode.next()`` and ``repr()`` loop, checks that the outputs are
+equal and prints the speed up.
+"""
+
+import io
+import sys
+import time
+
+from timecode import Timecode
+from timecode.labels import write_labels
+
+
+def main() -> None:
+    """Run the benchmark."""
+    n_labels = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    framerate = sys.argv[2] if len(sys.argv) > 2 else "59.94"
+
+    tc = Timecode(framerate)
+    loop_sink = io.StringIO()
+    start = time.perf_counter()
+    for _ in range(n_labels):
+        loop_sink.write(f"{tc!r}\n")
+        tc.next()
+    loop_time = time.perf_counter() - start
+
+    tc = Timecode(framerate)
+    sink = io.StringIO()
+    start = time.perf_counter()
+    write_labels(sink, tc.rate, tc.frames, n_labels)
+    generator_time = time.perf_counter() - start
+
+    assert sink.getvalue() == loop_sink.getvalue()
+    print(
+        f"{framerate} labels={n_labels} next()+repr()={loop_time:.3f}s "
+        f"write_labels()={generator_time:.3f}s speedup={loop_time / generator_time:.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
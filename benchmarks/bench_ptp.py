@@ -0,0 +1,54 @@
+"""Benchmark the PTP and RTP timestamp conversion.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/bench_ptp.py [N_PACKETS]
+
+Converts N_PACKETS (default 1,000,000) PTP timestamps of a 29.97 drop frame
+ST 2110 stream, spanning a daily jam at midnight, to frame counts with
+``timecode.ptp``, then the same packets as wrapping 32 bit RTP timestamps, and
+prints the throughput.
+"""
+
+import calendar
+import sys
+import time
+
+from timecode.ptp import (
+    NANOSECONDS,
+    RTP_CLOCK_RATE,
+    TAI_UTC_OFFSET,
+    ptp_to_frames,
+    rtp_to_frames,
+)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    n_packets = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    midnight = (calendar.timegm((2024, 3, 2, 0, 0, 0)) + TAI_UTC_OFFSET) * NANOSECONDS
+    # a few packets per frame, centered on the jam
+    step = 1001 * NANOSECONDS // 30000 // 4
+    first = midnight - n_packets // 2 * step
+    ptp = [first + i * step for i in range(n_packets)]
+    rtp = [t * RTP_CLOCK_RATE // NANOSECONDS % (1 << 32) for t in ptp]
+
+    start = time.perf_counter()
+    frames = ptp_to_frames(ptp, "29.97", utc_offset=3600)
+    elapsed = time.perf_counter() - start
+    print(
+        f"ptp_to_frames packets={len(ptp)} frames={len(set(frames))} "
+        f"time={elapsed:.2f}s packets/s={len(ptp) / elapsed / 1e6:.2f}M"
+    )
+
+    start = time.perf_counter()
+    frames = rtp_to_frames(rtp, "29.97", reference=first, utc_offset=3600)
+    elapsed = time.perf_counter() - start
+    print(
+        f"rtp_to_frames packets={len(rtp)} frames={len(set(frames))} "
+        f"time={elapsed:.2f}s packets/s={len(rtp) / elapsed / 1e6:.2f}M"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Benchmark the packet timestamp conversion.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/bench_pts.py [N_PACKETS]
+
+Converts N_PACKETS (default 1,000,000) 1/90000 timestamps of a 29.97 stream,
+with a B-frame reordering and a few dropped packets, to frame counts, gaps and
+labels with ``timecode.pts`` and prints the throughput. A baseline of
+``Timecode("29.97", start_seconds=...)`` per packet is measured on 100k
+packets.
+"""
+
+import sys
+import time
+
+from timecode import Timecode
+from timecode.labels import format_labels
+from timecode.pts import find_gaps, pts_to_frames
+
+
+def main() -> None:
+    """Run the benchmark."""
+    n_packets = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    pts = []
+    for i in range(0, n_packets, 3):
+        # I P B B in decoding order, every 1000th group dropped
+        if i % 3000:
+            pts.extend([(i + 2) * 3003, i * 3003, (i + 1) * 3003])
+    start_tc = Timecode("29.97", "01:00:00;00")
+
+    start = time.perf_counter()
+    frames, errors = pts_to_frames(pts, "1/90000", "29.97", start=start_tc, start_pts=0)
+    elapsed = time.perf_counter() - start
+    print(
+        f"pts_to_frames packets={len(pts)} time={elapsed:.2f}s "
+        f"packets/s={len(pts) / elapsed / 1e6:.2f}M"
+    )
+
+    start = time.perf_counter()
+    gaps = find_gaps(frames)
+    elapsed = time.perf_counter() - start
+    print(f"find_gaps gaps={len(gaps)} time={elapsed:.2f}s")
+
+    start = time.perf_counter()
+    format_labels(start_tc.rate, frames)
+    elapsed = time.perf_counter() - start
+    print(
+        f"format_labels labels={len(frames)} time={elapsed:.2f}s "
+        f"labels/s={len(frames) / elapsed / 1e6:.2f}M"
+    )
+
+    n_baseline = min(len(pts), 100_000)
+    start = time.perf_counter()
+    for p in pts[:n_baseline]:
+        Timecode("29.97", start_seconds=p / 90000)
+    elapsed = time.perf_counter() - start
+    print(
+        f"Timecode(start_seconds=...) packets={n_baseline} time={elapsed:.2f}s "
+        f"packets/s={n_baseline / elapsed / 1e6:.2f}M"
+    )
+
+
+if __name__ == "__main__":
+    main()
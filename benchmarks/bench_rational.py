@@ -0,0 +1,45 @@
+"""Benchmark the bulk rational time conversion.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/bench_rational.py [N_CLIPS]
+
+Builds the offset, start and duration attributes of N_CLIPS (default 500,000)
+FCPXML clips at 29.97 and converts them to frame numbers and back with
+``timecode.rational`` in a single pass, printing the throughput.
+"""
+
+import sys
+import time
+
+from timecode.rational import frame_numbers_to_rationals, rationals_to_frame_numbers
+
+
+def main() -> None:
+    """Run the benchmark."""
+    n_clips = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    frame_numbers = []
+    for i in range(n_clips):
+        frame_numbers.extend([i * 150, 108000 + i * 37, 150])
+    values = frame_numbers_to_rationals(frame_numbers, "29.97")
+
+    start = time.perf_counter()
+    result = rationals_to_frame_numbers(values, "29.97")
+    elapsed = time.perf_counter() - start
+    assert list(result) == frame_numbers
+    print(
+        f"rationals_to_frame_numbers clips={n_clips} time={elapsed:.3f}s "
+        f"values/s={len(values) / elapsed / 1e6:.2f}M"
+    )
+
+    start = time.perf_counter()
+    frame_numbers_to_rationals(result, "29.97")
+    elapsed = time.perf_counter() - start
+    print(
+        f"frame_numbers_to_rationals clips={n_clips} time={elapsed:.3f}s "
+        f"values/s={len(values) / elapsed / 1e6:.2f}M"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Benchmark the mmap based timecode label scanner.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/bench_scan.py [SIZE_MB]
+
+Writes a synthetic playout log of SIZE_MB megabytes (default 1024) with a
+29.97 drop frame label on every line to a temporary folder, scans it with
+``timecode.scan.scan_labels`` and prints the throughput in GB/s along with a
+baseline of decoding the lines and parsing them with ``Timecode``.
+"""
+
+import os
+import re
+import sys
+import tempfile
+import time
+
+from timecode import Timecode
+from timecode.core import get_rate
+from timecode.labels import iter_labels
+from timecode.scan import scan_labels
+
+BASELINE_LINES = 200_000
+
+
+def write_log(path, size):
+    """Write a synthetic playout log of about the given size in bytes."""
+    rate = get_rate("29.97")
+    written = 0
+    with open(path, "w") as f:
+        while written < size:
+            block = "".join(
+                [
+                    f"2024-05-01T10:00:00Z channel=1 event=play tc={label} "
+                    f"clip=PROMO_0042 status=ok\n"
+                    for label in iter_labels(rate, 1, 100_000)
+                ]
+            )
+            f.write(block)
+            written += len(block)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    size_mb = int(sys.argv[1]) if len(sys.argv) > 1 else 1024
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "playout.log")
+        write_log(path, size_mb * 1024 * 1024)
+        size = os.path.getsize(path)
+
+        start = time.perf_counter()
+        count = sum(1 for _ in scan_labels(path, "29.97"))
+        elapsed = time.perf_counter() - start
+        print(
+            f"scan_labels size={size / 1e9:.2f}GB labels={count} "
+            f"time={elapsed:.2f}s GB/s={size / elapsed / 1e9:.3f} "
+            f"labels/s={count / elapsed / 1e6:.2f}M"
+        )
+
+        pattern = re.compile(r"\d{2}:\d{2}:\d{2}[:;.]\d{2}")
+        start = time.perf_counter()
+        n_bytes = 0
+        with open(path) as f:
+            for i, line in enumerate(f):
+                if i == BASELINE_LINES:
+                    break
+                n_bytes += len(line)
+                for label in pattern.findall(line):
+                    Timecode("29.97", label)
+        elapsed = time.perf_counter() - start
+        print(
+            f"str lines + Timecode() lines={BASELINE_LINES} "
+            f"GB/s={n_bytes / elapsed / 1e9:.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Benchmark the seek index of an intra-only media file.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/bench_seek.py [HOURS]
+
+Builds the ``timecode.seek`` index of HOURS (default 2) of 23.976 fps ProRes
+4444 XQ like frames, about 2.9 MB each so 2 hours is a 500 GB file, saves it,
+memory maps it back and times 100,000 ten second span lookups.
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+from timecode.seek import SeekIndex, SeekIndexBuilder
+
+
+def main() -> None:
+    """Run the benchmark."""
+    hours = float(sys.argv[1]) if len(sys.argv) > 1 else 2
+    n_frames = int(hours * 3600 * 24000 / 1001)
+    rng = random.Random(0)
+    sizes = [rng.randrange(2_600_000, 3_200_000) for _ in range(n_frames)]
+    offsets = []
+    offset = 48
+    for size in sizes:
+        offsets.append(offset)
+        # interleaved audio
+        offset += size + 9216
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "A001C003.tcseek")
+        begin = time.perf_counter()
+        builder = SeekIndexBuilder("23.976", start="10:00:00:00")
+        builder.add_many(offsets, sizes)
+        builder.save(path)
+        elapsed = time.perf_counter() - begin
+        print(
+            f"build frames={n_frames} media={offset / 1e9:.0f}GB "
+            f"index={os.path.getsize(path) / 1e6:.1f}MB time={elapsed:.2f}s"
+        )
+
+        begin = time.perf_counter()
+        index = SeekIndex.load(path)
+        elapsed = time.perf_counter() - begin
+        print(f"load time={elapsed * 1e3:.3f}ms")
+
+        n_queries = 100_000
+        start = index.start
+        duration = 10 * 24 - 1
+        firsts = [start + rng.randrange(n_frames - duration) for _ in range(n_queries)]
+        begin = time.perf_counter()
+        total = 0
+        for first in firsts:
+            total += index.span(first, first.frames + duration).length
+        elapsed = time.perf_counter() - begin
+        index.close()
+        print(
+            f"span queries={n_queries} bytes={total / n_queries / 1e6:.0f}MB/query "
+            f"time={elapsed:.2f}s queries/s={n_queries / elapsed:,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Benchmark the image sequence index.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/bench_sequences.py [N_FILES] [DIRECTORY]
+
+Creates N_FILES (default 1,000,000) empty files in 100 shot directories of
+DIRECTORY (default a temporary directory, removed afterwards), with a few
+missing frames in each shot, scans them with
+``timecode.sequences.SequenceIndex.scan()`` and prints the scan time, the
+size of the saved index, the load time and the time of the frame to timecode,
+timecode to path and missing frame queries. An existing DIRECTORY is reused
+as it is.
+"""
+
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+from timecode import Timecode
+from timecode.sequences import SequenceIndex
+
+N_SHOTS = 100
+
+
+def create_files(root: str, n_files: int) -> None:
+    """Create the files of the shots.
+
+    Args:
+        root (str): The path of the directory.
+        n_files (int): The number of files.
+    """
+    rng = random.Random(0)
+    per_shot = n_files // N_SHOTS
+    for shot in range(N_SHOTS):
+        directory = os.path.join(root, f"sh{shot:03d}0")
+        os.makedirs(directory)
+        missing = set(rng.sample(range(per_shot), min(10, per_shot)))
+        for frame in range(per_shot):
+            if frame not in missing:
+                name = f"sh{shot:03d}0_comp_v001.{1001 + frame:04d}.exr"
+                open(os.path.join(directory, name), "w").close()
+
+
+def main() -> None:
+    """Run the benchmark."""
+    n_files = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    temporary = len(sys.argv) <= 2
+    root = tempfile.mkdtemp() if temporary else sys.argv[2]
+    try:
+        if temporary or not os.path.exists(root):
+            start = time.perf_counter()
+            create_files(root, n_files)
+            print(f"create files={n_files} time={time.perf_counter() - start:.2f}s")
+
+        start = time.perf_counter()
+        index = SequenceIndex.scan(root, "24", start=Timecode("24", "01:00:00:00"))
+        elapsed = time.perf_counter() - start
+        files = sum(len(s) for s in index)
+        runs = sum(s.frames.run_count for s in index)
+        print(
+            f"scan files={files} sequences={len(index)} runs={runs} "
+            f"time={elapsed:.2f}s files/s={files / elapsed / 1e6:.2f}M"
+        )
+
+        path = os.path.join(tempfile.gettempdir(), "bench_sequences.json")
+        index.save(path)
+        start = time.perf_counter()
+        index = SequenceIndex.load(path)
+        elapsed = time.perf_counter() - start
+        print(f"load size={os.path.getsize(path)}B time={elapsed * 1e3:.1f}ms")
+        os.remove(path)
+
+        sequences = list(index)
+        n_queries = 100_000
+        start = time.perf_counter()
+        for i in range(n_queries):
+            sequence = sequences[i % len(sequences)]
+            tc = sequence.timecode(sequence.first + i % len(sequence))
+            sequence.timecode_to_path(tc)
+        elapsed = time.perf_counter() - start
+        print(
+            f"frame->timecode->path queries={n_queries} time={elapsed:.2f}s "
+            f"queries/s={n_queries / elapsed / 1e6:.2f}M"
+        )
+
+        start = time.perf_counter()
+        missing = sum(len(list(s.missing())) for s in sequences)
+        elapsed = time.perf_counter() - start
+        print(f"missing runs={missing} time={elapsed * 1e3:.1f}ms")
+    finally:
+        if temporary:
+            shutil.rmtree(root)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Benchmark the run length encoded frame sets.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/bench_sets.py [N_FRAMES] [N_RUNS]
+
+Builds the rendered and the approved frames of a N_FRAMES (default 2,000,000)
+frame show as N_RUNS (default 10,000) random runs each, and measures the
+memory and the time of ``timecode.sets.TimecodeSet`` against Python sets of
+frame counts for the union, the intersection and the difference, and the time
+to format and parse the compact string form.
+"""
+
+import random
+import sys
+import time
+import tracemalloc
+
+from timecode.sets import TimecodeSet
+
+
+def random_runs(rng: random.Random, n_frames: int, n_runs: int) -> list:
+    """Return random disjoint runs of frames.
+
+    Args:
+        rng (random.Random): The random number generator.
+        n_frames (int): The number of frames of the show.
+        n_runs (int): The number of runs.
+
+    Returns:
+        list: The first and last frame counts of the runs.
+    """
+    bounds = sorted(rng.sample(range(1, n_frames + 1), 2 * n_runs))
+    return [(bounds[i], bounds[i + 1]) for i in range(0, len(bounds), 2)]
+
+
+def measure(build: object) -> tuple:
+    """Return the result, the allocated memory and the time of a build.
+
+    Args:
+        build (object): A callable returning the result.
+
+    Returns:
+        tuple: The result, the allocated bytes and the time in seconds.
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, size, elapsed
+
+
+def main() -> None:
+    """Run the benchmark."""
+    n_frames = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    n_runs = int(sys.argv[2]) if len(sys.argv) > 2 else 10_000
+    rng = random.Random(0)
+    rendered_runs = random_runs(rng, n_frames, n_runs)
+    approved_runs = random_runs(rng, n_frames, n_runs)
+
+    rendered, run_size, _ = measure(lambda: TimecodeSet("24", rendered_runs))
+    approved = TimecodeSet("24", approved_runs)
+    frames, set_size, _ = measure(
+        lambda: {f for first, last in rendered_runs for f in range(first, last + 1)}
+    )
+    approved_frames = {
+        f for first, last in approved_runs for f in range(first, last + 1)
+    }
+    print(
+        f"memory frames={len(frames)} TimecodeSet={run_size / 1e6:.2f}MB "
+        f"set={set_size / 1e6:.2f}MB ratio={set_size / run_size:.0f}x"
+    )
+
+    for name, operator in (
+        ("union", lambda a, b: a | b),
+        ("intersection", lambda a, b: a & b),
+        ("difference", lambda a, b: a - b),
+    ):
+        start = time.perf_counter()
+        operator(rendered, approved)
+        run_time = time.perf_counter() - start
+        start = time.perf_counter()
+        operator(frames, approved_frames)
+        set_time = time.perf_counter() - start
+        print(
+            f"{name} TimecodeSet={run_time * 1e3:.1f}ms set={set_time * 1e3:.1f}ms "
+            f"speed_up={set_time / run_time:.0f}x"
+        )
+
+    start = time.perf_counter()
+    value = str(rendered)
+    elapsed = time.perf_counter() - start
+    print(f"format runs={rendered.run_count} length={len(value)} time={elapsed:.2f}s")
+
+    start = time.perf_counter()
+    TimecodeSet.parse("24", value)
+    elapsed = time.perf_counter() - start
+    print(f"parse runs={rendered.run_count} time={elapsed:.2f}s")
+
+    start = time.perf_counter()
+    TimecodeSet.from_frames("24", frames)
+    elapsed = time.perf_counter() - start
+    print(f"from_frames frames={len(frames)} time={elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Benchmark sorting Timecode instances.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/bench_sort.py [N_TIMECODES]
+
+Sorts N_TIMECODES (default 1,000,000) random 29.97 timecodes with
+``sorted()``, which compares them with ``Timecode.__lt__``, and with
+``timecode.sorted_timecodes()`` and prints the timings.
+"""
+
+import random
+import sys
+import time
+
+from timecode import Timecode, sorted_timecodes
+
+
+def main() -> None:
+    """Run the benchmark."""
+    n_timecodes = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = random.Random(0)
+    timecodes = [
+        Timecode("29.97", frames=rng.randint(1, 2589408)) for _ in range(n_timecodes)
+    ]
+
+    start = time.perf_counter()
+    expected = sorted(timecodes)
+    baseline = time.perf_counter() - start
+    print(f"sorted() n={n_timecodes} time={baseline:.3f}s")
+
+    start = time.perf_counter()
+    result = sorted_timecodes(timecodes)
+    elapsed = time.perf_counter() - start
+    assert [tc.frames for tc in result] == [tc.frames for tc in expected]
+    print(
+        f"sorted_timecodes() n={n_timecodes} time={elapsed:.3f}s "
+        f"speed up={baseline / elapsed:.1f}x"
+    )
+
+    start = time.perf_counter()
+    sorted_timecodes(timecodes, indices=True)
+    elapsed = time.perf_counter() - start
+    print(f"sorted_timecodes(indices=True) n={n_timecodes} time={elapsed:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
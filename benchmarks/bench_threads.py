@@ -0,0 +1,52 @@
+"""Benchmark timecode.batch throughput against the number of threads.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/bench_threads.py [N_FRAMES] [FRAMERATE]
+
+Converts N_FRAMES (default 2,000,000) frame counts to labels with a pool of 1,
+2, 4, ... up to ``os.cpu_count()`` threads and prints the throughput and the
+speed up relative to a single thread. The conversions only scale with the
+number of threads on free-threaded (PEP 703) builds, i.e. ``python3.13t``.
+"""
+
+import os
+import sys
+import time
+
+from timecode.batch import map_frames_to_labels
+
+
+def main() -> None:
+    """Run the benchmark."""
+    n_frames = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    framerate = sys.argv[2] if len(sys.argv) > 2 else "29.97"
+    cpu_count = os.cpu_count() or 1
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"python={sys.version.split()[0]} gil_enabled={is_gil_enabled}")
+
+    thread_counts = []
+    threads = 1
+    while threads < cpu_count:
+        thread_counts.append(threads)
+        threads *= 2
+    thread_counts.append(cpu_count)
+
+    baseline = None
+    for threads in thread_counts:
+        start = time.perf_counter()
+        count = 0
+        for _ in map_frames_to_labels(
+            range(1, n_frames + 1), framerate, threads, threads=True
+        ):
+            count += 1
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(
+            f"threads={threads:3d} frames={count} time={elapsed:.3f}s "
+            f"rate={count / elapsed / 1e6:.2f}M/s speedup={baseline / elapsed:.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
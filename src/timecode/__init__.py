@@ -1,2 +1,17 @@
 from timecode._version import __version__  # noqa: F401
+from timecode.core import (  # noqa: F401
+    FrameRate,
+    components_to_frames,
+    format_label,
+    frames_to_components,
+    frames_to_label,
+    get_rate,
+    label_to_frames,
+)
+from timecode.sort import (  # noqa: F401
+    merge_frames,
+    merge_timecodes,
+    sort_frames,
+    sorted_timecodes,
+)
 from timecode.timecode import Timecode, TimecodeError  # noqa: F401
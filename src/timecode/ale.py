@@ -0,0 +1,336 @@
+"""Avid Log Exchange (ALE) reader and writer with columnar timecode fields.
+
+The timecode columns of an ALE file (Start, End, Duration, Auxiliary TC1 etc.)
+are stored as ``array("q")`` columns of frame counts, converted through one
+shared frame rate descriptor per column instead of a :class:`.Timecode` per
+cell. :class:`.Timecode` instances are only created when a row is accessed::
+
+    from timecode.ale import read_ale, write_ale
+
+    ale = read_ale("dailies.ale")
+    starts = ale.columns["Start"]  # array of frame counts
+    print(ale[0]["Start"])  # a Timecode instance
+    write_ale("out.ale", ale)
+
+Empty timecode cells are stored as 0, as a valid frame count is always
+positive.
+"""
+
+# Standard Library Imports
+from __future__ import annotations
+
+import os
+from array import array
+from itertools import islice
+from typing import TYPE_CHECKING
+
+from timecode.core import frames_to_label, get_rate, label_to_frames
+from timecode.timecode import Timecode
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from typing import TextIO
+
+    from timecode.core import FrameRate
+
+
+TIMECODE_COLUMNS = (
+    "Start",
+    "End",
+    "Duration",
+    "Auxiliary TC1",
+    "Auxiliary TC2",
+    "Auxiliary TC3",
+    "Auxiliary TC4",
+    "Auxiliary TC5",
+    "Sound TC",
+)
+"""tuple[str, ...]: The names of the columns holding timecode labels."""
+
+CHUNK_SIZE = 65536
+"""int: The number of rows converted at once while reading and writing."""
+
+
+class ALERow:
+    """Lazy view of a row of an :class:`.ALE`.
+
+    Timecode columns are returned as :class:`.Timecode` instances (or None for
+    empty cells) which are created when the column is accessed.
+
+    Args:
+        ale (ALE): The ALE instance.
+        index (int): The row index.
+    """
+
+    __slots__ = ("_ale", "_index")
+
+    def __init__(self, ale: ALE, index: int) -> None:
+        self._ale = ale
+        self._index = index
+
+    def __getitem__(self, name: str) -> None | str | Timecode:
+        """Return the value of the given column in this row.
+
+        Args:
+            name (str): The column name.
+
+        Returns:
+            None | str | Timecode: The value.
+        """
+        value = self._ale.columns[name][self._index]
+        if name not in self._ale.rates:
+            return value  # type: ignore
+        if not value:
+            return None
+        return Timecode.from_rate(self._ale.rates[name], value)  # type: ignore
+
+    def __repr__(self) -> str:
+        """Return the string representation of this row.
+
+        Returns:
+            str: The string representation of this row.
+        """
+        return f"<{self.__class__.__name__} {self._index} of {len(self._ale)} rows>"
+
+    def to_dict(self) -> dict[str, None | str | Timecode]:
+        """Return all the values of this row.
+
+        Returns:
+            dict: The values by column name.
+        """
+        return {name: self[name] for name in self._ale.column_names}
+
+
+class ALE:
+    """Columnar representation of an Avid Log Exchange file.
+
+    Args:
+        heading (dict[str, str]): The Heading section key and values. The "FPS"
+            value defines the frame rate of the timecode columns.
+        column_names (list[str]): The column names in order.
+        columns (dict[str, list[str] | array]): The columns, the text columns
+            are lists of str and the timecode columns are arrays of frame
+            counts.
+        rates (dict[str, FrameRate]): The frame rate descriptors of the
+            timecode columns.
+    """
+
+    def __init__(
+        self,
+        heading: dict[str, str],
+        column_names: list[str],
+        columns: dict[str, list[str] | array],
+        rates: dict[str, FrameRate],
+    ) -> None:
+        self.heading = heading
+        self.column_names = column_names
+        self.columns = columns
+        self.rates = rates
+
+    @property
+    def fps(self) -> str:
+        """Return the frame rate in the Heading section.
+
+        Returns:
+            str: The value of the FPS key.
+        """
+        return self.heading["FPS"]
+
+    def __len__(self) -> int:
+        """Return the number of rows.
+
+        Returns:
+            int: The number of rows.
+        """
+        if not self.column_names:
+            return 0
+        return len(self.columns[self.column_names[0]])
+
+    def __getitem__(self, index: int) -> ALERow:
+        """Return a lazy view of the row at the given index.
+
+        Args:
+            index (int): The row index, can be negative.
+
+        Returns:
+            ALERow: The row.
+        """
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError(f"ALE row index out of range: {index}")
+        return ALERow(self, index)
+
+    def __iter__(self) -> Iterator[ALERow]:
+        """Iterate over the rows.
+
+        Yields:
+            ALERow: The rows.
+        """
+        for index in range(len(self)):
+            yield ALERow(self, index)
+
+
+def _split(line: str) -> list[str]:
+    """Split the given tab delimited line, dropping the trailing tab.
+
+    Args:
+        line (str): The line.
+
+    Returns:
+        list[str]: The fields.
+    """
+    fields = line.rstrip("\r\n").split("\t")
+    if len(fields) > 1 and fields[-1] == "":
+        fields.pop()
+    return fields
+
+
+def _column_rate(rate: FrameRate, values: Iterable[str]) -> FrameRate:
+    """Return the rate of a timecode column based on its first label.
+
+    Drop frame rates use the non drop frame calculation for columns with ":"
+    as the frame delimiter.
+
+    Args:
+        rate (FrameRate): The rate from the Heading section.
+        values (Iterable[str]): The column values.
+
+    Returns:
+        FrameRate: The frame rate descriptor of the column.
+    """
+    if rate.drop_frame:
+        for value in values:
+            if value:
+                if ";" not in value:
+                    return get_rate(rate.framerate, force_non_drop_frame=True)
+                break
+    return rate
+
+
+def _read_sections(lines: Iterator[str]) -> tuple[dict[str, str], list[str]]:
+    """Read the Heading and Column sections, stops at the start of the Data.
+
+    Args:
+        lines (Iterator[str]): The lines of the ALE file.
+
+    Returns:
+        tuple: The heading key and values and the column names.
+    """
+    heading: dict[str, str] = {}
+    column_names: list[str] = []
+    for line in lines:
+        section = line.strip()
+        if section == "Heading":
+            for heading_line in lines:
+                if not heading_line.strip():
+                    break
+                key, _, value = heading_line.rstrip("\r\n").partition("\t")
+                heading[key] = value
+        elif section == "Column":
+            column_names = _split(next(lines))
+        elif section == "Data":
+            break
+    return heading, column_names
+
+
+def read_ale(
+    source: str | os.PathLike | Iterable[str],
+    timecode_columns: Iterable[str] = TIMECODE_COLUMNS,
+) -> ALE:
+    """Read the given ALE file.
+
+    The Data section is streamed in chunks and the timecode columns are
+    converted to frame counts in bulk.
+
+    Args:
+        source (str | os.PathLike | Iterable[str]): The path of the ALE file or
+            an iterable of its lines (i.e. an open text file).
+        timecode_columns (Iterable[str]): The names of the columns holding
+            timecode labels.
+
+    Returns:
+        ALE: The ALE instance.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, encoding="utf-8", errors="surrogateescape") as f:
+            return read_ale(f, timecode_columns)
+
+    lines = iter(source)
+    heading, column_names = _read_sections(lines)
+    if "FPS" not in heading:
+        raise ValueError("The ALE Heading section has no FPS value")
+
+    rate = get_rate(heading["FPS"])
+    timecode_columns = set(timecode_columns)
+    columns: dict[str, list[str] | array] = {
+        name: array("q") if name in timecode_columns else [] for name in column_names
+    }
+    rates: dict[str, FrameRate] = {}
+    n_columns = len(column_names)
+    padding = [""] * n_columns
+
+    rows = (line for line in lines if line.strip())
+    while True:
+        chunk = [
+            (_split(line) + padding)[:n_columns] for line in islice(rows, CHUNK_SIZE)
+        ]
+        if not chunk:
+            break
+        for name, values in zip(column_names, zip(*chunk)):
+            column = columns[name]
+            if name not in timecode_columns:
+                column.extend(values)  # type: ignore
+                continue
+            if name not in rates:
+                rates[name] = _column_rate(rate, values)
+            column_rate = rates[name]
+            column.extend(  # type: ignore
+                [label_to_frames(column_rate, v) if v else 0 for v in values]
+            )
+
+    for name in column_names:
+        if name in timecode_columns and name not in rates:
+            rates[name] = rate
+
+    return ALE(heading, column_names, columns, rates)
+
+
+def write_ale(target: str | os.PathLike | TextIO, ale: ALE) -> int:
+    """Write the given ALE.
+
+    The timecode columns are formatted in bulk, chunk by chunk.
+
+    Args:
+        target (str | os.PathLike | TextIO): The path of the ALE file or a text
+            stream to write to.
+        ale (ALE): The ALE instance.
+
+    Returns:
+        int: The number of rows written.
+    """
+    if isinstance(target, (str, os.PathLike)):
+        with open(target, "w", encoding="utf-8", errors="surrogateescape") as f:
+            return write_ale(f, ale)
+
+    write = target.write
+    write("Heading\n")
+    for key, value in ale.heading.items():
+        write(f"{key}\t{value}\n")
+    write("\nColumn\n")
+    write("\t".join(ale.column_names) + "\t\n")
+    write("\nData\n")
+
+    length = len(ale)
+    for start in range(0, length, CHUNK_SIZE):
+        end = min(start + CHUNK_SIZE, length)
+        chunk_columns = []
+        for name in ale.column_names:
+            values = ale.columns[name][start:end]
+            if name in ale.rates:
+                rate = ale.rates[name]
+                values = [frames_to_label(rate, f) if f else "" for f in values]  # type: ignore
+            chunk_columns.append(values)
+        write("".join(["\t".join(row) + "\t\n" for row in zip(*chunk_columns)]))
+    return length
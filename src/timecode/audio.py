@@ -0,0 +1,205 @@
+"""Exact conversion between audio sample positions and timecodes.
+
+At 48 kHz a 29.97 frame is 1601.6 samples long, so the frames do not start on
+sample boundaries, and the float seconds of :attr:`.Timecode.float` drift over
+long takes. The functions in this module use the exact number of samples per
+frame as a ratio of integers and integer arithmetic only, so they are sample
+accurate over a full 24 hours at any sample rate::
+
+    from timecode import Timecode
+    from timecode.audio import sample_to_timecode, timecode_to_sample
+
+    timecode_to_sample(Timecode("29.97", "01:00:00;00"), 48000)
+    # 172799828
+    sample_to_timecode(172799829, "29.97", 48000)
+    # (01:00:00;00, 1)
+
+Sample positions are 0 based and counted from "00:00:00:00". The first sample
+of a frame is the first sample at or after the start of the frame, a sample
+position maps to the frame it is in and the number of samples since the first
+sample of that frame (the subframe remainder), so the conversions are exact
+inverses.
+
+The :data:`.PULL_DOWN` and :data:`.PULL_UP` variants are for audio which plays
+0.1% slower or faster than it was recorded, i.e. 48 kHz audio recorded with
+30 fps timecode and played at 29.97, where a sample lasts ``1001 / 1000 /
+48000`` seconds (pull down) or ``1000 / 1001 / 48000`` seconds (pull up).
+"""
+
+# Standard Library Imports
+from __future__ import annotations
+
+from array import array
+from fractions import Fraction
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from timecode.core import get_rate
+from timecode.timecode import Timecode
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from timecode.core import FrameRate
+
+
+PULL_DOWN = "down"
+"""str: The audio plays 0.1% slower, at 1000/1001 of the sample rate."""
+
+PULL_UP = "up"
+"""str: The audio plays 0.1% faster, at 1001/1000 of the sample rate."""
+
+_PULL_FACTORS = {
+    None: Fraction(1),
+    PULL_DOWN: Fraction(1000, 1001),
+    PULL_UP: Fraction(1001, 1000),
+}
+
+
+def samples_per_frame(
+    framerate: str | float | Fraction,
+    sample_rate: int,
+    *,
+    pull: None | str = None,
+) -> Fraction:
+    """Return the exact number of samples per frame.
+
+    Args:
+        framerate (str | int | float | Fraction): The frame rate, see
+            :class:`.Timecode` for the accepted values.
+        sample_rate (int): The sample rate in Hz, i.e. 48000.
+        pull (None | str): Either :data:`.PULL_DOWN`, :data:`.PULL_UP` or None.
+
+    Returns:
+        Fraction: The number of samples per frame, i.e. 1601.6 for 48 kHz at
+            29.97.
+    """
+    return Fraction(*_samples_per_frame(get_rate(framerate), sample_rate, pull))
+
+
+@lru_cache(maxsize=64)
+def _samples_per_frame(
+    rate: FrameRate, sample_rate: int, pull: None | str
+) -> tuple[int, int]:
+    """Return the exact number of samples per frame as a ratio.
+
+    Args:
+        rate (FrameRate): The frame rate descriptor.
+        sample_rate (int): The sample rate in Hz.
+        pull (None | str): Either :data:`.PULL_DOWN`, :data:`.PULL_UP` or None.
+
+    Raises:
+        ValueError: If the sample rate or the pull is invalid.
+
+    Returns:
+        tuple[int, int]: The numerator and the denominator, in lowest terms.
+    """
+    if not isinstance(sample_rate, int) or sample_rate < 1:
+        raise ValueError(f"sample_rate should be a positive integer, not {sample_rate}")
+    if pull not in _PULL_FACTORS:
+        raise ValueError(
+            f"pull should be one of {PULL_DOWN!r}, {PULL_UP!r} or None, not {pull!r}"
+        )
+    # a sample lasts 1 / (sample_rate * factor) seconds of the timecode
+    ratio = (
+        Fraction(sample_rate * rate.denominator, rate.numerator) * _PULL_FACTORS[pull]
+    )
+    return ratio.numerator, ratio.denominator
+
+
+def samples_to_frames(
+    samples: Iterable[int],
+    framerate: str | float | Fraction,
+    sample_rate: int,
+    *,
+    pull: None | str = None,
+) -> tuple[array, array]:
+    """Convert the given sample positions to frame counts.
+
+    Args:
+        samples (Iterable[int]): The 0 based sample positions.
+        framerate (str | int | float | Fraction): The frame rate.
+        sample_rate (int): The sample rate in Hz.
+        pull (None | str): Either :data:`.PULL_DOWN`, :data:`.PULL_UP` or None.
+
+    Returns:
+        tuple[array, array]: An ``array("q")`` of the frame counts, where
+            "00:00:00:00" is 1, and an ``array("q")`` of the number of samples
+            since the first sample of each frame.
+    """
+    numerator, denominator = _samples_per_frame(get_rate(framerate), sample_rate, pull)
+    samples = samples if isinstance(samples, (array, list)) else list(samples)
+    frames = array("q", [s * denominator // numerator + 1 for s in samples])
+    remainders = array(
+        "q",
+        [s + (1 - f) * numerator // denominator for s, f in zip(samples, frames)],
+    )
+    return frames, remainders
+
+
+def frames_to_samples(
+    frames: Iterable[int],
+    framerate: str | float | Fraction,
+    sample_rate: int,
+    *,
+    pull: None | str = None,
+) -> array:
+    """Convert the given frame counts to the first sample of the frames.
+
+    Args:
+        frames (Iterable[int]): The frame counts, where "00:00:00:00" is 1.
+        framerate (str | int | float | Fraction): The frame rate.
+        sample_rate (int): The sample rate in Hz.
+        pull (None | str): Either :data:`.PULL_DOWN`, :data:`.PULL_UP` or None.
+
+    Returns:
+        array: An ``array("q")`` of the 0 based sample positions.
+    """
+    numerator, denominator = _samples_per_frame(get_rate(framerate), sample_rate, pull)
+    return array("q", [-((1 - f) * numerator // denominator) for f in frames])
+
+
+def sample_to_timecode(
+    sample: int,
+    framerate: str | float | Fraction,
+    sample_rate: int,
+    *,
+    pull: None | str = None,
+    force_non_drop_frame: bool = False,
+) -> tuple[Timecode, int]:
+    """Convert the given sample position to a timecode.
+
+    Args:
+        sample (int): The 0 based sample position.
+        framerate (str | int | float | Fraction): The frame rate.
+        sample_rate (int): The sample rate in Hz.
+        pull (None | str): Either :data:`.PULL_DOWN`, :data:`.PULL_UP` or None.
+        force_non_drop_frame (bool): Use non drop frame calculation for NTSC
+            rates.
+
+    Returns:
+        tuple[Timecode, int]: The timecode of the frame the sample is in and
+            the number of samples since the first sample of the frame.
+    """
+    rate = get_rate(framerate, force_non_drop_frame)
+    (frames,), (remainder,) = samples_to_frames(
+        [sample], framerate, sample_rate, pull=pull
+    )
+    return Timecode.from_rate(rate, frames), remainder
+
+
+def timecode_to_sample(
+    tc: Timecode, sample_rate: int, *, pull: None | str = None
+) -> int:
+    """Convert the given timecode to the first sample of its frame.
+
+    Args:
+        tc (Timecode): The timecode.
+        sample_rate (int): The sample rate in Hz.
+        pull (None | str): Either :data:`.PULL_DOWN`, :data:`.PULL_UP` or None.
+
+    Returns:
+        int: The 0 based sample position.
+    """
+    numerator, denominator = _samples_per_frame(tc.rate, sample_rate, pull)
+    return -((1 - tc.frames) * numerator // denominator)
@@ -0,0 +1,392 @@
+"""Batch conversion between frame counts and timecode labels.
+
+The functions in this module convert large sequences of frame counts to
+timecode labels (and back) without creating a :class:`.Timecode` instance per
+item. Big inputs are split into chunks which are spread over a
+``concurrent.futures.ProcessPoolExecutor``. The chunks travel between the
+processes as compact buffers (packed 64-bit integers or newline joined labels)
+instead of pickled :class:`.Timecode` instances, and the results are yielded in
+the input order.
+
+With ``threads=True`` the chunks are spread over a
+``concurrent.futures.ThreadPoolExecutor`` instead. The conversions are done by
+the stateless functions in :mod:`timecode.core`, which share no mutable state,
+so this scales with the number of threads on free-threaded (PEP 703) builds of
+Python and avoids the transfer costs of the process pool.
+"""
+
+# Standard Library Imports
+from __future__ import annotations
+
+import os
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import chain, islice
+from typing import TYPE_CHECKING
+
+from timecode.core import frames_to_label, get_rate, label_to_frames
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+    from concurrent.futures import Executor, Future
+    from fractions import Fraction
+
+
+DEFAULT_CHUNK_SIZE = 65536
+"""int: The default number of items sent to a worker process at once."""
+
+FRAMES_TYPECODE = "q"
+"""str: The ``array`` typecode used for packing frame counts."""
+
+
+def frames_to_labels(
+    frames: Iterable[int],
+    framerate: str | float | Fraction,
+    force_non_drop_frame: bool = False,
+) -> list[str]:
+    """Convert the given frame counts to timecode labels in this process.
+
+    Args:
+        frames (Iterable[int]): The frame counts, as they would be stored in
+            :attr:`.Timecode.frames`.
+        framerate (str | int | float | Fraction): The frame rate, see
+            :class:`.Timecode` for the accepted values.
+        force_non_drop_frame (bool): Use non drop frame calculation for NTSC
+            rates.
+
+    Returns:
+        list[str]: The labels, each one equal to the ``repr()`` of a
+            :class:`.Timecode` with the same frame rate and number of frames.
+    """
+    rate = get_rate(framerate, force_non_drop_frame)
+    return [frames_to_label(rate, f) for f in frames]
+
+
+def labels_to_frames(
+    labels: Iterable[str],
+    framerate: str | float | Fraction,
+    force_non_drop_frame: bool = False,
+) -> array:
+    """Convert the given timecode labels to frame counts in this process.
+
+    Args:
+        labels (Iterable[str]): The timecode labels.
+        framerate (str | int | float | Fraction): The frame rate, see
+            :class:`.Timecode` for the accepted values.
+        force_non_drop_frame (bool): Use non drop frame calculation for NTSC
+            rates.
+
+    Returns:
+        array: An ``array("q")`` of frame counts.
+    """
+    rate = get_rate(framerate, force_non_drop_frame)
+    # the frame count is linear in the frames part of a label, so the common
+    # "HH:MM:SS:FF" labels are converted with the cached count of their second
+    seconds: dict[str, int] = {}
+    frames = array(FRAMES_TYPECODE)
+    append = frames.append
+    for label in labels:
+        if len(label) == 11 and label[8] in ":;":
+            second = label[:8]
+            base = seconds.get(second)
+            if base is None:
+                base = seconds[second] = label_to_frames(rate, f"{second}:00")
+            append(base + int(label[9:]))
+        else:
+            append(label_to_frames(rate, label))
+    return frames
+
+
+def map_frames_to_labels(
+    frames_iterable: Iterable[int],
+    framerate: str | float | Fraction,
+    workers: None | int = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    force_non_drop_frame: bool = False,
+    *,
+    threads: bool = False,
+) -> Iterator[str]:
+    """Convert frame counts to timecode labels using a pool of processes.
+
+    The input is consumed lazily, only ``2 * workers`` chunks are in flight at
+    any time and the labels are yielded in the input order. If the input fits
+    in a single chunk or ``workers`` is 1 the conversion is done in this
+    process.
+
+    Args:
+        frames_iterable (Iterable[int]): The frame counts.
+        framerate (str | int | float | Fraction): The frame rate, see
+            :class:`.Timecode` for the accepted values.
+        workers (None | int): The number of worker processes. Defaults to the
+            number of CPUs.
+        chunk_size (int): The number of frame counts sent to a worker at once.
+        force_non_drop_frame (bool): Use non drop frame calculation for NTSC
+            rates.
+        threads (bool): Use a pool of threads instead of processes.
+
+    Raises:
+        ValueError: If the chunk size is not positive.
+
+    Yields:
+        str: The timecode labels.
+    """
+    _check_chunk_size(chunk_size)
+    return _map_chunks(
+        frames_to_labels,
+        _frames_to_labels_worker,
+        _encode_frames,
+        _decode_labels,
+        frames_iterable,
+        framerate=framerate,
+        workers=workers,
+        chunk_size=chunk_size,
+        force_non_drop_frame=force_non_drop_frame,
+        threads=threads,
+    )
+
+
+def map_labels_to_frames(
+    labels_iterable: Iterable[str],
+    framerate: str | float | Fraction,
+    workers: None | int = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    force_non_drop_frame: bool = False,
+    *,
+    threads: bool = False,
+) -> Iterator[int]:
+    """Convert timecode labels to frame counts using a pool of processes.
+
+    This is the reverse of :func:`.map_frames_to_labels` and follows the same
+    chunking, ordering and fallback rules.
+
+    Args:
+        labels_iterable (Iterable[str]): The timecode labels.
+        framerate (str | int | float | Fraction): The frame rate, see
+            :class:`.Timecode` for the accepted values.
+        workers (None | int): The number of worker processes. Defaults to the
+            number of CPUs.
+        chunk_size (int): The number of labels sent to a worker at once.
+        force_non_drop_frame (bool): Use non drop frame calculation for NTSC
+            rates.
+        threads (bool): Use a pool of threads instead of processes.
+
+    Raises:
+        ValueError: If the chunk size is not positive.
+
+    Yields:
+        int: The frame counts.
+    """
+    _check_chunk_size(chunk_size)
+    return _map_chunks(
+        labels_to_frames,
+        _labels_to_frames_worker,
+        _encode_labels,
+        _decode_frames,
+        labels_iterable,
+        framerate=framerate,
+        workers=workers,
+        chunk_size=chunk_size,
+        force_non_drop_frame=force_non_drop_frame,
+        threads=threads,
+    )
+
+
+def _check_chunk_size(chunk_size: int) -> None:
+    """Check the given chunk size.
+
+    Args:
+        chunk_size (int): The number of items in a chunk.
+
+    Raises:
+        ValueError: If the chunk size is not positive.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size should be a positive integer, not {chunk_size}")
+
+
+def _map_chunks(
+    local_func: Callable,
+    worker_func: Callable,
+    encode: Callable,
+    decode: Callable,
+    iterable: Iterable,
+    *,
+    framerate: str | float | Fraction,
+    workers: None | int,
+    chunk_size: int,
+    force_non_drop_frame: bool,
+    threads: bool,
+) -> Iterator:
+    """Run the conversion over chunks of the given iterable.
+
+    Args:
+        local_func (Callable): The in-process conversion function.
+        worker_func (Callable): The function run in the worker processes, it
+            takes and returns encoded chunks.
+        encode (Callable): Encodes a chunk for the worker.
+        decode (Callable): Decodes a worker result to an iterable.
+        iterable (Iterable): The input items.
+        framerate (str | int | float | Fraction): The frame rate.
+        workers (None | int): The number of worker processes or threads.
+        chunk_size (int): The number of items in a chunk.
+        force_non_drop_frame (bool): Use non drop frame calculation for NTSC
+            rates.
+        threads (bool): Use a pool of threads instead of processes.
+
+    Yields:
+        The converted items in the input order.
+    """
+    workers = workers or os.cpu_count() or 1
+    chunks = _chunked(iterable, chunk_size)
+
+    # small inputs are not worth the process start up and transfer costs
+    head = list(islice(chunks, 2))
+    if workers == 1 or len(head) < 2:
+        for chunk in chain(head, chunks):
+            yield from local_func(chunk, framerate, force_non_drop_frame)
+        return
+
+    if threads:
+        # threads share the memory, so there is nothing to encode
+        executor_class: type[Executor] = ThreadPoolExecutor
+        worker_func = local_func
+        encode = decode = _identity
+    else:
+        executor_class = ProcessPoolExecutor
+
+    max_pending = 2 * workers
+    with executor_class(max_workers=workers) as executor:
+        pending: deque[Future] = deque()
+        try:
+            for chunk in chain(head, chunks):
+                pending.append(
+                    executor.submit(
+                        worker_func, encode(chunk), framerate, force_non_drop_frame
+                    )
+                )
+                if len(pending) >= max_pending:
+                    yield from decode(pending.popleft().result())
+            while pending:
+                yield from decode(pending.popleft().result())
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def _chunked(iterable: Iterable, chunk_size: int) -> Iterator[list]:
+    """Split the given iterable into lists of chunk_size items.
+
+    Args:
+        iterable (Iterable): The input items.
+        chunk_size (int): The maximum number of items in a chunk.
+
+    Yields:
+        list: The chunks.
+    """
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _identity(chunk: Iterable) -> Iterable:
+    """Return the given chunk as is.
+
+    Args:
+        chunk (Iterable): A chunk.
+
+    Returns:
+        Iterable: The same chunk.
+    """
+    return chunk
+
+
+def _encode_frames(frames: list[int]) -> bytes:
+    """Pack the given frame counts to bytes.
+
+    Args:
+        frames (list[int]): The frame counts.
+
+    Returns:
+        bytes: The packed frame counts.
+    """
+    return array(FRAMES_TYPECODE, frames).tobytes()
+
+
+def _decode_frames(payload: bytes) -> array:
+    """Unpack frame counts packed with :func:`._encode_frames`.
+
+    Args:
+        payload (bytes): The packed frame counts.
+
+    Returns:
+        array: The frame counts.
+    """
+    frames = array(FRAMES_TYPECODE)
+    frames.frombytes(payload)
+    return frames
+
+
+def _encode_labels(labels: list[str]) -> str:
+    """Join the given labels to a single str.
+
+    Args:
+        labels (list[str]): The labels.
+
+    Returns:
+        str: The newline separated labels.
+    """
+    return "\n".join(labels)
+
+
+def _decode_labels(payload: str) -> list[str]:
+    """Split labels joined with :func:`._encode_labels`.
+
+    Args:
+        payload (str): The newline separated labels.
+
+    Returns:
+        list[str]: The labels.
+    """
+    return payload.split("\n")
+
+
+def _frames_to_labels_worker(
+    payload: bytes, framerate: str | float | Fraction, force_non_drop_frame: bool
+) -> str:
+    """Convert a packed chunk of frame counts to labels in a worker process.
+
+    Args:
+        payload (bytes): The packed frame counts.
+        framerate (str | int | float | Fraction): The frame rate.
+        force_non_drop_frame (bool): Use non drop frame calculation for NTSC
+            rates.
+
+    Returns:
+        str: The newline separated labels.
+    """
+    return _encode_labels(
+        frames_to_labels(_decode_frames(payload), framerate, force_non_drop_frame)
+    )
+
+
+def _labels_to_frames_worker(
+    payload: str, framerate: str | float | Fraction, force_non_drop_frame: bool
+) -> bytes:
+    """Convert a chunk of newline separated labels to packed frame counts.
+
+    Args:
+        payload (str): The newline separated labels.
+        framerate (str | int | float | Fraction): The frame rate.
+        force_non_drop_frame (bool): Use non drop frame calculation for NTSC
+            rates.
+
+    Returns:
+        bytes: The packed frame counts.
+    """
+    return labels_to_frames(
+        _decode_labels(payload), framerate, force_non_drop_frame
+    ).tobytes()
@@ -0,0 +1,241 @@
+"""Per-second and per-minute aggregation of timecoded measurements.
+
+:class:`.BucketAggregator` rolls per-frame measurements up into buckets of
+seconds or minutes of the timecode labels, keeping a running count, sum,
+minimum and maximum per bucket in compact arrays::
+
+    from timecode.buckets import MINUTE, BucketAggregator
+
+    aggregator = BucketAggregator("29.97", MINUTE)
+    aggregator.add_many(frames, loudness)
+    for bucket in aggregator.buckets():
+        print(bucket.label, bucket.count, bucket.mean, bucket.maximum)
+
+With drop frame rates the seconds are not of the same length, the first
+second of most of the minutes is two frames (four at 59.94) shorter. The
+frame count each bucket starts at is precomputed from the labels of the rate,
+so the buckets exactly follow the labels, and frame counts are mapped to
+buckets with a binary search instead of the drop frame arithmetic.
+
+Frame counts beyond 24 hours roll over to the buckets of the next day.
+
+Chunks of frame counts which are in ascending order (which is the case for
+per-frame measurements) are aggregated a bucket at a time, using the built in
+``sum()``, ``min()`` and ``max()`` over the slice of values of each bucket.
+"""
+
+# Standard Library Imports
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from itertools import islice
+from math import inf
+from operator import le
+from typing import TYPE_CHECKING, NamedTuple
+
+from timecode.core import components_to_frames, get_rate
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+    from fractions import Fraction
+
+    from timecode.core import FrameRate
+
+
+SECOND = "second"
+"""str: Buckets of a second."""
+
+MINUTE = "minute"
+"""str: Buckets of a minute."""
+
+
+class Bucket(NamedTuple):
+    """The aggregated values of a bucket.
+
+    Attributes:
+        label (str): The "HH:MM:SS" label of the bucket, seconds are "00" for
+            minute buckets.
+        start (int): The frame count of the first frame of the bucket.
+        count (int): The number of values.
+        total (float): The sum of the values.
+        minimum (float): The minimum value.
+        maximum (float): The maximum value.
+    """
+
+    label: str
+    start: int
+    count: int
+    total: float
+    minimum: float
+    maximum: float
+
+    @property
+    def mean(self) -> float:
+        """Return the mean of the values.
+
+        Returns:
+            float: The mean value.
+        """
+        return self.total / self.count
+
+
+@lru_cache(maxsize=32)
+def bucket_starts(rate: FrameRate, resolution: str = SECOND) -> array:
+    """Return the frame counts the buckets of a day start at.
+
+    Args:
+        rate (FrameRate): The frame rate descriptor.
+        resolution (str): Either :data:`.SECOND` or :data:`.MINUTE`.
+
+    Returns:
+        array: An ``array("q")`` of the frame count of the first frame of each
+            bucket, followed by the frame count of the first frame of the next
+            day. The result is cached, do not modify it.
+    """
+    if resolution not in (SECOND, MINUTE):
+        raise ValueError(
+            f"resolution should be one of {SECOND!r} or {MINUTE!r}, not {resolution!r}"
+        )
+    seconds = range(60) if resolution == SECOND else range(1)
+    starts = array("q")
+    for hours in range(24):
+        for minutes in range(60):
+            # the first labels of the minutes are dropped in drop frame
+            dropped = rate.drop_frames if minutes % 10 else 0
+            for secs in seconds:
+                first_frame = 0 if secs else dropped
+                starts.append(
+                    components_to_frames(rate, hours, minutes, secs, first_frame)
+                )
+    starts.append(rate.frames_per_24_hours + 1)
+    return starts
+
+
+class BucketAggregator:
+    """Aggregates values into buckets of the timecode labels.
+
+    Args:
+        framerate (str | int | float | Fraction): The frame rate, see
+            :class:`.Timecode` for the accepted values.
+        resolution (str): Either :data:`.SECOND` or :data:`.MINUTE`.
+        force_non_drop_frame (bool): Use non drop frame calculation for NTSC
+            rates.
+
+    Attributes:
+        counts (array): The number of values of each bucket.
+        totals (array): The sum of the values of each bucket.
+        minimums (array): The minimum value of each bucket, ``inf`` for empty
+            buckets.
+        maximums (array): The maximum value of each bucket, ``-inf`` for empty
+            buckets.
+    """
+
+    def __init__(
+        self,
+        framerate: str | float | Fraction,
+        resolution: str = SECOND,
+        force_non_drop_frame: bool = False,
+    ) -> None:
+        self.rate = get_rate(framerate, force_non_drop_frame)
+        self.resolution = resolution
+        self._starts = bucket_starts(self.rate, resolution)
+        n_buckets = len(self._starts) - 1
+        self.counts = array("q", [0]) * n_buckets
+        self.totals = array("d", [0.0]) * n_buckets
+        self.minimums = array("d", [inf]) * n_buckets
+        self.maximums = array("d", [-inf]) * n_buckets
+
+    def bucket_index(self, frames: int) -> int:
+        """Return the index of the bucket of the given frame count.
+
+        Args:
+            frames (int): The frame count, where "00:00:00:00" is 1.
+
+        Returns:
+            int: The bucket index.
+        """
+        day_frames = self.rate.frames_per_24_hours
+        return bisect_right(self._starts, (frames - 1) % day_frames + 1) - 1
+
+    def add(self, frames: int, value: float) -> None:
+        """Add a single value.
+
+        Args:
+            frames (int): The frame count of the value.
+            value (float): The value.
+        """
+        index = self.bucket_index(frames)
+        self.counts[index] += 1
+        self.totals[index] += value
+        self.minimums[index] = min(self.minimums[index], value)
+        self.maximums[index] = max(self.maximums[index], value)
+
+    def add_many(self, frames: Sequence[int], values: Sequence[float]) -> None:
+        """Add the given values.
+
+        Args:
+            frames (Sequence[int]): The frame counts of the values.
+            values (Sequence[float]): The values.
+        """
+        if len(frames) != len(values):
+            raise ValueError(
+                f"frames and values should be of the same length, not "
+                f"{len(frames)} and {len(values)}"
+            )
+        if all(map(le, frames, islice(frames, 1, None))):
+            self._add_sorted(frames, values)
+            return
+        add = self.add
+        for frame, value in zip(frames, values):
+            add(frame, value)
+
+    def _add_sorted(self, frames: Sequence[int], values: Sequence[float]) -> None:
+        """Add the given values with ascending frame counts.
+
+        Args:
+            frames (Sequence[int]): The frame counts of the values, in
+                ascending order.
+            values (Sequence[float]): The values.
+        """
+        starts = self._starts
+        day_frames = self.rate.frames_per_24_hours
+        counts = self.counts
+        totals = self.totals
+        minimums = self.minimums
+        maximums = self.maximums
+        n_values = len(frames)
+        i = 0
+        while i < n_values:
+            day, day_frame = divmod(frames[i] - 1, day_frames)
+            index = bisect_right(starts, day_frame + 1) - 1
+            end = bisect_left(frames, starts[index + 1] + day * day_frames, i)
+            chunk = values[i:end]
+            counts[index] += end - i
+            totals[index] += sum(chunk)
+            minimums[index] = min(minimums[index], min(chunk))
+            maximums[index] = max(maximums[index], max(chunk))
+            i = end
+
+    def buckets(self) -> Iterator[Bucket]:
+        """Yield the non empty buckets.
+
+        Yields:
+            Bucket: The buckets in label order.
+        """
+        per_hour = 3600 if self.resolution == SECOND else 60
+        per_minute = 60 if self.resolution == SECOND else 1
+        for index, count in enumerate(self.counts):
+            if not count:
+                continue
+            hours, rest = divmod(index, per_hour)
+            minutes, seconds = divmod(rest, per_minute)
+            yield Bucket(
+                f"{hours:02d}:{minutes:02d}:{seconds:02d}",
+                self._starts[index],
+                count,
+                self.totals[index],
+                self.minimums[index],
+                self.maximums[index],
+            )
@@ -0,0 +1,368 @@
+"""Streaming retimer for SCC, SRT and WebVTT caption files.
+
+The caption files are processed line by line, only the cue timestamps are
+rewritten and every other byte is copied as is, so the whole file is never
+loaded into memory and retiming by a zero offset gives an identical file. SCC
+labels which are not valid in their frame rate, like the dropped
+"00:01:00;00" of 29.97 DF, raise a ValueError instead of moving the cue::
+
+    from timecode.captions import retime_file
+
+    # shift the captions of a 29.97 DF timeline by 10 seconds
+    retime_file("in.scc", "out.scc", offset=300)
+
+    # conform the subtitles of a 23.976 timeline to 25 fps (PAL speed up)
+    retime_file("in.srt", "out.srt", framerate="23.976", target_framerate="25")
+
+The timestamps are converted to frames of the source frame rate, the offset is
+added in that frame space and the frames are converted to the target frame
+rate with exact rational arithmetic. SCC timestamps are timecode labels (";"
+for drop frame and ":" for non drop frame labels), and SRT
+(``HH:MM:SS,mmm``) and WebVTT (``HH:MM:SS.mmm``) timestamps are real time
+milliseconds, which are handled with the milliseconds based frame rate.
+"""
+
+# Standard Library Imports
+from __future__ import annotations
+
+import os
+import re
+import uuid
+from math import gcd
+from typing import TYPE_CHECKING
+
+from timecode.core import (
+    components_to_frames,
+    frames_to_components,
+    frames_to_label,
+    get_rate,
+    label_to_frames,
+    round_div,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from fractions import Fraction
+
+
+SCC = "scc"
+"""str: The Scenarist SCC caption format."""
+
+SRT = "srt"
+"""str: The SubRip caption format."""
+
+VTT = "vtt"
+"""str: The WebVTT caption format."""
+
+FORMATS = {".scc": SCC, ".srt": SRT, ".vtt": VTT}
+"""dict: The caption formats by file extension."""
+
+_SCC_LABEL = re.compile(r"\d{2}:\d{2}:\d{2}[:;]\d{2}")
+_SRT_TIME = re.compile(r"(\d{2,}):(\d{2}):(\d{2}),(\d{3})")
+_VTT_TIME = re.compile(r"(?:(\d{2,}):)?(\d{2}):(\d{2})\.(\d{3})")
+_VTT_INLINE_TIME = re.compile(r"<((?:\d{2,}:)?\d{2}:\d{2}\.\d{3})>")
+
+_MS_RATE = get_rate("ms")
+
+
+class CaptionRetimer:
+    """Retimes the timestamps of caption lines.
+
+    Args:
+        fmt (str): The caption format, one of :data:`.SCC`, :data:`.SRT` or
+            :data:`.VTT`.
+        framerate (str | int | float | Fraction): The frame rate of the
+            timeline the captions belong to, see :class:`.Timecode` for the
+            accepted values. For SCC files this is also the rate of the
+            labels. Defaults to "29.97".
+        offset (int): The number of frames (in the source frame rate) to add
+            to every timestamp, can be negative.
+        target_framerate (None | str | int | float | Fraction): The frame rate
+            to convert the timestamps to. The default None keeps the source
+            frame rate.
+    """
+
+    def __init__(
+        self,
+        fmt: str,
+        framerate: str | float | Fraction = "29.97",
+        offset: int = 0,
+        target_framerate: None | str | float | Fraction = None,
+    ) -> None:
+        if fmt not in (SCC, SRT, VTT):
+            raise ValueError(
+                f"fmt should be one of {SCC!r}, {SRT!r} or {VTT!r}, not {fmt!r}"
+            )
+        if not isinstance(offset, int):
+            raise TypeError(
+                f"{self.__class__.__name__}.offset should be an integer, not "
+                f"{offset.__class__.__name__}"
+            )
+        if target_framerate is None:
+            target_framerate = framerate
+
+        self.fmt = fmt
+        self.offset = offset
+        self.source_rates = (
+            get_rate(framerate),
+            get_rate(framerate, force_non_drop_frame=True),
+        )
+        self.target_rates = (
+            get_rate(target_framerate),
+            get_rate(target_framerate, force_non_drop_frame=True),
+        )
+
+        source = self.source_rates[0]
+        target = self.target_rates[0]
+        # target frames = source frames * _scale_num / _scale_den
+        scale_num = target.numerator * source.denominator
+        scale_den = target.denominator * source.numerator
+        divisor = gcd(scale_num, scale_den)
+        self._scale_num = scale_num // divisor
+        self._scale_den = scale_den // divisor
+
+        # target ms = (ms * _ms_num + _ms_offset) * _ms_scale_num / _ms_scale_den
+        self._ms_num = source.numerator
+        self._ms_offset = offset * 1000 * source.denominator
+        self._ms_scale_num = target.denominator
+        self._ms_scale_den = source.denominator * target.numerator
+
+        self.retime_line = {
+            SCC: self._retime_scc_line,
+            SRT: self._retime_srt_line,
+            VTT: self._retime_vtt_line,
+        }[fmt]
+
+    def retime_frames(self, frames: int) -> int:
+        """Retime the given frame count.
+
+        Args:
+            frames (int): The frame count in the source frame rate, where
+                "00:00:00:00" is 1.
+
+        Returns:
+            int: The frame count in the target frame rate.
+        """
+        frame_number = round_div(
+            (frames - 1 + self.offset) * self._scale_num, self._scale_den
+        )
+        if frame_number < 0:
+            raise ValueError(
+                f"The retimed timestamp of frame {frames} is before 00:00:00:00"
+            )
+        return frame_number + 1
+
+    def retime_ms(self, ms: int) -> int:
+        """Retime the given real time milliseconds.
+
+        Args:
+            ms (int): The milliseconds on the source timeline.
+
+        Returns:
+            int: The milliseconds on the target timeline.
+        """
+        retimed = round_div(
+            (ms * self._ms_num + self._ms_offset) * self._ms_scale_num,
+            self._ms_scale_den,
+        )
+        if retimed < 0:
+            raise ValueError(f"The retimed timestamp of {ms} ms is negative")
+        return retimed
+
+    def retime_lines(self, lines: Iterable[str]) -> Iterator[str]:
+        """Retime the given lines.
+
+        Args:
+            lines (Iterable[str]): The lines of a caption file, including the
+                line endings.
+
+        Yields:
+            str: The retimed lines.
+        """
+        retime_line = self.retime_line
+        for line in lines:
+            yield retime_line(line)
+
+    def _retime_scc_label(self, match: re.Match) -> str:
+        """Retime an SCC label.
+
+        Args:
+            match (re.Match): The label match.
+
+        Raises:
+            ValueError: If the label is not valid in the source frame rate.
+
+        Returns:
+            str: The retimed label.
+        """
+        label = match.group()
+        index = 0 if label[8] == ";" else 1
+        rate = self.source_rates[index]
+        frames = label_to_frames(rate, label)
+        # the dropped labels and the frames past the frame rate would silently
+        # move the cue, the separator is not checked
+        if frames_to_label(rate, frames).replace(";", ":") != label.replace(";", ":"):
+            line = match.string.rstrip("\r\n")
+            raise ValueError(
+                f"Invalid {rate.framerate} timecode {label} in SCC line {line!r}"
+            )
+        return frames_to_label(self.target_rates[index], self.retime_frames(frames))
+
+    def _retime_scc_line(self, line: str) -> str:
+        """Retime the label at the start of an SCC line.
+
+        Args:
+            line (str): The line.
+
+        Returns:
+            str: The retimed line.
+        """
+        if not line[:1].isdigit():
+            return line
+        match = _SCC_LABEL.match(line)
+        if match is None:
+            return line
+        return self._retime_scc_label(match) + line[match.end() :]
+
+    def _retime_ms(self, hrs: str | None, mins: str, secs: str, ms: str) -> tuple:
+        """Retime the given timestamp fields.
+
+        Args:
+            hrs (str | None): The hours field, can be None for WebVTT.
+            mins (str): The minutes field.
+            secs (str): The seconds field.
+            ms (str): The milliseconds field.
+
+        Returns:
+            tuple: The retimed hours, minutes, seconds and milliseconds.
+        """
+        frames = components_to_frames(
+            _MS_RATE, int(hrs or 0), int(mins), int(secs), int(ms)
+        )
+        return frames_to_components(
+            _MS_RATE, self.retime_ms(frames - 1) + 1, rollover=False
+        )
+
+    def _retime_srt_time(self, match: re.Match) -> str:
+        """Retime an SRT timestamp.
+
+        Args:
+            match (re.Match): The timestamp match.
+
+        Returns:
+            str: The retimed timestamp.
+        """
+        hrs, mins, secs, ms = self._retime_ms(*match.groups())
+        return f"{hrs:02d}:{mins:02d}:{secs:02d},{ms:03d}"
+
+    def _retime_srt_line(self, line: str) -> str:
+        """Retime the timestamps of an SRT cue timing line.
+
+        Args:
+            line (str): The line.
+
+        Returns:
+            str: The retimed line.
+        """
+        if "-->" not in line:
+            return line
+        return _SRT_TIME.sub(self._retime_srt_time, line)
+
+    def _retime_vtt_time(self, match: re.Match) -> str:
+        """Retime a WebVTT timestamp, hours are only written if needed.
+
+        Args:
+            match (re.Match): The timestamp match.
+
+        Returns:
+            str: The retimed timestamp.
+        """
+        hrs, mins, secs, ms = self._retime_ms(*match.groups())
+        if hrs or match.group(1) is not None:
+            return f"{hrs:02d}:{mins:02d}:{secs:02d}.{ms:03d}"
+        return f"{mins:02d}:{secs:02d}.{ms:03d}"
+
+    def _retime_vtt_inline_time(self, match: re.Match) -> str:
+        """Retime a WebVTT inline timestamp tag.
+
+        Args:
+            match (re.Match): The timestamp tag match.
+
+        Returns:
+            str: The retimed timestamp tag.
+        """
+        return f"<{_VTT_TIME.sub(self._retime_vtt_time, match.group(1))}>"
+
+    def _retime_vtt_line(self, line: str) -> str:
+        """Retime the timestamps of a WebVTT cue timing or cue text line.
+
+        Args:
+            line (str): The line.
+
+        Returns:
+            str: The retimed line.
+        """
+        if "-->" in line:
+            return _VTT_TIME.sub(self._retime_vtt_time, line)
+        if "<" in line:
+            return _VTT_INLINE_TIME.sub(self._retime_vtt_inline_time, line)
+        return line
+
+
+def retime_file(
+    src_path: str | os.PathLike,
+    dst_path: str | os.PathLike,
+    fmt: None | str = None,
+    *,
+    framerate: str | float | Fraction = "29.97",
+    offset: int = 0,
+    target_framerate: None | str | float | Fraction = None,
+) -> int:
+    """Retime the given caption file.
+
+    The file is streamed line by line and the line endings and the encoding
+    are preserved as is. The lines are written to a temporary file next to
+    ``dst_path`` which replaces it once the whole file is retimed, so a failed
+    retime leaves no partial file and keeps an existing ``dst_path``.
+
+    Args:
+        src_path (str | os.PathLike): The path of the source caption file.
+        dst_path (str | os.PathLike): The path of the retimed caption file.
+        fmt (None | str): The caption format, see :class:`.CaptionRetimer`.
+            The default None detects the format from the file extension.
+        framerate (str | int | float | Fraction): The source frame rate.
+        offset (int): The number of frames to add to every timestamp.
+        target_framerate (None | str | int | float | Fraction): The target
+            frame rate.
+
+    Raises:
+        ValueError: If the format can not be detected from the extension, if
+            it is not supported, if an SCC label is not valid in the source
+            frame rate or if a retimed timestamp is before 00:00:00:00.
+
+    Returns:
+        int: The number of lines written.
+    """
+    if fmt is None:
+        extension = os.path.splitext(os.fspath(src_path))[1].lower()
+        if extension not in FORMATS:
+            raise ValueError(f"Can not detect the caption format of {src_path!s}")
+        fmt = FORMATS[extension]
+
+    retimer = CaptionRetimer(fmt, framerate, offset, target_framerate)
+    count = 0
+    options = {"encoding": "utf-8", "errors": "surrogateescape", "newline": ""}
+    tmp_path = f"{os.fspath(dst_path)}.{uuid.uuid4().hex[:8]}.tmp"
+    try:
+        with open(src_path, **options) as src:  # noqa: SIM117
+            with open(tmp_path, "x", **options) as dst:
+                write = dst.write
+                for line in retimer.retime_lines(src):
+                    write(line)
+                    count += 1
+        os.replace(tmp_path, dst_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return count
@@ -0,0 +1,567 @@
+"""Append-only binary capture logs of timecodes.
+
+Capture rigs log the timecode of every frame for hours, 432,000 records per
+hour at 120 fps, and later query time ranges of them. A text log is slow to
+write and has to be read from the start to find a range. The capture log is a
+fixed width binary format instead, so the :class:`.CaptureLogReader` finds the
+records of a timecode range with a binary search over a memory map::
+
+    from timecode.capture import CaptureLogReader, CaptureLogWriter
+
+    with CaptureLogWriter("take_01.tclog", "119.88") as log:
+        for tc, wallclock_ns, user_bits in frames:
+            log.write(tc, wallclock_ns, user_bits)
+
+    with CaptureLogReader("take_01.tclog") as log:
+        for record in log.query(Timecode("119.88", "01:00:00;00"),
+                                Timecode("119.88", "01:00:10;00")):
+            print(log.timecode(record), record.wallclock_ns)
+
+The file is a 16 bytes header followed by 20 bytes records, all little
+endian:
+
+* Header: the magic ``b"TCAP"``, the format version (uint16), the flags
+  (uint16, bit 0 is drop frame) and the numerator and the denominator of the
+  exact frame rate (uint32 each).
+* Record: the frame count (int64), the wallclock time in nanoseconds (int64)
+  and the user bits (uint32).
+
+The frame counts of the records are stored unwrapped, a timecode smaller than
+the previous one by more than half a day is taken as a midnight rollover and
+counted from the end of the previous day, so the frame counts of a log never
+decrease and can be searched. Timecodes going backwards otherwise are
+rejected.
+"""
+
+# Standard Library Imports
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import TYPE_CHECKING, NamedTuple
+
+from timecode.core import get_rate
+from timecode.timecode import Timecode
+
+if TYPE_CHECKING:
+    import sys
+    from collections.abc import Iterable, Iterator
+    from fractions import Fraction
+    from types import TracebackType
+
+    from timecode.core import FrameRate
+
+    if sys.version_info >= (3, 11):
+        from typing import Self
+    else:
+        from typing_extensions import Self
+
+
+MAGIC = b"TCAP"
+"""bytes: The first bytes of a capture log."""
+
+FORMAT_VERSION = 1
+"""int: The version of the capture log format."""
+
+DROP_FRAME_FLAG = 1
+"""int: The header flag of the drop frame rates."""
+
+HEADER = struct.Struct("<4sHHII")
+"""struct.Struct: The header, the magic, the version, the flags and the rate."""
+
+RECORD = struct.Struct("<qqI")
+"""struct.Struct: A record, the frame count, the wallclock ns and the user
+bits."""
+
+DEFAULT_BUFFER_RECORDS = 4096
+"""int: The default maximum number of records buffered by the writer."""
+
+DEFAULT_MAX_LATENCY = 0.25
+"""float: The default maximum age of a buffered record in seconds."""
+
+
+class CaptureRecord(NamedTuple):
+    """A record of a capture log.
+
+    Attributes:
+        frames (int): The unwrapped frame count, where "00:00:00:00" of the
+            first day is 1.
+        wallclock_ns (int): The wallclock time of the frame in nanoseconds.
+        user_bits (int): The 32 user bits of the timecode.
+    """
+
+    frames: int
+    wallclock_ns: int
+    user_bits: int
+
+
+def _pack_header(rate: FrameRate) -> bytes:
+    """Return the header of a capture log of the given rate.
+
+    Args:
+        rate (FrameRate): The frame rate descriptor.
+
+    Returns:
+        bytes: The header.
+    """
+    flags = DROP_FRAME_FLAG if rate.drop_frame else 0
+    return HEADER.pack(MAGIC, FORMAT_VERSION, flags, rate.numerator, rate.denominator)
+
+
+def _unpack_header(header: bytes) -> FrameRate:
+    """Return the frame rate of the given capture log header.
+
+    Args:
+        header (bytes): The header.
+
+    Raises:
+        ValueError: If the header is not a capture log header of a supported
+            version.
+
+    Returns:
+        FrameRate: The frame rate descriptor.
+    """
+    if len(header) < HEADER.size or header[:4] != MAGIC:
+        raise ValueError("Not a timecode capture log")
+    _, version, flags, numerator, denominator = HEADER.unpack_from(header)
+    if version != FORMAT_VERSION:
+        raise ValueError(
+            f"Unsupported capture log version: {version}, expected {FORMAT_VERSION}"
+        )
+    return get_rate(
+        (numerator, denominator),
+        force_non_drop_frame=not flags & DROP_FRAME_FLAG,
+    )
+
+
+class CaptureLogWriter:
+    """Append records to a capture log.
+
+    The records are buffered and written when the buffer is full or when the
+    oldest buffered record is older than ``max_latency`` seconds, which is
+    checked on each write. Call :meth:`.flush` when the capture pauses, the
+    buffer is flushed when the writer is closed.
+
+    An existing log is appended to, its frame rate should be the same. A
+    partial record left at its end by an interrupted capture is dropped.
+
+    Args:
+        path (str | os.PathLike): The path of the log.
+        framerate (str | int | float | Fraction): The frame rate, see
+            :class:`.Timecode` for the accepted values.
+        force_non_drop_frame (bool): Use non drop frame timecodes for NTSC
+            rates.
+        buffer_records (int): The maximum number of buffered records.
+        max_latency (float): The maximum age of a buffered record in seconds.
+        sync (bool): Call :func:`os.fsync` after each write to the file, so
+            the records survive a power loss.
+
+    Raises:
+        ValueError: If the existing log has a different frame rate.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        framerate: str | float | Fraction,
+        *,
+        force_non_drop_frame: bool = False,
+        buffer_records: int = DEFAULT_BUFFER_RECORDS,
+        max_latency: float = DEFAULT_MAX_LATENCY,
+        sync: bool = False,
+    ) -> None:
+        self.rate: FrameRate = get_rate(framerate, force_non_drop_frame)
+        self.buffer_records = buffer_records
+        self.max_latency = max_latency
+        self.sync = sync
+        self._buffer = bytearray()
+        self._buffered = 0
+        self._buffered_since = 0.0
+        self._last = 0
+        self._day_offset = 0
+
+        self._file = open(path, "a+b")  # noqa: SIM115
+        try:
+            self._open_log()
+        except BaseException:
+            self._file.close()
+            raise
+
+    def _open_log(self) -> None:
+        """Write the header of a new log or check the header of an existing one.
+
+        Raises:
+            ValueError: If the existing log has a different frame rate.
+        """
+        f = self._file
+        size = f.seek(0, os.SEEK_END)
+        header = _pack_header(self.rate)
+        if size < HEADER.size:
+            f.truncate(0)
+            f.write(header)
+            f.flush()
+            return
+        f.seek(0)
+        existing = f.read(HEADER.size)
+        rate = _unpack_header(existing)
+        if existing != header:
+            raise ValueError(
+                "Can not append to a capture log of a different frame rate: "
+                f"{rate.framerate} and {self.rate.framerate}"
+            )
+        # drop a partial record
+        records, rest = divmod(size - HEADER.size, RECORD.size)
+        if rest:
+            f.truncate(size - rest)
+        if records:
+            f.seek(HEADER.size + (records - 1) * RECORD.size)
+            self._last = RECORD.unpack(f.read(RECORD.size))[0]
+            day = self.rate.frames_per_24_hours
+            self._day_offset = (self._last - 1) // day * day
+        f.seek(0, os.SEEK_END)
+
+    def write(self, tc: Timecode | int, wallclock_ns: int, user_bits: int = 0) -> None:
+        """Append a record.
+
+        Args:
+            tc (Timecode | int): The timecode or its frame count.
+            wallclock_ns (int): The wallclock time of the frame in nanoseconds,
+                i.e. :func:`time.time_ns`.
+            user_bits (int): The 32 user bits of the timecode.
+
+        Raises:
+            ValueError: If the timecode goes backwards.
+        """
+        frames = tc.frames if isinstance(tc, Timecode) else tc
+        frames = self._unwrap(frames)
+        if not self._buffered:
+            self._buffered_since = time.monotonic()
+        self._buffer += RECORD.pack(frames, wallclock_ns, user_bits)
+        self._buffered += 1
+        if (
+            self._buffered >= self.buffer_records
+            or time.monotonic() - self._buffered_since >= self.max_latency
+        ):
+            self.flush()
+
+    def write_many(
+        self,
+        frames: Iterable[Timecode | int],
+        wallclock_ns: Iterable[int],
+        user_bits: None | Iterable[int] = None,
+    ) -> None:
+        """Append the records of the given columns.
+
+        Args:
+            frames (Iterable[Timecode | int]): The timecodes or their frame
+                counts.
+            wallclock_ns (Iterable[int]): The wallclock times in nanoseconds.
+            user_bits (None | Iterable[int]): The user bits, 0 by default.
+
+        Raises:
+            ValueError: If a timecode goes backwards.
+        """
+        unwrap = self._unwrap
+        pack = RECORD.pack
+        if user_bits is None:
+            records = [
+                pack(unwrap(f.frames if isinstance(f, Timecode) else f), w, 0)
+                for f, w in zip(frames, wallclock_ns)
+            ]
+        else:
+            records = [
+                pack(unwrap(f.frames if isinstance(f, Timecode) else f), w, u)
+                for f, w, u in zip(frames, wallclock_ns, user_bits)
+            ]
+        if not self._buffered:
+            self._buffered_since = time.monotonic()
+        self._buffer += b"".join(records)
+        self._buffered += len(records)
+        self.flush()
+
+    def _unwrap(self, frames: int) -> int:
+        """Return the unwrapped frame count of the given frame count.
+
+        Args:
+            frames (int): The frame count, in the day.
+
+        Raises:
+            ValueError: If the timecode goes backwards.
+
+        Returns:
+            int: The unwrapped frame count.
+        """
+        unwrapped = frames + self._day_offset
+        if unwrapped < self._last:
+            day = self.rate.frames_per_24_hours
+            if self._last - unwrapped <= day // 2:
+                raise ValueError(
+                    "The timecodes of a capture log should not go backwards, "
+                    f"{Timecode.from_rate(self.rate, frames)} is after "
+                    f"{Timecode.from_rate(self.rate, (self._last - 1) % day + 1)}"
+                )
+            # midnight rollover
+            self._day_offset += day
+            unwrapped += day
+        self._last = unwrapped
+        return unwrapped
+
+    def flush(self) -> None:
+        """Write the buffered records to the file."""
+        if self._buffer:
+            self._file.write(self._buffer)
+            self._buffer.clear()
+            self._buffered = 0
+        self._file.flush()
+        if self.sync:
+            os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        """Flush the buffered records and close the file."""
+        if not self._file.closed:
+            try:
+                self.flush()
+            finally:
+                self._file.close()
+
+    def __enter__(self) -> Self:
+        """Return this writer.
+
+        Returns:
+            Self: This writer.
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: None | type[BaseException],
+        exc_value: None | BaseException,
+        traceback: None | TracebackType,
+    ) -> None:
+        """Close the file.
+
+        Args:
+            exc_type (None | type[BaseException]): The exception type.
+            exc_value (None | BaseException): The exception.
+            traceback (None | TracebackType): The traceback.
+        """
+        self.close()
+
+
+class _FrameColumn:
+    """The frame counts of the records of a memory map, for the binary search.
+
+    Args:
+        buffer (mmap.mmap | bytes): The content of the log.
+        count (int): The number of records.
+    """
+
+    __slots__ = ("_buffer", "_count", "_unpack_from")
+
+    def __init__(self, buffer: mmap.mmap | bytes, count: int) -> None:
+        self._buffer = buffer
+        self._count = count
+        self._unpack_from = struct.Struct("<q").unpack_from
+
+    def __len__(self) -> int:
+        """Return the number of records.
+
+        Returns:
+            int: The number of records.
+        """
+        return self._count
+
+    def __getitem__(self, index: int) -> int:
+        """Return the frame count of the record at the given index.
+
+        Args:
+            index (int): The index of the record.
+
+        Returns:
+            int: The frame count.
+        """
+        return self._unpack_from(self._buffer, HEADER.size + index * RECORD.size)[0]
+
+
+class CaptureLogReader:
+    """Read a capture log through a memory map.
+
+    The records written when the log is opened are read, open it again to read
+    the records appended since.
+
+    Args:
+        path (str | os.PathLike): The path of the log.
+
+    Raises:
+        ValueError: If the file is not a capture log of a supported version.
+    """
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size < HEADER.size:
+                raise ValueError("Not a timecode capture log")
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self.rate: FrameRate = _unpack_header(self._map[: HEADER.size])
+        except BaseException:
+            self._map.close()
+            raise
+        self._count = (len(self._map) - HEADER.size) // RECORD.size
+        self._frames = _FrameColumn(self._map, self._count)
+
+    def timecode(self, record: CaptureRecord | int) -> Timecode:
+        """Return the timecode of the given record.
+
+        Args:
+            record (CaptureRecord | int): The record or its frame count.
+
+        Returns:
+            Timecode: The timecode, in the day.
+        """
+        frames = record.frames if isinstance(record, CaptureRecord) else record
+        day = self.rate.frames_per_24_hours
+        return Timecode.from_rate(self.rate, (frames - 1) % day + 1)
+
+    def search(self, start: Timecode | int, end: Timecode | int) -> range:
+        """Return the indices of the records of the given range.
+
+        The timecodes are in the first day of the log, pass unwrapped frame
+        counts to search the following days.
+
+        Args:
+            start (Timecode | int): The first timecode or frame count.
+            end (Timecode | int): The last timecode or frame count, inclusive.
+
+        Returns:
+            range: The indices of the records.
+        """
+        if isinstance(start, Timecode):
+            start = start.frames
+        if isinstance(end, Timecode):
+            end = end.frames
+        first = bisect_left(self._frames, start)
+        return range(first, max(first, bisect_right(self._frames, end, first)))
+
+    def query(self, start: Timecode | int, end: Timecode | int) -> list[CaptureRecord]:
+        """Return the records of the given range.
+
+        Args:
+            start (Timecode | int): The first timecode or frame count.
+            end (Timecode | int): The last timecode or frame count, inclusive.
+
+        Returns:
+            list[CaptureRecord]: The records.
+        """
+        indices = self.search(start, end)
+        return self.read(indices.start, indices.stop)
+
+    def read(self, start: int = 0, stop: None | int = None) -> list[CaptureRecord]:
+        """Return the records between the given indices.
+
+        Args:
+            start (int): The index of the first record.
+            stop (None | int): The index after the last record, defaults to the
+                number of records.
+
+        Returns:
+            list[CaptureRecord]: The records.
+        """
+        start, stop, _ = slice(start, stop).indices(self._count)
+        stop = max(start, stop)
+        view = memoryview(self._map)[
+            HEADER.size + start * RECORD.size : HEADER.size + stop * RECORD.size
+        ]
+        try:
+            return [CaptureRecord._make(r) for r in RECORD.iter_unpack(view)]
+        finally:
+            view.release()
+
+    def columns(
+        self, start: int = 0, stop: None | int = None
+    ) -> tuple[array, array, array]:
+        """Return the columns of the records between the given indices.
+
+        Args:
+            start (int): The index of the first record.
+            stop (None | int): The index after the last record.
+
+        Returns:
+            tuple[array, array, array]: An ``array("q")`` of the frame counts,
+                an ``array("q")`` of the wallclock times and an ``array("L")``
+                of the user bits.
+        """
+        records = self.read(start, stop)
+        return (
+            array("q", [r[0] for r in records]),
+            array("q", [r[1] for r in records]),
+            array("L", [r[2] for r in records]),
+        )
+
+    def __len__(self) -> int:
+        """Return the number of records.
+
+        Returns:
+            int: The number of records.
+        """
+        return self._count
+
+    def __getitem__(self, index: int) -> CaptureRecord:
+        """Return the record at the given index.
+
+        Args:
+            index (int): The index of the record.
+
+        Raises:
+            IndexError: If the index is out of range.
+
+        Returns:
+            CaptureRecord: The record.
+        """
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("capture log index out of range")
+        return CaptureRecord._make(
+            RECORD.unpack_from(self._map, HEADER.size + index * RECORD.size)
+        )
+
+    def __iter__(self) -> Iterator[CaptureRecord]:
+        """Iterate over the records.
+
+        Yields:
+            CaptureRecord: The records.
+        """
+        chunk = 65536
+        for start in range(0, self._count, chunk):
+            yield from self.read(start, start + chunk)
+
+    def close(self) -> None:
+        """Close the memory map."""
+        self._map.close()
+
+    def __enter__(self) -> Self:
+        """Return this reader.
+
+        Returns:
+            Self: This reader.
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: None | type[BaseException],
+        exc_value: None | BaseException,
+        traceback: None | TracebackType,
+    ) -> None:
+        """Close the memory map.
+
+        Args:
+            exc_type (None | type[BaseException]): The exception type.
+            exc_value (None | BaseException): The exception.
+            traceback (None | TracebackType): The traceback.
+        """
+        self.close()
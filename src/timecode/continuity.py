@@ -0,0 +1,441 @@
+"""Streaming continuity analyzer for per-frame timecode feeds.
+
+:class:`.ContinuityAnalyzer` consumes frame counts (or timecode labels) in
+chunks and splits them into run-length :class:`.Segment` records, holding only
+the open segment and a few counters in memory::
+
+    from timecode.continuity import JUMP, ContinuityAnalyzer
+
+    analyzer = ContinuityAnalyzer("29.97")
+    for chunk in chunks:
+        for segment in analyzer.feed_labels(chunk):
+            if segment.kind == JUMP:
+                print(segment)
+    segments = analyzer.finish()
+    print(analyzer.stats)
+
+A segment starts at every break of the continuity and its kind tells what the
+break is:
+
+* :data:`.CONTINUOUS`: The first segment, or the samples continuing from the
+  last sample before a repeat or an illegal label.
+* :data:`.JUMP`: The samples after a jump, the ``step`` of the segment is the
+  difference from the last sample before it.
+* :data:`.ROLLOVER`: The samples after the 24 hour rollover.
+* :data:`.REPEAT`: The samples repeating the last sample.
+* :data:`.ILLEGAL`: Drop frame labels which are skipped by the drop frame
+  rules, i.e. "00:01:00;00". They are not taken into account in the
+  continuity of the other samples.
+
+Continuous and repeated runs of frame counts are found by comparing whole
+slices of ``array("q")`` instances with the expected values, so long
+uninterrupted feeds are processed at the speed of a memory comparison instead
+of a Python loop per sample.
+"""
+
+# Standard Library Imports
+from __future__ import annotations
+
+from array import array
+from itertools import islice
+from typing import TYPE_CHECKING, NamedTuple
+
+from timecode.core import get_rate, label_to_frames, split_label
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+    from fractions import Fraction
+
+
+CONTINUOUS = "continuous"
+"""str: Samples continuing the previous ones."""
+
+JUMP = "jump"
+"""str: Samples after a jump."""
+
+ROLLOVER = "rollover"
+"""str: Samples after the 24 hour rollover."""
+
+REPEAT = "repeat"
+"""str: Samples repeating the previous sample."""
+
+ILLEGAL = "illegal"
+"""str: Drop frame labels which do not exist."""
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+"""int: The default number of samples processed at once by the functions."""
+
+_FIRST_SLICE = 8
+
+
+class Segment(NamedTuple):
+    """A run of samples of the same kind.
+
+    Attributes:
+        kind (str): One of :data:`.CONTINUOUS`, :data:`.JUMP`,
+            :data:`.ROLLOVER`, :data:`.REPEAT` or :data:`.ILLEGAL`.
+        start (int): The index of the first sample of the segment.
+        count (int): The number of samples in the segment.
+        first (int): The frame count of the first sample.
+        last (int): The frame count of the last sample.
+        step (None | int): The difference of the first sample from the last
+            sample before the segment, None for the first segment and the
+            :data:`.ILLEGAL` segments.
+    """
+
+    kind: str
+    start: int
+    count: int
+    first: int
+    last: int
+    step: None | int
+
+
+class ContinuityStats(NamedTuple):
+    """The statistics of the analyzed samples.
+
+    Attributes:
+        samples (int): The number of samples.
+        segments (int): The number of segments, including the open one.
+        jumps (int): The number of jumps.
+        rollovers (int): The number of 24 hour rollovers.
+        repeats (int): The number of repeated samples.
+        illegal (int): The number of illegal drop frame labels.
+    """
+
+    samples: int
+    segments: int
+    jumps: int
+    rollovers: int
+    repeats: int
+    illegal: int
+
+
+class ContinuityAnalyzer:
+    """Finds the breaks in a stream of frame counts or timecode labels.
+
+    Args:
+        framerate (str | int | float | Fraction): The frame rate, see
+            :class:`.Timecode` for the accepted values.
+        force_non_drop_frame (bool): Use non drop frame calculation for NTSC
+            rates.
+    """
+
+    def __init__(
+        self, framerate: str | float | Fraction, force_non_drop_frame: bool = False
+    ) -> None:
+        self.rate = get_rate(framerate, force_non_drop_frame)
+        self._samples = 0
+        self._last: None | int = None
+        self._segment: None | list = None
+        self._counts = {JUMP: 0, ROLLOVER: 0, REPEAT: 0, ILLEGAL: 0}
+        self._segments = 0
+        # the frame count of each second and the number of its illegal labels,
+        # by the HH:MM:SS part of the labels
+        self._seconds: dict[str, tuple[int, int]] = {}
+
+    @property
+    def stats(self) -> ContinuityStats:
+        """Return the statistics of the samples analyzed so far.
+
+        Returns:
+            ContinuityStats: The statistics.
+        """
+        counts = self._counts
+        return ContinuityStats(
+            self._samples,
+            self._segments,
+            counts[JUMP],
+            counts[ROLLOVER],
+            counts[REPEAT],
+            counts[ILLEGAL],
+        )
+
+    def feed_frames(self, frames: Sequence[int]) -> list[Segment]:
+        """Analyze the given frame counts.
+
+        Args:
+            frames (Sequence[int]): The frame counts, where "00:00:00:00" is 1.
+                An ``array("q")`` is used as is, other sequences are copied to
+                one.
+
+        Returns:
+            list[Segment]: The segments completed by the given samples.
+        """
+        if not isinstance(frames, array) or frames.typecode != "q":
+            frames = array("q", frames)
+        done: list[Segment] = []
+        n_frames = len(frames)
+        i = 0
+        while i < n_frames:
+            frame = frames[i]
+            self._push(frame, done)
+            i += 1
+            segment = self._segment
+            # extend the segment with the following samples in bulk
+            step = 0 if segment[0] == REPEAT else 1  # type: ignore
+            count = _run_length(frames, i, frame + step, step)
+            if count:
+                i += count
+                self._last = frames[i - 1]
+                segment[2] += count  # type: ignore
+                segment[4] = self._last  # type: ignore
+                self._samples += count
+                if step == 0:
+                    self._counts[REPEAT] += count
+        return done
+
+    def feed_labels(self, labels: Iterable[str]) -> list[Segment]:
+        """Analyze the given timecode labels.
+
+        Args:
+            labels (Iterable[str]): The timecode labels.
+
+        Returns:
+            list[Segment]: The segments completed by the given samples.
+        """
+        done: list[Segment] = []
+        frames = array("q")
+        append = frames.append
+        for label in labels:
+            frame, illegal = self._parse(label)
+            if not illegal:
+                append(frame)
+                continue
+            if frames:
+                done.extend(self.feed_frames(frames))
+                frames = array("q")
+                append = frames.append
+            self._push_illegal(frame, done)
+        if frames:
+            done.extend(self.feed_frames(frames))
+        return done
+
+    def finish(self) -> list[Segment]:
+        """Complete the open segment.
+
+        The analyzer can be used for a new stream afterwards, the statistics
+        are kept.
+
+        Returns:
+            list[Segment]: The last segment, if there is one.
+        """
+        done: list[Segment] = []
+        self._close(done)
+        self._last = None
+        return done
+
+    def _close(self, done: list[Segment]) -> None:
+        """Complete the open segment.
+
+        Args:
+            done (list[Segment]): Collects the completed segments.
+        """
+        if self._segment is not None:
+            done.append(Segment(*self._segment))
+            self._segment = None
+
+    def _open(self, kind: str, frame: int, step: None | int, done: list) -> None:
+        """Complete the open segment and start a new one.
+
+        Args:
+            kind (str): The kind of the new segment.
+            frame (int): The frame count of its first sample.
+            step (None | int): The difference from the last sample.
+            done (list[Segment]): Collects the completed segments.
+        """
+        self._close(done)
+        self._segment = [kind, self._samples, 1, frame, frame, step]
+        self._segments += 1
+        if kind in self._counts:
+            self._counts[kind] += 1
+
+    def _push(self, frame: int, done: list[Segment]) -> None:
+        """Analyze a single frame count.
+
+        Args:
+            frame (int): The frame count.
+            done (list[Segment]): Collects the completed segments.
+        """
+        last = self._last
+        segment = self._segment
+        if last is None:
+            self._open(CONTINUOUS, frame, None, done)
+        else:
+            step = frame - last
+            kind = segment[0]  # type: ignore
+            if step == 0 and kind == REPEAT:
+                self._extend(frame)
+                self._counts[REPEAT] += 1
+            elif step == 0:
+                self._open(REPEAT, frame, 0, done)
+            elif step == 1 and kind not in (REPEAT, ILLEGAL):
+                self._extend(frame)
+            elif step == 1:
+                self._open(CONTINUOUS, frame, 1, done)
+            elif frame == 1 and last == self.rate.frames_per_24_hours:
+                self._open(ROLLOVER, frame, step, done)
+            else:
+                self._open(JUMP, frame, step, done)
+        self._last = frame
+        self._samples += 1
+
+    def _push_illegal(self, frame: int, done: list[Segment]) -> None:
+        """Analyze an illegal drop frame label.
+
+        Args:
+            frame (int): The frame count the label is converted to.
+            done (list[Segment]): Collects the completed segments.
+        """
+        segment = self._segment
+        if segment is not None and segment[0] == ILLEGAL:
+            self._extend(frame)
+            self._counts[ILLEGAL] += 1
+        else:
+            self._open(ILLEGAL, frame, None, done)
+        self._samples += 1
+
+    def _extend(self, frame: int) -> None:
+        """Add a sample to the open segment.
+
+        Args:
+            frame (int): The frame count of the sample.
+        """
+        segment = self._segment
+        segment[2] += 1  # type: ignore
+        segment[4] = frame  # type: ignore
+
+    def _parse(self, label: str) -> tuple[int, bool]:
+        """Convert the given label to a frame count.
+
+        Args:
+            label (str): The timecode label.
+
+        Returns:
+            tuple[int, bool]: The frame count and True if the label is an
+                illegal drop frame label.
+        """
+        if len(label) == 11 and label[8] in ":;":
+            second = label[:8]
+            cached = self._seconds.get(second)
+            if cached is None:
+                cached = self._seconds[second] = self._second(second)
+            frame = int(label[9:])
+            return cached[0] + frame, frame < cached[1]
+        hrs, mins, secs, frs = split_label(label)
+        _, illegal_frames = self._second(f"{hrs:02d}:{mins:02d}:{secs:02d}")
+        return label_to_frames(self.rate, label), frs < illegal_frames
+
+    def _second(self, second: str) -> tuple[int, int]:
+        """Return the frame count and the number of illegal labels of a second.
+
+        Args:
+            second (str): The "HH:MM:SS" part of a label.
+
+        Returns:
+            tuple[int, int]: The frame count of the frames part 00 and the
+                number of frames parts which are dropped in this second.
+        """
+        rate = self.rate
+        _, mins, secs, _ = split_label(f"{second}:00")
+        illegal_frames = 0
+        if rate.drop_frame and secs == 0 and mins % 10:
+            illegal_frames = rate.drop_frames
+        return label_to_frames(rate, f"{second}:00"), illegal_frames
+
+
+def _run_length(frames: array, start: int, first: int, step: int) -> int:
+    """Return the number of samples continuing a run.
+
+    The slices of the frame counts are compared with the expected values in
+    growing and shrinking sizes, so the length of a run is found with a few
+    comparisons done in C.
+
+    Args:
+        frames (array): The frame counts.
+        start (int): The index to start at.
+        first (int): The expected frame count at the start index.
+        step (int): The expected difference between the samples, 0 or 1.
+
+    Returns:
+        int: The number of samples following the run.
+    """
+    remaining = len(frames) - start
+    matched = 0
+    size = _FIRST_SLICE
+    while matched < remaining:
+        size = min(size, remaining - matched)
+        value = first + step * matched
+        if step:
+            expected = array("q", range(value, value + size))
+        else:
+            expected = array("q", [value]) * size
+        position = start + matched
+        if frames[position : position + size] == expected:
+            matched += size
+            size *= 2
+        elif size == 1:
+            break
+        else:
+            size //= 2
+    return matched
+
+
+def analyze_frames(
+    frames: Iterable[int],
+    framerate: str | float | Fraction,
+    *,
+    force_non_drop_frame: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[Segment]:
+    """Analyze the continuity of the given frame counts.
+
+    Args:
+        frames (Iterable[int]): The frame counts, where "00:00:00:00" is 1.
+        framerate (str | int | float | Fraction): The frame rate.
+        force_non_drop_frame (bool): Use non drop frame calculation for NTSC
+            rates.
+        chunk_size (int): The number of samples processed at once.
+
+    Yields:
+        Segment: The segments.
+    """
+    analyzer = ContinuityAnalyzer(framerate, force_non_drop_frame)
+    if isinstance(frames, array):
+        for start in range(0, len(frames), chunk_size):
+            yield from analyzer.feed_frames(frames[start : start + chunk_size])
+    else:
+        iterator = iter(frames)
+        while True:
+            chunk = array("q", islice(iterator, chunk_size))
+            if not chunk:
+                break
+            yield from analyzer.feed_frames(chunk)
+    yield from analyzer.finish()
+
+
+def analyze_labels(
+    labels: Iterable[str],
+    framerate: str | float | Fraction,
+    *,
+    force_non_drop_frame: bool = False,
+) -> Iterator[Segment]:
+    """Analyze the continuity of the given timecode labels.
+
+    Args:
+        labels (Iterable[str]): The timecode labels.
+        framerate (str | int | float | Fraction): The frame rate.
+        force_non_drop_frame (bool): Use non drop frame calculation for NTSC
+            rates.
+
+    Yields:
+        Segment: The segments.
+    """
+    analyzer = ContinuityAnalyzer(framerate, force_non_drop_frame)
+    iterator = iter(labels)
+    while True:
+        chunk = list(islice(iterator, DEFAULT_CHUNK_SIZE))
+        if not chunk:
+            break
+        yield from analyzer.feed_labels(chunk)
+    yield from analyzer.finish()
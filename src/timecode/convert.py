@@ -0,0 +1,270 @@
+"""Frame rate conversion of frame count columns.
+
+Adding a :class:`.Timecode` of another frame rate adds its raw frame count, it
+does not convert it. The functions in this module convert whole columns of
+frame counts from one rate to another by their exact rational time, with
+integer arithmetic only::
+
+    from timecode.convert import FLOOR, convert_frames
+
+    frames_24 = convert_frames(frames_25, "25", "24", rounding=FLOOR)
+
+A frame count of ``n`` (where "00:00:00:00" is 1) starts at ``(n - 1) / rate``
+seconds. The converted frame count is the target frame at the same time,
+rounded by one of:
+
+* :data:`.FLOOR`: The target frame the source frame starts in.
+* :data:`.NEAREST`: The target frame starting closest to the source frame,
+  ties are rounded to the even frame number like :func:`.round_div`.
+* :data:`.HOLD`: The first target frame starting at or after the source
+  frame, which is the first target frame holding the source frame in a
+  sample and hold conversion. When the target rate is slower, the source
+  frames which are not held by any target frame map to the same target frame
+  as the next source frame.
+
+Telecine between 23.976 (or 24) and 29.97 (or 30) does not spread the frames
+evenly in time but follows a pulldown cadence, which :func:`.pulldown_frames`
+and :func:`.pullup_frames` map explicitly, i.e. the 2:3 cadence turns the film
+frames A, B, C, D into the video frames AA, BB, BC, CD, DD (by fields).
+"""
+
+# Standard Library Imports
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_right
+from itertools import accumulate, repeat
+from math import gcd
+from typing import TYPE_CHECKING
+
+from timecode.core import get_rate, round_div
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from fractions import Fraction
+
+    from timecode.timecode import Timecode
+
+
+FLOOR = "floor"
+"""str: Round to the target frame the source frame starts in."""
+
+NEAREST = "nearest"
+"""str: Round to the target frame starting closest to the source frame."""
+
+HOLD = "hold"
+"""str: Round to the first target frame starting at or after the source frame."""
+
+PULLDOWN_23 = (2, 3, 2, 3)
+"""tuple[int, ...]: The fields of the film frames of the 2:3 pulldown cadence."""
+
+PULLDOWN_2332 = (2, 3, 3, 2)
+"""tuple[int, ...]: The fields of the film frames of the 2:3:3:2 (advanced)
+pulldown cadence."""
+
+
+def convert_frames(
+    frames: Iterable[int],
+    source_framerate: str | float | Fraction,
+    target_framerate: str | float | Fraction,
+    *,
+    rounding: str = NEAREST,
+) -> array:
+    """Convert the given frame counts to another frame rate.
+
+    Drop frame only changes the labels, not the frame counts, so the drop frame
+    setting of the rates does not matter.
+
+    Args:
+        frames (Iterable[int]): The frame counts, where "00:00:00:00" is 1.
+        source_framerate (str | int | float | Fraction): The frame rate of the
+            frame counts, see :class:`.Timecode` for the accepted values.
+        target_framerate (str | int | float | Fraction): The frame rate to
+            convert to.
+        rounding (str): One of :data:`.FLOOR`, :data:`.NEAREST` or
+            :data:`.HOLD`.
+
+    Returns:
+        array: An ``array("q")`` of the converted frame counts.
+    """
+    multiplier, divisor = _scale(source_framerate, target_framerate)
+    if rounding == FLOOR:
+        if divisor == 1:
+            return array("q", [(f - 1) * multiplier + 1 for f in frames])
+        return array("q", [(f - 1) * multiplier // divisor + 1 for f in frames])
+    if rounding == HOLD:
+        return array("q", [1 - (1 - f) * multiplier // divisor for f in frames])
+    if rounding == NEAREST:
+        if divisor & 1:
+            # the ties need an even divisor, round half up
+            half = divisor // 2
+            return array(
+                "q", [((f - 1) * multiplier + half) // divisor + 1 for f in frames]
+            )
+        products = [(f - 1) * multiplier for f in frames]
+        return array("q", [f + 1 for f in map(round_div, products, repeat(divisor))])
+    raise ValueError(
+        f"rounding should be one of {FLOOR!r}, {NEAREST!r} or {HOLD!r}, "
+        f"not {rounding!r}"
+    )
+
+
+def convert_timecode(
+    tc: Timecode,
+    framerate: str | float | Fraction,
+    *,
+    rounding: str = NEAREST,
+    force_non_drop_frame: bool = False,
+) -> Timecode:
+    """Convert the given timecode to another frame rate.
+
+    Args:
+        tc (Timecode): The timecode.
+        framerate (str | int | float | Fraction): The frame rate to convert to.
+        rounding (str): One of :data:`.FLOOR`, :data:`.NEAREST` or
+            :data:`.HOLD`.
+        force_non_drop_frame (bool): Use non drop frame labels for the NTSC
+            target rates.
+
+    Returns:
+        Timecode: The timecode at the target rate.
+    """
+    rate = get_rate(framerate, force_non_drop_frame)
+    (frames,) = convert_frames(
+        [tc.frames], tc.framerate, rate.framerate, rounding=rounding
+    )
+    return type(tc).from_rate(rate, frames)
+
+
+def pulldown_frames(
+    frames: Iterable[int],
+    *,
+    cadence: tuple[int, ...] = PULLDOWN_23,
+    phase: int = 0,
+) -> array:
+    """Map film frame counts to video frame counts through a pulldown cadence.
+
+    A film frame is mapped to the first video frame whose first field shows
+    it, so :func:`.pullup_frames` maps it back.
+
+    Args:
+        frames (Iterable[int]): The film (i.e. 23.976) frame counts, where
+            "00:00:00:00" is 1.
+        cadence (tuple[int, ...]): The number of fields of each film frame of
+            the cadence, i.e. :data:`.PULLDOWN_23` or :data:`.PULLDOWN_2332`.
+        phase (int): The position of the film frame count 1 in the cadence,
+            i.e. 0 if it is the A frame, 2 if it is the C frame.
+
+    Returns:
+        array: An ``array("q")`` of the video (i.e. 29.97) frame counts.
+    """
+    starts, video_frames = _cadence_starts(cadence, phase)
+    film_frames = len(cadence)
+    # the first video frame starting at or after the first field of each film
+    # frame of the cadence, relative to the first field of the phase
+    offsets = [-((starts[phase] - start) // 2) for start in starts[:-1]]
+    shift = phase - 1
+    return array(
+        "q",
+        [
+            video_frames * cycle + offsets[position] + 1
+            for cycle, position in map(
+                divmod, [f + shift for f in frames], repeat(film_frames)
+            )
+        ],
+    )
+
+
+def pullup_frames(
+    frames: Iterable[int],
+    *,
+    cadence: tuple[int, ...] = PULLDOWN_23,
+    phase: int = 0,
+    field: int = 0,
+) -> array:
+    """Map video frame counts to film frame counts through a pulldown cadence.
+
+    A video frame is mapped to the film frame of its first field, or of its
+    second field with ``field=1``. The video frames where they differ are the
+    split field frames, i.e. BC and CD of the 2:3 cadence, but only BC of the
+    2:3:3:2 cadence.
+
+    Args:
+        frames (Iterable[int]): The video (i.e. 29.97) frame counts, where
+            "00:00:00:00" is 1.
+        cadence (tuple[int, ...]): The number of fields of each film frame of
+            the cadence, i.e. :data:`.PULLDOWN_23` or :data:`.PULLDOWN_2332`.
+        phase (int): The position of the film frame count 1 in the cadence.
+        field (int): Either 0 for the first field or 1 for the second field
+            of the video frames.
+
+    Returns:
+        array: An ``array("q")`` of the film (i.e. 23.976) frame counts.
+    """
+    if field not in (0, 1):
+        raise ValueError(f"field should be either 0 or 1, not {field}")
+    starts, _ = _cadence_starts(cadence, phase)
+    film_frames = len(cadence)
+    fields = starts[-1]
+    # the film frame of each field of the cadence
+    positions = [bisect_right(starts, i) - 1 - phase for i in range(fields)]
+    shift = starts[phase] - 2 + field
+    return array(
+        "q",
+        [
+            film_frames * cycle + positions[position] + 1
+            for cycle, position in map(
+                divmod, [2 * f + shift for f in frames], repeat(fields)
+            )
+        ],
+    )
+
+
+def _scale(
+    source_framerate: str | float | Fraction,
+    target_framerate: str | float | Fraction,
+) -> tuple[int, int]:
+    """Return the ratio of the target rate to the source rate.
+
+    Args:
+        source_framerate (str | int | float | Fraction): The source rate.
+        target_framerate (str | int | float | Fraction): The target rate.
+
+    Returns:
+        tuple[int, int]: The multiplier and the divisor of the frame numbers,
+            reduced to the lowest terms.
+    """
+    source = get_rate(source_framerate)
+    target = get_rate(target_framerate)
+    multiplier = target.numerator * source.denominator
+    divisor = target.denominator * source.numerator
+    common = gcd(multiplier, divisor)
+    return multiplier // common, divisor // common
+
+
+def _cadence_starts(cadence: tuple[int, ...], phase: int) -> tuple[list[int], int]:
+    """Return the first field of each film frame of the given cadence.
+
+    Args:
+        cadence (tuple[int, ...]): The number of fields of each film frame.
+        phase (int): The position of the film frame count 1 in the cadence.
+
+    Raises:
+        ValueError: If the cadence or the phase is invalid.
+
+    Returns:
+        tuple[list[int], int]: The first fields, followed by the number of
+            fields of the cadence, and the number of video frames of the
+            cadence.
+    """
+    if not cadence or min(cadence) < 2 or sum(cadence) % 2:
+        raise ValueError(
+            f"cadence should have at least 2 fields per frame and an even "
+            f"number of fields, not {cadence}"
+        )
+    if not 0 <= phase < len(cadence):
+        raise ValueError(
+            f"phase should be between 0 and {len(cadence) - 1}, not {phase}"
+        )
+    starts = [0, *accumulate(cadence)]
+    return starts, starts[-1] // 2
@@ -0,0 +1,466 @@
+"""Stateless conversion functions between frame counts and timecode labels.
+
+All the calculations in this module are done with integers only. The frame
+rate is described by an immutable :class:`.FrameRate` descriptor which holds
+the exact rational rate (i.e. ``30000/1001``) along with the drop frame count
+and the block sizes derived from it, so that there is no float rounding
+involved in converting a label to a frame count or back.
+
+None of the functions in this module have side effects, so they are safe to be
+called concurrently from multiple threads and their results can be cached.
+:class:`.Timecode` delegates its conversions to them, and hot loops can call
+them directly without creating any :class:`.Timecode` instance::
+
+    from timecode.core import format_label, frames_to_label, get_rate
+
+    rate = get_rate("29.97")
+    labels = [frames_to_label(rate, frames) for frames in range(1, 1000)]
+"""
+
+# Standard Library Imports
+from __future__ import annotations
+
+from fractions import Fraction
+from functools import lru_cache
+from typing import NamedTuple
+
+SMPTE = "smpte"
+"""str: Label style using the frame number after the frame delimiter."""
+
+FRACTION = "fraction"
+"""str: Label style using fractions of a second, i.e. "00:00:01.500"."""
+
+
+class FrameRate(NamedTuple):
+    """Immutable frame rate descriptor.
+
+    Use :func:`.get_rate` to create instances of this class, it fills the
+    derived fields and caches the result.
+
+    Attributes:
+        numerator (int): The numerator of the exact frame rate.
+        denominator (int): The denominator of the exact frame rate.
+        framerate (str | int): The frame rate as it is stored in
+            :attr:`.Timecode.framerate`.
+        int_framerate (int): The nominal (integer) frame rate, the number of
+            frame labels in a second.
+        drop_frame (bool): True if this is a drop frame rate.
+        ms_frame (bool): True if this is a milliseconds based rate.
+        ntsc (bool): True if this is an NTSC rate (a multiple of 24000/1001 or
+            30000/1001).
+        drop_frames (int): The number of frame labels dropped at the start of
+            every minute except every tenth minute, 0 for non drop frame rates.
+        frames_per_minute (int): The number of frames in a minute that is not a
+            multiple of ten.
+        frames_per_10_minutes (int): The number of frames in ten minutes.
+        frames_per_24_hours (int): The number of frames in a day.
+    """
+
+    numerator: int
+    denominator: int
+    framerate: str | int
+    int_framerate: int
+    drop_frame: bool
+    ms_frame: bool
+    ntsc: bool
+    drop_frames: int
+    frames_per_minute: int
+    frames_per_10_minutes: int
+    frames_per_24_hours: int
+
+
+def is_ntsc_rate(fps: float) -> tuple[bool, int]:
+    """Check if framerate is NTSC (multiple of 24000/1001 or 30000/1001).
+
+    NTSC rates follow the pattern: nominal_rate * 1000/1001
+    Examples: 23.976, 29.97, 47.952, 59.94, 71.928, 89.91, 95.904, 119.88
+
+    Args:
+        fps (float): The framerate to check.
+
+    Returns:
+        tuple: (is_ntsc, int_framerate) where is_ntsc is True if this is an
+            NTSC rate, and int_framerate is the rounded integer framerate.
+    """
+    # Calculate what the integer framerate would be if this is NTSC
+    int_fps = round(fps * 1001 / 1000)
+
+    # Calculate what the NTSC rate would be for this integer framerate
+    expected_ntsc = int_fps * 1000 / 1001
+
+    # Check if the input matches expected NTSC rate (within tolerance)
+    is_ntsc = abs(fps - expected_ntsc) < 0.005
+
+    return is_ntsc, int_fps
+
+
+@lru_cache(maxsize=256, typed=True)
+def parse_framerate(
+    framerate: str | float | tuple[int, int] | Fraction,
+) -> tuple[str | int, int, bool, bool, bool, int, int]:
+    """Parse the given frame rate value.
+
+    Accepts the same values with the :attr:`.Timecode.framerate` setter.
+
+    Args:
+        framerate (int | float | str | tuple[int, int] | Fraction): The frame
+            rate.
+
+    Returns:
+        tuple: A tuple of (framerate, int_framerate, ntsc, ms_frame,
+            drop_frame_rate, numerator, denominator) where framerate is the
+            value to be stored in :attr:`.Timecode.framerate`,
+            drop_frame_rate is True if the rate is a multiple of 30000/1001
+            and the numerator and denominator are of the exact frame rate.
+    """
+    # Convert rational frame rate to float, defaults to None if not Fraction-like
+    numerator = getattr(framerate, "numerator", None)
+    denominator = getattr(framerate, "denominator", None)
+
+    try:
+        if "/" in framerate:  # type: ignore
+            numerator, denominator = framerate.split("/")  # type: ignore
+    except TypeError:
+        # not a string
+        pass
+
+    if isinstance(framerate, tuple):
+        numerator, denominator = framerate
+
+    exact = None
+    if numerator and denominator:
+        exact = Fraction(numerator) / Fraction(denominator)
+        framerate = round(float(numerator) / float(denominator), 2)
+        if framerate.is_integer():
+            framerate = int(framerate)
+
+    # check if number is passed and if so convert it to a string
+    if isinstance(framerate, (int, float)):
+        framerate = str(framerate)
+
+    ntsc = False
+    ms_frame = False
+    drop_frame_rate = False
+
+    # Handle special cases first
+    if framerate in ["ms", "1000"]:
+        int_framerate = 1000
+        ms_frame = True
+        framerate = 1000
+        exact = Fraction(1000)
+    elif framerate == "frames":
+        int_framerate = 1
+        exact = Fraction(1)
+    else:
+        # Try to detect NTSC rates
+        try:
+            fps = float(framerate)  # type: ignore
+            is_ntsc, int_fps = is_ntsc_rate(fps)
+
+            if is_ntsc:
+                ntsc = True
+                int_framerate = int_fps
+                # DF only for multiples of 30000/1001 (29.97, 59.94, etc.).
+                drop_frame_rate = int_fps % 30 == 0
+                exact = Fraction(int_fps * 1000, 1001)
+            else:
+                # Non-NTSC rate, use integer value
+                int_framerate = int(fps)
+                if exact is None:
+                    exact = Fraction(framerate)  # type: ignore
+        except (ValueError, TypeError):
+            # If conversion fails, fall back to direct integer conversion
+            int_framerate = int(float(framerate))  # type: ignore
+            exact = Fraction(int_framerate)
+
+    return (
+        framerate,  # type: ignore
+        int_framerate,
+        ntsc,
+        ms_frame,
+        drop_frame_rate,
+        exact.numerator,
+        exact.denominator,
+    )
+
+
+@lru_cache(maxsize=256)
+def make_rate(
+    numerator: int,
+    denominator: int,
+    framerate: str | int,
+    int_framerate: int,
+    *,
+    drop_frame: bool,
+    ms_frame: bool = False,
+    ntsc: bool = False,
+) -> FrameRate:
+    """Create a :class:`.FrameRate` and calculate the derived fields.
+
+    The number of dropped frame labels per minute is the nominal rate divided
+    by 15 (2 for 29.97, 4 for 59.94, 8 for 119.88 etc.) which is the integer
+    equivalent of the 6% of the frame rate rounded to the nearest integer.
+
+    Args:
+        numerator (int): The numerator of the exact frame rate.
+        denominator (int): The denominator of the exact frame rate.
+        framerate (str | int): The frame rate as it is stored in
+            :attr:`.Timecode.framerate`.
+        int_framerate (int): The nominal (integer) frame rate.
+        drop_frame (bool): True if this is a drop frame rate.
+        ms_frame (bool): True if this is a milliseconds based rate.
+        ntsc (bool): True if this is an NTSC rate.
+
+    Returns:
+        FrameRate: The frame rate descriptor.
+    """
+    drop_frames = (2 * int_framerate + 15) // 30 if drop_frame else 0
+    frames_per_minute = int_framerate * 60 - drop_frames
+    frames_per_10_minutes = int_framerate * 600 - drop_frames * 9
+    return FrameRate(
+        numerator,
+        denominator,
+        framerate,
+        int_framerate,
+        drop_frame,
+        ms_frame,
+        ntsc,
+        drop_frames,
+        frames_per_minute,
+        frames_per_10_minutes,
+        frames_per_10_minutes * 144,
+    )
+
+
+def get_rate(
+    framerate: str | float | tuple[int, int] | Fraction,
+    force_non_drop_frame: bool = False,
+) -> FrameRate:
+    """Return the frame rate descriptor for the given frame rate.
+
+    Args:
+        framerate (int | float | str | tuple[int, int] | Fraction): The frame
+            rate, see :class:`.Timecode` for the accepted values.
+        force_non_drop_frame (bool): If True, uses non drop frame calculation
+            for the drop frame rates.
+
+    Returns:
+        FrameRate: The frame rate descriptor.
+    """
+    (
+        framerate,
+        int_framerate,
+        ntsc,
+        ms_frame,
+        drop_frame_rate,
+        numerator,
+        denominator,
+    ) = parse_framerate(framerate)
+    return make_rate(
+        numerator,
+        denominator,
+        framerate,  # type: ignore
+        int_framerate,
+        drop_frame=drop_frame_rate and not force_non_drop_frame,
+        ms_frame=ms_frame,
+        ntsc=ntsc,
+    )
+
+
+def components_to_frames(
+    rate: FrameRate, hours: int, minutes: int, seconds: int, frames: int
+) -> int:
+    """Convert the given timecode components to a frame count.
+
+    Args:
+        rate (FrameRate): The frame rate descriptor.
+        hours (int): The hours part of the timecode.
+        minutes (int): The minutes part of the timecode.
+        seconds (int): The seconds part of the timecode.
+        frames (int): The frames part of the timecode.
+
+    Returns:
+        int: The number of frames, where "00:00:00:00" is 1.
+    """
+    total_minutes = 60 * hours + minutes
+    return (
+        (total_minutes * 60 + seconds) * rate.int_framerate
+        + frames
+        - rate.drop_frames * (total_minutes - total_minutes // 10)
+        + 1
+    )
+
+
+def frames_to_components(
+    rate: FrameRate, frames: int, rollover: bool = True
+) -> tuple[int, int, int, int]:
+    """Convert the given frame count to timecode components.
+
+    Args:
+        rate (FrameRate): The frame rate descriptor.
+        frames (int): The number of frames, where "00:00:00:00" is 1.
+        rollover (bool): If True, the timecode rolls over to "00:00:00:00"
+            after 24 hours.
+
+    Returns:
+        tuple: A tuple containing the hours, minutes, seconds and frames.
+    """
+    frame_number = frames - 1
+    if rollover:
+        frame_number %= rate.frames_per_24_hours
+
+    drop_frames = rate.drop_frames
+    if drop_frames:
+        d, m = divmod(frame_number, rate.frames_per_10_minutes)
+        frame_number += drop_frames * 9 * d
+        if m > drop_frames:
+            frame_number += drop_frames * ((m - drop_frames) // rate.frames_per_minute)
+
+    total_seconds, frs = divmod(frame_number, rate.int_framerate)
+    total_minutes, secs = divmod(total_seconds, 60)
+    hrs, mins = divmod(total_minutes, 60)
+    return hrs, mins, secs, frs
+
+
+def fraction_to_frames(rate: FrameRate, fraction: str) -> int:
+    """Convert the decimal digits of a fraction of a second to frames.
+
+    The result is rounded to the nearest frame, ties are rounded to the even
+    frame, just like ``round()``.
+
+    Args:
+        rate (FrameRate): The frame rate descriptor.
+        fraction (str): The digits after the decimal point, i.e. "040" for
+            "00:00:00.040".
+
+    Returns:
+        int: The number of frames in the given fraction of a second.
+    """
+    return round_div(
+        int(fraction) * rate.numerator, 10 ** len(fraction) * rate.denominator
+    )
+
+
+def round_div(dividend: int, divisor: int) -> int:
+    """Divide the given integers and round to the nearest integer.
+
+    Ties are rounded to the even integer, just like ``round()``.
+
+    Args:
+        dividend (int): The dividend.
+        divisor (int): The divisor, should be positive.
+
+    Returns:
+        int: The rounded quotient.
+    """
+    quotient, remainder = divmod(dividend, divisor)
+    remainder *= 2
+    if remainder > divisor or (remainder == divisor and quotient & 1):
+        quotient += 1
+    return quotient
+
+
+def split_label(label: int | str) -> tuple[int, int, int, int]:
+    """Split the given timecode label to its components.
+
+    See :meth:`.Timecode.parse_timecode` for the accepted values.
+
+    Args:
+        label (int | str): A timecode label or a Binary Coded Decimal integer.
+
+    Returns:
+        (int, int, int, int): A tuple containing the hours, minutes, seconds and
+            frames part of the label.
+    """
+    if isinstance(label, int):
+        hex_repr = f"{label:08x}"
+        return (
+            int(hex_repr[0:2]),
+            int(hex_repr[2:4]),
+            int(hex_repr[4:6]),
+            int(hex_repr[6:8]),
+        )
+
+    bfr = label.replace(";", ":").replace(".", ":").split(":")
+    return int(bfr[0]), int(bfr[1]), int(bfr[2]), int(bfr[3])
+
+
+def parse_label(rate: FrameRate, label: int | str) -> tuple[int, int, int, int, bool]:
+    """Parse the given timecode label.
+
+    Labels with a "." delimiter are using fractions of a second unless the rate
+    is milliseconds based, the fraction is converted to frames.
+
+    Args:
+        rate (FrameRate): The frame rate descriptor.
+        label (int | str): A timecode label or a Binary Coded Decimal integer.
+
+    Returns:
+        tuple: A tuple containing the hours, minutes, seconds, frames and a bool
+            which is True if the label is using fractions of a second.
+    """
+    hrs, mins, secs, frs = split_label(label)
+    if isinstance(label, str) and not rate.ms_frame:
+        parts = label.split(".")
+        if len(parts) == 2:
+            return hrs, mins, secs, fraction_to_frames(rate, parts[1]), True
+    return hrs, mins, secs, frs, False
+
+
+def label_to_frames(rate: FrameRate, label: int | str) -> int:
+    """Convert the given timecode label to a frame count.
+
+    Args:
+        rate (FrameRate): The frame rate descriptor.
+        label (int | str): A timecode label or a Binary Coded Decimal integer.
+
+    Returns:
+        int: The number of frames, where "00:00:00:00" is 1.
+    """
+    hrs, mins, secs, frs, _ = parse_label(rate, label)
+    return components_to_frames(rate, hrs, mins, secs, frs)
+
+
+def format_label(
+    rate: FrameRate, components: tuple[int, int, int, int], style: str = SMPTE
+) -> str:
+    """Format the given timecode components as a label.
+
+    Args:
+        rate (FrameRate): The frame rate descriptor.
+        components (tuple[int, int, int, int]): The hours, minutes, seconds and
+            frames, as returned by :func:`.frames_to_components`.
+        style (str): Either :data:`.SMPTE` to use the frame delimiter of the
+            rate (";" for drop frame, "." for milliseconds and ":" in any other
+            case), or :data:`.FRACTION` to represent the frames as fractions of
+            a second.
+
+    Returns:
+        str: The timecode label.
+    """
+    hrs, mins, secs, frs = components
+    if style == FRACTION:
+        return f"{hrs:02d}:{mins:02d}:{secs + round(frs / rate.int_framerate, 3):06.3f}"
+    if rate.drop_frame:
+        return f"{hrs:02d}:{mins:02d}:{secs:02d};{frs:02d}"
+    if rate.ms_frame:
+        return f"{hrs:02d}:{mins:02d}:{secs:02d}.{frs:03d}"
+    return f"{hrs:02d}:{mins:02d}:{secs:02d}:{frs:02d}"
+
+
+def frames_to_label(
+    rate: FrameRate, frames: int, style: str = SMPTE, rollover: bool = True
+) -> str:
+    """Convert the given frame count to a timecode label.
+
+    Args:
+        rate (FrameRate): The frame rate descriptor.
+        frames (int): The number of frames, where "00:00:00:00" is 1.
+        style (str): The label style, see :func:`.format_label`.
+        rollover (bool): If True, the timecode rolls over to "00:00:00:00"
+            after 24 hours.
+
+    Returns:
+        str: The timecode label.
+    """
+    return format_label(rate, frames_to_components(rate, frames, rollover), style)
@@ -0,0 +1,339 @@
+"""Sort-merge diff engine between two large lists of timecodes.
+
+Reconciling pull lists (i.e. editorial against the VFX vendor or the DI log)
+means matching hundreds of thousands of entries, which are not necessarily at
+the same frame rate. :func:`.diff_timecodes` converts the entries of both
+sides to exact integer time keys through the frame rate of each
+:class:`.Timecode`, sorts them and walks both sides in a single merge pass::
+
+    from timecode.diff import MATCH, diff_timecodes
+
+    for entry in diff_timecodes(editorial, vendor, max_slip=2):
+        if entry.kind != MATCH:
+            print(entry)
+
+The entries of a list are either :class:`.Timecode` instances or
+``(start, end)`` pairs of them. The report is yielded lazily as
+:class:`.DiffEntry` records:
+
+* :data:`.MATCH`: The entry is in both lists at the same time.
+* :data:`.DUPLICATE`: The entry is repeated in the same list, only its first
+  occurrence is compared with the other list.
+* :data:`.SLIP`: The entry is in both lists with the same duration but moved
+  by up to ``max_slip`` frames.
+* :data:`.MISSING`: The left entry is not in the right list.
+* :data:`.EXTRA`: The right entry is not in the left list.
+
+The matches and the duplicates are reported during the merge pass in time
+order, the remaining entries are paired as slips and reported afterwards.
+"""
+
+# Standard Library Imports
+from __future__ import annotations
+
+from math import lcm
+from typing import TYPE_CHECKING, NamedTuple
+
+from timecode.core import round_div
+from timecode.timecode import Timecode
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+
+MATCH = "match"
+"""str: An entry which is in both lists at the same time."""
+
+DUPLICATE = "duplicate"
+"""str: An entry which is repeated in the same list."""
+
+SLIP = "slip"
+"""str: An entry which is in both lists but moved by a few frames."""
+
+MISSING = "missing"
+"""str: A left entry which is not in the right list."""
+
+EXTRA = "extra"
+"""str: A right entry which is not in the left list."""
+
+
+class DiffEntry(NamedTuple):
+    """A record of the diff report.
+
+    Attributes:
+        kind (str): One of :data:`.MATCH`, :data:`.DUPLICATE`, :data:`.SLIP`,
+            :data:`.MISSING` or :data:`.EXTRA`.
+        left (None | int): The index of the entry in the left list.
+        right (None | int): The index of the entry in the right list.
+        slip (int): The number of frames, in the frame rate of the left entry,
+            the right entry is moved by. Only non zero for :data:`.SLIP`.
+    """
+
+    kind: str
+    left: None | int
+    right: None | int
+    slip: int = 0
+
+
+class _Side:
+    """The normalized entries of one side of the diff.
+
+    Args:
+        entries (Iterable[Timecode | tuple[Timecode, Timecode]]): The entries.
+        framerates (dict[str | int, int]): The frame rate ids, shared by both
+            sides.
+        exact_rates (list[tuple[int, int]]): The exact frame rates by id,
+            shared by both sides.
+    """
+
+    __slots__ = ("durations", "keys", "order", "rate_ids", "starts")
+
+    def __init__(
+        self,
+        entries: Iterable[Timecode | tuple[Timecode, Timecode]],
+        framerates: dict[str | int, int],
+        exact_rates: list[tuple[int, int]],
+    ) -> None:
+        starts: list[int] = []
+        durations: list[int] = []
+        rate_ids: list[int] = []
+        for entry in entries:
+            if isinstance(entry, Timecode):
+                start = end = entry
+            else:
+                start, end = entry
+            framerate = start.framerate
+            rate_id = framerates.get(framerate)
+            if rate_id is None:
+                rate = start.rate
+                rate_id = framerates[framerate] = len(exact_rates)
+                exact_rates.append((rate.numerator, rate.denominator))
+            starts.append(start.frames - 1)
+            durations.append(end.frames - start.frames)
+            rate_ids.append(rate_id)
+        self.starts = starts
+        self.durations = durations
+        self.rate_ids = rate_ids
+        self.keys: list[int] = []
+        self.order: list[int] = []
+
+    def scale(self, scales: list[int]) -> None:
+        """Convert the frame counts to time keys.
+
+        Args:
+            scales (list[int]): The length of a frame in time key units, by
+                frame rate id.
+        """
+        rate_scales = [scales[rate_id] for rate_id in self.rate_ids]
+        self.starts = [f * s for f, s in zip(self.starts, rate_scales)]
+        self.durations = [f * s for f, s in zip(self.durations, rate_scales)]
+
+    def pack(self, low: int, width: int) -> None:
+        """Pack the start and the duration of the entries to a single integer.
+
+        Sorting the packed keys orders the entries by start and then by
+        duration, which is a lot faster than sorting tuples.
+
+        Args:
+            low (int): The minimum duration of both sides.
+            width (int): The range of the durations of both sides.
+        """
+        self.keys = [
+            start * width + duration - low
+            for start, duration in zip(self.starts, self.durations)
+        ]
+
+    def split_duplicates(self, side: str) -> list[DiffEntry]:
+        """Sort the entries by time and split the repeated ones.
+
+        The indices of the unique entries are stored in :attr:`.order` in time
+        order.
+
+        Args:
+            side (str): Either "left" or "right".
+
+        Returns:
+            list[DiffEntry]: The :data:`.DUPLICATE` records of the repeated
+                entries.
+        """
+        keys = self.keys
+        unique: list[int] = []
+        duplicates: list[DiffEntry] = []
+        previous = None
+        for index in sorted(range(len(keys)), key=keys.__getitem__):
+            key = keys[index]
+            if key == previous:
+                duplicates.append(
+                    DiffEntry(DUPLICATE, index, None)
+                    if side == "left"
+                    else DiffEntry(DUPLICATE, None, index)
+                )
+            else:
+                unique.append(index)
+                previous = key
+        self.order = unique
+        return duplicates
+
+
+def diff_timecodes(
+    left: Iterable[Timecode | tuple[Timecode, Timecode]],
+    right: Iterable[Timecode | tuple[Timecode, Timecode]],
+    *,
+    max_slip: int = 0,
+) -> Iterator[DiffEntry]:
+    """Compare the given lists of timecodes.
+
+    The time of an entry is its distance from "00:00:00:00" in seconds, so
+    entries of different frame rates are matched if they are at the exact
+    same time. The diff takes ``O(n log n)`` time for sorting and a single
+    merge pass.
+
+    Args:
+        left (Iterable[Timecode | tuple[Timecode, Timecode]]): The reference
+            list, either timecodes or ``(start, end)`` pairs.
+        right (Iterable[Timecode | tuple[Timecode, Timecode]]): The list to
+            compare with the reference list.
+        max_slip (int): The maximum number of frames, in the frame rate of
+            the left entry, a right entry can be moved by to be reported as a
+            :data:`.SLIP`. The default 0 disables the slip detection.
+
+    Yields:
+        DiffEntry: The report records.
+    """
+    if not isinstance(max_slip, int) or max_slip < 0:
+        raise ValueError(f"max_slip should be a non negative integer, not {max_slip}")
+
+    framerates: dict[str | int, int] = {}
+    exact_rates: list[tuple[int, int]] = []
+    left_side = _Side(left, framerates, exact_rates)
+    right_side = _Side(right, framerates, exact_rates)
+
+    # the length of a frame is denominator / numerator seconds, the time keys
+    # are in 1 / lcm(numerators) seconds so they are exact integers
+    time_base = lcm(*(numerator for numerator, _ in exact_rates))
+    scales = [
+        denominator * (time_base // numerator) for numerator, denominator in exact_rates
+    ]
+    left_side.scale(scales)
+    right_side.scale(scales)
+    durations = left_side.durations + right_side.durations
+    low = min(durations, default=0)
+    width = max(durations, default=0) - low + 1
+    left_side.pack(low, width)
+    right_side.pack(low, width)
+
+    yield from left_side.split_duplicates("left")
+    yield from right_side.split_duplicates("right")
+
+    missing: list[int] = []
+    extra: list[int] = []
+    yield from _merge_join(left_side, right_side, missing, extra)
+    yield from _pair_slips(
+        left_side, right_side, missing, extra, max_slip=max_slip, scales=scales
+    )
+
+
+def _merge_join(
+    left: _Side,
+    right: _Side,
+    missing: list[int],
+    extra: list[int],
+) -> Iterator[DiffEntry]:
+    """Walk both sorted sides together and report the matches.
+
+    Args:
+        left (_Side): The left side.
+        right (_Side): The right side.
+        missing (list[int]): Collects the unmatched left indices.
+        extra (list[int]): Collects the unmatched right indices.
+
+    Yields:
+        DiffEntry: The :data:`.MATCH` records.
+    """
+    left_order, right_order = left.order, right.order
+    left_keys, right_keys = left.keys, right.keys
+    n_left = len(left_order)
+    n_right = len(right_order)
+    i = j = 0
+    while i < n_left and j < n_right:
+        a = left_order[i]
+        b = right_order[j]
+        key_a = left_keys[a]
+        key_b = right_keys[b]
+        if key_a == key_b:
+            yield DiffEntry(MATCH, a, b)
+            i += 1
+            j += 1
+        elif key_a < key_b:
+            missing.append(a)
+            i += 1
+        else:
+            extra.append(b)
+            j += 1
+    missing.extend(left_order[i:])
+    extra.extend(right_order[j:])
+
+
+def _pair_slips(
+    left: _Side,
+    right: _Side,
+    missing: list[int],
+    extra: list[int],
+    *,
+    max_slip: int,
+    scales: list[int],
+) -> Iterator[DiffEntry]:
+    """Pair the unmatched entries with the same duration as slips.
+
+    Args:
+        left (_Side): The left side.
+        right (_Side): The right side.
+        missing (list[int]): The unmatched left indices.
+        extra (list[int]): The unmatched right indices.
+        max_slip (int): The maximum slip in frames.
+        scales (list[int]): The length of a frame in time key units, by frame
+            rate id.
+
+    Yields:
+        DiffEntry: The :data:`.SLIP`, :data:`.MISSING` and :data:`.EXTRA`
+            records.
+    """
+    tolerances = [max_slip * scale for scale in scales]
+    # the right entries are skipped with the largest tolerance, the ones in
+    # the window of a left entry wait for a left entry of a lower frame rate
+    max_tolerance = max(tolerances, default=0)
+    left_keys = {a: (left.durations[a], left.starts[a]) for a in missing}
+    right_keys = [(right.durations[b], right.starts[b]) for b in extra]
+    # the unmatched entries are in time order, sort them by duration too
+    missing.sort(key=left_keys.__getitem__)
+    order = sorted(range(len(extra)), key=right_keys.__getitem__)
+    n_right = len(order)
+    pending: list[int] = []
+    j = 0
+    for a in missing:
+        duration, start = left_keys[a]
+        rate_id = left.rate_ids[a]
+        tolerance = tolerances[rate_id]
+        low = (duration, start - max_tolerance)
+        while pending and right_keys[pending[0]] < low:
+            yield DiffEntry(EXTRA, None, extra[pending.pop(0)])
+        while j < n_right and right_keys[order[j]] < low:
+            yield DiffEntry(EXTRA, None, extra[order[j]])
+            j += 1
+        high = (duration, start + max_tolerance)
+        while j < n_right and right_keys[order[j]] <= high:
+            pending.append(order[j])
+            j += 1
+        for index, k in enumerate(pending):
+            right_start = right_keys[k][1]
+            if abs(right_start - start) <= tolerance:
+                del pending[index]
+                slip = round_div(right_start - start, scales[rate_id])
+                yield DiffEntry(SLIP, a, extra[k], slip)
+                break
+        else:
+            yield DiffEntry(MISSING, a, None)
+    for k in pending:
+        yield DiffEntry(EXTRA, None, extra[k])
+    for k in order[j:]:
+        yield DiffEntry(EXTRA, None, extra[k])
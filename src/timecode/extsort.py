@@ -0,0 +1,306 @@
+"""External merge sort for timecoded log files larger than the memory.
+
+The lines of the logs are read in runs which fit in the given memory budget.
+The timecode label of each line is converted to a frame count with the
+stateless functions of :mod:`timecode.core` (no :class:`.Timecode` instance is
+created per line), the run is sorted by the frame count and spilled to a
+temporary file. The runs are then merged with a heap holding one line per run::
+
+    from timecode.extsort import sort_log
+
+    sort_log(
+        ["recorder_a.log", "recorder_b.log"],
+        "sorted.log",
+        "29.97",
+        memory_budget=2 * 1024**3,
+        workers=4,
+    )
+
+With ``workers`` greater than 1 the runs are sorted and spilled in a pool of
+processes while the next run is being read.
+
+The sort is stable, lines with the same timecode keep their input order (with
+the sources taken in the given order). The lines are written as they are read,
+except a newline is added to the last line of a source if it is missing, and
+blank lines are dropped.
+"""
+
+# Standard Library Imports
+from __future__ import annotations
+
+import os
+import tempfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from heapq import merge
+from itertools import chain
+from typing import TYPE_CHECKING
+
+from timecode.batch import labels_to_frames
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from concurrent.futures import Future
+    from fractions import Fraction
+
+
+DEFAULT_MEMORY_BUDGET = 256 * 1024 * 1024
+"""int: The default number of bytes the lines of the runs can use."""
+
+DEFAULT_FAN_IN = 64
+"""int: The default maximum number of runs merged at once."""
+
+LINE_OVERHEAD = 100
+"""int: The estimated memory used by a line on top of its characters."""
+
+KEY_WIDTH = 16
+"""int: The width of the hexadecimal frame count prefixed to the spilled lines."""
+
+_OPTIONS = {"encoding": "utf-8", "errors": "surrogateescape", "newline": ""}
+
+
+def sort_log(
+    sources: str | os.PathLike | Iterable[str | os.PathLike],
+    target: str | os.PathLike,
+    framerate: str | float | Fraction,
+    *,
+    memory_budget: int = DEFAULT_MEMORY_BUDGET,
+    workers: int = 1,
+    field: int = 0,
+    delimiter: None | str = None,
+    force_non_drop_frame: bool = False,
+    tmp_dir: None | str | os.PathLike = None,
+    fan_in: int = DEFAULT_FAN_IN,
+) -> int:
+    """Sort the lines of the given log files by their timecode.
+
+    Args:
+        sources (str | os.PathLike | Iterable[str | os.PathLike]): The path of
+            a log file or the paths of several log files to sort together.
+        target (str | os.PathLike): The path of the sorted log file.
+        framerate (str | int | float | Fraction): The frame rate of the
+            timecode labels, see :class:`.Timecode` for the accepted values.
+        memory_budget (int): The approximate number of bytes the lines held
+            in memory can use. It is shared by the runs being sorted in
+            parallel.
+        workers (int): The number of processes sorting the runs.
+        field (int): The index of the field holding the timecode label.
+        delimiter (None | str): The field delimiter, the default None splits
+            the fields at runs of whitespace.
+        force_non_drop_frame (bool): Use non drop frame calculation for NTSC
+            rates.
+        tmp_dir (None | str | os.PathLike): The folder to spill the runs in,
+            defaults to the system temporary folder.
+        fan_in (int): The maximum number of runs merged at once, more runs
+            are merged in several passes.
+
+    Returns:
+        int: The number of lines written.
+    """
+    if isinstance(sources, (str, os.PathLike)):
+        sources = [sources]
+    with ExitStack() as stack:
+        files = [stack.enter_context(open(path, **_OPTIONS)) for path in sources]
+        lines = chain.from_iterable(files)
+        with open(target, "w", **_OPTIONS) as f:
+            count = 0
+            write = f.write
+            for line in sort_lines(
+                lines,
+                framerate,
+                memory_budget=memory_budget,
+                workers=workers,
+                field=field,
+                delimiter=delimiter,
+                force_non_drop_frame=force_non_drop_frame,
+                tmp_dir=tmp_dir,
+                fan_in=fan_in,
+            ):
+                write(line)
+                count += 1
+    return count
+
+
+def sort_lines(
+    lines: Iterable[str],
+    framerate: str | float | Fraction,
+    *,
+    memory_budget: int = DEFAULT_MEMORY_BUDGET,
+    workers: int = 1,
+    field: int = 0,
+    delimiter: None | str = None,
+    force_non_drop_frame: bool = False,
+    tmp_dir: None | str | os.PathLike = None,
+    fan_in: int = DEFAULT_FAN_IN,
+) -> Iterator[str]:
+    """Sort the given lines by their timecode.
+
+    The temporary run files are deleted when the iterator is exhausted or
+    closed. See :func:`.sort_log` for the arguments.
+
+    Args:
+        lines (Iterable[str]): The lines, including the line endings.
+        framerate (str | int | float | Fraction): The frame rate.
+        memory_budget (int): The number of bytes the lines in memory can use.
+        workers (int): The number of processes sorting the runs.
+        field (int): The index of the field holding the timecode label.
+        delimiter (None | str): The field delimiter.
+        force_non_drop_frame (bool): Use non drop frame calculation for NTSC
+            rates.
+        tmp_dir (None | str | os.PathLike): The folder to spill the runs in.
+        fan_in (int): The maximum number of runs merged at once.
+
+    Yields:
+        str: The sorted lines.
+    """
+    if memory_budget < 1:
+        raise ValueError(
+            f"memory_budget should be a positive integer, not {memory_budget}"
+        )
+    if workers < 1:
+        raise ValueError(f"workers should be a positive integer, not {workers}")
+    if fan_in < 2:
+        raise ValueError(f"fan_in should be at least 2, not {fan_in}")
+
+    run_budget = max(1, memory_budget // (workers + 1))
+    options = (framerate, force_non_drop_frame, field, delimiter)
+    with tempfile.TemporaryDirectory(prefix="timecode-", dir=tmp_dir) as tmp:
+        runs = _spill_runs(_read_runs(lines, run_budget), tmp, options, workers=workers)
+        n_passes = 0
+        while len(runs) > fan_in:
+            # merge consecutive runs so the ties keep their input order
+            n_passes += 1
+            runs = [
+                _merge_runs(
+                    runs[i : i + fan_in], os.path.join(tmp, f"merged-{n_passes}-{i}")
+                )
+                for i in range(0, len(runs), fan_in)
+            ]
+
+        with ExitStack() as stack:
+            files = [stack.enter_context(open(path, **_OPTIONS)) for path in runs]
+            for line in merge(*files, key=_run_key):
+                yield line[KEY_WIDTH:]
+
+
+def _read_runs(lines: Iterable[str], run_budget: int) -> Iterator[list[str]]:
+    """Split the given lines to runs which fit in the given budget.
+
+    Args:
+        lines (Iterable[str]): The lines.
+        run_budget (int): The number of bytes the lines of a run can use.
+
+    Yields:
+        list[str]: The runs.
+    """
+    run: list[str] = []
+    size = 0
+    for line in lines:
+        run.append(line)
+        size += len(line) + LINE_OVERHEAD
+        if size >= run_budget:
+            yield run
+            run = []
+            size = 0
+    if run:
+        yield run
+
+
+def _spill_runs(
+    runs: Iterable[list[str]], tmp: str, options: tuple, *, workers: int
+) -> list[str]:
+    """Sort and spill the given runs to files.
+
+    Args:
+        runs (Iterable[list[str]]): The runs.
+        tmp (str): The folder to write the run files in.
+        options (tuple): The options of :func:`._sort_run`.
+        workers (int): The number of processes sorting the runs.
+
+    Returns:
+        list[str]: The paths of the run files, in the input order.
+    """
+    paths: list[str] = []
+    if workers == 1:
+        for run in runs:
+            paths.append(os.path.join(tmp, f"run-{len(paths)}"))
+            _sort_run(run, paths[-1], options)
+        return paths
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: deque[Future] = deque()
+        for run in runs:
+            paths.append(os.path.join(tmp, f"run-{len(paths)}"))
+            pending.append(executor.submit(_sort_run, run, paths[-1], options))
+            if len(pending) >= workers:
+                pending.popleft().result()
+        while pending:
+            pending.popleft().result()
+    return paths
+
+
+def _sort_run(
+    lines: list[str],
+    path: str,
+    options: tuple[str | float | Fraction, bool, int, None | str],
+) -> None:
+    """Sort the given lines by their timecode and write them to a run file.
+
+    Each line is prefixed with its frame count as a fixed width hexadecimal
+    number, so the run files can be merged by comparing the prefixes.
+
+    Args:
+        lines (list[str]): The lines.
+        path (str): The path of the run file.
+        options (tuple): The frame rate, force_non_drop_frame, field and
+            delimiter arguments of :func:`.sort_lines`.
+    """
+    framerate, force_non_drop_frame, field, delimiter = options
+    # only the last line of a source can be missing the line ending
+    lines = [
+        line if line.endswith(("\n", "\r")) else f"{line}\n"
+        for line in lines
+        if line.strip()
+    ]
+    try:
+        labels = [line.split(delimiter, field + 1)[field] for line in lines]
+    except IndexError:
+        raise ValueError(
+            f"The log has lines with less than {field + 1} fields"
+        ) from None
+    keys = labels_to_frames(labels, framerate, force_non_drop_frame)
+    order = sorted(range(len(keys)), key=keys.__getitem__)
+    with open(path, "w", **_OPTIONS) as f:
+        f.write("".join([f"{keys[i]:016x}{lines[i]}" for i in order]))
+
+
+def _run_key(line: str) -> str:
+    """Return the frame count prefix of a line of a run file.
+
+    Args:
+        line (str): The line.
+
+    Returns:
+        str: The fixed width hexadecimal frame count.
+    """
+    return line[:KEY_WIDTH]
+
+
+def _merge_runs(paths: list[str], path: str) -> str:
+    """Merge the given run files to a new run file and delete them.
+
+    Args:
+        paths (list[str]): The paths of the run files.
+        path (str): The path of the merged run file.
+
+    Returns:
+        str: The path of the merged run file.
+    """
+    with ExitStack() as stack:
+        files = [stack.enter_context(open(p, **_OPTIONS)) for p in paths]
+        with open(path, "w", **_OPTIONS) as f:
+            f.writelines(merge(*files, key=_run_key))
+    for p in paths:
+        os.remove(p)
+    return path
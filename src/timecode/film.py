@@ -0,0 +1,543 @@
+"""Film footage counts in feet and frames.
+
+Negative cutting and archival work track the film length in feet and frames,
+like "123+05", next to the timecode. The number of frames in a foot depends on
+the gauge and the pulldown of the camera, 16 for 35mm 4-perf, 40 for 16mm, and
+21 or 22 for 35mm 3-perf, where a foot is not a whole number of frames::
+
+    from timecode import Timecode
+    from timecode.film import GAUGE_35MM_3PERF, Footage
+
+    footage = Footage("123+05")
+    footage.frame_number  # 1973
+    str(footage + 16)  # "124+05"
+    Footage.from_timecode(Timecode("24", "00:01:00:00"))  # 90+00
+    Footage(1440, GAUGE_35MM_3PERF)  # 67+10
+
+A gauge is described by the number of perforations per foot and per frame,
+frame ``n`` starts at perforation ``n * perfs_per_frame`` and foot ``f`` starts
+with the first frame starting in it, so the conversions are exact integer
+arithmetic for all gauges.
+
+The frame numbers are 0 based, "0+00" is frame 0, matching
+:attr:`.Timecode.frame_number`. The bulk functions convert whole columns of
+:attr:`.Timecode.frames` counts, where the count of "0+00" is given by
+``start`` (1, "00:00:00:00", by default).
+"""
+
+# Standard Library Imports
+from __future__ import annotations
+
+from array import array
+from functools import lru_cache
+from math import gcd
+from typing import TYPE_CHECKING, NamedTuple
+
+from timecode.core import get_rate
+from timecode.timecode import Timecode, TimecodeError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from fractions import Fraction
+
+
+class Gauge(NamedTuple):
+    """A film gauge and pulldown.
+
+    Attributes:
+        name (str): The name of the gauge, i.e. "35mm 4-perf".
+        perfs_per_foot (int): The number of perforations in a foot.
+        perfs_per_frame (int): The number of perforations a frame advances.
+    """
+
+    name: str
+    perfs_per_foot: int
+    perfs_per_frame: int
+
+    def first_frame(self, feet: int) -> int:
+        """Return the frame number of the first frame of the given foot.
+
+        Args:
+            feet (int): The foot.
+
+        Returns:
+            int: The 0 based frame number.
+        """
+        return -(-feet * self.perfs_per_foot // self.perfs_per_frame)
+
+    def frames_in_foot(self, feet: int) -> int:
+        """Return the number of frames in the given foot.
+
+        Args:
+            feet (int): The foot.
+
+        Returns:
+            int: The number of frames starting in the foot.
+        """
+        return self.first_frame(feet + 1) - self.first_frame(feet)
+
+
+GAUGE_35MM = Gauge("35mm 4-perf", 64, 4)
+"""Gauge: 35mm 4-perf, 16 frames per foot."""
+
+GAUGE_35MM_3PERF = Gauge("35mm 3-perf", 64, 3)
+"""Gauge: 35mm 3-perf, 64 frames per 3 feet."""
+
+GAUGE_35MM_2PERF = Gauge("35mm 2-perf", 64, 2)
+"""Gauge: 35mm 2-perf (Techniscope), 32 frames per foot."""
+
+GAUGE_16MM = Gauge("16mm", 40, 1)
+"""Gauge: 16mm, 40 frames per foot."""
+
+GAUGE_65MM = Gauge("65mm 5-perf", 64, 5)
+"""Gauge: 65mm 5-perf, 64 frames per 5 feet."""
+
+
+def format_footage(frame_number: int, gauge: Gauge = GAUGE_35MM) -> str:
+    """Format the given frame number as feet and frames.
+
+    Args:
+        frame_number (int): The 0 based frame number.
+        gauge (Gauge): The gauge.
+
+    Raises:
+        ValueError: If the frame number is negative.
+
+    Returns:
+        str: The footage, i.e. "123+05".
+    """
+    if frame_number < 0:
+        raise ValueError(
+            f"frame_number should be a non-negative integer, not {frame_number}"
+        )
+    feet = frame_number * gauge.perfs_per_frame // gauge.perfs_per_foot
+    return f"{feet}+{frame_number - gauge.first_frame(feet):02d}"
+
+
+def parse_footage(footage: str, gauge: Gauge = GAUGE_35MM) -> int:
+    """Parse the given feet and frames.
+
+    Args:
+        footage (str): The footage, i.e. "123+05".
+        gauge (Gauge): The gauge.
+
+    Raises:
+        ValueError: If the footage is not valid for the gauge.
+
+    Returns:
+        int: The 0 based frame number.
+    """
+    feet, plus, frames = footage.partition("+")
+    try:
+        feet_value = int(feet)
+        frames_value = int(frames)
+    except ValueError:
+        raise ValueError(f"Invalid footage: {footage!r}") from None
+    if (
+        not plus
+        or feet_value < 0
+        or not 0 <= frames_value < gauge.frames_in_foot(feet_value)
+    ):
+        raise ValueError(f"Invalid footage: {footage!r}")
+    return gauge.first_frame(feet_value) + frames_value
+
+
+@lru_cache(maxsize=16)
+def _cycle_table(
+    gauge: Gauge,
+) -> tuple[int, int, list[int], list[str], list[dict[str, int]]]:
+    """Return the lookup tables of a cycle of feet of the given gauge.
+
+    The frames and the feet repeat every ``cycle_frames`` frames and
+    ``cycle_feet`` feet, i.e. 64 frames in 3 feet for 35mm 3-perf, or 16
+    frames in a foot for 35mm 4-perf.
+
+    Args:
+        gauge (Gauge): The gauge.
+
+    Returns:
+        tuple[int, int, list[int], list[str], list[dict[str, int]]]: The
+            number of frames and feet in a cycle, the foot in the cycle and the
+            "+frames" suffix of each frame in the cycle, and the frame in the
+            cycle of each zero padded frames string, for each foot in the cycle.
+    """
+    common = gcd(gauge.perfs_per_foot, gauge.perfs_per_frame)
+    cycle_frames = gauge.perfs_per_foot // common
+    cycle_feet = gauge.perfs_per_frame // common
+    feet = []
+    suffixes = []
+    values = []
+    for foot in range(cycle_feet):
+        first = gauge.first_frame(foot)
+        count = gauge.frames_in_foot(foot)
+        feet.extend([foot] * count)
+        suffixes.extend(f"+{i:02d}" for i in range(count))
+        values.append({f"{i:02d}": first + i for i in range(count)})
+    return cycle_frames, cycle_feet, feet, suffixes, values
+
+
+def format_footages(
+    frames: Iterable[int],
+    gauge: Gauge = GAUGE_35MM,
+    *,
+    start: int | Timecode = 1,
+) -> list[str]:
+    """Format the given frame counts as feet and frames.
+
+    Args:
+        frames (Iterable[int]): The frame counts, like :attr:`.Timecode.frames`.
+        gauge (Gauge): The gauge.
+        start (int | Timecode): The frame count or the timecode of "0+00".
+
+    Raises:
+        ValueError: If a frame count is before the start.
+
+    Returns:
+        list[str]: The footages.
+    """
+    if isinstance(start, Timecode):
+        start = start.frames
+    numbers = [f - start for f in frames]
+    if numbers and min(numbers) < 0:
+        raise ValueError(
+            f"frame_number should be a non-negative integer, not {min(numbers)}"
+        )
+    cycle_frames, cycle_feet, feet, suffixes, _ = _cycle_table(gauge)
+    if cycle_feet == 1:
+        return [
+            f"{cycle}{suffixes[rest]}"
+            for cycle, rest in (divmod(n, cycle_frames) for n in numbers)
+        ]
+    return [
+        f"{cycle * cycle_feet + feet[rest]}{suffixes[rest]}"
+        for cycle, rest in (divmod(n, cycle_frames) for n in numbers)
+    ]
+
+
+def parse_footages(
+    footages: Iterable[str],
+    gauge: Gauge = GAUGE_35MM,
+    *,
+    start: int | Timecode = 1,
+) -> array:
+    """Parse the given feet and frames to frame counts.
+
+    Args:
+        footages (Iterable[str]): The footages, i.e. "123+05".
+        gauge (Gauge): The gauge.
+        start (int | Timecode): The frame count or the timecode of "0+00".
+
+    Raises:
+        ValueError: If a footage is not valid for the gauge.
+
+    Returns:
+        array: An ``array("q")`` of the frame counts.
+    """
+    if isinstance(start, Timecode):
+        start = start.frames
+    cycle_frames, cycle_feet, _, _, values = _cycle_table(gauge)
+    result = array("q")
+    append = result.append
+    for footage in footages:
+        feet, _, frames = footage.partition("+")
+        if feet.isdecimal():
+            cycle, foot = divmod(int(feet), cycle_feet)
+            value = values[foot].get(frames)
+            if value is not None:
+                append(cycle * cycle_frames + value + start)
+                continue
+        # the frames are not zero padded, or the footage is invalid
+        append(parse_footage(footage, gauge) + start)
+    return result
+
+
+class Footage:
+    """A film footage in feet and frames.
+
+    The arithmetic and the ordering comparisons work like the
+    :class:`.Timecode` ones, on the frame numbers. Unlike a Timecode a Footage
+    is hashable, so it is only equal to the Footage instances of the same
+    gauge and frame number.
+
+    Args:
+        footage (str | int): Either the feet and frames, i.e. "123+05", or the
+            0 based frame number.
+        gauge (Gauge): The gauge, 35mm 4-perf by default.
+
+    Raises:
+        ValueError: If the footage is not valid for the gauge.
+    """
+
+    __slots__ = ("frame_number", "gauge")
+
+    def __init__(self, footage: str | int = 0, gauge: Gauge = GAUGE_35MM) -> None:
+        if isinstance(footage, str):
+            footage = parse_footage(footage, gauge)
+        elif footage < 0:
+            raise ValueError(
+                f"frame_number should be a non-negative integer, not {footage}"
+            )
+        self.frame_number: int = footage
+        self.gauge: Gauge = gauge
+
+    @classmethod
+    def from_timecode(
+        cls,
+        tc: Timecode,
+        gauge: Gauge = GAUGE_35MM,
+        *,
+        start: int | Timecode = 1,
+    ) -> Footage:
+        """Create a Footage from the given timecode.
+
+        Args:
+            tc (Timecode): The timecode.
+            gauge (Gauge): The gauge.
+            start (int | Timecode): The frame count or the timecode of "0+00".
+
+        Returns:
+            Footage: The footage.
+        """
+        if isinstance(start, Timecode):
+            start = start.frames
+        return cls(tc.frames - start, gauge)
+
+    def to_timecode(
+        self,
+        framerate: str | float | Fraction,
+        *,
+        start: int | Timecode = 1,
+        force_non_drop_frame: bool = False,
+    ) -> Timecode:
+        """Return the timecode of this footage.
+
+        Args:
+            framerate (str | int | float | Fraction): The frame rate, see
+                :class:`.Timecode` for the accepted values.
+            start (int | Timecode): The frame count or the timecode of "0+00".
+            force_non_drop_frame (bool): Use non drop frame calculation for
+                NTSC rates.
+
+        Returns:
+            Timecode: The timecode.
+        """
+        if isinstance(start, Timecode):
+            start = start.frames
+        rate = get_rate(framerate, force_non_drop_frame)
+        return Timecode.from_rate(rate, self.frame_number + start)
+
+    @property
+    def feet(self) -> int:
+        """Return the feet.
+
+        Returns:
+            int: The feet.
+        """
+        gauge = self.gauge
+        return self.frame_number * gauge.perfs_per_frame // gauge.perfs_per_foot
+
+    @property
+    def frs(self) -> int:
+        """Return the frames in the foot.
+
+        Returns:
+            int: The frames.
+        """
+        return self.frame_number - self.gauge.first_frame(self.feet)
+
+    def _other_frame_number(self, other: int | str | Footage | object) -> int:
+        """Return the frame number of the other operand.
+
+        Args:
+            other (int | str | Footage): Either a frame number, a footage of
+                the same gauge or a Footage.
+
+        Raises:
+            TypeError: If the other is not an int, str or Footage.
+
+        Returns:
+            int: The frame number.
+        """
+        if isinstance(other, Footage):
+            return other.frame_number
+        if isinstance(other, str):
+            return parse_footage(other, self.gauge)
+        if isinstance(other, int):
+            return other
+        raise TypeError(other.__class__.__name__)
+
+    def __eq__(self, other: object) -> bool:
+        """Override the equality operator.
+
+        The frame numbers and the footage strings are not equal to a Footage,
+        they would not have the same hash.
+
+        Args:
+            other (object): The other object.
+
+        Returns:
+            bool: True if the other is a Footage of the same gauge and frame
+                number.
+        """
+        if isinstance(other, Footage):
+            return self.gauge == other.gauge and self.frame_number == other.frame_number
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        """Return the hash of this Footage instance.
+
+        Returns:
+            int: The hash.
+        """
+        return hash((self.gauge, self.frame_number))
+
+    def _compare(self, other: int | str | Footage, operator: str) -> int:
+        """Return the difference of the frame numbers for the comparisons.
+
+        Args:
+            other (int | str | Footage): The other operand.
+            operator (str): The operator, for the error message.
+
+        Raises:
+            TypeError: If the other is not an int, str or Footage.
+
+        Returns:
+            int: This frame number minus the other one.
+        """
+        try:
+            return self.frame_number - self._other_frame_number(other)
+        except TypeError:
+            raise TypeError(
+                f"'{operator}' not supported between instances of 'Footage' and "
+                f"'{other.__class__.__name__}'"
+            ) from None
+
+    def __ge__(self, other: int | str | Footage) -> bool:
+        """Override greater than or equal to operator.
+
+        Args:
+            other (int | str | Footage): The other operand.
+
+        Returns:
+            bool: True if this Footage instance is greater than or equal to the
+                other.
+        """
+        return self._compare(other, ">=") >= 0
+
+    def __gt__(self, other: int | str | Footage) -> bool:
+        """Override greater than operator.
+
+        Args:
+            other (int | str | Footage): The other operand.
+
+        Returns:
+            bool: True if this Footage instance is greater than the other.
+        """
+        return self._compare(other, ">") > 0
+
+    def __le__(self, other: int | str | Footage) -> bool:
+        """Override less than or equal to operator.
+
+        Args:
+            other (int | str | Footage): The other operand.
+
+        Returns:
+            bool: True if this Footage instance is less than or equal to the
+                other.
+        """
+        return self._compare(other, "<=") <= 0
+
+    def __lt__(self, other: int | str | Footage) -> bool:
+        """Override less than operator.
+
+        Args:
+            other (int | str | Footage): The other operand.
+
+        Returns:
+            bool: True if this Footage instance is less than the other.
+        """
+        return self._compare(other, "<") < 0
+
+    def _arithmetic_operand(self, other: int | Footage) -> int:
+        """Return the frame number of the other arithmetic operand.
+
+        Args:
+            other (int | Footage): Either a number of frames or a Footage.
+
+        Raises:
+            TimecodeError: If the other is not an int or Footage.
+
+        Returns:
+            int: The number of frames.
+        """
+        if isinstance(other, Footage):
+            return other.frame_number
+        if isinstance(other, int):
+            return other
+        raise TimecodeError(
+            f"Type {other.__class__.__name__} not supported for arithmetic."
+        )
+
+    def __add__(self, other: int | Footage) -> Footage:
+        """Return a new Footage with the given footage or frames added.
+
+        Args:
+            other (int | Footage): Either a number of frames or a Footage.
+
+        Returns:
+            Footage: The resultant Footage instance.
+        """
+        return Footage(self.frame_number + self._arithmetic_operand(other), self.gauge)
+
+    def __sub__(self, other: int | Footage) -> Footage:
+        """Return a new Footage with the distance to the given footage or frames.
+
+        Like :meth:`.Timecode.__sub__` the result is the absolute difference.
+
+        Args:
+            other (int | Footage): Either a number of frames or a Footage.
+
+        Returns:
+            Footage: The resultant Footage instance.
+        """
+        return Footage(
+            abs(self.frame_number - self._arithmetic_operand(other)), self.gauge
+        )
+
+    def __mul__(self, other: int | Footage) -> Footage:
+        """Return a new Footage with the multiplied frame number.
+
+        Args:
+            other (int | Footage): Either a multiplier or a Footage.
+
+        Returns:
+            Footage: The resultant Footage instance.
+        """
+        return Footage(self.frame_number * self._arithmetic_operand(other), self.gauge)
+
+    def __truediv__(self, other: int | Footage) -> Footage:
+        """Return a new Footage with the divided frame number.
+
+        Args:
+            other (int | Footage): Either a divisor or a Footage.
+
+        Returns:
+            Footage: The resultant Footage instance, truncated to whole frames.
+        """
+        return Footage(self.frame_number // self._arithmetic_operand(other), self.gauge)
+
+    def __str__(self) -> str:
+        """Return the feet and frames of this Footage instance.
+
+        Returns:
+            str: The footage, i.e. "123+05".
+        """
+        return format_footage(self.frame_number, self.gauge)
+
+    def __repr__(self) -> str:
+        """Return the string representation of this Footage instance.
+
+        Returns:
+            str: The footage, i.e. "123+05".
+        """
+        return self.__str__()
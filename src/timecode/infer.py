@@ -0,0 +1,295 @@
+"""Inference of the frame rate of timecode labels or frame timestamps.
+
+Inbound metadata often comes without a frame rate. The functions in this
+module look at a sample of labels or of per-frame wall clock timestamps in a
+single pass and return the most likely frame rate and drop frame setting::
+
+    from timecode import Timecode
+    from timecode.infer import infer_from_labels
+
+    inferred = infer_from_labels(labels)
+    if inferred.confident:
+        tc = Timecode(
+            inferred.framerate,
+            labels[0],
+            force_non_drop_frame=not inferred.drop_frame,
+        )
+
+The input is consumed lazily and the pass stops as soon as the result is
+certain enough, so only the first few hundred labels of a file are read in the
+common case. The returned :class:`.InferredRate` records whether the pass
+stopped early (``confident``) or ran out of samples.
+
+Labels:
+
+* The largest frame number seen gives the nominal rate, the smallest of
+  :data:`.NOMINAL_RATES` above it.
+* A ";" frame delimiter means drop frame.
+* A label which is dropped in drop frame (i.e. ``00:01:00:00``) means non drop
+  frame, and consecutive labels skipping them (``00:00:59:29`` followed by
+  ``00:01:00:02``) mean drop frame.
+
+Labels can not tell the NTSC rates from the integer ones, except the drop frame
+rates which are always NTSC. Labels with a "." delimiter (fractions of a
+second) carry no frame rate information and are skipped.
+
+Timestamps:
+
+The mean frame duration is measured over the sample, skipping the gaps (i.e.
+dropped frames), and compared with the NTSC pattern of
+:func:`timecode.core.is_ntsc_rate`. The drop frame setting can not be seen in
+timestamps, the default of the rate is returned (drop frame for the multiples
+of 29.97).
+"""
+
+# Standard Library Imports
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, NamedTuple
+
+from timecode.core import FrameRate, get_rate, is_ntsc_rate, split_label
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+NOMINAL_RATES = (24, 25, 30, 48, 50, 60, 72, 96, 100, 120)
+"""tuple[int, ...]: The nominal frame rates the labels are matched against."""
+
+DEFAULT_MIN_SAMPLES = 100
+"""int: The default number of samples to look at before stopping early."""
+
+GAP_FACTOR = 1.5
+"""float: Timestamp deltas longer than this many frames are skipped as gaps."""
+
+
+class InferredRate(NamedTuple):
+    """The result of a frame rate inference.
+
+    Attributes:
+        framerate (str): The frame rate, as accepted by :class:`.Timecode`.
+        drop_frame (bool): True if the labels are drop frame.
+        confident (bool): True if the inference stopped early because the
+            result is certain, False if it ran out of samples.
+        samples (int): The number of samples looked at.
+    """
+
+    framerate: str
+    drop_frame: bool
+    confident: bool
+    samples: int
+
+    @property
+    def rate(self) -> FrameRate:
+        """Return the frame rate descriptor of the inferred rate.
+
+        Returns:
+            FrameRate: The frame rate descriptor.
+        """
+        return get_rate(self.framerate, not self.drop_frame)
+
+
+def format_rate(nominal: int, ntsc: bool) -> str:
+    """Return the frame rate string of the given nominal rate.
+
+    Args:
+        nominal (int): The nominal (integer) frame rate.
+        ntsc (bool): True for the NTSC variant of the rate.
+
+    Returns:
+        str: The frame rate, i.e. "25", "23.976" or "29.97".
+    """
+    if not ntsc:
+        return str(nominal)
+    return f"{nominal * 1000 / 1001:.3f}".rstrip("0")
+
+
+def infer_from_labels(
+    labels: Iterable[str],
+    *,
+    min_samples: int = DEFAULT_MIN_SAMPLES,
+) -> InferredRate:
+    """Infer the frame rate of the given timecode labels.
+
+    The labels do not need to be consecutive or in order, but consecutive
+    labels give the drop frame evidence a lot faster.
+
+    Args:
+        labels (Iterable[str]): The labels, consumed up to the point the
+            result is certain.
+        min_samples (int): The minimum number of labels to look at before
+            stopping early. With consecutive labels it should be more than a
+            second of frames, so the largest frame number is seen.
+
+    Raises:
+        ValueError: If there are no labels with frame numbers or the frame
+            numbers are too large for the :data:`.NOMINAL_RATES`.
+
+    Returns:
+        InferredRate: The inferred frame rate.
+    """
+    max_frame = -1
+    nominal = NOMINAL_RATES[0]
+    drop_frame = non_drop_frame = False
+    previous = None
+    samples = 0
+    for label in labels:
+        if "." in label:
+            continue
+        samples += 1
+        hours, minutes, seconds, frames = components = split_label(label)
+        if frames > max_frame:
+            max_frame = frames
+            nominal = _nominal_rate(max_frame)
+        if ";" in label:
+            drop_frame = True
+        if not seconds and minutes % 10 and frames < nominal // 15:
+            # a label which does not exist in drop frame
+            non_drop_frame = True
+        elif (
+            previous is not None
+            and not seconds
+            and minutes % 10
+            and frames == nominal // 15
+            and previous == (hours, minutes - 1, 59, nominal - 1)
+        ):
+            # the dropped labels are skipped
+            drop_frame = True
+        previous = components
+        if (
+            samples >= min_samples
+            and max_frame == nominal - 1
+            and (nominal % 30 or drop_frame or non_drop_frame)
+        ):
+            return _label_result(nominal, drop_frame, non_drop_frame, True, samples)
+
+    if not samples:
+        raise ValueError("Can not infer the frame rate without frame numbered labels")
+    return _label_result(nominal, drop_frame, non_drop_frame, False, samples)
+
+
+def infer_from_timestamps(
+    timestamps: Iterable[float],
+    *,
+    resolution: float = 1e-3,
+    min_samples: int = DEFAULT_MIN_SAMPLES,
+) -> InferredRate:
+    """Infer the frame rate of the given per-frame timestamps.
+
+    The pass stops early when the measured rate is closer to the inferred
+    rate than to its NTSC (or non NTSC) counterpart by more than the error the
+    timestamp resolution allows.
+
+    Args:
+        timestamps (Iterable[float]): The wall clock time of the frames in
+            seconds, in ascending order, consumed up to the point the result
+            is certain.
+        resolution (float): The precision of the timestamps in seconds.
+        min_samples (int): The minimum number of timestamps to look at before
+            stopping early.
+
+    Raises:
+        ValueError: If there are less than two distinct timestamps.
+
+    Returns:
+        InferredRate: The inferred frame rate.
+    """
+    previous = None
+    total = 0.0
+    count = 0
+    segments = 1
+    samples = 0
+    for timestamp in timestamps:
+        samples += 1
+        if previous is None:
+            previous = timestamp
+            continue
+        delta = timestamp - previous
+        previous = timestamp
+        if delta <= 0:
+            continue
+        if count and delta * count > GAP_FACTOR * total:
+            segments += 1
+            continue
+        total += delta
+        count += 1
+        if samples < min_samples:
+            continue
+        fps = count / total
+        ntsc, nominal = is_ntsc_rate(fps)
+        # the error of the measured rate, against the distance of the NTSC
+        # rate from the integer rate
+        error = fps * 2 * resolution * segments / total
+        distance = abs(fps - (nominal * 1000 / 1001 if ntsc else nominal))
+        if nominal and error + distance < nominal / 2002:
+            return _timestamp_result(nominal, ntsc, True, samples)
+
+    if not count:
+        raise ValueError("Can not infer the frame rate from less than two timestamps")
+    ntsc, nominal = is_ntsc_rate(count / total)
+    return _timestamp_result(nominal, ntsc, False, samples)
+
+
+def _nominal_rate(max_frame: int) -> int:
+    """Return the smallest nominal rate the given frame number fits in.
+
+    Args:
+        max_frame (int): The largest frame number.
+
+    Raises:
+        ValueError: If the frame number is too large.
+
+    Returns:
+        int: The nominal rate.
+    """
+    for nominal in NOMINAL_RATES:
+        if max_frame < nominal:
+            return nominal
+    raise ValueError(
+        f"Frame number {max_frame} is too large for the nominal rates, "
+        f"the maximum is {NOMINAL_RATES[-1] - 1}"
+    )
+
+
+def _label_result(
+    nominal: int,
+    drop_frame: bool,
+    non_drop_frame: bool,
+    confident: bool,
+    samples: int,
+) -> InferredRate:
+    """Return the inference result of labels.
+
+    Args:
+        nominal (int): The nominal rate.
+        drop_frame (bool): True if there is drop frame evidence.
+        non_drop_frame (bool): True if there is non drop frame evidence.
+        confident (bool): True if the inference stopped early.
+        samples (int): The number of labels looked at.
+
+    Returns:
+        InferredRate: The inference result.
+    """
+    # a label which does not exist in drop frame outweighs the delimiter
+    drop_frame = drop_frame and not non_drop_frame and not nominal % 30
+    return InferredRate(
+        format_rate(nominal, drop_frame), drop_frame, confident, samples
+    )
+
+
+def _timestamp_result(
+    nominal: int, ntsc: bool, confident: bool, samples: int
+) -> InferredRate:
+    """Return the inference result of timestamps.
+
+    Args:
+        nominal (int): The nominal rate.
+        ntsc (bool): True if the rate is NTSC.
+        confident (bool): True if the inference stopped early.
+        samples (int): The number of timestamps looked at.
+
+    Returns:
+        InferredRate: The inference result.
+    """
+    framerate = format_rate(nominal, ntsc)
+    return InferredRate(framerate, get_rate(framerate).drop_frame, confident, samples)
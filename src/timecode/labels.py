@@ -0,0 +1,219 @@
+"""Incremental generation of consecutive timecode labels.
+
+Generating one label per frame with :meth:`.Timecode.next` and ``repr()``
+decodes the frame count and formats the label from scratch for every frame.
+The generators in this module instead increment the hours, minutes, seconds
+and frames fields directly, skip the dropped frame labels of drop frame rates
+and build the labels from precomputed field strings::
+
+    from timecode import Timecode
+    from timecode.labels import write_labels
+
+    tc = Timecode("59.94", "00:00:00;00")
+    with open("sidecar.txt", "w") as f:
+        write_labels(f, tc.rate, tc.frames, 5178816)
+
+The labels are equal to the ``repr()`` of the :class:`.Timecode` instances with
+the same frame counts, including the rollover after 24 hours.
+"""
+
+# Standard Library Imports
+from __future__ import annotations
+
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import chain, islice
+from typing import TYPE_CHECKING
+
+from timecode.buckets import bucket_starts
+from timecode.core import (
+    FRACTION,
+    SMPTE,
+    format_label,
+    frames_to_components,
+    frames_to_label,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from typing import TextIO
+
+    from timecode.core import FrameRate
+
+
+TWO_DIGITS = tuple(f"{i:02d}" for i in range(100))
+"""tuple[str, ...]: Zero padded two digit strings from "00" to "99"."""
+
+
+@lru_cache(maxsize=32)
+def _second_fields(rate: FrameRate, style: str) -> tuple[tuple[str, ...], ...]:
+    """Return the seconds and frames part of the labels for every second.
+
+    Args:
+        rate (FrameRate): The frame rate descriptor.
+        style (str): The label style, see :func:`.format_label`.
+
+    Returns:
+        tuple: 60 tuples, one for each second of a minute, containing the
+            seconds and frames part of the labels of every frame in that second.
+    """
+    return tuple(
+        tuple(
+            format_label(rate, (0, 0, secs, frs), style)[6:]
+            for frs in range(rate.int_framerate)
+        )
+        for secs in range(60)
+    )
+
+
+@lru_cache(maxsize=8)
+def _label_table(rate: FrameRate) -> tuple[list[int], list[str], list[int]]:
+    """Return the lookup table of the labels of every second of a day.
+
+    Args:
+        rate (FrameRate): The frame rate descriptor.
+
+    Returns:
+        tuple: The frame count each second starts at, then the "HH:MM:SS" part
+            of the labels with the delimiter and the number to add to a frame
+            count to get the frames part of its label for each second. The
+            last two have a leading dummy item, so they are indexed with the
+            ``bisect_right()`` of the frame count in the first one.
+    """
+    starts = bucket_starts(rate)
+    prefixes = [""]
+    offsets = [0]
+    for start in starts[:-1]:
+        hrs, mins, secs, frs = frames_to_components(rate, start)
+        prefixes.append(format_label(rate, (hrs, mins, secs, 0))[:-2])
+        offsets.append(frs - start)
+    return list(starts), prefixes, offsets
+
+
+def format_labels(rate: FrameRate, frames: Iterable[int]) -> list[str]:
+    """Convert the given frame counts to labels.
+
+    Unlike the other functions in this module the frame counts do not need to
+    be consecutive. Each frame count is looked up in a table of the seconds of
+    a day, built once per frame rate, which is a lot faster than
+    :func:`timecode.core.frames_to_label` for large inputs.
+
+    Args:
+        rate (FrameRate): The frame rate descriptor.
+        frames (Iterable[int]): The frame counts.
+
+    Returns:
+        list[str]: The labels, equal to the ``repr()`` of the
+            :class:`.Timecode` instances with the same frame counts.
+    """
+    if rate.ms_frame or rate.int_framerate > len(TWO_DIGITS):
+        return [frames_to_label(rate, f) for f in frames]
+    starts, prefixes, offsets = _label_table(rate)
+    day = rate.frames_per_24_hours
+    return [
+        prefixes[i] + TWO_DIGITS[f + offsets[i]]
+        for f in [(f - 1) % day + 1 for f in frames]
+        for i in (bisect_right(starts, f),)
+    ]
+
+
+def iter_label_chunks(
+    rate: FrameRate, frames: int = 1, style: str = SMPTE
+) -> Iterator[list[str]]:
+    """Yield the consecutive labels starting from the given frame count.
+
+    The labels are yielded in lists, one list for each second.
+
+    Args:
+        rate (FrameRate): The frame rate descriptor.
+        frames (int): The frame count of the first label.
+        style (str): The label style, see :func:`.format_label`.
+
+    Yields:
+        list[str]: The labels of one second, the first and last lists may be
+            partial.
+    """
+    if style not in (SMPTE, FRACTION):
+        raise ValueError(
+            f"style should be one of {SMPTE!r} or {FRACTION!r}, not {style!r}"
+        )
+
+    second_fields = _second_fields(rate, style)
+    drop_frames = rate.drop_frames
+    hrs, mins, secs, frs = frames_to_components(rate, frames)
+    prefix = f"{TWO_DIGITS[hrs]}:{TWO_DIGITS[mins]}:"
+    while True:
+        yield [prefix + fields for fields in second_fields[secs][frs:]]
+        frs = 0
+        secs += 1
+        if secs == 60:
+            secs = 0
+            mins += 1
+            if mins == 60:
+                mins = 0
+                hrs += 1
+                if hrs == 24:
+                    hrs = 0
+            if mins % 10:
+                frs = drop_frames
+            prefix = f"{TWO_DIGITS[hrs]}:{TWO_DIGITS[mins]}:"
+
+
+def iter_labels(
+    rate: FrameRate, frames: int = 1, count: None | int = None, style: str = SMPTE
+) -> Iterator[str]:
+    """Yield the consecutive labels starting from the given frame count.
+
+    Args:
+        rate (FrameRate): The frame rate descriptor.
+        frames (int): The frame count of the first label.
+        count (None | int): The number of labels, the generator is endless if
+            skipped.
+        style (str): The label style, see :func:`.format_label`.
+
+    Returns:
+        Iterator[str]: The labels.
+    """
+    labels = chain.from_iterable(iter_label_chunks(rate, frames, style))
+    if count is None:
+        return labels
+    return islice(labels, count)
+
+
+def write_labels(
+    sink: TextIO,
+    rate: FrameRate,
+    frames: int,
+    count: int,
+    *,
+    style: str = SMPTE,
+    newline: str = "\n",
+) -> int:
+    """Write the consecutive labels starting from the given frame count.
+
+    The labels of each second are joined and written at once.
+
+    Args:
+        sink (TextIO): A text stream to write the labels to.
+        rate (FrameRate): The frame rate descriptor.
+        frames (int): The frame count of the first label.
+        count (int): The number of labels.
+        style (str): The label style, see :func:`.format_label`.
+        newline (str): The str written after each label.
+
+    Returns:
+        int: The number of labels written.
+    """
+    if count <= 0:
+        return 0
+    remaining = count
+    write = sink.write
+    for labels in iter_label_chunks(rate, frames, style):
+        if len(labels) >= remaining:
+            write(newline.join(labels[:remaining]))
+            write(newline)
+            break
+        remaining -= len(labels)
+        write(newline.join(labels))
+        write(newline)
+    return count
@@ -0,0 +1,266 @@
+"""Timecode of PTP and RTP timestamps of SMPTE ST 2110 streams.
+
+In an IP facility the timecode is not carried with the essence, it is derived
+from the PTP time (SMPTE ST 2059-1), which counts TAI nanoseconds since the
+PTP epoch (1970-01-01 00:00:00 TAI), or from the 90 kHz RTP timestamps of the
+packets (SMPTE ST 2110-10), which count the same time modulo 2**32::
+
+    from timecode.ptp import ptp_to_frames, rtp_to_frames
+
+    frames = ptp_to_frames(ptp_ns, "29.97", utc_offset=3600)
+    frames = rtp_to_frames(rtp_timestamps, "25", reference=capture_start_ns)
+
+The conversion follows the alignment rules of ST 2059-1 with integer
+arithmetic only:
+
+* The frames are aligned to the PTP epoch, frame ``n`` starts at
+  ``n * denominator / numerator`` seconds after the epoch.
+* The time of day is the TAI time minus the leap seconds (the TAI - UTC
+  offset), plus the local time offset.
+* The timecode is jammed every day at the jam time (midnight by default): the
+  first frame starting at or after the jam time gets the label of the jam time,
+  and the following frames are counted from it. For the integer rates the
+  timecode is the time of day. The drop frame and NTSC non drop frame labels
+  drift from the time of day during the day, which the daily jam resets.
+
+Captured timestamps can be replayed from text files with
+:func:`.read_timestamps`.
+"""
+
+# Standard Library Imports
+from __future__ import annotations
+
+from array import array
+from typing import TYPE_CHECKING
+
+from timecode.core import components_to_frames, get_rate
+from timecode.timecode import Timecode
+
+if TYPE_CHECKING:
+    import os
+    from collections.abc import Iterable
+    from fractions import Fraction
+
+
+NANOSECONDS = 1_000_000_000
+"""int: The clock rate of the PTP timestamps."""
+
+RTP_CLOCK_RATE = 90_000
+"""int: The clock rate of the RTP timestamps of video streams."""
+
+TAI_UTC_OFFSET = 37
+"""int: The leap seconds between TAI and UTC, since 2017-01-01."""
+
+SECONDS_PER_DAY = 86400
+"""int: The number of seconds in a day."""
+
+
+def ptp_to_frames(
+    timestamps: Iterable[int],
+    framerate: str | float | Fraction,
+    *,
+    leap_seconds: int = TAI_UTC_OFFSET,
+    utc_offset: int = 0,
+    jam_time: int = 0,
+    force_non_drop_frame: bool = False,
+    clock_rate: int = NANOSECONDS,
+) -> array:
+    """Convert the given PTP timestamps to frame counts.
+
+    Args:
+        timestamps (Iterable[int]): The TAI time since the PTP epoch, in ticks
+            of the clock rate.
+        framerate (str | int | float | Fraction): The frame rate, see
+            :class:`.Timecode` for the accepted values.
+        leap_seconds (int): The TAI - UTC offset in seconds.
+        utc_offset (int): The offset of the local time from UTC in seconds,
+            i.e. 3600 for CET.
+        jam_time (int): The time of day the timecode is jammed at, in seconds
+            after the local midnight. With drop frame rates it should not be
+            a dropped label (the start of a minute other than the tenth).
+        force_non_drop_frame (bool): Use non drop frame calculation for NTSC
+            rates.
+        clock_rate (int): The number of ticks per second of the timestamps.
+
+    Raises:
+        ValueError: If the jam time or the clock rate is invalid, or the jam
+            time is a label dropped by the drop frame rates.
+
+    Returns:
+        array: An ``array("q")`` of the frame counts, where "00:00:00:00" is 1.
+    """
+    if not isinstance(jam_time, int) or not 0 <= jam_time < SECONDS_PER_DAY:
+        raise ValueError(
+            f"jam_time should be an integer between 0 and {SECONDS_PER_DAY - 1}, "
+            f"not {jam_time}"
+        )
+    if not isinstance(clock_rate, int) or clock_rate < 1:
+        raise ValueError(f"clock_rate should be a positive integer, not {clock_rate}")
+
+    rate = get_rate(framerate, force_non_drop_frame)
+    # frame n starts at n * frame_ticks / numerator ticks
+    frame_ticks = rate.denominator * clock_rate
+    numerator = rate.numerator
+    day = SECONDS_PER_DAY * clock_rate
+    # the TAI time of the jam time of the local day 0
+    jam_offset = (jam_time + leap_seconds - utc_offset) * clock_rate
+    minutes, seconds = divmod(jam_time, 60)
+    if rate.drop_frame and not seconds and minutes % 10:
+        raise ValueError(f"jam_time {jam_time} is a dropped drop frame label")
+    jam_label = components_to_frames(rate, minutes // 60, minutes % 60, seconds, 0)
+    day_frames = rate.frames_per_24_hours
+
+    # the first frame of each jam, by the number of days since the epoch
+    jam_frames: dict[int, int] = {}
+    day_numerator = day * numerator
+    jam_numerator = jam_offset * numerator
+    result = array("q")
+    append = result.append
+    for timestamp in timestamps:
+        number = timestamp * numerator // frame_ticks
+        # the day of the last jam at or before the start of the frame
+        days = (number * frame_ticks - jam_numerator) // day_numerator
+        jam_frame = jam_frames.get(days)
+        if jam_frame is None:
+            jam_frame = jam_frames[days] = -(
+                -(days * day_numerator + jam_numerator) // frame_ticks
+            )
+        append((jam_label - 1 + number - jam_frame) % day_frames + 1)
+    return result
+
+
+def ptp_to_timecode(
+    timestamp: int,
+    framerate: str | float | Fraction,
+    *,
+    leap_seconds: int = TAI_UTC_OFFSET,
+    utc_offset: int = 0,
+    jam_time: int = 0,
+    force_non_drop_frame: bool = False,
+) -> Timecode:
+    """Convert the given PTP timestamp to a timecode.
+
+    See :func:`.ptp_to_frames` for the arguments.
+
+    Args:
+        timestamp (int): The TAI nanoseconds since the PTP epoch.
+        framerate (str | int | float | Fraction): The frame rate.
+        leap_seconds (int): The TAI - UTC offset in seconds.
+        utc_offset (int): The offset of the local time from UTC in seconds.
+        jam_time (int): The time of day the timecode is jammed at.
+        force_non_drop_frame (bool): Use non drop frame calculation for NTSC
+            rates.
+
+    Returns:
+        Timecode: The timecode.
+    """
+    (frames,) = ptp_to_frames(
+        [timestamp],
+        framerate,
+        leap_seconds=leap_seconds,
+        utc_offset=utc_offset,
+        jam_time=jam_time,
+        force_non_drop_frame=force_non_drop_frame,
+    )
+    return Timecode.from_rate(get_rate(framerate, force_non_drop_frame), frames)
+
+
+def unwrap_rtp(
+    timestamps: Iterable[int],
+    *,
+    reference: None | int = None,
+    bits: int = 32,
+) -> array:
+    """Unwrap the given RTP timestamps to a monotonic timeline.
+
+    Consecutive timestamps are assumed to be less than half of the wrap
+    period (13 hours for 32 bit 90 kHz timestamps) apart, and can go
+    backwards (i.e. the reordered packets).
+
+    Args:
+        timestamps (Iterable[int]): The RTP timestamps.
+        reference (None | int): The approximate full timestamp of the first
+            one, i.e. the PTP time of the capture in ticks of the RTP clock.
+            Without it the first timestamp is taken as it is.
+        bits (int): The number of bits of the timestamps.
+
+    Returns:
+        array: An ``array("q")`` of the unwrapped timestamps.
+    """
+    period = 1 << bits
+    half = period >> 1
+    result = array("q")
+    append = result.append
+    previous = reference
+    for timestamp in timestamps:
+        if previous is None:
+            previous = timestamp
+        else:
+            # the signed distance from the previous timestamp
+            previous += (timestamp - previous + half) % period - half
+        append(previous)
+    return result
+
+
+def rtp_to_frames(
+    timestamps: Iterable[int],
+    framerate: str | float | Fraction,
+    *,
+    reference: int,
+    leap_seconds: int = TAI_UTC_OFFSET,
+    utc_offset: int = 0,
+    jam_time: int = 0,
+    force_non_drop_frame: bool = False,
+    clock_rate: int = RTP_CLOCK_RATE,
+) -> array:
+    """Convert the given 32 bit RTP timestamps to frame counts.
+
+    The timestamps are unwrapped with :func:`.unwrap_rtp` around the given PTP
+    time and converted with :func:`.ptp_to_frames`.
+
+    Args:
+        timestamps (Iterable[int]): The RTP timestamps.
+        framerate (str | int | float | Fraction): The frame rate.
+        reference (int): The approximate PTP time of the first timestamp in
+            TAI nanoseconds, within a few hours.
+        leap_seconds (int): The TAI - UTC offset in seconds.
+        utc_offset (int): The offset of the local time from UTC in seconds.
+        jam_time (int): The time of day the timecode is jammed at.
+        force_non_drop_frame (bool): Use non drop frame calculation for NTSC
+            rates.
+        clock_rate (int): The clock rate of the RTP timestamps.
+
+    Returns:
+        array: An ``array("q")`` of the frame counts, where "00:00:00:00" is 1.
+    """
+    return ptp_to_frames(
+        unwrap_rtp(timestamps, reference=reference * clock_rate // NANOSECONDS),
+        framerate,
+        leap_seconds=leap_seconds,
+        utc_offset=utc_offset,
+        jam_time=jam_time,
+        force_non_drop_frame=force_non_drop_frame,
+        clock_rate=clock_rate,
+    )
+
+
+def read_timestamps(path: str | os.PathLike) -> array:
+    """Read captured timestamps from a text file.
+
+    The file has one integer timestamp per line, blank lines and the lines
+    starting with "#" are skipped. Only the first whitespace separated field
+    of a line is read, so the capture can have more columns.
+
+    Args:
+        path (str | os.PathLike): The path of the file.
+
+    Returns:
+        array: An ``array("q")`` of the timestamps.
+    """
+    result = array("q")
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            fields = line.split(None, 1)
+            if fields and not fields[0].startswith("#"):
+                result.append(int(fields[0]))
+    return result
@@ -0,0 +1,233 @@
+"""Conversion of packet timestamps to timecodes.
+
+Demuxers (i.e. ``ffprobe -show_packets``) report the presentation timestamps
+of the packets as integer ticks of a time base like ``1/90000`` or
+``1001/60000``. The functions in this module convert whole columns of them to
+frame counts with integer arithmetic, snapping each timestamp to the nearest
+frame of the frame rate and reporting how far it was from it::
+
+    from timecode import Timecode
+    from timecode.pts import find_gaps, pts_to_frames
+
+    start = Timecode("29.97", "01:00:00;00")
+    frames, errors = pts_to_frames(pts, "1/90000", "29.97", start=start)
+    for gap in find_gaps(frames):
+        print(f"{gap.count} frames missing after packet {gap.index}")
+
+Unlike ``Timecode(framerate, start_seconds=...)``, which truncates the float
+seconds with the integer frame rate, the conversion uses the exact frame rate,
+so NTSC timestamps do not drift.
+"""
+
+# Standard Library Imports
+from __future__ import annotations
+
+from array import array
+from fractions import Fraction
+from math import gcd
+from typing import TYPE_CHECKING, NamedTuple
+
+from timecode.core import get_rate
+from timecode.labels import format_labels
+from timecode.sort import argsort
+from timecode.timecode import Timecode
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from timecode.core import FrameRate
+
+
+class SnappedFrames(NamedTuple):
+    """The frame counts of a timestamp column.
+
+    Attributes:
+        frames (array): An ``array("q")`` of the frame counts, where
+            "00:00:00:00" is 1.
+        errors (array): An ``array("d")`` of the distance of each timestamp
+            from the start of the nearest frame, in frames, from -0.5 up to
+            (but not including) 0.5. Positive errors are after the frame
+            start.
+    """
+
+    frames: array
+    errors: array
+
+
+class Gap(NamedTuple):
+    """A run of frames without a timestamp.
+
+    Attributes:
+        index (int): The index of the timestamp before the gap.
+        start (int): The frame count of the first missing frame.
+        count (int): The number of missing frames.
+    """
+
+    index: int
+    start: int
+    count: int
+
+
+def parse_time_base(time_base: str | tuple[int, int] | Fraction) -> Fraction:
+    """Parse the given time base.
+
+    Args:
+        time_base (str | tuple[int, int] | Fraction): The length of a tick in
+            seconds, i.e. "1/90000", ``(1001, 60000)`` or a Fraction.
+
+    Raises:
+        ValueError: If the time base is not a positive ratio.
+
+    Returns:
+        Fraction: The time base.
+    """
+    try:
+        if isinstance(time_base, tuple):
+            value = Fraction(*time_base)
+        else:
+            value = Fraction(time_base)
+    except (TypeError, ValueError, ZeroDivisionError):
+        raise ValueError(f"Invalid time base: {time_base!r}") from None
+    if value <= 0:
+        raise ValueError(f"Invalid time base: {time_base!r}")
+    return value
+
+
+def pts_to_frames(
+    pts: Sequence[int],
+    time_base: str | tuple[int, int] | Fraction,
+    framerate: str | float | Fraction,
+    *,
+    start: int | Timecode = 1,
+    start_pts: None | int = None,
+) -> SnappedFrames:
+    """Convert the given timestamps to frame counts.
+
+    Args:
+        pts (Sequence[int]): The timestamps in ticks of the time base, in any
+            order (i.e. decoding order).
+        time_base (str | tuple[int, int] | Fraction): The length of a tick in
+            seconds.
+        framerate (str | int | float | Fraction): The frame rate, see
+            :class:`.Timecode` for the accepted values.
+        start (int | Timecode): The frame count or the timecode of the frame
+            at ``start_pts``.
+        start_pts (None | int): The timestamp of the ``start`` frame, defaults
+            to the first timestamp.
+
+    Returns:
+        SnappedFrames: The frame counts and the snap errors.
+    """
+    multiplier, divisor = _scale(parse_time_base(time_base), get_rate(framerate))
+    if isinstance(start, Timecode):
+        start = start.frames
+    if start_pts is None:
+        start_pts = pts[0] if len(pts) else 0
+    # the frame number times the divisor, rounded half up to whole frames
+    scaled = [(p - start_pts) * multiplier for p in pts]
+    double = 2 * divisor
+    numbers = [(2 * s + divisor) // double for s in scaled]
+    return SnappedFrames(
+        array("q", [n + start for n in numbers]),
+        array("d", [(s - n * divisor) / divisor for s, n in zip(scaled, numbers)]),
+    )
+
+
+def pts_to_labels(
+    pts: Sequence[int],
+    time_base: str | tuple[int, int] | Fraction,
+    framerate: str | float | Fraction,
+    *,
+    start: int | Timecode = 1,
+    start_pts: None | int = None,
+    force_non_drop_frame: bool = False,
+) -> list[str]:
+    """Convert the given timestamps to timecode labels.
+
+    The labels are formatted with :func:`timecode.labels.format_labels`. See
+    :func:`.pts_to_frames` for the arguments.
+
+    Args:
+        pts (Sequence[int]): The timestamps in ticks of the time base.
+        time_base (str | tuple[int, int] | Fraction): The length of a tick.
+        framerate (str | int | float | Fraction): The frame rate.
+        start (int | Timecode): The frame count or the timecode of the frame
+            at ``start_pts``.
+        start_pts (None | int): The timestamp of the ``start`` frame.
+        force_non_drop_frame (bool): Use non drop frame labels for NTSC rates.
+
+    Returns:
+        list[str]: The labels.
+    """
+    frames, _ = pts_to_frames(
+        pts, time_base, framerate, start=start, start_pts=start_pts
+    )
+    return format_labels(get_rate(framerate, force_non_drop_frame), frames)
+
+
+def pts_to_timecode(
+    pts: int,
+    time_base: str | tuple[int, int] | Fraction,
+    framerate: str | float | Fraction,
+    *,
+    start: int | Timecode = 1,
+    start_pts: int = 0,
+    force_non_drop_frame: bool = False,
+) -> tuple[Timecode, float]:
+    """Convert the given timestamp to a timecode.
+
+    Args:
+        pts (int): The timestamp in ticks of the time base.
+        time_base (str | tuple[int, int] | Fraction): The length of a tick.
+        framerate (str | int | float | Fraction): The frame rate.
+        start (int | Timecode): The frame count or the timecode of the frame
+            at ``start_pts``.
+        start_pts (int): The timestamp of the ``start`` frame.
+        force_non_drop_frame (bool): Use non drop frame calculation for NTSC
+            rates.
+
+    Returns:
+        tuple[Timecode, float]: The timecode of the nearest frame and the snap
+            error in frames.
+    """
+    (frames,), (error,) = pts_to_frames(
+        [pts], time_base, framerate, start=start, start_pts=start_pts
+    )
+    return Timecode.from_rate(get_rate(framerate, force_non_drop_frame), frames), error
+
+
+def find_gaps(frames: Sequence[int]) -> list[Gap]:
+    """Find the frames without a timestamp.
+
+    With variable frame rate streams or dropped packets, frames are missing
+    between the timestamps. Repeated frame counts are not gaps.
+
+    Args:
+        frames (Sequence[int]): The frame counts, in any order.
+
+    Returns:
+        list[Gap]: The gaps, in frame count order.
+    """
+    order = argsort(frames)
+    return [
+        Gap(a, frames[a] + 1, frames[b] - frames[a] - 1)
+        for a, b in zip(order, order[1:])
+        if frames[b] - frames[a] > 1
+    ]
+
+
+def _scale(time_base: Fraction, rate: FrameRate) -> tuple[int, int]:
+    """Return the ratio of the frame numbers to the ticks.
+
+    Args:
+        time_base (Fraction): The time base.
+        rate (FrameRate): The frame rate descriptor.
+
+    Returns:
+        tuple[int, int]: The multiplier and the divisor of the ticks, in
+            lowest terms.
+    """
+    multiplier = time_base.numerator * rate.numerator
+    divisor = time_base.denominator * rate.denominator
+    common = gcd(multiplier, divisor)
+    return multiplier // common, divisor // common
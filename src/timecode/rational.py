@@ -0,0 +1,235 @@
+"""Conversion between rational time strings and frame numbers.
+
+FCPXML and similar formats express time as a rational number of seconds, like
+``"1001/30000s"`` or ``"3600s"``. The functions in this module convert those
+strings to frame numbers (and back) with integer arithmetic only, at any frame
+rate supported by :class:`.Timecode`::
+
+    from timecode.core import get_rate
+    from timecode.rational import rational_to_frame_number, rationals_to_frame_numbers
+
+    rate = get_rate("29.97")
+    rational_to_frame_number(rate, "1001/30000s")  # 1
+    rationals_to_frame_numbers(["0s", "3003/30000s"], "29.97")  # array("q", [0, 3])
+
+The frame numbers are 0 based, so they can be used both for durations and for
+offsets, where the :attr:`.Timecode.frames` of an offset is the frame number
+plus 1. Values which do not fall on a frame boundary raise a ``ValueError``.
+
+The scale factors are calculated once per frame rate and time denominator, so
+converting many values which share the same few denominators (which is the
+case for an FCPXML document) is a division and a multiplication per value.
+"""
+
+# Standard Library Imports
+from __future__ import annotations
+
+from array import array
+from functools import lru_cache
+from math import gcd
+from typing import TYPE_CHECKING
+
+from timecode.core import get_rate
+from timecode.timecode import Timecode
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from fractions import Fraction
+
+    from timecode.core import FrameRate
+
+
+def split_rational(value: str) -> tuple[int, int]:
+    """Split the given rational time string to its numerator and denominator.
+
+    Args:
+        value (str): The rational time, i.e. "1001/30000s" or "3600s".
+
+    Returns:
+        tuple[int, int]: The numerator and the denominator, the denominator is
+            1 for whole seconds.
+    """
+    if not value.endswith("s"):
+        raise ValueError(f"Invalid rational time: {value!r}")
+    numerator, slash, denominator = value[:-1].partition("/")
+    try:
+        return int(numerator), int(denominator) if slash else 1
+    except ValueError:
+        raise ValueError(f"Invalid rational time: {value!r}") from None
+
+
+@lru_cache(maxsize=1024)
+def _time_scale(rate: FrameRate, denominator: int) -> tuple[int, int]:
+    """Return the scale factors from time numerators to frame numbers.
+
+    A time of ``n / denominator`` seconds is ``n * multiplier / divisor``
+    frames, where the multiplier and the divisor have no common factor.
+
+    Args:
+        rate (FrameRate): The frame rate descriptor.
+        denominator (int): The denominator of the time.
+
+    Returns:
+        tuple[int, int]: The multiplier and the divisor.
+    """
+    if denominator <= 0:
+        raise ValueError(
+            f"The denominator of a rational time should be positive, not {denominator}"
+        )
+    multiplier = rate.numerator
+    divisor = rate.denominator * denominator
+    common = gcd(multiplier, divisor)
+    return multiplier // common, divisor // common
+
+
+def rational_to_frame_number(rate: FrameRate, value: str) -> int:
+    """Convert the given rational time string to a frame number.
+
+    Args:
+        rate (FrameRate): The frame rate descriptor.
+        value (str): The rational time, i.e. "1001/30000s" or "3600s".
+
+    Returns:
+        int: The 0 based frame number.
+    """
+    numerator, denominator = split_rational(value)
+    multiplier, divisor = _time_scale(rate, denominator)
+    quotient, remainder = divmod(numerator, divisor)
+    if remainder:
+        raise ValueError(f"{value!r} is not on the frame grid of {rate.framerate} fps")
+    return quotient * multiplier
+
+
+def frame_number_to_rational(rate: FrameRate, frame_number: int) -> str:
+    """Convert the given frame number to a rational time string.
+
+    The time is written in the time base of the frame rate, i.e.
+    "1001/30000s" at 29.97, and whole seconds are written without a
+    denominator, i.e. "3600s".
+
+    Args:
+        rate (FrameRate): The frame rate descriptor.
+        frame_number (int): The 0 based frame number.
+
+    Returns:
+        str: The rational time.
+    """
+    numerator = frame_number * rate.denominator
+    if numerator % rate.numerator:
+        return f"{numerator}/{rate.numerator}s"
+    return f"{numerator // rate.numerator}s"
+
+
+def rationals_to_frame_numbers(
+    values: Iterable[str],
+    framerate: str | float | Fraction,
+    force_non_drop_frame: bool = False,
+) -> array:
+    """Convert the given rational time strings to frame numbers in bulk.
+
+    Args:
+        values (Iterable[str]): The rational times.
+        framerate (str | int | float | Fraction): The frame rate, see
+            :class:`.Timecode` for the accepted values.
+        force_non_drop_frame (bool): Use non drop frame calculation for NTSC
+            rates.
+
+    Returns:
+        array: An ``array("q")`` of 0 based frame numbers.
+    """
+    rate = get_rate(framerate, force_non_drop_frame)
+    # the scale factors by the denominator text, so the cached factors are
+    # looked up without hashing the rate for every value
+    scales: dict[str, tuple[int, int]] = {}
+    frame_numbers = array("q")
+    append = frame_numbers.append
+    for value in values:
+        numerator, slash, denominator = value.partition("/")
+        if not slash:
+            if not value.endswith("s"):
+                raise ValueError(f"Invalid rational time: {value!r}")
+            numerator = value[:-1]
+            denominator = "1s"
+        try:
+            multiplier, divisor = scales[denominator]
+        except KeyError:
+            if not denominator.endswith("s"):
+                raise ValueError(f"Invalid rational time: {value!r}") from None
+            try:
+                scale = _time_scale(rate, int(denominator[:-1]))
+            except ValueError:
+                raise ValueError(f"Invalid rational time: {value!r}") from None
+            multiplier, divisor = scales[denominator] = scale
+        try:
+            quotient, remainder = divmod(int(numerator), divisor)
+        except ValueError:
+            raise ValueError(f"Invalid rational time: {value!r}") from None
+        if remainder:
+            raise ValueError(
+                f"{value!r} is not on the frame grid of {rate.framerate} fps"
+            )
+        append(quotient * multiplier)
+    return frame_numbers
+
+
+def frame_numbers_to_rationals(
+    frame_numbers: Iterable[int],
+    framerate: str | float | Fraction,
+    force_non_drop_frame: bool = False,
+) -> list[str]:
+    """Convert the given frame numbers to rational time strings in bulk.
+
+    Args:
+        frame_numbers (Iterable[int]): The 0 based frame numbers.
+        framerate (str | int | float | Fraction): The frame rate, see
+            :class:`.Timecode` for the accepted values.
+        force_non_drop_frame (bool): Use non drop frame calculation for NTSC
+            rates.
+
+    Returns:
+        list[str]: The rational times, see :func:`.frame_number_to_rational`.
+    """
+    rate = get_rate(framerate, force_non_drop_frame)
+    rate_numerator = rate.numerator
+    rate_denominator = rate.denominator
+    values = []
+    append = values.append
+    for frame_number in frame_numbers:
+        seconds, remainder = divmod(frame_number * rate_denominator, rate_numerator)
+        if remainder:
+            append(f"{frame_number * rate_denominator}/{rate_numerator}s")
+        else:
+            append(f"{seconds}s")
+    return values
+
+
+def rational_to_timecode(
+    value: str,
+    framerate: str | float | Fraction,
+    force_non_drop_frame: bool = False,
+) -> Timecode:
+    """Create a :class:`.Timecode` at the given rational time offset.
+
+    Args:
+        value (str): The rational time, i.e. "3600s".
+        framerate (str | int | float | Fraction): The frame rate.
+        force_non_drop_frame (bool): Use non drop frame calculation for NTSC
+            rates.
+
+    Returns:
+        Timecode: The timecode, where "0s" is "00:00:00:00".
+    """
+    rate = get_rate(framerate, force_non_drop_frame)
+    return Timecode.from_rate(rate, rational_to_frame_number(rate, value) + 1)
+
+
+def timecode_to_rational(timecode: Timecode) -> str:
+    """Return the rational time offset of the given :class:`.Timecode`.
+
+    Args:
+        timecode (Timecode): The timecode.
+
+    Returns:
+        str: The rational time, where "00:00:00:00" is "0s".
+    """
+    return frame_number_to_rational(timecode.rate, timecode.frame_number)
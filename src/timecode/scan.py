@@ -0,0 +1,183 @@
+"""Extraction of timecode labels from huge text logs.
+
+The scanner runs a compiled bytes regular expression over a memory mapped
+file, so the file is never decoded or loaded into memory as a whole, and
+yields the byte offset and the frame count of every label lazily::
+
+    from timecode.scan import follow_labels, scan_labels
+
+    for offset, frames in scan_labels("playout.log", "29.97"):
+        ...
+
+    # keep scanning a growing file, resuming from a previous offset
+    for offset, frames in follow_labels("playout.log", "29.97", offset=offset + 1):
+        ...
+
+Labels with a ":" or ";" frame delimiter are converted with a fast path which
+works on the matched bytes directly and caches the frame count of each
+``HH:MM:SS`` prefix. Labels with a "." delimiter are converted with
+:func:`timecode.core.label_to_frames`, so they follow the same rules with the
+:class:`.Timecode` class (fractions of a second unless the rate is
+milliseconds based). Labels with an out of range frames part are skipped.
+"""
+
+# Standard Library Imports
+from __future__ import annotations
+
+import mmap
+import os
+import re
+import time
+from typing import TYPE_CHECKING
+
+from timecode.core import get_rate, label_to_frames
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from fractions import Fraction
+
+    from timecode.core import FrameRate
+
+
+LABEL_PATTERN = re.compile(rb":[0-5]\d:[0-5]\d[:;.]\d{2,3}(?![\d:;])")
+"""re.Pattern: The pattern of a timecode label after the hours part.
+
+The pattern starts with a literal, which lets the regular expression engine
+skip to the candidates a lot faster than a pattern starting with the hours
+digits. The hours are checked separately.
+"""
+
+_HOURS = frozenset(f"{hours:02d}".encode() for hours in range(24))
+_SEPARATORS = frozenset(b"0123456789:;.")
+
+
+def scan_labels(
+    source: str | os.PathLike | bytes | bytearray | mmap.mmap,
+    framerate: str | float | Fraction,
+    *,
+    force_non_drop_frame: bool = False,
+    start: int = 0,
+    end: None | int = None,
+) -> Iterator[tuple[int, int]]:
+    """Find the timecode labels in the given file or buffer.
+
+    Args:
+        source (str | os.PathLike | bytes | bytearray | mmap): The
+            path of a file, which is memory mapped, or a bytes-like object.
+        framerate (str | int | float | Fraction): The frame rate of the labels,
+            see :class:`.Timecode` for the accepted values.
+        force_non_drop_frame (bool): Use non drop frame calculation for NTSC
+            rates.
+        start (int): The offset to start scanning at.
+        end (None | int): The offset to stop scanning at, defaults to the end
+            of the source.
+
+    Yields:
+        tuple[int, int]: The byte offset and the frame count of each label.
+    """
+    rate = get_rate(framerate, force_non_drop_frame)
+    if not isinstance(source, (str, os.PathLike)):
+        yield from _scan(rate, source, start, len(source) if end is None else end)
+        return
+
+    with open(source, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if not size:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield from _scan(rate, mm, start, size if end is None else end)
+
+
+def follow_labels(
+    path: str | os.PathLike,
+    framerate: str | float | Fraction,
+    *,
+    force_non_drop_frame: bool = False,
+    offset: int = 0,
+    poll_interval: float = 0.5,
+    idle_timeout: None | float = None,
+) -> Iterator[tuple[int, int]]:
+    """Find the timecode labels in a growing file.
+
+    Only complete lines are scanned, the rest is scanned when the line is
+    finished. If the file shrinks (i.e. it is truncated or rotated) it is
+    scanned again from the beginning.
+
+    Args:
+        path (str | os.PathLike): The path of the file.
+        framerate (str | int | float | Fraction): The frame rate of the labels.
+        force_non_drop_frame (bool): Use non drop frame calculation for NTSC
+            rates.
+        offset (int): The offset to start scanning at, pass the offset after
+            the last label of a previous scan to resume it.
+        poll_interval (float): The number of seconds to wait for the file to
+            grow.
+        idle_timeout (None | float): Stop after the file has not grown for this
+            many seconds, the default None follows the file forever.
+
+    Yields:
+        tuple[int, int]: The byte offset and the frame count of each label.
+    """
+    rate = get_rate(framerate, force_non_drop_frame)
+    idle_since = time.monotonic()
+    while True:
+        size = os.path.getsize(path)
+        if size < offset:
+            offset = 0
+        end = offset
+        if size > offset:
+            with open(path, "rb") as f:  # noqa: SIM117
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    end = mm.rfind(b"\n", offset, size) + 1
+                    if end > offset:
+                        yield from _scan(rate, mm, offset, end)
+        if end > offset:
+            offset = end
+            idle_since = time.monotonic()
+        elif idle_timeout is not None and time.monotonic() - idle_since >= idle_timeout:
+            return
+        else:
+            time.sleep(poll_interval)
+
+
+def _scan(
+    rate: FrameRate,
+    buffer: bytes | bytearray | mmap.mmap,
+    start: int,
+    end: int,
+) -> Iterator[tuple[int, int]]:
+    """Find the timecode labels in the given buffer.
+
+    Args:
+        rate (FrameRate): The frame rate descriptor.
+        buffer (bytes | bytearray | mmap): The buffer.
+        start (int): The offset to start scanning at.
+        end (int): The offset to stop scanning at.
+
+    Yields:
+        tuple[int, int]: The byte offset and the frame count of each label.
+    """
+    int_framerate = rate.int_framerate
+    # the frame count of the first frame of each second, by the HH:MM:SS bytes
+    seconds: dict[bytes, int] = {}
+    get_second = seconds.get
+    valid_hours = _HOURS
+    separators = _SEPARATORS
+    for match in LABEL_PATTERN.finditer(buffer, start + 2, end):
+        offset = match.start() - 2
+        hours = buffer[offset : offset + 2]
+        if hours not in valid_hours or (offset and buffer[offset - 1] in separators):
+            continue
+        rest = match.group()
+        if rest[6] == 46:  # "."
+            label = (hours + rest).decode()
+            yield offset, label_to_frames(rate, label)
+            continue
+        frames = int(rest[7:])
+        if frames >= int_framerate:
+            continue
+        second = hours + rest[:6]
+        base = get_second(second)
+        if base is None:
+            base = seconds[second] = label_to_frames(rate, f"{second.decode()}:00")
+        yield offset, base + frames
@@ -0,0 +1,661 @@
+"""Byte offsets of the frames of intra-only media files.
+
+Intra-only essence (ProRes or DNxHR in QuickTime, headerless frame dumps)
+decodes every frame on its own, so a range of timecodes is a range of bytes of
+the file. The :class:`.SeekIndexBuilder` records the offset and the size of
+each frame with the start timecode and the frame rate of the file, and the
+:class:`.SeekIndex` memory maps the saved index and maps the timecodes to byte
+ranges, so pulling a segment out of a large file is a seek and a read::
+
+    from timecode import Timecode
+    from timecode.seek import SeekIndex, SeekIndexBuilder
+
+    builder = SeekIndexBuilder.from_quicktime("A001C003.mov", "23.976",
+                                              start="10:00:00:00")
+    builder.save("A001C003.tcseek")
+
+    with SeekIndex.load("A001C003.tcseek") as index:
+        offset, length = index.span(Timecode("23.976", "10:01:00:00"),
+                                    Timecode("23.976", "10:01:09:23"))
+    with open("A001C003.mov", "rb") as f:
+        f.seek(offset)
+        segment = f.read(length)
+
+The saved index is a 32 bytes header followed by two packed columns, all
+little endian:
+
+* Header: the magic ``b"TCSK"``, the format version (uint16), the flags
+  (uint16, bit 0 is drop frame), the numerator and the denominator of the exact
+  frame rate (uint32 each), the frame count of the first frame (int64) and the
+  number of frames (uint64).
+* The offsets of the frames (uint64 each), then their sizes (uint32 each).
+
+The frames are stored in file order, the byte range of consecutive frames
+goes from the first frame to the end of the last one and includes the other
+tracks interleaved with the video of a QuickTime file. The timecodes of a file
+crossing midnight are counted from its start timecode.
+"""
+
+# Standard Library Imports
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import TYPE_CHECKING, NamedTuple
+
+from timecode.core import get_rate, label_to_frames
+from timecode.timecode import Timecode
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+    from fractions import Fraction
+    from types import TracebackType
+
+    from timecode.core import FrameRate
+    from timecode.sets import TimecodeSet
+
+    if sys.version_info >= (3, 11):
+        from typing import Self
+    else:
+        from typing_extensions import Self
+
+
+MAGIC = b"TCSK"
+"""bytes: The first bytes of a seek index."""
+
+FORMAT_VERSION = 1
+"""int: The version of the seek index format."""
+
+DROP_FRAME_FLAG = 1
+"""int: The header flag of the drop frame rates."""
+
+HEADER = struct.Struct("<4sHHIIqQ")
+"""struct.Struct: The header, the magic, the version, the flags, the rate, the
+first frame count and the number of frames."""
+
+_ATOM = struct.Struct(">I4s")
+_UINT32 = struct.Struct(">I")
+_UINT64 = struct.Struct(">Q")
+
+
+class ByteRange(NamedTuple):
+    """A range of bytes of a file.
+
+    Attributes:
+        offset (int): The offset of the first byte.
+        length (int): The number of bytes.
+    """
+
+    offset: int
+    length: int
+
+    @property
+    def end(self) -> int:
+        """Return the offset after the last byte.
+
+        Returns:
+            int: The end offset.
+        """
+        return self.offset + self.length
+
+
+def _atoms(data: bytes, start: int, end: int) -> Iterator[tuple[bytes, int, int]]:
+    """Iterate over the QuickTime atoms of the given bytes.
+
+    Args:
+        data (bytes): The bytes.
+        start (int): The offset of the first atom.
+        end (int): The offset after the last atom.
+
+    Raises:
+        ValueError: If an atom is larger than its parent.
+
+    Yields:
+        tuple[bytes, int, int]: The type, the offset of the payload and the end
+            offset of each atom.
+    """
+    while start + _ATOM.size <= end:
+        size, kind = _ATOM.unpack_from(data, start)
+        header = _ATOM.size
+        if size == 1:
+            (size,) = _UINT64.unpack_from(data, start + header)
+            header += _UINT64.size
+        elif size == 0:
+            size = end - start
+        if size < header or start + size > end:
+            raise ValueError(f"Invalid QuickTime atom: {kind!r}")
+        yield kind, start + header, start + size
+        start += size
+
+
+def _child(data: bytes, start: int, end: int, path: bytes) -> None | tuple[int, int]:
+    """Return the payload of the atom at the given path.
+
+    Args:
+        data (bytes): The bytes.
+        start (int): The offset of the first child atom.
+        end (int): The offset after the last child atom.
+        path (bytes): The types of the nested atoms, separated by dots, i.e.
+            ``b"mdia.minf.stbl"``.
+
+    Returns:
+        None | tuple[int, int]: The offset of the payload and the end offset of
+            the first atom at the path, None if there is none.
+    """
+    for kind in path.split(b"."):
+        for child, child_start, child_end in _atoms(data, start, end):
+            if child == kind:
+                start, end = child_start, child_end
+                break
+        else:
+            return None
+    return start, end
+
+
+def _column(data: bytes, start: int, count: int, typecode: str) -> array:
+    """Return a column of big endian integers.
+
+    Args:
+        data (bytes): The bytes.
+        start (int): The offset of the first integer.
+        count (int): The number of integers.
+        typecode (str): The array type code, "I" or "Q".
+
+    Raises:
+        ValueError: If the column is larger than the bytes.
+
+    Returns:
+        array: The integers.
+    """
+    column = array(typecode)
+    end = start + count * column.itemsize
+    if end > len(data):
+        raise ValueError("Invalid QuickTime sample table")
+    column.frombytes(data[start:end])
+    if sys.byteorder == "little":
+        column.byteswap()
+    return column
+
+
+def _find_moov(path: str | os.PathLike) -> bytes:
+    """Return the payload of the moov atom of a QuickTime file.
+
+    The top level atoms are skipped with seeks, the media data is not read.
+
+    Args:
+        path (str | os.PathLike): The path of the file.
+
+    Raises:
+        ValueError: If the file has no moov atom.
+
+    Returns:
+        bytes: The payload.
+    """
+    with open(path, "rb") as f:
+        end = f.seek(0, os.SEEK_END)
+        start = 0
+        while start + _ATOM.size <= end:
+            f.seek(start)
+            header = f.read(_ATOM.size + _UINT64.size)
+            size, kind = _ATOM.unpack_from(header)
+            header_size = _ATOM.size
+            if size == 1:
+                (size,) = _UINT64.unpack_from(header, _ATOM.size)
+                header_size += _UINT64.size
+            elif size == 0:
+                size = end - start
+            if size < header_size:
+                raise ValueError(f"Invalid QuickTime atom: {kind!r}")
+            if kind == b"moov":
+                f.seek(start + header_size)
+                return f.read(size - header_size)
+            start += size
+    raise ValueError("Not a QuickTime file, no moov atom")
+
+
+def read_quicktime_samples(path: str | os.PathLike) -> tuple[array, array]:
+    """Return the offsets and the sizes of the frames of a QuickTime file.
+
+    The sample table of the first video track is read, the edit lists and the
+    timecode track are ignored.
+
+    Args:
+        path (str | os.PathLike): The path of the QuickTime (.mov) or MPEG-4
+            file.
+
+    Raises:
+        ValueError: If the file is not a QuickTime file with a video track.
+
+    Returns:
+        tuple[array, array]: An ``array("Q")`` of the offsets and an
+            ``array("I")`` of the sizes of the frames.
+    """
+    moov = _find_moov(path)
+    for kind, start, end in _atoms(moov, 0, len(moov)):
+        if kind != b"trak":
+            continue
+        hdlr = _child(moov, start, end, b"mdia.hdlr")
+        if hdlr is None or moov[hdlr[0] + 8 : hdlr[0] + 12] != b"vide":
+            continue
+        stbl = _child(moov, start, end, b"mdia.minf.stbl")
+        if stbl is None:
+            continue
+        return _read_sample_table(moov, *stbl)
+    raise ValueError("No video track in the QuickTime file")
+
+
+def _read_sample_table(data: bytes, start: int, end: int) -> tuple[array, array]:
+    """Return the offsets and the sizes of the samples of a sample table.
+
+    Args:
+        data (bytes): The bytes.
+        start (int): The offset of the payload of the stbl atom.
+        end (int): The end offset of the stbl atom.
+
+    Raises:
+        ValueError: If the sample table is incomplete.
+
+    Returns:
+        tuple[array, array]: The offsets and the sizes of the samples.
+    """
+    stsz = _child(data, start, end, b"stsz")
+    stsc = _child(data, start, end, b"stsc")
+    chunk_atom = _child(data, start, end, b"stco")
+    typecode = "I"
+    if chunk_atom is None:
+        chunk_atom = _child(data, start, end, b"co64")
+        typecode = "Q"
+    if stsz is None or stsc is None or chunk_atom is None:
+        raise ValueError("Invalid QuickTime sample table")
+
+    sample_size, count = struct.unpack_from(">II", data, stsz[0] + 4)
+    if sample_size:
+        sizes = array("I", [sample_size]) * count
+    else:
+        sizes = _column(data, stsz[0] + 12, count, "I")
+    (count,) = _UINT32.unpack_from(data, chunk_atom[0] + 4)
+    chunks = _column(data, chunk_atom[0] + 8, count, typecode)
+    (count,) = _UINT32.unpack_from(data, stsc[0] + 4)
+    # first chunk, samples per chunk, sample description
+    entries = _column(data, stsc[0] + 8, count * 3, "I")
+
+    offsets = array("Q")
+    sample = 0
+    for i in range(0, len(entries), 3):
+        first_chunk, per_chunk = entries[i], entries[i + 1]
+        last_chunk = entries[i + 3] - 1 if i + 3 < len(entries) else len(chunks)
+        for offset in chunks[first_chunk - 1 : last_chunk]:
+            for size in sizes[sample : sample + per_chunk]:
+                offsets.append(offset)
+                offset += size
+            sample += per_chunk
+    if sample != len(sizes):
+        raise ValueError("Invalid QuickTime sample table")
+    return offsets, sizes
+
+
+class SeekIndexBuilder:
+    """Record the byte offsets of the frames of a file.
+
+    Args:
+        framerate (str | int | float | Fraction): The frame rate, see
+            :class:`.Timecode` for the accepted values.
+        start (Timecode | str): The timecode of the first frame.
+        force_non_drop_frame (bool): Use non drop frame timecodes for NTSC
+            rates.
+    """
+
+    def __init__(
+        self,
+        framerate: str | float | Fraction,
+        *,
+        start: Timecode | str = "00:00:00:00",
+        force_non_drop_frame: bool = False,
+    ) -> None:
+        self.rate: FrameRate = get_rate(framerate, force_non_drop_frame)
+        self.start_frames = (
+            start.frames
+            if isinstance(start, Timecode)
+            else label_to_frames(self.rate, start)
+        )
+        self.offsets = array("Q")
+        self.sizes = array("I")
+        self._end = 0
+
+    @classmethod
+    def from_frame_size(
+        cls,
+        framerate: str | float | Fraction,
+        frame_size: int,
+        count: int,
+        *,
+        start: Timecode | str = "00:00:00:00",
+        offset: int = 0,
+        force_non_drop_frame: bool = False,
+    ) -> SeekIndexBuilder:
+        """Return the builder of a headerless dump of frames of the same size.
+
+        Args:
+            framerate (str | int | float | Fraction): The frame rate.
+            frame_size (int): The size of each frame in bytes.
+            count (int): The number of frames.
+            start (Timecode | str): The timecode of the first frame.
+            offset (int): The offset of the first frame, the size of a file
+                header.
+            force_non_drop_frame (bool): Use non drop frame timecodes for NTSC
+                rates.
+
+        Returns:
+            SeekIndexBuilder: The builder.
+        """
+        builder = cls(framerate, start=start, force_non_drop_frame=force_non_drop_frame)
+        builder.offsets = array(
+            "Q", range(offset, offset + count * frame_size, frame_size)
+        )
+        builder.sizes = array("I", [frame_size]) * count
+        builder._end = offset + count * frame_size
+        return builder
+
+    @classmethod
+    def from_quicktime(
+        cls,
+        path: str | os.PathLike,
+        framerate: str | float | Fraction,
+        *,
+        start: Timecode | str = "00:00:00:00",
+        force_non_drop_frame: bool = False,
+    ) -> SeekIndexBuilder:
+        """Return the builder of the video track of a QuickTime file.
+
+        Args:
+            path (str | os.PathLike): The path of the file.
+            framerate (str | int | float | Fraction): The frame rate.
+            start (Timecode | str): The timecode of the first frame.
+            force_non_drop_frame (bool): Use non drop frame timecodes for NTSC
+                rates.
+
+        Raises:
+            ValueError: If the file is not a QuickTime file with a video track,
+                or if its frames are not in file order.
+
+        Returns:
+            SeekIndexBuilder: The builder.
+        """
+        builder = cls(framerate, start=start, force_non_drop_frame=force_non_drop_frame)
+        builder.add_many(*read_quicktime_samples(path))
+        return builder
+
+    def add(self, offset: int, size: int) -> None:
+        """Record the next frame.
+
+        Args:
+            offset (int): The offset of the frame.
+            size (int): The size of the frame in bytes.
+
+        Raises:
+            ValueError: If the frame starts before the end of the previous one.
+        """
+        if offset < self._end:
+            raise ValueError(
+                "The frames of a seek index should be in file order, "
+                f"the frame at {offset} starts before {self._end}"
+            )
+        self.offsets.append(offset)
+        self.sizes.append(size)
+        self._end = offset + size
+
+    def add_many(self, offsets: Iterable[int], sizes: Iterable[int]) -> None:
+        """Record the next frames.
+
+        Args:
+            offsets (Iterable[int]): The offsets of the frames.
+            sizes (Iterable[int]): The sizes of the frames in bytes.
+
+        Raises:
+            ValueError: If a frame starts before the end of the previous one.
+        """
+        add = self.add
+        for offset, size in zip(offsets, sizes):
+            add(offset, size)
+
+    def build(self) -> SeekIndex:
+        """Return the index of the recorded frames, in memory.
+
+        Returns:
+            SeekIndex: The index.
+        """
+        return SeekIndex(
+            self.rate,
+            self.start_frames,
+            array("Q", self.offsets),
+            array("I", self.sizes),
+        )
+
+    def save(self, path: str | os.PathLike) -> None:
+        """Save the index of the recorded frames.
+
+        Args:
+            path (str | os.PathLike): The path of the file.
+        """
+        flags = DROP_FRAME_FLAG if self.rate.drop_frame else 0
+        header = HEADER.pack(
+            MAGIC,
+            FORMAT_VERSION,
+            flags,
+            self.rate.numerator,
+            self.rate.denominator,
+            self.start_frames,
+            len(self.offsets),
+        )
+        offsets, sizes = self.offsets, self.sizes
+        if sys.byteorder != "little":
+            offsets, sizes = array("Q", offsets), array("I", sizes)
+            offsets.byteswap()
+            sizes.byteswap()
+        with open(path, "wb") as f:
+            f.write(header)
+            offsets.tofile(f)
+            sizes.tofile(f)
+
+
+class SeekIndex:
+    """Map the timecodes of the frames of a file to byte ranges.
+
+    Use :meth:`.load` to memory map a saved index, or
+    :meth:`.SeekIndexBuilder.build`.
+
+    Args:
+        rate (FrameRate): The frame rate descriptor.
+        start_frames (int): The frame count of the first frame.
+        offsets (Sequence[int]): The offsets of the frames.
+        sizes (Sequence[int]): The sizes of the frames in bytes.
+    """
+
+    def __init__(
+        self,
+        rate: FrameRate,
+        start_frames: int,
+        offsets: Sequence[int],
+        sizes: Sequence[int],
+    ) -> None:
+        self.rate = rate
+        self.start_frames = start_frames
+        self._offsets = offsets
+        self._sizes = sizes
+        self._map: None | mmap.mmap = None
+
+    @classmethod
+    def load(cls, path: str | os.PathLike) -> SeekIndex:
+        """Memory map an index saved with :meth:`.SeekIndexBuilder.save`.
+
+        Args:
+            path (str | os.PathLike): The path of the file.
+
+        Raises:
+            ValueError: If the file is not a complete seek index of a
+                supported version.
+
+        Returns:
+            SeekIndex: The index.
+        """
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            header = f.read(HEADER.size)
+            if len(header) < HEADER.size or header[:4] != MAGIC:
+                raise ValueError("Not a timecode seek index")
+            _, version, flags, numerator, denominator, start, count = HEADER.unpack(
+                header
+            )
+            if version != FORMAT_VERSION:
+                raise ValueError(
+                    f"Unsupported seek index version: {version}, "
+                    f"expected {FORMAT_VERSION}"
+                )
+            end = HEADER.size + count * 12
+            if size < end:
+                raise ValueError(
+                    f"Truncated seek index of {count} frames, {size} bytes"
+                )
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        rate = get_rate(
+            (numerator, denominator),
+            force_non_drop_frame=not flags & DROP_FRAME_FLAG,
+        )
+        view = memoryview(data)
+        offsets = view[HEADER.size : HEADER.size + count * 8].cast("Q")
+        sizes = view[HEADER.size + count * 8 : end].cast("I")
+        view.release()
+        if sys.byteorder != "little":
+            offsets, sizes = array("Q", offsets), array("I", sizes)
+            offsets.byteswap()
+            sizes.byteswap()
+        index = cls(rate, start, offsets, sizes)
+        index._map = data
+        return index
+
+    @property
+    def start(self) -> Timecode:
+        """Return the timecode of the first frame.
+
+        Returns:
+            Timecode: The timecode.
+        """
+        return Timecode.from_rate(self.rate, self.start_frames)
+
+    def index(self, tc: Timecode | int) -> int:
+        """Return the index of the frame of the given timecode.
+
+        Args:
+            tc (Timecode | int): The timecode or its frame count.
+
+        Raises:
+            ValueError: If the frame is not in the index.
+
+        Returns:
+            int: The index of the frame.
+        """
+        frames = tc.frames if isinstance(tc, Timecode) else tc
+        day = self.rate.frames_per_24_hours
+        index = (frames - self.start_frames) % day
+        if index >= len(self._offsets):
+            label = Timecode.from_rate(self.rate, (frames - 1) % day + 1)
+            raise ValueError(f"Timecode {label} is not in the seek index")
+        return index
+
+    def locate(self, tc: Timecode | int) -> ByteRange:
+        """Return the byte range of the frame of the given timecode.
+
+        Args:
+            tc (Timecode | int): The timecode or its frame count.
+
+        Raises:
+            ValueError: If the frame is not in the index.
+
+        Returns:
+            ByteRange: The offset and the size of the frame.
+        """
+        index = self.index(tc)
+        return ByteRange(self._offsets[index], self._sizes[index])
+
+    def span(self, start: Timecode | int, end: Timecode | int) -> ByteRange:
+        """Return the byte range of the frames of the given timecodes.
+
+        Args:
+            start (Timecode | int): The first timecode or frame count.
+            end (Timecode | int): The last timecode or frame count, inclusive.
+
+        Raises:
+            ValueError: If a frame is not in the index or if the end is before
+                the start.
+
+        Returns:
+            ByteRange: The range from the offset of the first frame to the end
+                of the last one.
+        """
+        first = self.index(start)
+        last = self.index(end)
+        if last < first:
+            raise ValueError(
+                "The end of a span should not be before its start, not "
+                f"{self.start + first}-{self.start + last}"
+            )
+        offset = self._offsets[first]
+        return ByteRange(offset, self._offsets[last] + self._sizes[last] - offset)
+
+    def spans(self, frames: TimecodeSet) -> list[ByteRange]:
+        """Return the byte ranges of the runs of the given frames.
+
+        Args:
+            frames (TimecodeSet): The frames.
+
+        Raises:
+            ValueError: If a frame is not in the index.
+
+        Returns:
+            list[ByteRange]: The byte range of each run.
+        """
+        return [self.span(run.first, run.last) for run in frames.runs()]
+
+    def __len__(self) -> int:
+        """Return the number of frames.
+
+        Returns:
+            int: The number of frames.
+        """
+        return len(self._offsets)
+
+    def close(self) -> None:
+        """Close the memory map of a loaded index."""
+        if self._map is not None:
+            for column in (self._offsets, self._sizes):
+                if isinstance(column, memoryview):
+                    column.release()
+            self._map.close()
+            self._map = None
+
+    def __enter__(self) -> Self:
+        """Return this index.
+
+        Returns:
+            Self: This index.
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: None | type[BaseException],
+        exc_value: None | BaseException,
+        traceback: None | TracebackType,
+    ) -> None:
+        """Close the memory map of a loaded index.
+
+        Args:
+            exc_type (None | type[BaseException]): The exception type.
+            exc_value (None | BaseException): The exception.
+            traceback (None | TracebackType): The traceback.
+        """
+        self.close()
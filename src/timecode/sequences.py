@@ -0,0 +1,450 @@
+"""Index of image sequences and their timecodes.
+
+Pipelines name the frames of a shot like ``shot.1001.exr`` and map the frame
+numbers to timecodes through the timecode of a start frame. The
+:class:`.SequenceIndex` scans directory trees with :func:`os.scandir`, pulls
+the frame numbers out of the file names with a compiled pattern and compresses
+them into runs with a :class:`.TimecodeSet` per sequence, so it does not store
+an object per file::
+
+    from timecode import Timecode
+    from timecode.sequences import SequenceIndex
+
+    index = SequenceIndex.scan("/shows/abc/renders", "24",
+                               start=Timecode("24", "01:00:00:00"))
+    for sequence in index:
+        print(sequence.pattern, sequence.first, sequence.last,
+              list(sequence.missing()))
+    index.path_to_timecode("/shows/abc/renders/sh010/sh010.1001.exr")
+    index.save("renders.json")
+    index = SequenceIndex.load("renders.json")
+
+A sequence is the files of a directory with the same prefix and suffix around
+the frame number. The frame numbers are mapped to timecodes with an offset,
+where ``start`` is the timecode of ``start_frame`` (the first frame of each
+sequence by default), so the frame to timecode conversion is an addition, and
+the timecode to path and the missing frame queries are a binary search over
+the runs.
+
+The padding of a sequence is the width of its shortest frame number, frame
+numbers are zero padded to it.
+"""
+
+# Standard Library Imports
+from __future__ import annotations
+
+import json
+import os
+import re
+from typing import TYPE_CHECKING
+
+from timecode.core import get_rate, label_to_frames
+from timecode.sets import TimecodeSet
+from timecode.timecode import Timecode
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from fractions import Fraction
+
+    from timecode.core import FrameRate
+    from timecode.sets import Run
+
+
+DEFAULT_PATTERN = re.compile(r"(?P<prefix>(?:.*\D)?)(?P<frame>\d+)(?P<suffix>\.[^.]+)")
+"""re.Pattern: Matches the file names like "shot.1001.exr", where the frame
+number is the last number before the extension."""
+
+FORMAT_VERSION = 1
+"""int: The version of the saved index format."""
+
+
+class ImageSequence:
+    """The frames of an image sequence.
+
+    Args:
+        directory (str): The path of the directory.
+        prefix (str): The file name before the frame number, i.e. "shot.".
+        suffix (str): The file name after the frame number, i.e. ".exr".
+        padding (int): The width the frame numbers are zero padded to.
+        frames (TimecodeSet): The frame numbers of the files, at the frame rate
+            of the timecodes.
+        offset (int): The timecode frame count of frame number 0.
+    """
+
+    __slots__ = ("directory", "frames", "offset", "padding", "prefix", "suffix")
+
+    def __init__(
+        self,
+        directory: str,
+        prefix: str,
+        suffix: str,
+        padding: int,
+        *,
+        frames: TimecodeSet,
+        offset: int,
+    ) -> None:
+        self.directory: str = directory
+        self.prefix: str = prefix
+        self.suffix: str = suffix
+        self.padding: int = padding
+        self.frames: TimecodeSet = frames
+        self.offset: int = offset
+
+    @property
+    def rate(self) -> FrameRate:
+        """Return the frame rate of the timecodes.
+
+        Returns:
+            FrameRate: The frame rate descriptor.
+        """
+        return self.frames.rate
+
+    @property
+    def pattern(self) -> str:
+        """Return the path pattern of the files.
+
+        Returns:
+            str: The path with the frame number replaced by "#" characters, i.e.
+                "renders/shot.####.exr".
+        """
+        return os.path.join(
+            self.directory, f"{self.prefix}{'#' * self.padding}{self.suffix}"
+        )
+
+    @property
+    def first(self) -> None | int:
+        """Return the first frame number.
+
+        Returns:
+            None | int: The frame number, None if the sequence has no frames.
+        """
+        return self.frames.first
+
+    @property
+    def last(self) -> None | int:
+        """Return the last frame number.
+
+        Returns:
+            None | int: The frame number, None if the sequence has no frames.
+        """
+        return self.frames.last
+
+    def path(self, frame_number: int) -> str:
+        """Return the path of the given frame number.
+
+        The file is not checked to exist.
+
+        Args:
+            frame_number (int): The frame number.
+
+        Returns:
+            str: The path.
+        """
+        return os.path.join(
+            self.directory,
+            f"{self.prefix}{frame_number:0{self.padding}d}{self.suffix}",
+        )
+
+    def timecode(self, frame_number: int) -> Timecode:
+        """Return the timecode of the given frame number.
+
+        Args:
+            frame_number (int): The frame number.
+
+        Returns:
+            Timecode: The timecode.
+        """
+        return Timecode.from_rate(self.rate, frame_number + self.offset)
+
+    def frame_number(self, tc: Timecode | int) -> int:
+        """Return the frame number of the given timecode.
+
+        Args:
+            tc (Timecode | int): The timecode or its frame count.
+
+        Returns:
+            int: The frame number.
+        """
+        if isinstance(tc, Timecode):
+            tc = tc.frames
+        return tc - self.offset
+
+    def timecode_to_path(self, tc: Timecode | int) -> None | str:
+        """Return the path of the file of the given timecode.
+
+        Args:
+            tc (Timecode | int): The timecode or its frame count.
+
+        Returns:
+            None | str: The path, or None if there is no file for the timecode.
+        """
+        frame_number = self.frame_number(tc)
+        if frame_number not in self.frames:
+            return None
+        return self.path(frame_number)
+
+    def missing(self) -> Iterator[Run]:
+        """Iterate over the runs of frame numbers missing between the files.
+
+        Yields:
+            Run: The missing runs, in order.
+        """
+        return self.frames.gaps()
+
+    def __contains__(self, frame_number: int) -> bool:
+        """Return whether there is a file for the given frame number.
+
+        Args:
+            frame_number (int): The frame number.
+
+        Returns:
+            bool: True if there is a file.
+        """
+        return frame_number in self.frames
+
+    def __len__(self) -> int:
+        """Return the number of files.
+
+        Returns:
+            int: The number of files.
+        """
+        return len(self.frames)
+
+    def __repr__(self) -> str:
+        """Return the string representation of this sequence.
+
+        Returns:
+            str: The representation.
+        """
+        runs = ",".join(
+            f"{run.first}-{run.last}" if run.count > 1 else f"{run.first}"
+            for run in self.frames.runs()
+        )
+        return f"<ImageSequence {self.pattern} {runs}>"
+
+
+class SequenceIndex:
+    """An index of image sequences.
+
+    Args:
+        sequences (Iterable[ImageSequence]): The sequences.
+    """
+
+    def __init__(self, sequences: Iterable[ImageSequence] = ()) -> None:
+        self._sequences: dict[tuple[str, str, str], ImageSequence] = {
+            (s.directory, s.prefix, s.suffix): s for s in sequences
+        }
+
+    @classmethod
+    def scan(
+        cls,
+        root: str | os.PathLike,
+        framerate: str | float | Fraction,
+        *,
+        start: Timecode | str = "00:00:00:00",
+        start_frame: None | int = None,
+        pattern: re.Pattern = DEFAULT_PATTERN,
+        recursive: bool = True,
+        force_non_drop_frame: bool = False,
+    ) -> SequenceIndex:
+        """Scan the given directory for image sequences.
+
+        Args:
+            root (str | os.PathLike): The path of the directory.
+            framerate (str | int | float | Fraction): The frame rate, see
+                :class:`.Timecode` for the accepted values.
+            start (Timecode | str): The timecode of the start frame.
+            start_frame (None | int): The frame number of the start timecode,
+                defaults to the first frame of each sequence.
+            pattern (re.Pattern): The compiled pattern matching the whole file
+                names, with the "prefix", "frame" and "suffix" named groups.
+            recursive (bool): Scan the sub directories.
+            force_non_drop_frame (bool): Use non drop frame timecodes for NTSC
+                rates.
+
+        Returns:
+            SequenceIndex: The index.
+        """
+        rate = get_rate(framerate, force_non_drop_frame)
+        start_frames = (
+            start.frames
+            if isinstance(start, Timecode)
+            else label_to_frames(rate, start)
+        )
+        groups: dict[tuple[str, str, str], list[str]] = {}
+        stack = [os.fspath(root)]
+        fullmatch = pattern.fullmatch
+        while stack:
+            directory = stack.pop()
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            stack.append(entry.path)
+                        continue
+                    match = fullmatch(entry.name)
+                    if match is None:
+                        continue
+                    prefix, frame, suffix = match.group("prefix", "frame", "suffix")
+                    key = (directory, prefix, suffix)
+                    digits = groups.get(key)
+                    if digits is None:
+                        digits = groups[key] = []
+                    digits.append(frame)
+
+        sequences = []
+        for (directory, prefix, suffix), digits in sorted(groups.items()):
+            frames = TimecodeSet.from_frames(
+                rate.framerate,
+                map(int, digits),
+                force_non_drop_frame=force_non_drop_frame,
+            )
+            first = frames.first if start_frame is None else start_frame
+            sequences.append(
+                ImageSequence(
+                    directory,
+                    prefix,
+                    suffix,
+                    min(map(len, digits)),
+                    frames=frames,
+                    offset=start_frames - first,
+                )
+            )
+        return cls(sequences)
+
+    def get(
+        self, directory: str | os.PathLike, prefix: str, suffix: str
+    ) -> None | ImageSequence:
+        """Return the sequence of the given name parts.
+
+        Args:
+            directory (str | os.PathLike): The path of the directory, as it
+                was scanned.
+            prefix (str): The file name before the frame number.
+            suffix (str): The file name after the frame number.
+
+        Returns:
+            None | ImageSequence: The sequence, or None if it is not indexed.
+        """
+        return self._sequences.get((os.fspath(directory), prefix, suffix))
+
+    def find(
+        self, path: str | os.PathLike, pattern: re.Pattern = DEFAULT_PATTERN
+    ) -> None | tuple[ImageSequence, int]:
+        """Find the sequence and the frame number of the given file.
+
+        Args:
+            path (str | os.PathLike): The path of the file, as it was scanned.
+            pattern (re.Pattern): The pattern the index was scanned with.
+
+        Returns:
+            None | tuple[ImageSequence, int]: The sequence and the frame number,
+                or None if the file is not indexed.
+        """
+        directory, name = os.path.split(os.fspath(path))
+        match = pattern.fullmatch(name)
+        if match is None:
+            return None
+        sequence = self.get(directory, match["prefix"], match["suffix"])
+        frame_number = int(match["frame"])
+        if sequence is None or frame_number not in sequence:
+            return None
+        return sequence, frame_number
+
+    def path_to_timecode(
+        self, path: str | os.PathLike, pattern: re.Pattern = DEFAULT_PATTERN
+    ) -> None | Timecode:
+        """Return the timecode of the given file.
+
+        Args:
+            path (str | os.PathLike): The path of the file, as it was scanned.
+            pattern (re.Pattern): The pattern the index was scanned with.
+
+        Returns:
+            None | Timecode: The timecode, or None if the file is not indexed.
+        """
+        found = self.find(path, pattern)
+        if found is None:
+            return None
+        sequence, frame_number = found
+        return sequence.timecode(frame_number)
+
+    def save(self, path: str | os.PathLike) -> None:
+        """Save this index to a JSON file.
+
+        The runs of the frame numbers are saved, not the file names.
+
+        Args:
+            path (str | os.PathLike): The path of the file.
+        """
+        data = {
+            "version": FORMAT_VERSION,
+            "sequences": [
+                {
+                    "directory": s.directory,
+                    "prefix": s.prefix,
+                    "suffix": s.suffix,
+                    "padding": s.padding,
+                    "framerate": s.rate.framerate,
+                    "force_non_drop_frame": get_rate(s.rate.framerate) != s.rate,
+                    "offset": s.offset,
+                    "runs": [list(run) for run in s.frames.runs()],
+                }
+                for s in self
+            ],
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, path: str | os.PathLike) -> SequenceIndex:
+        """Load an index saved with :meth:`.save`.
+
+        Args:
+            path (str | os.PathLike): The path of the file.
+
+        Raises:
+            ValueError: If the file is not a saved index of a supported version.
+
+        Returns:
+            SequenceIndex: The index.
+        """
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        version = data.get("version") if isinstance(data, dict) else None
+        if version != FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported sequence index version: {version!r}, "
+                f"expected {FORMAT_VERSION}"
+            )
+        return cls(
+            ImageSequence(
+                s["directory"],
+                s["prefix"],
+                s["suffix"],
+                s["padding"],
+                frames=TimecodeSet(
+                    s["framerate"],
+                    s["runs"],
+                    force_non_drop_frame=s["force_non_drop_frame"],
+                ),
+                offset=s["offset"],
+            )
+            for s in data["sequences"]
+        )
+
+    def __iter__(self) -> Iterator[ImageSequence]:
+        """Iterate over the sequences.
+
+        Yields:
+            ImageSequence: The sequences, in the order they were indexed.
+        """
+        return iter(self._sequences.values())
+
+    def __len__(self) -> int:
+        """Return the number of sequences.
+
+        Returns:
+            int: The number of sequences.
+        """
+        return len(self._sequences)
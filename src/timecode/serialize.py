@@ -0,0 +1,161 @@
+"""Compact binary encoding of sequences of timecodes.
+
+:meth:`.Timecode.to_bytes` encodes a single Timecode in 11 bytes, this module
+encodes whole sequences of them, i.e. to send them to other processes or to
+store them, in 8 bytes per Timecode::
+
+    from timecode.serialize import decode_timecodes, encode_timecodes
+
+    data = encode_timecodes(timecodes)
+    timecodes = decode_timecodes(data)
+
+The Timecodes are grouped into runs of consecutive Timecodes of the same frame
+rate and flags. A run is :data:`RUN_HEADER`, the frame rate id, the flags, the
+length of the frame rate text and the number of Timecodes, followed by the
+frame rate text for the frame rates not in
+:data:`timecode.timecode.SERIAL_FRAMERATES` and the frame counts (uint64
+each), all little endian. The decoded Timecodes of a frame rate share the
+attributes derived from it, like the unpickled ones.
+"""
+
+# Standard Library Imports
+from __future__ import annotations
+
+import struct
+import sys
+from array import array
+from typing import TYPE_CHECKING
+
+from timecode.timecode import (
+    CUSTOM_FRAMERATE_ID,
+    Timecode,
+    _serial_attributes,
+    _serial_key,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+RUN_HEADER = struct.Struct("<HBBI")
+"""struct.Struct: The header of a run, the frame rate id, the flags, the length
+of the frame rate text and the number of Timecodes."""
+
+MAX_FRAMERATE_TEXT = 255
+"""int: The maximum length in bytes of the frame rate text of a run."""
+
+
+def encode_timecodes(timecodes: Iterable[Timecode]) -> bytes:
+    """Encode the given Timecodes.
+
+    Args:
+        timecodes (Iterable[Timecode]): The Timecodes.
+
+    Raises:
+        ValueError: If a frame count is larger than
+            :data:`timecode.timecode.MAX_SERIAL_FRAMES` or if a frame rate text
+            is longer than :data:`MAX_FRAMERATE_TEXT` bytes.
+
+    Returns:
+        bytes: The encoded Timecodes.
+    """
+    chunks: list[bytes] = []
+
+    def add_run(key: tuple[int | str, int], frames: array) -> None:
+        rate, flags = key
+        text = b""
+        if not isinstance(rate, int):
+            text = rate.encode("ascii")
+            if len(text) > MAX_FRAMERATE_TEXT:
+                raise ValueError(
+                    f"The frame rate text should be at most {MAX_FRAMERATE_TEXT} "
+                    f"bytes to be encoded, not {len(text)}"
+                )
+            rate = CUSTOM_FRAMERATE_ID
+        chunks.append(RUN_HEADER.pack(rate, flags, len(text), len(frames)))
+        chunks.append(text)
+        if sys.byteorder != "little":
+            frames.byteswap()
+        chunks.append(frames.tobytes())
+
+    key = None
+    rate = fraction_frame = force_non_drop_frame = None
+    frames = array("Q")
+    append = frames.append
+    for tc in timecodes:
+        # the frame rate descriptors are cached and hold the frame rate and
+        # the drop frame flag, the key is only computed when they change
+        if (
+            tc.rate is not rate
+            or tc.fraction_frame != fraction_frame
+            or tc.force_non_drop_frame != force_non_drop_frame
+        ):
+            rate = tc.rate
+            fraction_frame = tc.fraction_frame
+            force_non_drop_frame = tc.force_non_drop_frame
+            tc_key = _serial_key(tc)
+            if tc_key != key:
+                if frames:
+                    add_run(key, frames)  # type: ignore
+                key = tc_key
+                frames = array("Q")
+                append = frames.append
+        try:
+            append(tc.frames)
+        except OverflowError:
+            raise ValueError(
+                "Timecode.frames should be smaller than 2**64 to be serialized, "
+                f"not {tc.frames}"
+            ) from None
+    if frames:
+        add_run(key, frames)  # type: ignore
+    return b"".join(chunks)
+
+
+def decode_timecodes(data: bytes) -> list[Timecode]:
+    """Decode the Timecodes encoded with :func:`.encode_timecodes`.
+
+    Args:
+        data (bytes): The encoded Timecodes.
+
+    Raises:
+        ValueError: If the data is not encoded Timecodes, or if the flags of a
+            run are unknown or invalid for its frame rate.
+
+    Returns:
+        list[Timecode]: The Timecodes.
+    """
+    timecodes: list[Timecode] = []
+    view = memoryview(data)
+    offset = 0
+    while offset < len(view):
+        if offset + RUN_HEADER.size > len(view):
+            raise ValueError(f"Truncated encoded timecodes at byte {offset}")
+        rate, flags, text_length, count = RUN_HEADER.unpack_from(view, offset)
+        offset += RUN_HEADER.size
+        if rate == CUSTOM_FRAMERATE_ID:
+            rate = bytes(view[offset : offset + text_length]).decode("ascii")
+        offset += text_length
+        end = offset + count * 8
+        if end > len(view):
+            raise ValueError(f"Truncated encoded timecodes at byte {offset}")
+        frames = array("Q")
+        frames.frombytes(view[offset:end])
+        if sys.byteorder != "little":
+            frames.byteswap()
+        offset = end
+        if count and not min(frames):
+            raise ValueError(
+                "Timecode.frames should be a positive integer bigger than zero, not 0"
+            )
+
+        attributes = _serial_attributes(rate, flags)
+        new = Timecode.__new__
+        append = timecodes.append
+        for value in frames:
+            tc = new(Timecode)
+            state = attributes.copy()
+            state["_frames"] = value
+            tc.__dict__ = state
+            append(tc)
+    return timecodes
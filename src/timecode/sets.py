@@ -0,0 +1,506 @@
+"""Run length encoded sets of frames.
+
+Tracking which frames of a show are rendered, approved or missing with a
+Python ``set`` of :attr:`.Timecode.frames` costs tens of bytes per frame. A
+:class:`.TimecodeSet` stores the sorted disjoint runs of the frames at a single
+frame rate instead, 16 bytes per run, and does the set operations in a single
+merge pass over the runs::
+
+    from timecode.sets import TimecodeSet
+
+    rendered = TimecodeSet.parse("24", "01:00:00:00-01:00:10:23,01:00:20:00")
+    approved = TimecodeSet.from_frames("24", approved_frames)
+    todo = rendered - approved
+    for gap in rendered.gaps():
+        print(f"{gap.count} frames missing from {gap.first}")
+    str(todo)  # "01:00:00:00-01:00:03:11,01:00:20:00"
+
+The runs are stored as a flat ``array("q")`` of half open boundaries, the
+start of each run and the frame after its end, so the membership test is a
+binary search and the union, the intersection, the difference and the
+symmetric difference take a time proportional to the number of runs.
+
+The string form lists the runs as their first and last labels joined with a
+dash, separated by commas, a run of one frame is a single label. As the labels
+wrap around after 24 hours, so do the frame counts of the parsed runs.
+"""
+
+# Standard Library Imports
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from operator import and_, or_, xor
+from typing import TYPE_CHECKING, NamedTuple
+
+from timecode.core import get_rate, label_to_frames
+from timecode.labels import format_labels
+from timecode.timecode import Timecode
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+    from fractions import Fraction
+
+    from timecode.core import FrameRate
+
+
+class Run(NamedTuple):
+    """A run of consecutive frames.
+
+    Attributes:
+        first (int): The frame count of the first frame.
+        last (int): The frame count of the last frame, inclusive.
+    """
+
+    first: int
+    last: int
+
+    @property
+    def count(self) -> int:
+        """Return the number of frames in the run.
+
+        Returns:
+            int: The number of frames.
+        """
+        return self.last - self.first + 1
+
+
+def _difference(a: int, b: int) -> int:
+    """Return whether a frame is in the first set and not in the second one.
+
+    Args:
+        a (int): 1 if the frame is in the first set.
+        b (int): 1 if the frame is in the second set.
+
+    Returns:
+        int: 1 if the frame is in the difference.
+    """
+    return a & ~b
+
+
+def _combine(a: array, b: array, keep: Callable[[int, int], int]) -> array:
+    """Combine the given run boundaries with a set operation.
+
+    Args:
+        a (array): The boundaries of the first set.
+        b (array): The boundaries of the second set.
+        keep (Callable[[int, int], int]): The set operation on the membership
+            of a frame in the two sets, i.e. :func:`operator.and_`.
+
+    Returns:
+        array: The boundaries of the result.
+    """
+    result = array("q")
+    append = result.append
+    len_a, len_b = len(a), len(b)
+    i = j = 0
+    inside = 0
+    while i < len_a and j < len_b:
+        position = min(a[i], b[j])
+        # the boundaries are strictly increasing in each set
+        if a[i] == position:
+            i += 1
+        if b[j] == position:
+            j += 1
+        # an odd number of boundaries passed means the frame is in the set
+        now = keep(i & 1, j & 1)
+        if now != inside:
+            append(position)
+            inside = now
+    # one side is exhausted, the rest of the other one is either kept or not
+    if keep(1, 0):
+        result.extend(a[i:])
+    if keep(0, 1):
+        result.extend(b[j:])
+    return result
+
+
+class TimecodeSet:
+    """A set of frames at a single frame rate, stored as runs.
+
+    Args:
+        framerate (str | int | float | Fraction): The frame rate, see
+            :class:`.Timecode` for the accepted values.
+        runs (Iterable[tuple[int, int]]): The first and the last frame counts
+            of the runs, inclusive, in any order. Overlapping and adjacent
+            runs are merged.
+        force_non_drop_frame (bool): Use non drop frame labels for NTSC rates.
+    """
+
+    __slots__ = ("_bounds", "rate")
+
+    def __init__(
+        self,
+        framerate: str | float | Fraction,
+        runs: Iterable[tuple[int, int]] = (),
+        *,
+        force_non_drop_frame: bool = False,
+    ) -> None:
+        self.rate: FrameRate = get_rate(framerate, force_non_drop_frame)
+        bounds = array("q")
+        append = bounds.append
+        for first, last in sorted(runs):
+            if first > last:
+                raise ValueError(
+                    f"The last frame of a run should not be before the first one, "
+                    f"not {first}-{last}"
+                )
+            if bounds and first <= bounds[-1]:
+                # overlapping or adjacent
+                bounds[-1] = max(bounds[-1], last + 1)
+            else:
+                append(first)
+                append(last + 1)
+        self._bounds: array = bounds
+
+    @classmethod
+    def _from_bounds(cls, rate: FrameRate, bounds: array) -> TimecodeSet:
+        """Create a set from the given boundaries.
+
+        Args:
+            rate (FrameRate): The frame rate descriptor.
+            bounds (array): The strictly increasing run boundaries.
+
+        Returns:
+            TimecodeSet: The set.
+        """
+        result = cls.__new__(cls)
+        result.rate = rate
+        result._bounds = bounds
+        return result
+
+    @classmethod
+    def from_frames(
+        cls,
+        framerate: str | float | Fraction,
+        frames: Iterable[int],
+        *,
+        force_non_drop_frame: bool = False,
+    ) -> TimecodeSet:
+        """Create a set from the given frame counts.
+
+        Args:
+            framerate (str | int | float | Fraction): The frame rate.
+            frames (Iterable[int]): The frame counts, in any order, repeats are
+                ignored.
+            force_non_drop_frame (bool): Use non drop frame labels for NTSC
+                rates.
+
+        Returns:
+            TimecodeSet: The set.
+        """
+        bounds = array("q")
+        append = bounds.append
+        previous = None
+        for frame in sorted(frames):
+            if previous is None or frame > previous + 1:
+                if previous is not None:
+                    append(previous + 1)
+                append(frame)
+            previous = frame
+        if previous is not None:
+            append(previous + 1)
+        return cls._from_bounds(get_rate(framerate, force_non_drop_frame), bounds)
+
+    @classmethod
+    def parse(
+        cls,
+        framerate: str | float | Fraction,
+        value: str,
+        *,
+        force_non_drop_frame: bool = False,
+    ) -> TimecodeSet:
+        """Parse the given runs of labels.
+
+        Args:
+            framerate (str | int | float | Fraction): The frame rate.
+            value (str): The runs, i.e. "01:00:00:00-01:00:10:23,01:00:20:00".
+                Whitespace around the labels is ignored.
+            force_non_drop_frame (bool): Use non drop frame labels for NTSC
+                rates.
+
+        Raises:
+            ValueError: If a run or a label is not valid.
+
+        Returns:
+            TimecodeSet: The set.
+        """
+        rate = get_rate(framerate, force_non_drop_frame)
+        runs = []
+        for part in value.split(","):
+            first, dash, last = part.partition("-")
+            first = first.strip()
+            if not first and not dash:
+                # empty set or trailing comma
+                continue
+            try:
+                first_frames = label_to_frames(rate, first)
+                last_frames = (
+                    label_to_frames(rate, last.strip()) if dash else first_frames
+                )
+            except ValueError:
+                raise ValueError(f"Invalid run: {part!r}") from None
+            if first_frames > last_frames:
+                raise ValueError(f"Invalid run: {part!r}")
+            runs.append((first_frames, last_frames))
+        return cls(rate.framerate, runs, force_non_drop_frame=force_non_drop_frame)
+
+    def format(self) -> str:
+        """Format the runs of this set as labels.
+
+        Returns:
+            str: The runs, i.e. "01:00:00:00-01:00:10:23,01:00:20:00".
+        """
+        bounds = self._bounds
+        # the first and the last frame of each run
+        labels = format_labels(self.rate, [b - (i & 1) for i, b in enumerate(bounds)])
+        return ",".join(
+            first if first_frame + 1 == end else f"{first}-{last}"
+            for first, last, first_frame, end in zip(
+                labels[::2], labels[1::2], bounds[::2], bounds[1::2]
+            )
+        )
+
+    def runs(self) -> Iterator[Run]:
+        """Iterate over the runs of this set.
+
+        Yields:
+            Run: The runs, in order.
+        """
+        bounds = self._bounds
+        for i in range(0, len(bounds), 2):
+            yield Run(bounds[i], bounds[i + 1] - 1)
+
+    def gaps(self, first: None | int = None, last: None | int = None) -> Iterator[Run]:
+        """Iterate over the runs of frames missing from this set.
+
+        Args:
+            first (None | int): The first frame of the range, defaults to the
+                first frame of this set.
+            last (None | int): The last frame of the range, defaults to the last
+                frame of this set.
+
+        Yields:
+            Run: The missing runs in the range, in order.
+        """
+        return self.complement(first, last).runs()
+
+    def complement(
+        self, first: None | int = None, last: None | int = None
+    ) -> TimecodeSet:
+        """Return the frames of the given range which are not in this set.
+
+        Args:
+            first (None | int): The first frame of the range, defaults to the
+                first frame of this set.
+            last (None | int): The last frame of the range, defaults to the last
+                frame of this set.
+
+        Returns:
+            TimecodeSet: The complement.
+        """
+        bounds = self._bounds
+        if first is None:
+            first = bounds[0] if bounds else 1
+        if last is None:
+            last = bounds[-1] - 1 if bounds else 0
+        if first > last:
+            return self._from_bounds(self.rate, array("q"))
+        universe = array("q", [first, last + 1])
+        return self._from_bounds(self.rate, _combine(universe, bounds, _difference))
+
+    def add(self, frame: int | Timecode) -> None:
+        """Add the given frame to this set.
+
+        Args:
+            frame (int | Timecode): The frame count or the timecode.
+        """
+        if isinstance(frame, Timecode):
+            frame = frame.frames
+        self.add_run(frame, frame)
+
+    def add_run(self, first: int, last: int) -> None:
+        """Add the given run of frames to this set.
+
+        Args:
+            first (int): The frame count of the first frame.
+            last (int): The frame count of the last frame, inclusive.
+
+        Raises:
+            ValueError: If the last frame is before the first one.
+        """
+        if first > last:
+            raise ValueError(
+                f"The last frame of a run should not be before the first one, "
+                f"not {first}-{last}"
+            )
+        bounds = self._bounds
+        # the boundaries touching or inside the new run are replaced
+        low = bisect_left(bounds, first)
+        high = bisect_right(bounds, last + 1)
+        new = array("q")
+        if not low & 1:
+            new.append(first)
+        if not high & 1:
+            new.append(last + 1)
+        bounds[low:high] = new
+
+    def _check_other(self, other: TimecodeSet) -> None:
+        """Check the given set has the same frame rate.
+
+        Args:
+            other (TimecodeSet): The other set.
+
+        Raises:
+            ValueError: If the frame rates are different.
+        """
+        if other.rate != self.rate:
+            raise ValueError(
+                "Can not combine sets with different frame rates: "
+                f"{self.rate.framerate} and {other.rate.framerate}"
+            )
+
+    def union(self, other: TimecodeSet) -> TimecodeSet:
+        """Return the frames in either this or the other set.
+
+        Args:
+            other (TimecodeSet): The other set.
+
+        Returns:
+            TimecodeSet: The union.
+        """
+        self._check_other(other)
+        return self._from_bounds(self.rate, _combine(self._bounds, other._bounds, or_))
+
+    def intersection(self, other: TimecodeSet) -> TimecodeSet:
+        """Return the frames in both this and the other set.
+
+        Args:
+            other (TimecodeSet): The other set.
+
+        Returns:
+            TimecodeSet: The intersection.
+        """
+        self._check_other(other)
+        return self._from_bounds(self.rate, _combine(self._bounds, other._bounds, and_))
+
+    def difference(self, other: TimecodeSet) -> TimecodeSet:
+        """Return the frames in this set but not in the other one.
+
+        Args:
+            other (TimecodeSet): The other set.
+
+        Returns:
+            TimecodeSet: The difference.
+        """
+        self._check_other(other)
+        return self._from_bounds(
+            self.rate, _combine(self._bounds, other._bounds, _difference)
+        )
+
+    def symmetric_difference(self, other: TimecodeSet) -> TimecodeSet:
+        """Return the frames in exactly one of this and the other set.
+
+        Args:
+            other (TimecodeSet): The other set.
+
+        Returns:
+            TimecodeSet: The symmetric difference.
+        """
+        self._check_other(other)
+        return self._from_bounds(self.rate, _combine(self._bounds, other._bounds, xor))
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+    __xor__ = symmetric_difference
+
+    @property
+    def first(self) -> None | int:
+        """Return the first frame of this set.
+
+        Returns:
+            None | int: The frame count, or None if this set is empty.
+        """
+        return self._bounds[0] if self._bounds else None
+
+    @property
+    def last(self) -> None | int:
+        """Return the last frame of this set.
+
+        Returns:
+            None | int: The frame count, or None if this set is empty.
+        """
+        return self._bounds[-1] - 1 if self._bounds else None
+
+    @property
+    def run_count(self) -> int:
+        """Return the number of runs.
+
+        Returns:
+            int: The number of runs.
+        """
+        return len(self._bounds) // 2
+
+    def __contains__(self, frame: int | Timecode) -> bool:
+        """Return whether the given frame is in this set.
+
+        Args:
+            frame (int | Timecode): The frame count or the timecode.
+
+        Returns:
+            bool: True if the frame is in this set.
+        """
+        if isinstance(frame, Timecode):
+            frame = frame.frames
+        return bool(bisect_right(self._bounds, frame) & 1)
+
+    def __len__(self) -> int:
+        """Return the number of frames.
+
+        Returns:
+            int: The number of frames.
+        """
+        bounds = self._bounds
+        return sum(bounds[1::2]) - sum(bounds[::2])
+
+    def __iter__(self) -> Iterator[int]:
+        """Iterate over the frame counts of this set.
+
+        Yields:
+            int: The frame counts, in order.
+        """
+        bounds = self._bounds
+        for i in range(0, len(bounds), 2):
+            yield from range(bounds[i], bounds[i + 1])
+
+    def __eq__(self, other: object) -> bool:
+        """Return whether the given set has the same frames and frame rate.
+
+        Args:
+            other (object): The other set.
+
+        Returns:
+            bool: True if the sets are equal.
+        """
+        if not isinstance(other, TimecodeSet):
+            return NotImplemented
+        return self.rate == other.rate and self._bounds == other._bounds
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __str__(self) -> str:
+        """Return the runs of this set as labels.
+
+        Returns:
+            str: The runs, see :meth:`.format`.
+        """
+        return self.format()
+
+    def __repr__(self) -> str:
+        """Return the string representation of this set.
+
+        Returns:
+            str: The representation.
+        """
+        return f"TimecodeSet({self.rate.framerate!r}, {self.format()!r})"
@@ -0,0 +1,188 @@
+"""Sorting and merging helpers for large collections of timecodes.
+
+Sorting :class:`.Timecode` instances with ``sorted()`` calls
+:meth:`.Timecode.__lt__` for every comparison, which checks the type and
+compares the frame rates each time. The functions in this module pull the
+frame counts out once and sort the plain integers, which is a stable sort in C
+without any Python level comparison::
+
+    from timecode import sort_frames, sorted_timecodes
+
+    sorted_tcs = sorted_timecodes(timecodes)
+    order = sorted_timecodes(timecodes, indices=True)
+    names = [names[i] for i in order]  # sort a companion column
+
+Timecodes of different frame rates are not comparable, so they are grouped by
+frame rate first, the groups are ordered by the first appearance of their
+frame rate in the input and sorted by the frame count within each group.
+
+Already sorted streams can be combined with :func:`.merge_frames` and
+:func:`.merge_timecodes` which do a lazy, stable k-way merge.
+"""
+
+# Standard Library Imports
+from __future__ import annotations
+
+from array import array
+from heapq import merge
+from itertools import count, repeat
+from operator import attrgetter, itemgetter
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator, Sequence
+
+    from timecode.timecode import Timecode
+
+
+def argsort(keys: Sequence[int]) -> array:
+    """Return the permutation which sorts the given integers.
+
+    The sort is stable, so equal keys keep their input order.
+
+    Args:
+        keys (Sequence[int]): The integer keys.
+
+    Returns:
+        array: An ``array("q")`` of the indices of the keys in sorted order.
+    """
+    return array("q", sorted(range(len(keys)), key=keys.__getitem__))
+
+
+def sort_frames(frames: Iterable[int], *, indices: bool = False) -> array:
+    """Sort the given frame counts.
+
+    Args:
+        frames (Iterable[int]): The frame counts.
+        indices (bool): Return the permutation which sorts the frame counts
+            instead of the sorted frame counts.
+
+    Returns:
+        array: An ``array("q")`` of the sorted frame counts or of their
+            indices.
+    """
+    if indices:
+        frames = frames if isinstance(frames, (list, array)) else list(frames)
+        return argsort(frames)
+    return array("q", sorted(frames))
+
+
+def sorted_timecodes(
+    timecodes: Iterable[Timecode], *, indices: bool = False
+) -> list[Timecode] | array:
+    """Sort the given timecodes.
+
+    The timecodes are grouped by frame rate, in the order the frame rates
+    first appear in the input, and sorted by the frame count within each
+    group. Equal timecodes keep their input order.
+
+    Args:
+        timecodes (Iterable[Timecode]): The timecodes.
+        indices (bool): Return the permutation which sorts the timecodes
+            instead of the sorted timecodes.
+
+    Returns:
+        list[Timecode] | array: The sorted timecodes or an ``array("q")`` of
+            their indices.
+    """
+    timecodes = list(timecodes)
+    frames = [tc.frames for tc in timecodes]
+    # intern the frame rates to group numbers, in their order of appearance
+    groups: dict[str | int, int] = {}
+    group_ids = [groups.setdefault(tc.framerate, len(groups)) for tc in timecodes]
+    if len(groups) > 1:
+        shift = max(frames).bit_length()
+        frames = [(group << shift) | frame for group, frame in zip(group_ids, frames)]
+    order = argsort(frames)
+    if indices:
+        return order
+    return [timecodes[index] for index in order]
+
+
+def merge_frames(
+    *streams: Iterable[int], indices: bool = False
+) -> Iterator[int] | Iterator[tuple[int, int]]:
+    """Merge the given sorted streams of frame counts.
+
+    The streams are consumed lazily and equal frame counts are yielded in the
+    order of the streams.
+
+    Args:
+        *streams (Iterable[int]): The sorted streams of frame counts.
+        indices (bool): Yield ``(stream_index, item_index)`` pairs instead of
+            the frame counts.
+
+    Yields:
+        int | tuple[int, int]: The frame counts in sorted order, or the
+            positions they are coming from.
+    """
+    if not indices:
+        return merge(*streams)
+    return _merge_positions(streams, itemgetter(0))
+
+
+def merge_timecodes(
+    *streams: Iterable[Timecode], indices: bool = False
+) -> Iterator[Timecode] | Iterator[tuple[int, int]]:
+    """Merge the given sorted streams of timecodes with the same frame rate.
+
+    The streams are consumed lazily and equal timecodes are yielded in the
+    order of the streams.
+
+    Args:
+        *streams (Iterable[Timecode]): The sorted streams of timecodes.
+        indices (bool): Yield ``(stream_index, item_index)`` pairs instead of
+            the timecodes.
+
+    Yields:
+        Timecode | tuple[int, int]: The timecodes in sorted order, or the
+            positions they are coming from.
+    """
+    framerates: list[str | int] = []
+    checked = [_check_framerate(stream, framerates) for stream in streams]
+    if not indices:
+        return merge(*checked, key=attrgetter("frames"))
+    return _merge_positions(checked, lambda item: item[0].frames)
+
+
+def _check_framerate(
+    stream: Iterable[Timecode], framerates: list[str | int]
+) -> Iterator[Timecode]:
+    """Check the given timecodes have the same frame rate with the others.
+
+    Args:
+        stream (Iterable[Timecode]): The timecodes.
+        framerates (list[str | int]): The frame rate of the first timecode,
+            shared by the streams which are merged together.
+
+    Yields:
+        Timecode: The timecodes.
+    """
+    for tc in stream:
+        if not framerates:
+            framerates.append(tc.framerate)
+        elif tc.framerate != framerates[0]:
+            raise ValueError(
+                "Can not merge timecodes with different frame rates: "
+                f"{framerates[0]} and {tc.framerate}"
+            )
+        yield tc
+
+
+def _merge_positions(streams: Iterable[Iterable], key: Callable) -> Iterator:
+    """Merge the given sorted streams and yield the positions of the items.
+
+    Args:
+        streams (Iterable[Iterable]): The sorted streams.
+        key (Callable): The sort key of an ``(item, item_index, stream_index)``
+            tuple.
+
+    Yields:
+        tuple[int, int]: The stream and the item indices.
+    """
+    enumerated = [
+        zip(stream, count(), repeat(stream_index))
+        for stream_index, stream in enumerate(streams)
+    ]
+    for _, item_index, stream_index in merge(*enumerated, key=key):
+        yield stream_index, item_index
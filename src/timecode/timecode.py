@@ -3,8 +3,11 @@
 # Standard Library Imports
 from __future__ import annotations
 
+import struct
 import sys
 from contextlib import suppress
+from functools import lru_cache
+from types import MappingProxyType
 from typing import TYPE_CHECKING, overload
 
 if sys.version_info >= (3, 11):
@@ -15,11 +18,160 @@ else:
 with suppress(ImportError):
     from typing import Literal
 
+from timecode.core import (
+    components_to_frames,
+    format_label,
+    frames_to_components,
+    is_ntsc_rate,
+    make_rate,
+    parse_framerate,
+    parse_label,
+    split_label,
+)
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Iterator, Mapping
     from fractions import Fraction
 
+    from timecode.core import FrameRate
+
+
+SERIAL_FRAMERATES: tuple[str | int, ...] = (
+    "23.976",
+    "23.98",
+    "24",
+    "25",
+    "29.97",
+    "30",
+    "47.952",
+    "48",
+    "50",
+    "59.94",
+    "60",
+    "72",
+    "96",
+    "100",
+    "119.88",
+    "120",
+    1000,
+    "frames",
+)
+"""tuple[str | int, ...]: The frame rates stored as their index in this tuple by
+the pickles and :meth:`.Timecode.to_bytes`. The indices are part of the
+serialized data, only append to it."""
+
+CUSTOM_FRAMERATE_ID = 0xFFFF
+"""int: The frame rate id of the frame rates not in :data:`SERIAL_FRAMERATES`,
+the frame rate text follows the serialized timecode."""
+
+SERIAL_HEADER = struct.Struct("<HBQ")
+"""struct.Struct: A serialized timecode, the frame rate id, the flags and the
+frame count."""
+
+MAX_SERIAL_FRAMES = (1 << 64) - 1
+"""int: The largest frame count of a serialized timecode, an uint64."""
+
+DROP_FRAME_FLAG = 1
+"""int: The serialized flag of the drop frame timecodes."""
+
+FORCE_NON_DROP_FRAME_FLAG = 2
+"""int: The serialized flag of :attr:`.Timecode.force_non_drop_frame`."""
+
+FRACTION_FRAME_FLAG = 4
+"""int: The serialized flag of :attr:`.Timecode.fraction_frame`."""
+
+SERIAL_FLAGS = DROP_FRAME_FLAG | FORCE_NON_DROP_FRAME_FLAG | FRACTION_FRAME_FLAG
+"""int: All the serialized flags."""
+
+_FRAMERATE_IDS = {framerate: i for i, framerate in enumerate(SERIAL_FRAMERATES)}
+
+
+def _serial_key(tc: Timecode) -> tuple[int | str, int]:
+    """Return the serialized frame rate and flags of the given Timecode.
+
+    Args:
+        tc (Timecode): The Timecode.
+
+    Returns:
+        tuple[int | str, int]: The frame rate id, or the frame rate text if it
+            is not in :data:`SERIAL_FRAMERATES`, and the flags.
+    """
+    framerate = tc._framerate
+    flags = (
+        (DROP_FRAME_FLAG if tc._drop_frame else 0)
+        | (FORCE_NON_DROP_FRAME_FLAG if tc.force_non_drop_frame else 0)
+        | (FRACTION_FRAME_FLAG if tc.fraction_frame else 0)
+    )
+    return _FRAMERATE_IDS.get(framerate, framerate), flags  # type: ignore
+
+
+@lru_cache(maxsize=256)
+def _serial_attributes(rate: int | str, flags: int) -> Mapping[str, object]:
+    """Return the attributes of the Timecodes of a serialized frame rate.
+
+    The attributes are cached per frame rate and flags, and copied to the
+    restored Timecodes.
+
+    Args:
+        rate (int | str): The frame rate id or the frame rate text.
+        flags (int): The flags.
+
+    Raises:
+        ValueError: If the frame rate id or a flag is unknown, or if the drop
+            frame flag is set for a frame rate that is not drop frame.
+
+    Returns:
+        Mapping[str, object]: A read only view of the instance attributes,
+            without the frame count.
+    """
+    if flags & ~SERIAL_FLAGS:
+        raise ValueError(f"Unknown serialized timecode flags: {flags:#x}")
+    if isinstance(rate, int):
+        if not 0 <= rate < len(SERIAL_FRAMERATES):
+            raise ValueError(f"Unknown frame rate id: {rate}")
+        framerate = SERIAL_FRAMERATES[rate]
+    else:
+        framerate = rate
+    tc = Timecode(
+        framerate,
+        frames=1,
+        force_non_drop_frame=bool(flags & FORCE_NON_DROP_FRAME_FLAG),
+    )
+    if flags & DROP_FRAME_FLAG and not (
+        tc._ntsc_framerate and tc._int_framerate % 30 == 0
+    ):
+        raise ValueError(f"The frame rate {tc.framerate} can not be drop frame")
+    tc.drop_frame = bool(flags & DROP_FRAME_FLAG)
+    tc.fraction_frame = bool(flags & FRACTION_FRAME_FLAG)
+    attributes = dict(tc.__dict__)
+    del attributes["_frames"]
+    return MappingProxyType(attributes)
+
+
+def _restore_timecode(
+    rate: int | str, frames: int, flags: int, cls: None | type[Timecode] = None
+) -> Timecode:
+    """Return the Timecode of the given serialized form.
+
+    This is the function called to unpickle Timecodes.
+
+    Args:
+        rate (int | str): The frame rate id or the frame rate text.
+        frames (int): The frame count.
+        flags (int): The flags.
+        cls (None | type[Timecode]): The Timecode class, defaults to
+            :class:`.Timecode`.
+
+    Returns:
+        Timecode: The Timecode.
+    """
+    if cls is None:
+        cls = Timecode
+    tc = cls.__new__(cls)
+    tc.__dict__.update(_serial_attributes(rate, flags))
+    tc._frames = frames
+    return tc
+
 
 class Timecode:
     """The main timecode class.
@@ -58,8 +210,7 @@ class Timecode:
     def _is_ntsc_rate(fps: float) -> tuple[bool, int]:
         """Check if framerate is NTSC (multiple of 24000/1001 or 30000/1001).
 
-        NTSC rates follow the pattern: nominal_rate * 1000/1001
-        Examples: 23.976, 29.97, 47.952, 59.94, 71.928, 89.91, 95.904, 119.88
+        See :func:`timecode.core.is_ntsc_rate`.
 
         Args:
             fps (float): The framerate to check.
@@ -68,16 +219,7 @@ class Timecode:
             tuple: (is_ntsc, int_framerate) where is_ntsc is True if this is an
                 NTSC rate, and int_framerate is the rounded integer framerate.
         """
-        # Calculate what the integer framerate would be if this is NTSC
-        int_fps = round(fps * 1001 / 1000)
-
-        # Calculate what the NTSC rate would be for this integer framerate
-        expected_ntsc = int_fps * 1000 / 1001
-
-        # Check if the input matches expected NTSC rate (within tolerance)
-        is_ntsc = abs(fps - expected_ntsc) < 0.005
-
-        return is_ntsc, int_fps
+        return is_ntsc_rate(fps)
 
     def __init__(
         self,
@@ -89,12 +231,13 @@ class Timecode:
     ) -> None:
         self.force_non_drop_frame = force_non_drop_frame
 
+        self._framerate: None | str | int | float | Fraction = None
+        self._rate: None | FrameRate = None
         self.drop_frame = False
 
         self.ms_frame = False
         self.fraction_frame = False
         self._int_framerate: None | int = None
-        self._framerate: None | str | int | float | Fraction = None
         self.framerate = framerate  # type: ignore
         self._frames: None | int = None
 
@@ -170,58 +313,164 @@ class Timecode:
                 Fraction: If the current version of Python supports (which it should)
                     then Fraction is also accepted.
         """
-        # Convert rational frame rate to float, defaults to None if not Fraction-like
-        numerator = getattr(framerate, "numerator", None)
-        denominator = getattr(framerate, "denominator", None)
+        (
+            framerate,
+            self._int_framerate,
+            self._ntsc_framerate,
+            ms_frame,
+            drop_frame_rate,
+            self._numerator,
+            self._denominator,
+        ) = parse_framerate(framerate)
+
+        if ms_frame:
+            self.ms_frame = True
+        if drop_frame_rate:
+            self.drop_frame = not self.force_non_drop_frame
 
-        try:
-            if "/" in framerate:  # type: ignore
-                numerator, denominator = framerate.split("/")  # type: ignore
-        except TypeError:
-            # not a string
-            pass
+        self._framerate = framerate  # type: ignore
+        self._update_rate()
 
-        if isinstance(framerate, tuple):
-            numerator, denominator = framerate
+    @property
+    def drop_frame(self) -> bool:
+        """Return the drop_frame attribute.
 
-        if numerator and denominator:
-            framerate = round(float(numerator) / float(denominator), 2)
-            if framerate.is_integer():
-                framerate = int(framerate)
+        Returns:
+            bool: True if this is a drop frame Timecode.
+        """
+        return self._drop_frame
 
-        # check if number is passed and if so convert it to a string
-        if isinstance(framerate, (int, float)):
-            framerate = str(framerate)
+    @drop_frame.setter
+    def drop_frame(self, drop_frame: bool) -> None:
+        """Set the drop_frame attribute.
 
-        self._ntsc_framerate = False
+        Args:
+            drop_frame (bool): True to use drop frame calculation.
+        """
+        self._drop_frame = drop_frame
+        if self._framerate is not None:
+            self._update_rate()
 
-        # Handle special cases first
-        if framerate in ["ms", "1000"]:
-            self._int_framerate = 1000
-            self.ms_frame = True
-            framerate = 1000
-        elif framerate == "frames":
-            self._int_framerate = 1
-        else:
-            # Try to detect NTSC rates
-            try:
-                fps = float(framerate)  # type: ignore
-                is_ntsc, int_fps = self._is_ntsc_rate(fps)
-
-                if is_ntsc:
-                    self._ntsc_framerate = True
-                    self._int_framerate = int_fps
-                    # DF only for multiples of 30000/1001 (29.97, 59.94, etc.).
-                    if int_fps % 30 == 0:
-                        self.drop_frame = not self.force_non_drop_frame
-                else:
-                    # Non-NTSC rate, use integer value
-                    self._int_framerate = int(fps)
-            except (ValueError, TypeError):
-                # If conversion fails, fall back to direct integer conversion
-                self._int_framerate = int(float(framerate))  # type: ignore
+    @property
+    def rate(self) -> FrameRate:
+        """Return the frame rate descriptor used in the conversions.
 
-        self._framerate = framerate  # type: ignore
+        The descriptor reflects the current :attr:`.framerate` and
+        :attr:`.drop_frame` values and can be passed to the functions in
+        :mod:`timecode.core`.
+
+        Returns:
+            FrameRate: The frame rate descriptor.
+        """
+        return self._rate  # type: ignore
+
+    def _update_rate(self) -> None:
+        """Update the frame rate descriptor used in conversions."""
+        self._rate = make_rate(
+            self._numerator,
+            self._denominator,
+            self._framerate,  # type: ignore
+            self._int_framerate,  # type: ignore
+            drop_frame=self._drop_frame,
+            ms_frame=self.ms_frame,
+            ntsc=self._ntsc_framerate,
+        )
+
+    @classmethod
+    def from_rate(cls, rate: FrameRate, frames: int) -> Self:
+        """Create a Timecode from a frame rate descriptor and a frame count.
+
+        Args:
+            rate (FrameRate): The frame rate descriptor, i.e. the one returned by
+                :func:`timecode.core.get_rate`.
+            frames (int): The number of frames.
+
+        Returns:
+            Timecode: The Timecode instance.
+        """
+        # only the drop frame capable rates are forced to non drop frame, the
+        # other ones are created the same as with their frame rate
+        force_non_drop_frame = (
+            rate.ntsc and rate.int_framerate % 30 == 0 and not rate.drop_frame
+        )
+        return cls(
+            rate.framerate, frames=frames, force_non_drop_frame=force_non_drop_frame
+        )
+
+    def to_bytes(self) -> bytes:
+        """Return the compact binary form of this Timecode.
+
+        The form is :data:`SERIAL_HEADER`, 11 bytes, followed by the frame rate
+        text for the frame rates not in :data:`SERIAL_FRAMERATES`. Use
+        :func:`timecode.serialize.encode_timecodes` for sequences of Timecodes.
+
+        Raises:
+            ValueError: If the frame count is larger than
+                :data:`MAX_SERIAL_FRAMES`.
+
+        Returns:
+            bytes: The binary form.
+        """
+        frames = self.frames
+        if frames > MAX_SERIAL_FRAMES:
+            raise ValueError(
+                "Timecode.frames should be smaller than 2**64 to be serialized, "
+                f"not {frames}"
+            )
+        rate, flags = _serial_key(self)
+        if isinstance(rate, int):
+            return SERIAL_HEADER.pack(rate, flags, frames)
+        header = SERIAL_HEADER.pack(CUSTOM_FRAMERATE_ID, flags, frames)
+        return header + rate.encode("ascii")
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Self:
+        """Create a Timecode from the binary form of :meth:`.to_bytes`.
+
+        Args:
+            data (bytes): The binary form.
+
+        Raises:
+            ValueError: If the data is not a serialized Timecode, or if its
+                flags are unknown or invalid for its frame rate.
+
+        Returns:
+            Timecode: The Timecode instance.
+        """
+        size = SERIAL_HEADER.size
+        if len(data) < size:
+            raise ValueError(f"Invalid serialized timecode of {len(data)} bytes")
+        rate, flags, frames = SERIAL_HEADER.unpack_from(data)
+        if rate == CUSTOM_FRAMERATE_ID:
+            rate = bytes(data[size:]).decode("ascii")
+        elif len(data) != size:
+            raise ValueError(f"Invalid serialized timecode of {len(data)} bytes")
+        tc = _restore_timecode(rate, 1, flags, cls)
+        tc.frames = frames
+        return tc  # type: ignore
+
+    def __reduce__(self) -> tuple:
+        """Return the compact pickled form of this Timecode.
+
+        The frame rate id, the frame count and the flags are pickled instead of
+        the instance attributes, the attributes derived from the frame rate are
+        shared by the unpickled Timecodes of the same frame rate.
+
+        Returns:
+            tuple: The function restoring the Timecode and its arguments, and
+                the other attributes of the instances of subclasses.
+        """
+        rate, flags = _serial_key(self)
+        cls = self.__class__
+        if cls is Timecode:
+            return _restore_timecode, (rate, self._frames, flags)
+        attributes = _serial_attributes(rate, flags)
+        state = {
+            name: value
+            for name, value in self.__dict__.items()
+            if name != "_frames" and name not in attributes
+        }
+        return _restore_timecode, (rate, self._frames, flags, cls), state or None
 
     def set_fractional(self, state: bool) -> None:
         """Set if the Timecode is to be represented with fractional seconds.
@@ -268,52 +517,11 @@ class Timecode:
         if isinstance(timecode, Timecode):
             return timecode.frames
 
-        hours, minutes, seconds, frames = map(int, self.parse_timecode(timecode))
-
-        if isinstance(timecode, int):
-            time_tokens = [hours, minutes, seconds, frames]
-            timecode = ":".join(str(t) for t in time_tokens)
-
-            if self.drop_frame:
-                timecode = ";".join(timecode.rsplit(":", 1))
-
-        ffps = (
-            float(self.framerate)
-            if self.framerate != "frames"
-            else float(self._int_framerate)
-        )
-
-        # Number of drop frames is 6% of framerate rounded to nearest integer
-        drop_frames = round(ffps * 0.066666) if self.drop_frame else 0
-
-        # We don't need the exact framerate anymore, we just need it rounded to
-        # nearest integer
-        ifps = self._int_framerate
-
-        # Number of frames per hour (non-drop)
-        hour_frames = ifps * 60 * 60
-
-        # Number of frames per minute (non-drop)
-        minute_frames = ifps * 60
-
-        # Total number of minutes
-        total_minutes = (60 * hours) + minutes
-
-        # Handle case where frames are fractions of a second
-        if len(timecode.split(".")) == 2 and not self.ms_frame:
+        hours, minutes, seconds, frames, fractional = parse_label(self._rate, timecode)
+        if fractional:
             self.fraction_frame = True
-            fraction = timecode.rsplit(".", 1)[1]
-
-            frames = round(float("." + fraction) * ffps)
-
-        frame_number = (
-            (hour_frames * hours)
-            + (minute_frames * minutes)
-            + (ifps * seconds)
-            + frames
-        ) - (drop_frames * (total_minutes - (total_minutes // 10)))
 
-        return frame_number + 1  # frames
+        return components_to_frames(self._rate, hours, minutes, seconds, frames)
 
     def frames_to_tc(
         self, frames: int, skip_rollover: bool = False
@@ -328,52 +536,11 @@ class Timecode:
         Returns:
             tuple: A tuple containing the hours, minutes, seconds and frames
         """
-        if self.drop_frame:
-            # Number of frames to drop on the minute marks is the nearest
-            # integer to 6% of the framerate
-            ffps = float(self.framerate)
-            drop_frames = round(ffps * 0.066666)
-        else:
-            ffps = float(self._int_framerate)
-            drop_frames = 0
-
-        # Number of frames per ten minutes
-        frames_per_10_minutes = round(ffps * 60 * 10)
-
-        # Number of frames in a day - timecode rolls over after 24 hours
-        frames_per_24_hours = round(ffps * 60 * 60 * 24)
-
-        # Number of frames per minute is the round of the framerate * 60 minus
-        # the number of dropped frames
-        frames_per_minute = int(round(ffps) * 60) - drop_frames
-
-        frame_number = frames - 1
-
-        # If frame_number is greater than 24 hrs, next operation will rollover
-        # clock
-        if not skip_rollover:
-            frame_number %= frames_per_24_hours
-
-        if self.drop_frame:
-            d = frame_number // frames_per_10_minutes
-            m = frame_number % frames_per_10_minutes
-            if m > drop_frames:
-                frame_number += (drop_frames * 9 * d) + drop_frames * (
-                    (m - drop_frames) // frames_per_minute
-                )
-            else:
-                frame_number += drop_frames * 9 * d
-
-        ifps = self._int_framerate
-
-        frs: int | float = frame_number % ifps
+        hrs, mins, secs, frs = frames_to_components(
+            self._rate, frames, rollover=not skip_rollover
+        )
         if self.fraction_frame:
-            frs = round(frs / float(ifps), 3)
-
-        secs = int((frame_number // ifps) % 60)
-        mins = int(((frame_number // ifps) // 60) % 60)
-        hrs = int(((frame_number // ifps) // 60) // 60)
-
+            return hrs, mins, secs, round(frs / float(self._int_framerate), 3)
         return hrs, mins, secs, frs
 
     def tc_to_string(self, hrs: int, mins: int, secs: int, frs: float) -> str:
@@ -391,13 +558,7 @@ class Timecode:
         if self.fraction_frame:
             return f"{hrs:02d}:{mins:02d}:{secs + frs:06.3f}"
 
-        ff = "{:02d}"
-        if self.ms_frame:
-            ff = "{:03d}"
-
-        return ("{:02d}:{:02d}:{:02d}{}" + ff).format(
-            hrs, mins, secs, self.frame_delimiter, frs
-        )
+        return format_label(self._rate, (hrs, mins, secs, frs))  # type: ignore
 
     @overload
     def to_systemtime(self, as_float: Literal[True]) -> float:
@@ -500,22 +661,7 @@ class Timecode:
             (int, int, int, int): A tuple containing the hours, minutes, seconds and
                 frames part of the Timecode.
         """
-        if isinstance(timecode, int):
-            hex_repr = hex(timecode)
-            # fix short string
-            hex_repr = f"0x{hex_repr[2:].zfill(8)}"
-            hrs, mins, secs, frs = tuple(
-                map(int, [hex_repr[i : i + 2] for i in range(2, 10, 2)])
-            )
-
-        else:
-            bfr = timecode.replace(";", ":").replace(".", ":").split(":")
-            hrs = int(bfr[0])
-            mins = int(bfr[1])
-            secs = int(bfr[2])
-            frs = int(bfr[3])
-
-        return hrs, mins, secs, frs
+        return split_label(timecode)
 
     @property
     def frame_delimiter(self) -> str:
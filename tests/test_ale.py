@@ -0,0 +1,127 @@
+#!-*- coding: utf-8 -*-
+import io
+from array import array
+
+import pytest
+
+from timecode import Timecode
+from timecode.ale import ALE, read_ale, write_ale
+
+ALE_TEXT = (
+    "Heading\n"
+    "FIELD_DELIM\tTABS\n"
+    "VIDEO_FORMAT\t1080\n"
+    "AUDIO_FORMAT\t48khz\n"
+    "FPS\t29.97\n"
+    "\n"
+    "Column\n"
+    "Name\tTracks\tStart\tEnd\tDuration\tAuxiliary TC1\tTape\t\n"
+    "\n"
+    "Data\n"
+    "A001C001\tV\t01:00:00;00\t01:00:10;00\t00:00:10;00\t10:00:00:00\tA001\t\n"
+    "A001C002\tVA1A2\t01:00:59;28\t01:01:00;04\t00:00:00;06\t\tA001\t\n"
+)
+
+
+def test_read_ale_columns():
+    """Timecode columns are converted to arrays of frame counts."""
+    ale = read_ale(io.StringIO(ALE_TEXT))
+    assert ale.fps == "29.97"
+    assert ale.heading["VIDEO_FORMAT"] == "1080"
+    assert len(ale) == 2
+    assert ale.column_names == [
+        "Name", "Tracks", "Start", "End", "Duration", "Auxiliary TC1", "Tape"
+    ]
+    assert ale.columns["Name"] == ["A001C001", "A001C002"]
+    assert isinstance(ale.columns["Start"], array)
+    assert list(ale.columns["Start"]) == [
+        Timecode("29.97", "01:00:00;00").frames,
+        Timecode("29.97", "01:00:59;28").frames,
+    ]
+    # empty cells are 0
+    assert list(ale.columns["Auxiliary TC1"]) == [
+        Timecode("29.97", "10:00:00:00", force_non_drop_frame=True).frames,
+        0,
+    ]
+
+
+def test_column_rate_follows_the_frame_delimiter():
+    """Columns with ":" labels use the non drop frame calculation."""
+    ale = read_ale(io.StringIO(ALE_TEXT))
+    assert ale.rates["Start"].drop_frame is True
+    assert ale.rates["Auxiliary TC1"].drop_frame is False
+
+
+def test_rows_create_timecodes_lazily():
+    """Rows return Timecode instances for timecode columns."""
+    ale = read_ale(io.StringIO(ALE_TEXT))
+    row = ale[1]
+    assert row["Name"] == "A001C002"
+    start = row["Start"]
+    assert isinstance(start, Timecode)
+    assert repr(start) == "01:00:59;28"
+    assert row["Auxiliary TC1"] is None
+    assert repr(ale[0]["Auxiliary TC1"]) == "10:00:00:00"
+    assert repr(ale[-1]["End"]) == "01:01:00;04"
+    assert [r["Name"] for r in ale] == ["A001C001", "A001C002"]
+    assert ale[0].to_dict()["Tape"] == "A001"
+
+
+def test_row_index_out_of_range():
+    """IndexError is raised for rows out of range."""
+    ale = read_ale(io.StringIO(ALE_TEXT))
+    with pytest.raises(IndexError) as cm:
+        ale[2]
+    assert str(cm.value) == "ALE row index out of range: 2"
+
+
+def test_round_trip():
+    """Writing a read ALE gives the same text."""
+    ale = read_ale(io.StringIO(ALE_TEXT))
+    out = io.StringIO()
+    assert write_ale(out, ale) == 2
+    assert out.getvalue() == ALE_TEXT
+
+
+def test_round_trip_file(tmp_path):
+    """Paths are accepted for reading and writing."""
+    src = tmp_path / "in.ale"
+    dst = tmp_path / "out.ale"
+    src.write_text(ALE_TEXT)
+    write_ale(dst, read_ale(src))
+    assert dst.read_text() == ALE_TEXT
+
+
+def test_write_modified_columns():
+    """The timecode columns can be modified in bulk."""
+    ale = read_ale(io.StringIO(ALE_TEXT))
+    start = ale.columns["Start"]
+    for i in range(len(start)):
+        start[i] += 30
+    out = io.StringIO()
+    write_ale(out, ale)
+    assert "\t01:00:01;00\t" in out.getvalue()
+    assert "\t01:01:01;00\t" in out.getvalue()
+
+
+def test_ale_without_fps_raises_value_error():
+    """The FPS value is required."""
+    with pytest.raises(ValueError) as cm:
+        read_ale(io.StringIO("Heading\nFIELD_DELIM\tTABS\n\nColumn\nName\n\nData\n"))
+    assert str(cm.value) == "The ALE Heading section has no FPS value"
+
+
+def test_empty_ale():
+    """An ALE without rows is handled."""
+    ale = read_ale(io.StringIO("Heading\nFPS\t24\n\nColumn\nName\tStart\t\n\nData\n"))
+    assert len(ale) == 0
+    assert ale.rates["Start"].int_framerate == 24
+    assert isinstance(ale, ALE)
+
+
+def test_timecode_from_rate():
+    """Timecode.from_rate() creates a Timecode with the given rate."""
+    tc = Timecode("29.97", "00:01:00;02")
+    ndf = Timecode("29.97", "00:01:00:00", force_non_drop_frame=True)
+    assert Timecode.from_rate(tc.rate, tc.frames) == tc
+    assert Timecode.from_rate(ndf.rate, ndf.frames).drop_frame is False
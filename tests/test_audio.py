@@ -0,0 +1,119 @@
+#!-*- coding: utf-8 -*-
+import math
+from array import array
+from fractions import Fraction
+
+import pytest
+
+from timecode import Timecode
+from timecode.audio import (
+    PULL_DOWN,
+    PULL_UP,
+    frames_to_samples,
+    sample_to_timecode,
+    samples_per_frame,
+    samples_to_frames,
+    timecode_to_sample,
+)
+
+
+@pytest.mark.parametrize(
+    "framerate, sample_rate, pull, expected",
+    [
+        ("24", 48000, None, Fraction(2000)),
+        ("25", 44100, None, Fraction(1764)),
+        ("29.97", 48000, None, Fraction(8008, 5)),
+        ("29.97", 96000, None, Fraction(16016, 5)),
+        ("23.976", 48000, None, Fraction(2002)),
+        ("23.976", 44100, None, Fraction(147147, 80)),
+        ("29.97", 48000, PULL_DOWN, Fraction(1600)),
+        ("30", 48000, PULL_DOWN, Fraction(1600000, 1001)),
+        ("30", 48000, PULL_UP, Fraction(8008, 5)),
+        ("24", 48000, PULL_UP, Fraction(10010, 5)),
+    ],
+)
+def test_samples_per_frame(framerate, sample_rate, pull, expected):
+    """The exact number of samples per frame."""
+    assert samples_per_frame(framerate, sample_rate, pull=pull) == expected
+
+
+@pytest.mark.parametrize(
+    "framerate, sample_rate, pull",
+    [
+        ("29.97", 48000, None),
+        ("29.97", 44100, None),
+        ("59.94", 96000, None),
+        ("23.976", 48000, PULL_DOWN),
+        ("25", 48000, PULL_UP),
+        ("24", 44100, None),
+    ],
+)
+def test_round_trip(framerate, sample_rate, pull):
+    """The sample positions map back through the frames and the remainders."""
+    spf = samples_per_frame(framerate, sample_rate, pull=pull)
+    day = Timecode(framerate).rate.frames_per_24_hours
+    last = math.ceil(day * spf) - 1
+    samples = array("q", [*range(0, 10000), *range(last - 10000, last + 1)])
+    frames, remainders = samples_to_frames(samples, framerate, sample_rate, pull=pull)
+    firsts = frames_to_samples(frames, framerate, sample_rate, pull=pull)
+    assert array("q", [f + r for f, r in zip(firsts, remainders)]) == samples
+    for sample, frame, remainder in zip(samples, frames, remainders):
+        assert frame == math.floor(sample / spf) + 1
+        assert 0 <= remainder < spf
+    assert frames[-1] == day
+
+
+def test_frames_to_samples():
+    """The first sample of the frames is at or after the frame start."""
+    assert list(frames_to_samples(range(1, 7), "29.97", 48000)) == [
+        0, 1602, 3204, 4805, 6407, 8008
+    ]  # fmt: skip
+
+
+def test_no_drift():
+    """The conversions are exact over 24 hours."""
+    tc = Timecode("29.97", "23:59:59;29")
+    sample = timecode_to_sample(tc, 48000)
+    assert sample == math.ceil((tc.frames - 1) * Fraction(8008, 5))
+    assert sample_to_timecode(sample, "29.97", 48000) == (tc, 0)
+    assert sample_to_timecode(sample + 1600, "29.97", 48000) == (tc, 1600)
+
+
+def test_timecode_conversions():
+    """A timecode and a sample position."""
+    tc = Timecode("29.97", "01:00:00;00")
+    assert timecode_to_sample(tc, 48000) == 172799828
+    result, remainder = sample_to_timecode(172799829, "29.97", 48000)
+    assert str(result) == "01:00:00;00"
+    assert remainder == 1
+
+    result, remainder = sample_to_timecode(
+        172799829, "29.97", 48000, force_non_drop_frame=True
+    )
+    assert str(result) == "00:59:56:12"
+
+    tc = Timecode("30", "01:00:00:00")
+    assert timecode_to_sample(tc, 48000) == 172800000
+    assert timecode_to_sample(tc, 48000, pull=PULL_DOWN) == 172627373
+    result, remainder = sample_to_timecode(172627373, "30", 48000, pull=PULL_DOWN)
+    assert (str(result), remainder) == ("01:00:00:00", 0)
+
+
+def test_invalid_sample_rate():
+    """The sample rate is a positive integer."""
+    with pytest.raises(ValueError) as cm:
+        samples_per_frame("25", 0)
+    assert str(cm.value) == "sample_rate should be a positive integer, not 0"
+
+    with pytest.raises(ValueError) as cm:
+        samples_to_frames([0], "25", 44.1)
+    assert str(cm.value) == "sample_rate should be a positive integer, not 44.1"
+
+
+def test_invalid_pull():
+    """The pull is either up, down or None."""
+    with pytest.raises(ValueError) as cm:
+        frames_to_samples([1], "25", 48000, pull="sideways")
+    assert str(cm.value) == (
+        "pull should be one of 'down', 'up' or None, not 'sideways'"
+    )
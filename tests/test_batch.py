@@ -0,0 +1,144 @@
+#!-*- coding: utf-8 -*-
+import pytest
+
+from timecode import Timecode
+from timecode.batch import (
+    frames_to_labels,
+    labels_to_frames,
+    map_frames_to_labels,
+    map_labels_to_frames,
+)
+
+
+@pytest.mark.parametrize(
+    "framerate,kwargs", [
+        ["24", {}],
+        ["23.976", {}],
+        ["29.97", {}],
+        ["29.97", {"force_non_drop_frame": True}],
+        ["59.94", {}],
+        ["ms", {}],
+    ]
+)
+def test_frames_to_labels_matches_repr(framerate, kwargs):
+    """frames_to_labels() returns the same labels with Timecode.__repr__()."""
+    frames = [1, 2, 1799, 1800, 1801, 17982, 17983, 2589408, 2589409]
+    expected = [repr(Timecode(framerate, frames=f, **kwargs)) for f in frames]
+    assert frames_to_labels(frames, framerate, **kwargs) == expected
+
+
+def test_labels_to_frames_matches_tc_to_frames():
+    """labels_to_frames() returns the same frames with Timecode.frames."""
+    labels = ["00:00:00;00", "00:01:00;02", "00:10:00;00", "23:59:59;29"]
+    expected = [Timecode("29.97", label).frames for label in labels]
+    assert list(labels_to_frames(labels, "29.97")) == expected
+
+
+def test_map_frames_to_labels_in_process_for_small_inputs():
+    """Small inputs are converted without a process pool."""
+    assert list(map_frames_to_labels(range(1, 25), 24)) == frames_to_labels(
+        range(1, 25), 24
+    )
+
+
+@pytest.mark.parametrize("framerate", ["24", "29.97", "59.94"])
+def test_map_frames_to_labels_with_workers(framerate):
+    """Chunks spread over worker processes are yielded in order."""
+    frames = range(1, 5001)
+    result = list(map_frames_to_labels(frames, framerate, workers=2, chunk_size=317))
+    assert result == frames_to_labels(frames, framerate)
+
+
+def test_map_labels_to_frames_with_workers():
+    """Labels are converted back to frames in order."""
+    frames = list(range(1, 5001))
+    labels = frames_to_labels(frames, "29.97")
+    result = list(map_labels_to_frames(iter(labels), "29.97", workers=2, chunk_size=250))
+    assert result == frames
+
+
+def test_map_frames_to_labels_single_worker():
+    """workers=1 converts the whole input in this process."""
+    frames = range(1, 1001)
+    result = list(map_frames_to_labels(frames, "25", workers=1, chunk_size=10))
+    assert result == frames_to_labels(frames, "25")
+
+
+def test_map_frames_to_labels_early_close():
+    """Closing the generator early doesn't block or raise."""
+    gen = map_frames_to_labels(range(1, 100001), "24", workers=2, chunk_size=1000)
+    assert next(gen) == "00:00:00:00"
+    gen.close()
+
+
+@pytest.mark.parametrize(
+    "func, items", [(map_frames_to_labels, [1]), (map_labels_to_frames, ["00:00:00:00"])]
+)
+def test_chunk_size_is_validated(func, items):
+    """chunk_size should be a positive integer, checked before iterating."""
+    with pytest.raises(ValueError) as cm:
+        func(items, "24", chunk_size=0)
+    assert str(cm.value) == "chunk_size should be a positive integer, not 0"
+
+
+@pytest.mark.parametrize("framerate", ["24", "29.97", "59.94"])
+def test_map_frames_to_labels_with_threads(framerate):
+    """Chunks spread over worker threads are yielded in order."""
+    frames = range(1, 5001)
+    result = list(
+        map_frames_to_labels(frames, framerate, workers=4, chunk_size=317, threads=True)
+    )
+    assert result == frames_to_labels(frames, framerate)
+
+
+def test_map_labels_to_frames_with_threads():
+    """Labels are converted back to frames in order with threads."""
+    frames = list(range(1, 5001))
+    labels = frames_to_labels(frames, "59.94")
+    result = list(
+        map_labels_to_frames(labels, "59.94", workers=4, chunk_size=250, threads=True)
+    )
+    assert result == frames
+
+
+def test_conversions_on_many_threads_match_single_threaded_reference():
+    """Stress test, conversions on many threads give the single threaded results."""
+    import random
+    import threading
+
+    from timecode import frames_to_label, get_rate, label_to_frames
+
+    framerates = ["23.976", "24", "25", "29.97", "59.94", "119.88", "ms"]
+    random.seed(703)
+    frames = [random.randint(1, 20000000) for _ in range(500)]
+    reference = {
+        framerate: [repr(Timecode(framerate, frames=f)) for f in frames]
+        for framerate in framerates
+    }
+
+    n_threads = 16
+    barrier = threading.Barrier(n_threads)
+    errors = []
+
+    def worker(index):
+        barrier.wait()
+        for i in range(len(framerates)):
+            framerate = framerates[(index + i) % len(framerates)]
+            rate = get_rate(framerate)
+            expected = reference[framerate]
+            tc = Timecode(framerate)
+            for f, label in zip(frames, expected):
+                tc.frames = f
+                if (
+                    frames_to_label(rate, f) != label
+                    or repr(tc) != label
+                    or label_to_frames(rate, label) != tc.tc_to_frames(label)
+                ):
+                    errors.append((framerate, f, label))
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(n_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
@@ -0,0 +1,129 @@
+#!-*- coding: utf-8 -*-
+from array import array
+
+import pytest
+
+from timecode import Timecode
+from timecode.buckets import MINUTE, SECOND, Bucket, BucketAggregator, bucket_starts
+from timecode.core import frames_to_label, get_rate
+
+
+@pytest.mark.parametrize("framerate", ["23.976", "24", "25", "29.97", "59.94", "30"])
+@pytest.mark.parametrize("resolution", [SECOND, MINUTE])
+def test_bucket_index_follows_labels(framerate, resolution):
+    """The bucket of a frame count is the second or minute of its label."""
+    aggregator = BucketAggregator(framerate, resolution)
+    rate = aggregator.rate
+    day = rate.frames_per_24_hours
+    frames = [
+        *range(1, 20000),
+        *range(day // 3, day // 3 + 20000),
+        *range(day - 20000, day + 20000),
+    ]
+    for frame in frames:
+        label = frames_to_label(rate, frame)
+        hours, minutes, seconds = int(label[:2]), int(label[3:5]), int(label[6:8])
+        if resolution == SECOND:
+            expected = hours * 3600 + minutes * 60 + seconds
+        else:
+            expected = hours * 60 + minutes
+        assert aggregator.bucket_index(frame) == expected
+
+
+def test_drop_frame_boundaries():
+    """The first second of a drop frame minute is shorter."""
+    starts = bucket_starts(get_rate("29.97"))
+    assert len(starts) == 86401
+    assert starts[59] == Timecode("29.97", "00:00:59;00").frames
+    assert starts[60] == Timecode("29.97", "00:01:00;02").frames
+    assert starts[61] - starts[60] == 28
+    assert starts[600] == Timecode("29.97", "00:10:00;00").frames
+    assert starts[601] - starts[600] == 30
+    assert starts[-1] == get_rate("29.97").frames_per_24_hours + 1
+
+    starts = bucket_starts(get_rate("59.94"), MINUTE)
+    assert len(starts) == 1441
+    assert starts[1] == Timecode("59.94", "00:01:00;04").frames
+    assert starts[2] - starts[1] == 3596
+
+
+def test_add():
+    """Single values are aggregated."""
+    aggregator = BucketAggregator("25")
+    aggregator.add(1, 2.0)
+    aggregator.add(25, -1.0)
+    aggregator.add(26, 5.0)
+    assert list(aggregator.buckets()) == [
+        Bucket("00:00:00", 1, 2, 1.0, -1.0, 2.0),
+        Bucket("00:00:01", 26, 1, 5.0, 5.0, 5.0),
+    ]
+
+
+@pytest.mark.parametrize("framerate", ["25", "29.97", "59.94"])
+@pytest.mark.parametrize("resolution", [SECOND, MINUTE])
+def test_add_many_sorted_and_unsorted(framerate, resolution):
+    """The sorted fast path gives the same result as single values."""
+    day = get_rate(framerate).frames_per_24_hours
+    frames = array("q", [*range(1, 10000), *range(day - 5000, day + 5000)])
+    values = array("d", [(i * 7919) % 101 - 50.0 for i in range(len(frames))])
+
+    sorted_aggregator = BucketAggregator(framerate, resolution)
+    sorted_aggregator.add_many(frames, values)
+    sorted_aggregator.add_many(frames[:100], values[:100])
+
+    reversed_aggregator = BucketAggregator(framerate, resolution)
+    reversed_aggregator.add_many(frames[::-1], values[::-1])
+    reversed_aggregator.add_many(frames[:100], values[:100])
+
+    single_aggregator = BucketAggregator(framerate, resolution)
+    for frame, value in zip([*frames, *frames[:100]], [*values, *values[:100]]):
+        single_aggregator.add(frame, value)
+
+    expected = list(single_aggregator.buckets())
+    assert list(sorted_aggregator.buckets()) == expected
+    assert list(reversed_aggregator.buckets()) == expected
+    assert sum(bucket.count for bucket in expected) == len(frames) + 100
+
+
+def test_rollover():
+    """Frame counts beyond 24 hours roll over to the next day."""
+    aggregator = BucketAggregator("24", MINUTE)
+    day = aggregator.rate.frames_per_24_hours
+    aggregator.add_many([day, day + 1, day + 2], [1.0, 2.0, 3.0])
+    assert list(aggregator.buckets()) == [
+        Bucket("00:00:00", 1, 2, 5.0, 2.0, 3.0),
+        Bucket("23:59:00", day - 1439, 1, 1.0, 1.0, 1.0),
+    ]
+
+
+def test_mean():
+    """The mean of a bucket."""
+    assert Bucket("00:00:00", 1, 4, 10.0, 1.0, 4.0).mean == 2.5
+
+
+def test_empty_buckets():
+    """The empty buckets have infinite minimums and maximums."""
+    aggregator = BucketAggregator("25")
+    aggregator.add_many([], [])
+    assert list(aggregator.buckets()) == []
+    assert aggregator.minimums[0] == float("inf")
+    assert aggregator.maximums[0] == float("-inf")
+
+
+def test_length_mismatch():
+    """The frames and values should be of the same length."""
+    aggregator = BucketAggregator("25")
+    with pytest.raises(ValueError) as cm:
+        aggregator.add_many([1, 2], [1.0])
+    assert str(cm.value) == (
+        "frames and values should be of the same length, not 2 and 1"
+    )
+
+
+def test_invalid_resolution():
+    """The resolution is either second or minute."""
+    with pytest.raises(ValueError) as cm:
+        BucketAggregator("25", "hour")
+    assert str(cm.value) == (
+        "resolution should be one of 'second' or 'minute', not 'hour'"
+    )
@@ -0,0 +1,200 @@
+#!-*- coding: utf-8 -*-
+import pytest
+
+from timecode import Timecode
+from timecode.captions import SCC, SRT, VTT, CaptionRetimer, retime_file
+
+SCC_TEXT = (
+    "Scenarist_SCC V1.0\r\n"
+    "\r\n"
+    "00:00:59;28\t9420 9420 94ae 94ae\r\n"
+    "\r\n"
+    "00:01:00;02\t942c 942c\r\n"
+    "\r\n"
+    "01:00:00:00\t942f 942f\r\n"
+)
+
+SRT_TEXT = (
+    "\ufeff1\n"
+    "00:00:01,000 --> 00:00:02,500\n"
+    "Hello 00:00:01,000 world\n"
+    "\n"
+    "2\n"
+    "01:59:59,999 --> 02:00:01,234 X1:10\n"
+    "Bye\n"
+)
+
+VTT_TEXT = (
+    "WEBVTT\n"
+    "X-TIMESTAMP-MAP=MPEGTS:900000,LOCAL:00:00:00.000\n"
+    "\n"
+    "00:01.000 --> 00:02.500 align:start\n"
+    "<v Bob>Hi <00:01.500>there\n"
+    "\n"
+    "01:00:00.000 --> 01:00:01.000\n"
+    "Later\n"
+)
+
+
+@pytest.mark.parametrize(
+    "fmt,text", [[SCC, SCC_TEXT], [SRT, SRT_TEXT], [VTT, VTT_TEXT]]
+)
+def test_zero_offset_is_identical(fmt, text):
+    """Retiming with a zero offset doesn't change anything."""
+    retimer = CaptionRetimer(fmt)
+    lines = text.splitlines(keepends=True)
+    assert "".join(retimer.retime_lines(lines)) == text
+
+
+@pytest.mark.parametrize(
+    "fmt,text", [[SCC, SCC_TEXT], [SRT, SRT_TEXT], [VTT, VTT_TEXT]]
+)
+def test_zero_offset_file_is_byte_identical(tmp_path, fmt, text):
+    """retime_file() keeps the bytes of the file as is."""
+    src = tmp_path / f"in.{fmt}"
+    dst = tmp_path / f"out.{fmt}"
+    src.write_bytes(text.encode("utf-8"))
+    assert retime_file(src, dst) == len(text.splitlines())
+    assert dst.read_bytes() == src.read_bytes()
+
+
+def test_scc_offset():
+    """SCC labels are offset in frame space keeping their drop frame style."""
+    retimer = CaptionRetimer(SCC, offset=2)
+    lines = SCC_TEXT.splitlines(keepends=True)
+    result = list(retimer.retime_lines(lines))
+    assert result[2] == "00:01:00;02\t9420 9420 94ae 94ae\r\n"
+    assert result[4] == "00:01:00;04\t942c 942c\r\n"
+    assert result[6] == "01:00:00:02\t942f 942f\r\n"
+
+
+def test_scc_offset_matches_timecode_arithmetic():
+    """The retimed label is the same with adding frames to a Timecode."""
+    retimer = CaptionRetimer(SCC, offset=17982)
+    tc = Timecode("29.97", "00:09:59;29") + 17982
+    assert retimer.retime_line("00:09:59;29\t9420\n") == f"{tc!r}\t9420\n"
+
+
+def test_srt_offset():
+    """SRT timestamps are offset by the given number of frames."""
+    retimer = CaptionRetimer(SRT, framerate="25", offset=25)
+    lines = SRT_TEXT.splitlines(keepends=True)
+    result = list(retimer.retime_lines(lines))
+    assert result[1] == "00:00:02,000 --> 00:00:03,500\n"
+    # text lines are not changed
+    assert result[2] == "Hello 00:00:01,000 world\n"
+    assert result[5] == "02:00:00,999 --> 02:00:02,234 X1:10\n"
+
+
+def test_srt_ntsc_offset_is_exact():
+    """One NTSC second is 1001 ms."""
+    retimer = CaptionRetimer(SRT, framerate="23.976", offset=24000)
+    assert retimer.retime_ms(0) == 1001000
+
+
+def test_srt_rate_conversion():
+    """23.976 to 25 fps conversion speeds the timeline up."""
+    retimer = CaptionRetimer(SRT, framerate="23.976", target_framerate="25")
+    # 25 frames at 23.976 fps is 1042.708 ms, at 25 fps it is 1 second
+    assert retimer.retime_line("00:00:01,043 --> 00:00:02,085\n") == (
+        "00:00:01,000 --> 00:00:02,000\n"
+    )
+
+
+def test_vtt_offset():
+    """WebVTT timestamps keep the optional hours field."""
+    retimer = CaptionRetimer(VTT, framerate="25", offset=-25)
+    lines = VTT_TEXT.splitlines(keepends=True)
+    result = list(retimer.retime_lines(lines))
+    assert result[1] == lines[1]
+    assert result[3] == "00:00.000 --> 00:01.500 align:start\n"
+    assert result[4] == "<v Bob>Hi <00:00.500>there\n"
+    assert result[6] == "00:59:59.000 --> 01:00:00.000\n"
+
+
+def test_vtt_hours_are_added_when_needed():
+    """Hours are added to timestamps that exceed an hour."""
+    retimer = CaptionRetimer(VTT, framerate="25", offset=90000)
+    assert retimer.retime_line("00:01.000 --> 00:02.000\n") == (
+        "01:00:01.000 --> 01:00:02.000\n"
+    )
+
+
+def test_scc_rate_conversion_df_to_ndf_keeps_frames():
+    """29.97 DF and NDF labels share the same frame grid."""
+    retimer = CaptionRetimer(SCC, target_framerate="30000/1001")
+    assert retimer.retime_frames(1801) == 1801
+
+
+def test_negative_result_raises_value_error():
+    """Offsetting before zero raises a ValueError."""
+    retimer = CaptionRetimer(SRT, framerate="25", offset=-50)
+    with pytest.raises(ValueError) as cm:
+        retimer.retime_line("00:00:01,000 --> 00:00:02,000\n")
+    assert str(cm.value) == "The retimed timestamp of 1000 ms is negative"
+
+
+@pytest.mark.parametrize(
+    "framerate,line,message",
+    [
+        [
+            "29.97",
+            "00:01:00;00\t9420 9420\n",
+            "Invalid 29.97 timecode 00:01:00;00 in SCC line '00:01:00;00\\t9420 9420'",
+        ],
+        [
+            "25",
+            "00:00:01:25\t9420\r\n",
+            "Invalid 25 timecode 00:00:01:25 in SCC line '00:00:01:25\\t9420'",
+        ],
+    ],
+)
+def test_invalid_scc_label_raises_value_error(framerate, line, message):
+    """The labels which are not valid in the frame rate are not moved."""
+    retimer = CaptionRetimer(SCC, framerate=framerate)
+    with pytest.raises(ValueError) as cm:
+        retimer.retime_line(line)
+    assert str(cm.value) == message
+
+
+def test_invalid_format():
+    """Unknown formats raise a ValueError."""
+    with pytest.raises(ValueError) as cm:
+        CaptionRetimer("ass")
+    assert str(cm.value) == "fmt should be one of 'scc', 'srt' or 'vtt', not 'ass'"
+
+
+def test_offset_should_be_an_int():
+    """Offset should be an int."""
+    with pytest.raises(TypeError) as cm:
+        CaptionRetimer(SRT, offset=1.5)
+    assert str(cm.value) == "CaptionRetimer.offset should be an integer, not float"
+
+
+def test_retime_file_unknown_extension(tmp_path):
+    """The format can not be detected from unknown extensions."""
+    src = tmp_path / "in.txt"
+    src.write_text("")
+    with pytest.raises(ValueError) as cm:
+        retime_file(src, tmp_path / "out.txt")
+    assert str(cm.value) == f"Can not detect the caption format of {src}"
+
+
+def test_retime_file_failure_keeps_destination(tmp_path):
+    """A failed retime leaves the existing destination file as is."""
+    src = tmp_path / "in.srt"
+    src.write_text(
+        "1\n00:00:01,000 --> 00:00:02,000\nHello\n\n"
+        "2\n00:00:00,000 --> 00:00:00,500\nWorld\n",
+        encoding="utf-8",
+    )
+    dst = tmp_path / "out.srt"
+    dst.write_text("good", encoding="utf-8")
+    with pytest.raises(ValueError) as cm:
+        retime_file(src, dst, framerate="25", offset=-10)
+    assert str(cm.value) == "The retimed timestamp of 0 ms is negative"
+    assert dst.read_text(encoding="utf-8") == "good"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["in.srt", "out.srt"]
+
+    retime_file(src, dst, framerate="25", offset=0)
+    assert dst.read_text(encoding="utf-8") == src.read_text(encoding="utf-8")
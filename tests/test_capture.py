@@ -0,0 +1,157 @@
+#!-*- coding: utf-8 -*-
+import pytest
+
+from timecode import Timecode
+from timecode.capture import (
+    HEADER,
+    RECORD,
+    CaptureLogReader,
+    CaptureLogWriter,
+    CaptureRecord,
+)
+
+
+def test_round_trip(tmp_path):
+    """The records are read back with the frame rate of the log."""
+    path = tmp_path / "take.tclog"
+    start = Timecode("29.97", "00:00:59;28")
+    with CaptureLogWriter(path, "29.97") as log:
+        for i in range(4):
+            log.write(start + i, 1_000 + i, user_bits=i << 8)
+    assert path.stat().st_size == HEADER.size + 4 * RECORD.size
+
+    with CaptureLogReader(path) as log:
+        assert log.rate.drop_frame
+        assert len(log) == 4
+        assert [str(log.timecode(r)) for r in log] == [
+            "00:00:59;28",
+            "00:00:59;29",
+            "00:01:00;02",
+            "00:01:00;03",
+        ]
+        assert log[0] == CaptureRecord(start.frames, 1_000, 0)
+        assert log[-1].user_bits == 3 << 8
+        with pytest.raises(IndexError):
+            log[4]
+        frames, wallclock_ns, user_bits = log.columns(1, 3)
+        assert list(frames) == [start.frames + 1, start.frames + 2]
+        assert list(wallclock_ns) == [1_001, 1_002]
+        assert list(user_bits) == [1 << 8, 2 << 8]
+
+
+def test_force_non_drop_frame(tmp_path):
+    """The drop frame flag is stored in the header."""
+    path = tmp_path / "take.tclog"
+    with CaptureLogWriter(path, "29.97", force_non_drop_frame=True) as log:
+        log.write(Timecode("29.97", "00:01:00:00", force_non_drop_frame=True), 0)
+    with CaptureLogReader(path) as log:
+        assert not log.rate.drop_frame
+        assert str(log.timecode(log[0])) == "00:01:00:00"
+
+
+def test_search_and_query(tmp_path):
+    """The records of a timecode range are found with a binary search."""
+    path = tmp_path / "take.tclog"
+    start = Timecode("119.88", "01:00:00;00")
+    with CaptureLogWriter(path, "119.88") as log:
+        # every other frame
+        log.write_many(range(start.frames, start.frames + 2000, 2), range(1000))
+
+    with CaptureLogReader(path) as log:
+        indices = log.search(start + 10, start + 20)
+        assert indices == range(5, 11)
+        records = log.query(start + 9, start + 11)
+        assert [r.frames - start.frames for r in records] == [10]
+        assert [r.wallclock_ns for r in records] == [5]
+        assert log.query(start + 3000, start + 4000) == []
+        assert log.query(start + 20, start + 10) == []
+        assert len(log.query(1, start + 10_000)) == 1000
+
+
+def test_append(tmp_path):
+    """An existing log is appended to, a partial record is dropped."""
+    path = tmp_path / "take.tclog"
+    with CaptureLogWriter(path, "25") as log:
+        log.write_many([10, 11, 12], [0, 1, 2])
+    with path.open("ab") as f:
+        f.write(b"\x00" * 7)
+
+    with CaptureLogWriter(path, "25") as log:
+        log.write(13, 3)
+        with pytest.raises(ValueError) as cm:
+            log.write(5, 4)
+    assert str(cm.value) == (
+        "The timecodes of a capture log should not go backwards, "
+        "00:00:00:04 is after 00:00:00:12"
+    )
+    with CaptureLogReader(path) as log:
+        assert [r.frames for r in log] == [10, 11, 12, 13]
+
+
+def test_append_different_rate(tmp_path):
+    """A log is appended to with its own frame rate only."""
+    path = tmp_path / "take.tclog"
+    CaptureLogWriter(path, "24").close()
+    with pytest.raises(ValueError) as cm:
+        CaptureLogWriter(path, "25")
+    assert str(cm.value) == (
+        "Can not append to a capture log of a different frame rate: 24 and 25"
+    )
+
+
+def test_midnight(tmp_path):
+    """The frame counts are unwrapped at midnight, also when appending."""
+    path = tmp_path / "take.tclog"
+    last = Timecode("24", "23:59:59:23")
+    with CaptureLogWriter(path, "24") as log:
+        log.write(last, 0)
+        log.write(Timecode("24", "00:00:00:00"), 1)
+    with CaptureLogWriter(path, "24") as log:
+        log.write(Timecode("24", "00:00:00:01"), 2)
+
+    with CaptureLogReader(path) as log:
+        assert [r.frames for r in log] == [last.frames, last.frames + 1, last.frames + 2]
+        assert [str(log.timecode(r)) for r in log] == [
+            "23:59:59:23",
+            "00:00:00:00",
+            "00:00:00:01",
+        ]
+        assert log.search(last.frames + 1, last.frames + 2) == range(1, 3)
+
+
+def test_buffering(tmp_path):
+    """The records are written when the buffer is full or too old."""
+    path = tmp_path / "take.tclog"
+    log = CaptureLogWriter(path, "24", buffer_records=3, max_latency=3600)
+    log.write(1, 0)
+    log.write(2, 0)
+    assert path.stat().st_size == HEADER.size
+    log.write(3, 0)
+    assert path.stat().st_size == HEADER.size + 3 * RECORD.size
+    log.write(4, 0)
+    log.close()
+    assert path.stat().st_size == HEADER.size + 4 * RECORD.size
+
+    with CaptureLogWriter(path, "24", max_latency=0, sync=True) as log:
+        log.write(5, 0)
+        assert path.stat().st_size == HEADER.size + 5 * RECORD.size
+
+
+@pytest.mark.parametrize(
+    "content, message",
+    [
+        (b"", "Not a timecode capture log"),
+        (b"TCAX" + b"\x00" * 12, "Not a timecode capture log"),
+        (
+            HEADER.pack(b"TCAP", 2, 0, 24, 1),
+            "Unsupported capture log version: 2, expected 1",
+        ),
+    ],
+)
+def test_invalid(tmp_path, content, message):
+    """The header is checked."""
+    path = tmp_path / "take.tclog"
+    path.write_bytes(content)
+    with pytest.raises(ValueError) as cm:
+        CaptureLogReader(path)
+    assert str(cm.value) == message
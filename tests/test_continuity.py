@@ -0,0 +1,116 @@
+#!-*- coding: utf-8 -*-
+from array import array
+
+import pytest
+
+from timecode import Timecode
+from timecode.continuity import (
+    CONTINUOUS,
+    ILLEGAL,
+    JUMP,
+    REPEAT,
+    ROLLOVER,
+    ContinuityAnalyzer,
+    ContinuityStats,
+    Segment,
+    analyze_frames,
+    analyze_labels,
+)
+from timecode.core import get_rate
+
+
+def test_continuous_frames():
+    """A continuous feed is a single segment."""
+    frames = array("q", range(100, 100000))
+    assert list(analyze_frames(frames, "25")) == [
+        Segment(CONTINUOUS, 0, 99900, 100, 99999, None)
+    ]
+
+
+def test_breaks():
+    """Jumps, repeats and rollovers split the segments."""
+    last = get_rate("25").frames_per_24_hours
+    frames = [1, 2, 3, 3, 3, 4, 5, 10, 11, 9, last - 1, last, 1, 2]
+    assert list(analyze_frames(frames, "25")) == [
+        Segment(CONTINUOUS, 0, 3, 1, 3, None),
+        Segment(REPEAT, 3, 2, 3, 3, 0),
+        Segment(CONTINUOUS, 5, 2, 4, 5, 1),
+        Segment(JUMP, 7, 2, 10, 11, 5),
+        Segment(JUMP, 9, 1, 9, 9, -2),
+        Segment(JUMP, 10, 2, last - 1, last, last - 10),
+        Segment(ROLLOVER, 12, 2, 1, 2, 1 - last),
+    ]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 1000])
+def test_chunks(chunk_size):
+    """The segments do not depend on the chunk size."""
+    frames = [1, 2, 3, 3, 3, 4, 5, 10, 11, 9] + list(range(20, 60)) + [59] * 7
+    expected = list(analyze_frames(frames, "24"))
+    assert list(analyze_frames(frames, "24", chunk_size=chunk_size)) == expected
+    assert list(analyze_frames(array("q", frames), "24", chunk_size=chunk_size)) == (
+        expected
+    )
+
+
+def test_incremental_feed_and_stats():
+    """Samples can be fed incrementally and statistics are collected."""
+    analyzer = ContinuityAnalyzer("25")
+    assert analyzer.feed_frames([1, 2, 3]) == []
+    assert analyzer.feed_frames([3, 3, 4]) == [
+        Segment(CONTINUOUS, 0, 3, 1, 3, None),
+        Segment(REPEAT, 3, 2, 3, 3, 0),
+    ]
+    assert analyzer.feed_frames(array("q", [4, 100])) == [
+        Segment(CONTINUOUS, 5, 1, 4, 4, 1),
+        Segment(REPEAT, 6, 1, 4, 4, 0),
+    ]
+    assert analyzer.finish() == [Segment(JUMP, 7, 1, 100, 100, 96)]
+    assert analyzer.finish() == []
+    assert analyzer.stats == ContinuityStats(
+        samples=8, segments=5, jumps=1, rollovers=0, repeats=3, illegal=0
+    )
+
+
+def test_labels_with_illegal_drop_frame_labels():
+    """Drop frame labels which do not exist are reported."""
+    labels = [
+        "00:00:59;28",
+        "00:00:59;29",
+        "00:01:00;00",
+        "00:01:00;01",
+        "00:01:00;02",
+        "00:01:00;03",
+        "00:10:00;00",
+    ]
+    start = Timecode("29.97", "00:00:59;28").frames
+    assert list(analyze_labels(labels, "29.97")) == [
+        Segment(CONTINUOUS, 0, 2, start, start + 1, None),
+        Segment(ILLEGAL, 2, 2, start, start + 1, None),
+        Segment(CONTINUOUS, 4, 2, start + 2, start + 3, 1),
+        Segment(JUMP, 6, 1, 17983, 17983, 17983 - start - 3),
+    ]
+
+
+def test_labels_non_drop_frame():
+    """Non drop frame labels are never illegal."""
+    labels = ["00:00:59:29", "00:01:00:00", "00:01:00:01"]
+    result = list(analyze_labels(labels, "29.97", force_non_drop_frame=True))
+    assert result == [Segment(CONTINUOUS, 0, 3, 1800, 1802, None)]
+
+
+def test_labels_rollover():
+    """Labels rolling over 24 hours are reported as rollovers."""
+    labels = ["23:59:59;28", "23:59:59;29", "00:00:00;00", "00:00:00;01"]
+    kinds = [segment.kind for segment in analyze_labels(labels, "29.97")]
+    assert kinds == [CONTINUOUS, ROLLOVER]
+
+
+def test_labels_match_timecode():
+    """The frame counts of the labels match the Timecode class."""
+    labels = [repr(Timecode("59.94", frames=f)) for f in range(1, 40000)]
+    assert list(analyze_labels(labels, "59.94")) == [
+        Segment(CONTINUOUS, 0, 39999, 1, 39999, None)
+    ]
+    labels = ["00:00:00.500", "00:00:01.000"]
+    assert [s.first for s in analyze_labels(labels, "1000")] == [501, 1001]
@@ -0,0 +1,195 @@
+#!-*- coding: utf-8 -*-
+import math
+from array import array
+from fractions import Fraction
+
+import pytest
+
+from timecode import Timecode
+from timecode.convert import (
+    FLOOR,
+    HOLD,
+    NEAREST,
+    PULLDOWN_23,
+    PULLDOWN_2332,
+    convert_frames,
+    convert_timecode,
+    pulldown_frames,
+    pullup_frames,
+)
+from timecode.core import get_rate
+
+
+@pytest.mark.parametrize(
+    "source, target",
+    [
+        ("25", "24"),
+        ("24", "25"),
+        ("23.976", "29.97"),
+        ("29.97", "59.94"),
+        ("24", "30"),
+        ("30", "24"),
+        ("29.97", "25"),
+        ("24", "48"),
+        ("ms", "25"),
+    ],
+)
+def test_convert_frames(source, target):
+    """The frame counts are converted by their exact time."""
+    source_rate = get_rate(source)
+    target_rate = get_rate(target)
+    ratio = Fraction(
+        target_rate.numerator * source_rate.denominator,
+        target_rate.denominator * source_rate.numerator,
+    )
+    frames = range(-100, 3000)
+    assert convert_frames(frames, source, target, rounding=FLOOR) == array(
+        "q", [math.floor((f - 1) * ratio) + 1 for f in frames]
+    )
+    assert convert_frames(frames, source, target, rounding=NEAREST) == array(
+        "q", [round((f - 1) * ratio) + 1 for f in frames]
+    )
+    assert convert_frames(frames, source, target, rounding=HOLD) == array(
+        "q", [math.ceil((f - 1) * ratio) + 1 for f in frames]
+    )
+
+
+def test_convert_frames_rounding():
+    """The rounding modes."""
+    frames = [1, 2, 3, 4, 5, 6]
+    assert list(convert_frames(frames, "24", "30", rounding=FLOOR)) == [
+        1, 2, 3, 4, 6, 7
+    ]  # fmt: skip
+    # 2.5 and 7.5 are rounded to the even frame number
+    assert list(convert_frames(frames, "24", "30", rounding=NEAREST)) == [
+        1, 2, 3, 5, 6, 7
+    ]  # fmt: skip
+    assert list(convert_frames(frames, "24", "30", rounding=HOLD)) == [
+        1, 3, 4, 5, 6, 8
+    ]  # fmt: skip
+    assert list(convert_frames(frames, "30", "24", rounding=HOLD)) == [
+        1, 2, 3, 4, 5, 5
+    ]  # fmt: skip
+
+
+def test_convert_frames_ignores_drop_frame():
+    """Drop frame does not change the frame counts."""
+    frames = range(1, 1000)
+    assert list(convert_frames(frames, "29.97", "29.97")) == list(frames)
+    assert list(convert_frames(frames, "59.94", "29.97", rounding=FLOOR)) == [
+        (f - 1) // 2 + 1 for f in frames
+    ]
+
+
+def test_convert_frames_invalid_rounding():
+    """The rounding is one of the modes."""
+    with pytest.raises(ValueError) as cm:
+        convert_frames([1], "25", "24", rounding="up")
+    assert str(cm.value) == (
+        "rounding should be one of 'floor', 'nearest' or 'hold', not 'up'"
+    )
+
+
+def test_convert_timecode():
+    """A timecode is converted to the same time at another rate."""
+    tc = convert_timecode(Timecode("25", "01:00:00:00"), "29.97")
+    assert tc.framerate == "29.97"
+    assert tc.drop_frame
+    assert str(tc) == "01:00:00;00"
+
+    tc = convert_timecode(
+        Timecode("25", "01:00:00:00"), "29.97", force_non_drop_frame=True
+    )
+    assert str(tc) == "00:59:56:12"
+
+    tc = convert_timecode(
+        Timecode("23.976", "01:00:00:00"), "29.97", force_non_drop_frame=True
+    )
+    assert str(tc) == "01:00:00:00"
+
+    tc = convert_timecode(Timecode("25", "00:00:01:01"), "24", rounding=FLOOR)
+    assert str(tc) == "00:00:01:00"
+
+
+def test_pulldown_23():
+    """The 2:3 cadence turns A B C D to AA BB BC CD DD."""
+    assert list(pulldown_frames(range(1, 9))) == [1, 2, 4, 5, 6, 7, 9, 10]
+    assert list(pullup_frames(range(1, 11))) == [1, 2, 2, 3, 4, 5, 6, 6, 7, 8]
+    assert list(pullup_frames(range(1, 11), field=1)) == [
+        1, 2, 3, 4, 4, 5, 6, 7, 8, 8
+    ]  # fmt: skip
+
+
+def test_pulldown_2332():
+    """The 2:3:3:2 cadence turns A B C D to AA BB BC CC DD."""
+    assert list(pulldown_frames(range(1, 9), cadence=PULLDOWN_2332)) == [
+        1, 2, 4, 5, 6, 7, 9, 10
+    ]  # fmt: skip
+    assert list(pullup_frames(range(1, 11), cadence=PULLDOWN_2332)) == [
+        1, 2, 2, 3, 4, 5, 6, 6, 7, 8
+    ]  # fmt: skip
+    assert list(pullup_frames(range(1, 11), cadence=PULLDOWN_2332, field=1)) == [
+        1, 2, 3, 3, 4, 5, 6, 7, 7, 8
+    ]  # fmt: skip
+
+
+def test_pulldown_phase():
+    """The phase is the position of the first film frame in the cadence."""
+    # B C D A, the first film frame is 3 fields long
+    assert list(pulldown_frames(range(1, 6), phase=1)) == [1, 3, 4, 5, 6]
+    assert list(pullup_frames(range(1, 8), phase=1)) == [1, 1, 2, 3, 4, 5, 5]
+    # D A B C, the first video frame is a split field frame CD, and the first
+    # film frame is D
+    assert list(pullup_frames(range(1, 4), phase=3)) == [1, 1, 2]
+    assert list(pullup_frames(range(1, 4), phase=3, field=1)) == [1, 2, 3]
+
+
+@pytest.mark.parametrize(
+    "cadence", [PULLDOWN_23, PULLDOWN_2332, ((2,) * 11 + (3,)) * 2]
+)
+def test_pulldown_round_trip(cadence):
+    """Pulling up the pulled down frame counts gives the film frame counts."""
+    frames = range(-50, 500)
+    for phase in range(len(cadence)):
+        video = pulldown_frames(frames, cadence=cadence, phase=phase)
+        assert list(pullup_frames(video, cadence=cadence, phase=phase)) == list(frames)
+
+
+def test_pulldown_time():
+    """The pulled down frames are within a video frame of the film frames."""
+    film = range(1, 1001)
+    video = pulldown_frames(film)
+    for film_frame, video_frame in zip(film, video):
+        film_time = Fraction(film_frame - 1, 24)
+        video_time = Fraction(video_frame - 1, 30)
+        assert abs(video_time - film_time) < Fraction(1, 30)
+
+
+def test_invalid_cadence():
+    """The cadence needs at least 2 fields per frame and full video frames."""
+    with pytest.raises(ValueError) as cm:
+        pulldown_frames([1], cadence=(2, 3))
+    assert str(cm.value) == (
+        "cadence should have at least 2 fields per frame and an even number "
+        "of fields, not (2, 3)"
+    )
+    with pytest.raises(ValueError) as cm:
+        pullup_frames([1], cadence=(1, 3))
+    assert str(cm.value) == (
+        "cadence should have at least 2 fields per frame and an even number "
+        "of fields, not (1, 3)"
+    )
+
+
+def test_invalid_phase():
+    """The phase is a position in the cadence."""
+    with pytest.raises(ValueError) as cm:
+        pulldown_frames([1], phase=4)
+    assert str(cm.value) == "phase should be between 0 and 3, not 4"
+
+
+def test_invalid_field():
+    """The field is either the first or the second."""
+    with pytest.raises(ValueError) as cm:
+        pullup_frames([1], field=2)
+    assert str(cm.value) == "field should be either 0 or 1, not 2"
@@ -0,0 +1,237 @@
+#!-*- coding: utf-8 -*-
+from fractions import Fraction
+
+import pytest
+
+from timecode import Timecode
+from timecode.core import (
+    FRACTION,
+    components_to_frames,
+    format_label,
+    fraction_to_frames,
+    frames_to_components,
+    frames_to_label,
+    get_rate,
+    label_to_frames,
+    parse_label,
+)
+
+NTSC_RATES = [
+    ("23.976", 24, 0),
+    ("29.97", 30, 2),
+    ("47.952", 48, 0),
+    ("59.94", 60, 4),
+    ("71.928", 72, 0),
+    ("89.91", 90, 6),
+    ("95.904", 96, 0),
+    ("119.88", 120, 8),
+]
+
+
+@pytest.mark.parametrize(
+    "framerate,numerator,denominator", [
+        ["23.976", 24000, 1001],
+        ["23.98", 24000, 1001],
+        [29.97, 30000, 1001],
+        ["30000/1001", 30000, 1001],
+        [(60000, 1001), 60000, 1001],
+        [Fraction(120000, 1001), 120000, 1001],
+        ["24", 24, 1],
+        [25, 25, 1],
+        ["24000/1000", 24, 1],
+        [(25, 2), 25, 2],
+        ["ms", 1000, 1],
+        ["frames", 1, 1],
+    ]
+)
+def test_get_rate_keeps_the_exact_rate(framerate, numerator, denominator):
+    """The exact rational rate is not rounded to 2 decimals."""
+    rate = get_rate(framerate)
+    assert (rate.numerator, rate.denominator) == (numerator, denominator)
+
+
+@pytest.mark.parametrize("framerate,int_framerate,drop_frames", NTSC_RATES)
+def test_get_rate_derived_fields(framerate, int_framerate, drop_frames):
+    """Drop counts and block sizes are derived exactly per rate."""
+    rate = get_rate(framerate)
+    assert rate.int_framerate == int_framerate
+    assert rate.drop_frame is (drop_frames != 0)
+    assert rate.drop_frames == drop_frames
+    assert rate.frames_per_minute == int_framerate * 60 - drop_frames
+    assert rate.frames_per_10_minutes == int_framerate * 600 - 9 * drop_frames
+    assert rate.frames_per_24_hours == 144 * rate.frames_per_10_minutes
+
+
+def test_get_rate_force_non_drop_frame():
+    """force_non_drop_frame disables the drop frame calculation."""
+    rate = get_rate("29.97", force_non_drop_frame=True)
+    assert rate.drop_frame is False
+    assert rate.drop_frames == 0
+    assert rate.frames_per_24_hours == 30 * 86400
+
+
+def test_get_rate_is_cached():
+    """The same descriptor is returned for the same frame rate."""
+    assert get_rate("29.97") is get_rate("30000/1001")
+
+
+def _next_label(rate, hrs, mins, secs, frs):
+    """Return the label following the given one, skipping dropped labels."""
+    frs += 1
+    if frs == rate.int_framerate:
+        frs = 0
+        secs += 1
+        if secs == 60:
+            secs = 0
+            mins += 1
+            if mins == 60:
+                mins = 0
+                hrs = (hrs + 1) % 24
+            if secs == 0 and mins % 10:
+                frs = rate.drop_frames
+    return hrs, mins, secs, frs
+
+
+@pytest.mark.parametrize("framerate,int_framerate,drop_frames", NTSC_RATES)
+@pytest.mark.parametrize("force_non_drop_frame", [False, True])
+def test_full_day_blocks(framerate, int_framerate, drop_frames, force_non_drop_frame):
+    """Every frame of the first and last ten minutes of the day is consecutive.
+
+    The drop frame pattern repeats every ten minutes, so this together with the
+    minute boundary test covers the full day.
+    """
+    rate = get_rate(framerate, force_non_drop_frame)
+    block = rate.frames_per_10_minutes
+    day = rate.frames_per_24_hours
+    for start in (1, day - block + 1):
+        label = frames_to_components(rate, start)
+        for frames in range(start, start + block):
+            assert frames_to_components(rate, frames) == label
+            assert components_to_frames(rate, *label) == frames
+            label = _next_label(rate, *label)
+    # rolls over after 24 hours
+    assert frames_to_components(rate, day) == (23, 59, 59, int_framerate - 1)
+    assert frames_to_components(rate, day + 1) == (0, 0, 0, 0)
+    assert frames_to_components(rate, day + 1, rollover=False) == (24, 0, 0, 0)
+
+
+@pytest.mark.parametrize("framerate,int_framerate,drop_frames", NTSC_RATES)
+def test_minute_boundaries_over_full_day(framerate, int_framerate, drop_frames):
+    """Labels around every minute boundary of the day round trip exactly."""
+    rate = get_rate(framerate)
+    for total_minutes in range(24 * 60):
+        hrs, mins = divmod(total_minutes, 60)
+        first = drop_frames if mins % 10 else 0
+        frames = components_to_frames(rate, hrs, mins, 0, first)
+        assert frames_to_components(rate, frames) == (hrs, mins, 0, first)
+        assert frames_to_components(rate, frames - 1) == (
+            (hrs, mins - 1, 59, int_framerate - 1)
+            if mins
+            else ((hrs - 1) % 24, 59, 59, int_framerate - 1)
+        )
+
+
+@pytest.mark.parametrize(
+    "framerate,fraction,expected", [
+        ["25", "040", 1],
+        ["24", "1", 2],
+        ["24", "5", 12],
+        ["25", "5", 12],
+        ["23.976", "5", 12],
+        ["29.97", "999", 30],
+    ]
+)
+def test_fraction_to_frames(framerate, fraction, expected):
+    """Fractions of seconds are rounded to the nearest frame, ties to even."""
+    assert fraction_to_frames(get_rate(framerate), fraction) == expected
+
+
+def test_timecode_uses_the_integer_engine():
+    """Timecode conversions match the engine."""
+    rate = get_rate("59.94")
+    tc = Timecode("59.94", "04:20:13;21")
+    assert tc.frames == components_to_frames(rate, 4, 20, 13, 21)
+    assert tc.frames_to_tc(tc.frames) == frames_to_components(rate, tc.frames)
+
+
+def test_timecode_drop_frame_change_updates_the_rate():
+    """Changing the drop_frame attribute changes the calculation."""
+    tc = Timecode("29.97", frames=17983)
+    assert repr(tc) == "00:10:00;00"
+    tc.drop_frame = False
+    assert repr(tc) == "00:09:59:12"
+
+
+@pytest.mark.parametrize(
+    "framerate,label", [
+        ["24", "01:00:00:00"],
+        ["23.976", "04:01:45:23"],
+        ["29.97", "00:09:00;02"],
+        ["59.94", "04:20:13;21"],
+        ["119.88", "01:30:45;100"],
+        ["ms", "03:36:09.230"],
+        ["25", "00:00:00.040"],
+        ["24", 421729315],
+    ]
+)
+def test_label_to_frames_matches_timecode(framerate, label):
+    """label_to_frames() returns the same frames with Timecode."""
+    assert label_to_frames(get_rate(framerate), label) == Timecode(framerate, label).frames
+
+
+def test_label_to_frames_has_no_side_effects():
+    """Parsing fractional labels doesn't change any state."""
+    rate = get_rate("24")
+    assert label_to_frames(rate, "00:00:01.500") == 37
+    assert frames_to_label(rate, 37) == "00:00:01:12"
+    assert parse_label(rate, "00:00:01.500") == (0, 0, 1, 12, True)
+    assert parse_label(rate, "00:00:01:12") == (0, 0, 1, 12, False)
+
+
+def test_timecode_tc_to_frames_still_sets_fraction_frame():
+    """Timecode.tc_to_frames() keeps switching the instance to fractions."""
+    tc = Timecode("24", "00:00:01:12")
+    assert tc.tc_to_frames("00:00:01.500") == 37
+    assert tc.fraction_frame is True
+
+
+@pytest.mark.parametrize(
+    "framerate,kwargs,frames", [
+        ["24", {}, 12000],
+        ["29.97", {}, 2589408],
+        ["29.97", {"force_non_drop_frame": True}, 2589409],
+        ["59.94", {}, 935866],
+        ["ms", {}, 12969231],
+        ["frames", {}, 100],
+    ]
+)
+def test_frames_to_label_matches_repr(framerate, kwargs, frames):
+    """frames_to_label() returns the same label with Timecode.__repr__()."""
+    rate = get_rate(framerate, **kwargs)
+    assert frames_to_label(rate, frames) == repr(Timecode(framerate, frames=frames, **kwargs))
+
+
+@pytest.mark.parametrize("framerate", ["24", "25", "29.97", "60"])
+def test_format_label_fraction_style_matches_repr(framerate):
+    """The fraction style matches Timecode with fraction_frame enabled."""
+    rate = get_rate(framerate)
+    tc = Timecode(framerate)
+    tc.set_fractional(True)
+    for frames in range(1, 2 * rate.int_framerate + 2):
+        tc.frames = frames
+        assert format_label(rate, frames_to_components(rate, frames), FRACTION) == repr(tc)
+
+
+def test_frames_to_label_without_rollover():
+    """rollover=False keeps counting the hours."""
+    rate = get_rate("24")
+    assert frames_to_label(rate, 24 * 86400 + 1, rollover=False) == "24:00:00:00"
+
+
+def test_functions_are_exported_from_the_package():
+    """The functional API is available from the package."""
+    import timecode
+
+    rate = timecode.get_rate("29.97")
+    assert isinstance(rate, timecode.FrameRate)
+    assert timecode.frames_to_label(rate, timecode.label_to_frames(rate, "00:01:00;02")) == "00:01:00;02"
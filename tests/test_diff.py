@@ -0,0 +1,135 @@
+#!-*- coding: utf-8 -*-
+import pytest
+
+from timecode import Timecode
+from timecode.diff import (
+    DUPLICATE,
+    EXTRA,
+    MATCH,
+    MISSING,
+    SLIP,
+    DiffEntry,
+    diff_timecodes,
+)
+
+
+def tcs(framerate, *labels):
+    """Return Timecode instances of the given labels."""
+    return [Timecode(framerate, label) for label in labels]
+
+
+def test_diff_matches_and_missing_entries():
+    """Equal entries are matched and the rest are reported."""
+    left = tcs("24", "01:00:00:00", "01:00:01:00", "01:00:02:00")
+    right = tcs("24", "01:00:02:00", "01:00:00:00", "01:00:03:00")
+    assert list(diff_timecodes(left, right)) == [
+        DiffEntry(MATCH, 0, 1),
+        DiffEntry(MATCH, 2, 0),
+        DiffEntry(MISSING, 1, None),
+        DiffEntry(EXTRA, None, 2),
+    ]
+
+
+def test_diff_duplicates():
+    """Repeated entries are reported and only the first one is compared."""
+    left = tcs("25", "00:00:01:00", "00:00:01:00", "00:00:02:00")
+    right = tcs("25", "00:00:02:00", "00:00:01:00", "00:00:02:00")
+    assert list(diff_timecodes(left, right)) == [
+        DiffEntry(DUPLICATE, 1, None),
+        DiffEntry(DUPLICATE, None, 2),
+        DiffEntry(MATCH, 0, 1),
+        DiffEntry(MATCH, 2, 0),
+    ]
+
+
+def test_diff_across_frame_rates():
+    """Entries of different frame rates are matched at the exact same time."""
+    left = tcs("25", "00:00:01:00", "00:00:01:01")
+    right = [
+        Timecode("50", "00:00:01:00"),
+        Timecode("50", "00:00:01:01"),
+        Timecode("50", "00:00:01:02"),
+    ]
+    assert list(diff_timecodes(left, right)) == [
+        DiffEntry(MATCH, 0, 0),
+        DiffEntry(MATCH, 1, 2),
+        DiffEntry(EXTRA, None, 1),
+    ]
+
+
+def test_diff_ntsc_against_real_time():
+    """29.97 frames are matched with the milliseconds based rate."""
+    # 30 frames at 29.97 is exactly 1.001 seconds
+    left = [Timecode("29.97", frames=31)]
+    right = [Timecode("1000", frames=1002), Timecode("1000", frames=1001)]
+    assert list(diff_timecodes(left, right)) == [
+        DiffEntry(MATCH, 0, 0),
+        DiffEntry(EXTRA, None, 1),
+    ]
+
+
+def test_diff_slips():
+    """Moved entries with the same duration are reported as slips."""
+    left = [
+        tuple(tcs("24", "01:00:00:00", "01:00:05:00")),
+        tuple(tcs("24", "01:00:10:00", "01:00:12:00")),
+        tuple(tcs("24", "01:00:20:00", "01:00:25:00")),
+        tuple(tcs("24", "01:00:30:00", "01:00:31:00")),
+    ]
+    right = [
+        tuple(tcs("24", "01:00:00:00", "01:00:05:00")),
+        tuple(tcs("24", "01:00:10:02", "01:00:12:02")),
+        tuple(tcs("24", "01:00:19:23", "01:00:24:23")),
+        tuple(tcs("24", "01:00:30:03", "01:00:31:03")),
+    ]
+    assert list(diff_timecodes(left, right, max_slip=2)) == [
+        DiffEntry(MATCH, 0, 0),
+        DiffEntry(MISSING, 3, None),
+        DiffEntry(EXTRA, None, 3),
+        DiffEntry(SLIP, 1, 1, 2),
+        DiffEntry(SLIP, 2, 2, -1),
+    ]
+    kinds = [entry.kind for entry in diff_timecodes(left, right)]
+    assert sorted(kinds) == sorted([MATCH] + [MISSING] * 3 + [EXTRA] * 3)
+
+
+def test_diff_slips_across_frame_rates():
+    """The slip tolerance is the one of the frame rate of each left entry."""
+    left = [
+        tuple(tcs("60", "00:00:10:01", "00:00:11:01")),
+        tuple(tcs("24", "00:00:10:01", "00:00:11:01")),
+    ]
+    right = [tuple(tcs("60", "00:00:09:58", "00:00:10:58"))]
+    # 0.05 seconds is 3 frames at 60 and 0.075 seconds is 1.8 frames at 24
+    assert list(diff_timecodes(left, right, max_slip=2)) == [
+        DiffEntry(MISSING, 0, None),
+        DiffEntry(SLIP, 1, 0, -2),
+    ]
+
+
+def test_diff_ranges_with_different_durations_do_not_match():
+    """Ranges with the same start but different ends are not matched."""
+    left = [tuple(tcs("24", "01:00:00:00", "01:00:05:00"))]
+    right = [tuple(tcs("24", "01:00:00:00", "01:00:05:01"))]
+    assert list(diff_timecodes(left, right, max_slip=5)) == [
+        DiffEntry(MISSING, 0, None),
+        DiffEntry(EXTRA, None, 0),
+    ]
+
+
+def test_diff_empty_lists():
+    """Empty lists are supported."""
+    assert list(diff_timecodes([], [])) == []
+    assert list(diff_timecodes(tcs("24", "00:00:00:01"), [])) == [
+        DiffEntry(MISSING, 0, None)
+    ]
+
+
+@pytest.mark.parametrize("max_slip", [-1, 1.5])
+def test_diff_raises_for_invalid_max_slip(max_slip):
+    """max_slip should be a non negative integer."""
+    with pytest.raises(ValueError) as cm:
+        list(diff_timecodes([], [], max_slip=max_slip))
+    assert str(cm.value) == (
+        f"max_slip should be a non negative integer, not {max_slip}"
+    )
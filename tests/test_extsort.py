@@ -0,0 +1,115 @@
+#!-*- coding: utf-8 -*-
+import random
+
+import pytest
+
+from timecode.core import frames_to_label, get_rate
+from timecode.extsort import sort_lines, sort_log
+
+
+def make_lines(count, seed=0):
+    """Return shuffled log lines with two lines per timecode."""
+    rate = get_rate("29.97")
+    lines = []
+    for i in range(count):
+        frames = i // 2 + 1
+        lines.append(f"{frames_to_label(rate, frames)} recorder{i % 2} frame {i}\n")
+    random.Random(seed).shuffle(lines)
+    return lines
+
+
+def sort_key(line):
+    """Return the frame count of the given line."""
+    return int(line.rsplit(" ", 1)[1]) // 2
+
+
+@pytest.mark.parametrize(
+    "memory_budget, fan_in, workers",
+    [
+        (10**9, 64, 1),
+        (4096, 64, 1),
+        (4096, 2, 1),
+        (4096, 3, 2),
+    ],
+)
+def test_sort_lines(memory_budget, fan_in, workers):
+    """Lines are sorted by timecode in one or many runs and merge passes."""
+    lines = make_lines(2000)
+    result = list(
+        sort_lines(
+            lines,
+            "29.97",
+            memory_budget=memory_budget,
+            fan_in=fan_in,
+            workers=workers,
+        )
+    )
+    assert result == sorted(lines, key=sort_key)
+
+
+def test_sort_lines_is_stable():
+    """Lines with the same timecode keep their input order."""
+    lines = [
+        "00:00:01;00 c\n",
+        "00:00:00;00 a\n",
+        "00:00:01;00 b\n",
+        "00:00:00;00 d\n",
+        "00:00:01;00 a\n",
+    ] * 50
+    result = list(sort_lines(lines, "29.97", memory_budget=1000, fan_in=2))
+    assert result == sorted(lines, key=lambda line: line[:11])
+
+
+def test_sort_lines_field_and_delimiter():
+    """The timecode label can be in any field."""
+    lines = ["b,00:00:00:02\n", "a,00:00:00:01\n", "c,00:00:00:00\n"]
+    result = list(sort_lines(lines, "25", field=1, delimiter=","))
+    assert result == ["c,00:00:00:00\n", "a,00:00:00:01\n", "b,00:00:00:02\n"]
+
+
+def test_sort_lines_raises_for_missing_fields():
+    """An error is raised if a line has less fields than expected."""
+    with pytest.raises(ValueError) as cm:
+        list(sort_lines(["00:00:00:00\n"], "25", field=1))
+    assert str(cm.value) == "The log has lines with less than 2 fields"
+
+
+@pytest.mark.parametrize(
+    "kwargs, message",
+    [
+        ({"memory_budget": 0}, "memory_budget should be a positive integer, not 0"),
+        ({"workers": 0}, "workers should be a positive integer, not 0"),
+        ({"fan_in": 1}, "fan_in should be at least 2, not 1"),
+    ],
+)
+def test_sort_lines_raises_for_invalid_arguments(kwargs, message):
+    """The arguments are validated."""
+    with pytest.raises(ValueError) as cm:
+        list(sort_lines([], "25", **kwargs))
+    assert str(cm.value) == message
+
+
+def test_sort_log(tmp_path):
+    """Several log files are sorted together into a new file."""
+    lines = make_lines(1000)
+    (tmp_path / "a.log").write_text("".join(lines[:500]), newline="")
+    # the last line is missing the newline and there is a blank line
+    (tmp_path / "b.log").write_text(
+        "\r\n" + "".join(lines[500:]).rstrip("\n"), newline=""
+    )
+    count = sort_log(
+        [tmp_path / "a.log", tmp_path / "b.log"],
+        tmp_path / "sorted.log",
+        "29.97",
+        memory_budget=8192,
+        tmp_dir=tmp_path,
+    )
+    assert count == 1000
+    with open(tmp_path / "sorted.log", newline="") as f:
+        assert f.readlines() == sorted(lines, key=sort_key)
+    # the temporary files are cleaned up
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "a.log",
+        "b.log",
+        "sorted.log",
+    ]
@@ -0,0 +1,184 @@
+#!-*- coding: utf-8 -*-
+from array import array
+
+import pytest
+
+from timecode import Timecode, TimecodeError
+from timecode.film import (
+    GAUGE_16MM,
+    GAUGE_35MM,
+    GAUGE_35MM_2PERF,
+    GAUGE_35MM_3PERF,
+    GAUGE_65MM,
+    Footage,
+    format_footage,
+    format_footages,
+    parse_footage,
+    parse_footages,
+)
+
+GAUGES = [GAUGE_35MM, GAUGE_35MM_3PERF, GAUGE_35MM_2PERF, GAUGE_16MM, GAUGE_65MM]
+
+
+@pytest.mark.parametrize(
+    "gauge, frames_in_feet",
+    [
+        (GAUGE_35MM, [16, 16, 16]),
+        (GAUGE_35MM_3PERF, [22, 21, 21, 22, 21, 21]),
+        (GAUGE_35MM_2PERF, [32, 32]),
+        (GAUGE_16MM, [40, 40]),
+        (GAUGE_65MM, [13, 13, 13, 13, 12, 13]),
+    ],
+)
+def test_frames_in_foot(gauge, frames_in_feet):
+    """The number of frames in the feet of the gauges."""
+    assert [gauge.frames_in_foot(i) for i in range(len(frames_in_feet))] == (
+        frames_in_feet
+    )
+
+
+@pytest.mark.parametrize(
+    "gauge, frame_number, footage",
+    [
+        (GAUGE_35MM, 0, "0+00"),
+        (GAUGE_35MM, 15, "0+15"),
+        (GAUGE_35MM, 1973, "123+05"),
+        (GAUGE_35MM_3PERF, 21, "0+21"),
+        (GAUGE_35MM_3PERF, 22, "1+00"),
+        (GAUGE_35MM_3PERF, 64, "3+00"),
+        (GAUGE_35MM_3PERF, 1440, "67+10"),
+        (GAUGE_16MM, 39, "0+39"),
+        (GAUGE_16MM, 1000, "25+00"),
+        (GAUGE_65MM, 64, "5+00"),
+    ],
+)
+def test_format_and_parse(gauge, frame_number, footage):
+    """The feet and frames of the frame numbers."""
+    assert format_footage(frame_number, gauge) == footage
+    assert parse_footage(footage, gauge) == frame_number
+
+
+@pytest.mark.parametrize(
+    "gauge, footage",
+    [
+        (GAUGE_35MM, "1+16"),
+        (GAUGE_35MM_3PERF, "1+21"),
+        (GAUGE_35MM, "-1+00"),
+        (GAUGE_35MM, "12"),
+        (GAUGE_35MM, "12+"),
+        (GAUGE_35MM, "a+01"),
+    ],
+)
+def test_invalid_footage(gauge, footage):
+    """The frames should be in the foot."""
+    with pytest.raises(ValueError) as cm:
+        parse_footage(footage, gauge)
+    assert str(cm.value) == f"Invalid footage: {footage!r}"
+
+    with pytest.raises(ValueError) as cm:
+        parse_footages(["0+00", footage], gauge)
+    assert str(cm.value) == f"Invalid footage: {footage!r}"
+
+
+@pytest.mark.parametrize("gauge", GAUGES)
+def test_bulk_round_trip(gauge):
+    """The bulk conversions match the single ones."""
+    frames = range(1, 2000)
+    footages = format_footages(frames, gauge)
+    assert footages == [format_footage(f - 1, gauge) for f in frames]
+    assert parse_footages(footages, gauge) == array("q", frames)
+
+
+def test_bulk_start():
+    """The frame count of "0+00"."""
+    start = Timecode("24", "01:00:00:00")
+    frames = [start.frames, start.frames + 16, start.frames + 17]
+    assert format_footages(frames, start=start) == ["0+00", "1+00", "1+01"]
+    assert parse_footages(["0+00", "1+00", "1+1"], start=start) == array("q", frames)
+    assert format_footages([]) == []
+
+    with pytest.raises(ValueError) as cm:
+        format_footages([start.frames - 1], start=start)
+    assert str(cm.value) == "frame_number should be a non-negative integer, not -1"
+
+
+def test_footage():
+    """The Footage value type."""
+    footage = Footage("123+05")
+    assert footage.frame_number == 1973
+    assert (footage.feet, footage.frs) == (123, 5)
+    assert repr(footage) == "123+05"
+    assert str(Footage(1440, GAUGE_35MM_3PERF)) == "67+10"
+    assert Footage(1440, GAUGE_35MM_3PERF).frs == 10
+
+    with pytest.raises(ValueError) as cm:
+        Footage(-1)
+    assert str(cm.value) == "frame_number should be a non-negative integer, not -1"
+
+
+def test_timecode_conversions():
+    """The exact conversion to and from timecodes."""
+    tc = Timecode("24", "00:01:00:00")
+    assert str(Footage.from_timecode(tc)) == "90+00"
+    assert Footage.from_timecode(tc).to_timecode("24") == tc
+
+    start = Timecode("23.976", "00:59:30:00")
+    footage = Footage.from_timecode(
+        Timecode("23.976", "01:00:00:00"), GAUGE_16MM, start=start
+    )
+    assert str(footage) == "18+00"
+    assert str(footage.to_timecode("23.976", start=start)) == "01:00:00:00"
+
+    tc = Footage("0+00").to_timecode("29.97", start=Timecode("29.97", "00:59:59;29"))
+    assert str(tc) == "00:59:59;29"
+
+
+def test_arithmetic():
+    """The arithmetic works like the Timecode one."""
+    footage = Footage("10+00")
+    assert str(footage + 16) == "11+00"
+    assert str(footage + Footage("0+08")) == "10+08"
+    assert str(footage - 1) == "9+15"
+    assert str(Footage("1+00") - Footage("2+00")) == "1+00"
+    assert str(footage * 2) == "20+00"
+    assert str(footage / 3) == "3+05"
+    assert (footage + 1).gauge == GAUGE_35MM
+
+    with pytest.raises(TimecodeError) as cm:
+        footage + 1.5
+    assert str(cm.value) == "Type float not supported for arithmetic."
+
+
+def test_comparisons():
+    """The ordering comparisons work like the Timecode ones."""
+    footage = Footage("10+00")
+    assert footage == Footage(160)
+    assert footage == Footage("10+00")
+    assert footage != Footage(160, GAUGE_16MM)
+    assert footage != 1.5
+    assert footage < "10+01"
+    assert footage <= 160
+    assert footage > Footage("9+15")
+    assert footage >= 161 - 1
+    assert sorted([Footage(3), Footage(1), Footage(2)]) == [
+        Footage(1),
+        Footage(2),
+        Footage(3),
+    ]
+
+    with pytest.raises(TypeError) as cm:
+        _ = footage < 1.5
+    assert str(cm.value) == (
+        "'<' not supported between instances of 'Footage' and 'float'"
+    )
+
+
+def test_hash():
+    """The equal Footage instances have the same hash."""
+    footage = Footage("10+00")
+    assert len({footage, Footage(160), Footage(161)}) == 2
+    # the frame numbers and the footage strings are not equal to a Footage
+    assert footage != 160
+    assert footage != "10+00"
+    assert footage not in {160, "10+00"}
+    assert len({160: "a", footage: "b"}) == 2
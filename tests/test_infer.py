@@ -0,0 +1,201 @@
+#!-*- coding: utf-8 -*-
+import itertools
+
+import pytest
+
+from timecode import Timecode
+from timecode.core import get_rate
+from timecode.infer import (
+    InferredRate,
+    format_rate,
+    infer_from_labels,
+    infer_from_timestamps,
+)
+
+
+def make_labels(framerate, start, count, force_non_drop_frame=False):
+    """Return consecutive labels."""
+    tc = Timecode(framerate, start, force_non_drop_frame=force_non_drop_frame)
+    labels = []
+    for _ in range(count):
+        labels.append(str(tc))
+        tc += 1
+    return labels
+
+
+def make_timestamps(framerate, count, offset=1000.0, resolution=3):
+    """Return the rounded wall clock timestamps of consecutive frames."""
+    rate = get_rate(framerate)
+    return [
+        round(offset + i * rate.denominator / rate.numerator, resolution)
+        for i in range(count)
+    ]
+
+
+@pytest.mark.parametrize(
+    "framerate, force_non_drop_frame, expected",
+    [
+        ("24", False, ("24", False)),
+        ("23.976", False, ("24", False)),
+        ("25", False, ("25", False)),
+        ("29.97", False, ("29.97", True)),
+        ("29.97", True, ("30", False)),
+        ("30", False, ("30", False)),
+        ("50", False, ("50", False)),
+        ("59.94", False, ("59.94", True)),
+        ("59.94", True, ("60", False)),
+        ("60", False, ("60", False)),
+    ],
+)
+def test_infer_from_labels(framerate, force_non_drop_frame, expected):
+    """The nominal rate and the drop frame setting of consecutive labels."""
+    labels = make_labels(framerate, "00:00:40:00", 10000, force_non_drop_frame)
+    inferred = infer_from_labels(labels)
+    assert (inferred.framerate, inferred.drop_frame) == expected
+    assert inferred.confident
+
+
+def test_infer_from_drop_frame_delimiter():
+    """A ";" delimiter is drop frame."""
+    labels = make_labels("29.97", "00:00:10;00", 200)
+    assert infer_from_labels(labels) == InferredRate("29.97", True, True, 100)
+
+
+def test_infer_from_skipped_labels():
+    """Consecutive labels skipping the dropped labels are drop frame."""
+    labels = [
+        label.replace(";", ":") for label in make_labels("29.97", "00:00:50;00", 1000)
+    ]
+    inferred = infer_from_labels(labels)
+    assert inferred == InferredRate("29.97", True, True, 301)
+
+
+def test_infer_from_dropped_labels():
+    """A label which does not exist in drop frame is non drop frame."""
+    labels = make_labels("30", "00:00:50:00", 1000)
+    assert infer_from_labels(labels) == InferredRate("30", False, True, 301)
+
+    # the dropped label outweighs a ";" delimiter
+    labels = make_labels("30", "00:00:59:00", 1000)
+    labels = [label.replace(":", ";") for label in labels]
+    assert infer_from_labels(labels) == InferredRate("30", False, True, 100)
+
+
+def test_infer_stops_early():
+    """The labels are consumed up to the point the result is certain."""
+    labels = iter(make_labels("25", "01:00:00:00", 1000))
+    assert infer_from_labels(labels, min_samples=30) == InferredRate(
+        "25", False, True, 30
+    )
+    assert next(labels) == "01:00:01:05"
+
+
+def test_infer_without_evidence():
+    """A short sample is not confident."""
+    labels = make_labels("29.97", "00:00:10:00", 20, force_non_drop_frame=True)
+    assert infer_from_labels(labels) == InferredRate("24", False, False, 20)
+
+    labels = make_labels("29.97", "00:00:10:00", 200, force_non_drop_frame=True)
+    assert infer_from_labels(labels) == InferredRate("30", False, False, 200)
+
+
+def test_infer_skips_fraction_labels():
+    """Labels with fractions of a second are skipped."""
+    labels = ["00:00:00.5", "00:00:01:24", "00:00:02.25"]
+    assert infer_from_labels(labels, min_samples=1) == InferredRate(
+        "25", False, True, 1
+    )
+    with pytest.raises(ValueError) as cm:
+        infer_from_labels(["00:00:00.5"])
+    assert str(cm.value) == (
+        "Can not infer the frame rate without frame numbered labels"
+    )
+
+
+def test_infer_frame_number_too_large():
+    """Frame numbers larger than the nominal rates are an error."""
+    with pytest.raises(ValueError) as cm:
+        infer_from_labels(["00:00:00:150"])
+    assert str(cm.value) == (
+        "Frame number 150 is too large for the nominal rates, the maximum is 119"
+    )
+
+
+@pytest.mark.parametrize(
+    "framerate, expected",
+    [
+        ("23.976", InferredRate("23.976", False, True, 104)),
+        ("24", InferredRate("24", False, True, 100)),
+        ("25", InferredRate("25", False, True, 102)),
+        ("29.97", InferredRate("29.97", True, True, 121)),
+        ("30", InferredRate("30", False, True, 124)),
+        ("50", InferredRate("50", False, True, 202)),
+        ("59.94", InferredRate("59.94", True, True, 241)),
+        ("60", InferredRate("60", False, True, 244)),
+    ],
+)
+def test_infer_from_timestamps(framerate, expected):
+    """The rate of millisecond timestamps."""
+    assert infer_from_timestamps(make_timestamps(framerate, 5000)) == expected
+
+
+def test_infer_from_timestamps_with_gaps():
+    """Gaps, repeated and out of order timestamps are skipped."""
+    timestamps = make_timestamps("29.97", 5000)
+    sample = [*timestamps[:50], timestamps[49], *timestamps[80:150:2]]
+    sample += [timestamps[10], *timestamps[500:]]
+    inferred = infer_from_timestamps(sample)
+    assert inferred.framerate == "29.97"
+    assert inferred.confident
+
+
+def test_infer_from_coarse_timestamps():
+    """Coarse timestamps need a longer sample."""
+    timestamps = make_timestamps("29.97", 5000, resolution=2)
+    inferred = infer_from_timestamps(timestamps, resolution=0.01)
+    assert inferred.framerate == "29.97"
+    assert inferred.samples > 1000
+
+    inferred = infer_from_timestamps(timestamps[:200], resolution=0.01)
+    assert not inferred.confident
+
+
+def test_infer_from_timestamps_stops_early():
+    """The timestamps are consumed up to the point the result is certain."""
+    timestamps = itertools.count(0, 0.04)
+    assert infer_from_timestamps(timestamps, resolution=1e-9) == InferredRate(
+        "25", False, True, 100
+    )
+    assert next(timestamps) == pytest.approx(4.0)
+
+
+def test_infer_from_too_few_timestamps():
+    """At least two distinct timestamps are needed."""
+    with pytest.raises(ValueError) as cm:
+        infer_from_timestamps([1.0, 1.0])
+    assert str(cm.value) == (
+        "Can not infer the frame rate from less than two timestamps"
+    )
+
+
+@pytest.mark.parametrize(
+    "nominal, ntsc, expected",
+    [
+        (24, False, "24"),
+        (24, True, "23.976"),
+        (30, True, "29.97"),
+        (48, True, "47.952"),
+        (60, True, "59.94"),
+        (120, True, "119.88"),
+    ],
+)
+def test_format_rate(nominal, ntsc, expected):
+    """The frame rate strings."""
+    assert format_rate(nominal, ntsc) == expected
+    assert get_rate(expected).ntsc == ntsc
+
+
+def test_rate():
+    """The frame rate descriptor of the result."""
+    assert InferredRate("29.97", False, True, 1).rate == get_rate("29.97", True)
+    assert InferredRate("29.97", True, True, 1).rate == get_rate("29.97")
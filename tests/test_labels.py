@@ -0,0 +1,116 @@
+#!-*- coding: utf-8 -*-
+import io
+
+import pytest
+
+from timecode import Timecode, get_rate
+from timecode.core import FRACTION, frames_to_label
+from timecode.labels import format_labels, iter_labels, write_labels
+
+
+def _reprs(framerate, frames, count, fractional=False, **kwargs):
+    """Return the labels generated with the Timecode.next() and repr() loop."""
+    tc = Timecode(framerate, frames=frames, **kwargs)
+    tc.set_fractional(fractional)
+    labels = []
+    for _ in range(count):
+        labels.append(repr(tc))
+        tc.next()
+    return labels
+
+
+@pytest.mark.parametrize(
+    "framerate,kwargs,start_label",
+    [
+        ["24", {}, "00:59:58:00"],
+        ["23.976", {}, "00:09:58:00"],
+        ["25", {}, "23:59:58:00"],
+        ["29.97", {}, "00:00:58;00"],
+        ["29.97", {}, "00:09:58;00"],
+        ["29.97", {}, "23:59:58;00"],
+        ["29.97", {"force_non_drop_frame": True}, "23:59:58:00"],
+        ["59.94", {}, "00:00:58;00"],
+        ["59.94", {}, "23:59:58;00"],
+        ["119.88", {}, "23:59:58;00"],
+        ["ms", {}, "23:59:59.000"],
+    ],
+)
+def test_iter_labels_matches_repr(framerate, kwargs, start_label):
+    """The labels are equal to repr() over minute, hour and day boundaries."""
+    tc = Timecode(framerate, start_label, **kwargs)
+    count = 4 * tc.rate.int_framerate
+    expected = _reprs(framerate, tc.frames, count, **kwargs)
+    assert list(iter_labels(tc.rate, tc.frames, count)) == expected
+    assert expected[-1].startswith("00:") or expected[0].startswith("00:")
+
+
+@pytest.mark.parametrize("framerate", ["24", "25", "29.97", "60"])
+def test_iter_labels_fraction_style_matches_repr(framerate):
+    """The fraction style labels are equal to repr() of fractional Timecodes."""
+    rate = get_rate(framerate)
+    frames = rate.frames_per_24_hours - 2 * rate.int_framerate
+    count = 4 * rate.int_framerate
+    expected = _reprs(framerate, frames, count, fractional=True)
+    assert list(iter_labels(rate, frames, count, FRACTION)) == expected
+
+
+def test_iter_labels_is_endless_without_count():
+    """The generator is endless if count is skipped."""
+    labels = iter_labels(get_rate("24"))
+    for _ in range(24 * 86400 + 1):
+        label = next(labels)
+    assert label == "00:00:00:00"
+
+
+def test_write_labels():
+    """write_labels() writes newline terminated labels to the sink."""
+    rate = get_rate("29.97")
+    sink = io.StringIO()
+    assert write_labels(sink, rate, 1790, 40) == 40
+    assert sink.getvalue() == "".join(
+        f"{label}\n" for label in _reprs("29.97", 1790, 40)
+    )
+
+
+def test_write_labels_with_custom_newline():
+    """The newline argument is written after each label."""
+    sink = io.StringIO()
+    write_labels(sink, get_rate("24"), 1, 3, newline="\r\n")
+    assert sink.getvalue() == "00:00:00:00\r\n00:00:00:01\r\n00:00:00:02\r\n"
+
+
+def test_write_labels_zero_count():
+    """Nothing is written if count is zero."""
+    sink = io.StringIO()
+    assert write_labels(sink, get_rate("24"), 1, 0) == 0
+    assert sink.getvalue() == ""
+
+
+def test_invalid_style():
+    """An unknown style raises a ValueError."""
+    with pytest.raises(ValueError) as cm:
+        list(iter_labels(get_rate("24"), 1, 2, "bogus"))
+    assert str(cm.value) == "style should be one of 'smpte' or 'fraction', not 'bogus'"
+
+
+def test_timecode_rate_property():
+    """Timecode.rate reflects the current framerate and drop_frame values."""
+    tc = Timecode("29.97", force_non_drop_frame=True)
+    assert tc.rate is get_rate("29.97", force_non_drop_frame=True)
+    tc.drop_frame = True
+    assert tc.rate is get_rate("29.97")
+
+
+@pytest.mark.parametrize(
+    "framerate", ["23.976", "24", "25", "29.97", "59.94", "100", "120", "ms"]
+)
+def test_format_labels_matches_frames_to_label(framerate):
+    """format_labels() matches frames_to_label() for any frame counts."""
+    rate = get_rate(framerate)
+    day = rate.frames_per_24_hours
+    frames = [
+        *range(-100, 5000),
+        *range(day - 5000, day + 100),
+        *range(1, 50 * day, 9973),
+    ]
+    assert format_labels(rate, frames) == [frames_to_label(rate, f) for f in frames]
@@ -0,0 +1,135 @@
+#!-*- coding: utf-8 -*-
+import calendar
+from array import array
+
+import pytest
+
+from timecode import Timecode
+from timecode.core import frames_to_label, get_rate
+from timecode.ptp import (
+    NANOSECONDS,
+    RTP_CLOCK_RATE,
+    TAI_UTC_OFFSET,
+    ptp_to_frames,
+    ptp_to_timecode,
+    read_timestamps,
+    rtp_to_frames,
+    unwrap_rtp,
+)
+
+
+def ptp_time(*utc):
+    """Return the PTP nanoseconds of the given UTC time."""
+    return (calendar.timegm(utc) + TAI_UTC_OFFSET) * NANOSECONDS
+
+
+NOON = ptp_time(2024, 3, 1, 12, 34, 56)
+MIDNIGHT = ptp_time(2024, 3, 2, 0, 0, 0)
+
+
+def labels(framerate, frames):
+    """Return the labels of the frame counts."""
+    rate = get_rate(framerate)
+    return [frames_to_label(rate, f) for f in frames]
+
+
+@pytest.mark.parametrize("framerate", ["24", "25", "30", "50", "60", "100"])
+def test_integer_rates(framerate):
+    """The timecode of the integer rates is the time of day."""
+    rate = get_rate(framerate)
+    frame = -(-NANOSECONDS // rate.numerator)
+    frames = ptp_to_frames([NOON, NOON + frame, NOON + frame - 1], framerate)
+    start = Timecode(framerate, "12:34:56:00").frames
+    assert list(frames) == [start, start + 1, start]
+
+
+def test_ntsc_rates():
+    """The NTSC labels drift from the time of day since the jam."""
+    frames = ptp_to_frames([NOON, NOON + 40_000_000], "29.97")
+    assert labels("29.97", frames) == ["12:34:55;29", "12:34:56;00"]
+    frames = ptp_to_frames([NOON], "23.976")
+    assert labels("23.976", frames) == ["12:34:10:17"]
+
+
+def test_daily_jam():
+    """The first frame starting at or after the jam time gets its label."""
+    ms = 1_000_000
+    timestamps = [MIDNIGHT - ms, MIDNIGHT + ms, MIDNIGHT + 34 * ms]
+    assert labels("29.97", ptp_to_frames(timestamps, "29.97")) == [
+        "00:00:00;01",
+        "00:00:00;01",
+        "00:00:00;00",
+    ]
+    assert labels("25", ptp_to_frames(timestamps, "25")) == [
+        "23:59:59:24",
+        "00:00:00:00",
+        "00:00:00:00",
+    ]
+
+
+def test_offsets():
+    """The leap seconds, the local time offset and the jam time."""
+    assert str(ptp_to_timecode(NOON, "25", utc_offset=3600)) == "13:34:56:00"
+    assert str(ptp_to_timecode(NOON, "25", utc_offset=-5 * 3600)) == "07:34:56:00"
+    assert str(ptp_to_timecode(NOON, "25", leap_seconds=0)) == "12:35:33:00"
+
+    jammed = ptp_time(2024, 3, 1, 6, 0, 0) + 42_000_000
+    tc = ptp_to_timecode(jammed, "23.976", jam_time=6 * 3600)
+    assert str(tc) == "06:00:00:00"
+    assert str(ptp_to_timecode(jammed, "23.976")) == "05:59:38:10"
+
+
+@pytest.mark.parametrize(
+    "kwargs, message",
+    [
+        ({"jam_time": 86400}, "jam_time should be an integer between 0 and 86399, not 86400"),
+        ({"jam_time": 1.5}, "jam_time should be an integer between 0 and 86399, not 1.5"),
+        ({"jam_time": 60}, "jam_time 60 is a dropped drop frame label"),
+        ({"clock_rate": 0}, "clock_rate should be a positive integer, not 0"),
+    ],
+)  # fmt: skip
+def test_invalid_arguments(kwargs, message):
+    """The jam time and the clock rate are validated."""
+    with pytest.raises(ValueError) as cm:
+        ptp_to_frames([NOON], "29.97", **kwargs)
+    assert str(cm.value) == message
+
+
+def test_unwrap_rtp():
+    """The timestamps are unwrapped to the nearest value."""
+    wrap = 1 << 32
+    timestamps = [wrap - 10, 5, wrap - 3, 20]
+    assert unwrap_rtp(timestamps) == array(
+        "q", [wrap - 10, wrap + 5, wrap - 3, wrap + 20]
+    )
+    assert unwrap_rtp(timestamps, reference=10 * wrap) == array(
+        "q", [10 * wrap - 10, 10 * wrap + 5, 10 * wrap - 3, 10 * wrap + 20]
+    )
+    assert unwrap_rtp([250, 10, 100], bits=8) == array("q", [250, 266, 356])
+    assert unwrap_rtp([]) == array("q")
+
+
+def test_rtp_to_frames():
+    """The RTP timestamps give the frames of their PTP time."""
+    ticks = [(NOON + i * 40_000_000) * RTP_CLOCK_RATE // NANOSECONDS for i in range(50)]
+    rtp = [t % (1 << 32) for t in ticks]
+    # the reference is only needed to within half of the wrap period
+    reference = NOON - 3 * 3600 * NANOSECONDS
+    frames = rtp_to_frames(rtp, "25", reference=reference)
+    assert frames == ptp_to_frames(ticks, "25", clock_rate=RTP_CLOCK_RATE)
+    assert labels("25", frames[:2]) == ["12:34:56:00", "12:34:56:01"]
+
+
+def test_read_timestamps(tmp_path):
+    """Captured timestamps are replayed from text files."""
+    path = tmp_path / "capture.txt"
+    path.write_text(
+        f"# ptp_ns marker\n{NOON} 1\n\n{NOON + 40_000_000}\n",
+        encoding="utf-8",
+    )
+    timestamps = read_timestamps(path)
+    assert timestamps == array("q", [NOON, NOON + 40_000_000])
+    assert labels("25", ptp_to_frames(timestamps, "25")) == [
+        "12:34:56:00",
+        "12:34:56:01",
+    ]
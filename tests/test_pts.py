@@ -0,0 +1,121 @@
+#!-*- coding: utf-8 -*-
+from array import array
+from fractions import Fraction
+
+import pytest
+
+from timecode import Timecode
+from timecode.pts import (
+    Gap,
+    SnappedFrames,
+    find_gaps,
+    parse_time_base,
+    pts_to_frames,
+    pts_to_labels,
+    pts_to_timecode,
+)
+
+
+@pytest.mark.parametrize(
+    "time_base, expected",
+    [
+        ("1/90000", Fraction(1, 90000)),
+        ("1001/60000", Fraction(1001, 60000)),
+        ((1, 1000), Fraction(1, 1000)),
+        (Fraction(1, 48000), Fraction(1, 48000)),
+    ],
+)
+def test_parse_time_base(time_base, expected):
+    """The time base formats."""
+    assert parse_time_base(time_base) == expected
+
+
+@pytest.mark.parametrize("time_base", ["1/0", "0/1", "-1/90000", "ticks", None])
+def test_invalid_time_base(time_base):
+    """The time base is a positive ratio."""
+    with pytest.raises(ValueError) as cm:
+        parse_time_base(time_base)
+    assert str(cm.value) == f"Invalid time base: {time_base!r}"
+
+
+def test_pts_to_frames():
+    """The timestamps are snapped to the nearest frame."""
+    pts = [0, 3003, 6006, 9000, 12500, 13514]
+    assert pts_to_frames(pts, "1/90000", "29.97") == SnappedFrames(
+        array("q", [1, 2, 3, 4, 5, 6]),
+        array("d", [0.0, 0.0, 0.0, -9 / 3003, 488 / 3003, -1501 / 3003]),
+    )
+
+
+def test_pts_to_frames_start():
+    """The frame counts start at the start frame and timestamp."""
+    start = Timecode("29.97", "01:00:00;00")
+    pts = [1000 + i * 1001 for i in range(10)]
+    frames, errors = pts_to_frames(pts, "1/30000", "29.97", start=start)
+    assert list(frames) == list(range(start.frames, start.frames + 10))
+    assert set(errors) == {0.0}
+
+    frames, _ = pts_to_frames(pts, "1/30000", "29.97", start=5, start_pts=0)
+    assert frames[0] == 6
+
+
+def test_pts_to_frames_decoding_order():
+    """The timestamps do not need to be in order."""
+    pts = [0, 3, 1, 2, 6, 4, 5]
+    frames, _ = pts_to_frames(pts, (1001, 60000), "59.94")
+    assert list(frames) == [1, 4, 2, 3, 7, 5, 6]
+
+
+def test_pts_to_frames_no_drift():
+    """NTSC timestamps do not drift over 24 hours."""
+    start = Timecode("29.97", "00:00:00;00")
+    last = start.rate.frames_per_24_hours - 1
+    frames, errors = pts_to_frames([0, last * 3003], "1/90000", "29.97")
+    assert list(frames) == [1, last + 1]
+    assert list(errors) == [0.0, 0.0]
+
+    # Timecode(start_seconds=...) truncates with the integer rate
+    seconds = last * 3003 / 90000
+    assert Timecode("29.97", start_seconds=seconds).frames != last + 1
+
+
+def test_pts_to_frames_empty():
+    """An empty column."""
+    assert pts_to_frames([], "1/90000", "25") == SnappedFrames(array("q"), array("d"))
+
+
+def test_pts_to_labels():
+    """The labels of the timestamps."""
+    start = Timecode("29.97", "00:59:59;28")
+    pts = [i * 3003 for i in range(4)]
+    assert pts_to_labels(pts, "1/90000", "29.97", start=start) == [
+        "00:59:59;28",
+        "00:59:59;29",
+        "01:00:00;00",
+        "01:00:00;01",
+    ]
+    assert pts_to_labels(
+        pts, "1/90000", "29.97", start=start.frames, force_non_drop_frame=True
+    ) == ["00:59:56:10", "00:59:56:11", "00:59:56:12", "00:59:56:13"]
+
+
+def test_pts_to_timecode():
+    """A single timestamp."""
+    tc, error = pts_to_timecode(3600 * 90000, "1/90000", "29.97")
+    assert str(tc) == "01:00:00;00"
+    assert error == pytest.approx(0.1079, abs=1e-4)
+
+    tc, error = pts_to_timecode(
+        3600 * 90000, "1/90000", "25", start=Timecode("25", "10:00:00:00")
+    )
+    assert str(tc) == "11:00:00:00"
+    assert error == 0.0
+
+
+def test_find_gaps():
+    """The missing frames between the timestamps."""
+    frames = [10, 11, 12, 12, 15, 13, 20]
+    assert find_gaps(frames) == [Gap(5, 14, 1), Gap(4, 16, 4)]
+    assert find_gaps([5, 1, 3]) == [Gap(1, 2, 1), Gap(2, 4, 1)]
+    assert find_gaps([]) == []
+    assert find_gaps([1, 2, 3]) == []
@@ -0,0 +1,130 @@
+#!-*- coding: utf-8 -*-
+from array import array
+
+import pytest
+
+from timecode import Timecode
+from timecode.core import get_rate
+from timecode.rational import (
+    frame_number_to_rational,
+    frame_numbers_to_rationals,
+    rational_to_frame_number,
+    rational_to_timecode,
+    rationals_to_frame_numbers,
+    split_rational,
+    timecode_to_rational,
+)
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("0s", (0, 1)),
+        ("3600s", (3600, 1)),
+        ("1001/30000s", (1001, 30000)),
+        ("-1001/24000s", (-1001, 24000)),
+    ],
+)
+def test_split_rational(value, expected):
+    """Rational times are split to the numerator and the denominator."""
+    assert split_rational(value) == expected
+
+
+@pytest.mark.parametrize("value", ["", "3600", "1001/30000", "a/30000s", "1/s"])
+def test_split_rational_raises_for_invalid_values(value):
+    """An error is raised for invalid rational times."""
+    with pytest.raises(ValueError) as cm:
+        split_rational(value)
+    assert str(cm.value) == f"Invalid rational time: {value!r}"
+
+
+@pytest.mark.parametrize(
+    "framerate, value, expected",
+    [
+        ("29.97", "0s", 0),
+        ("29.97", "1001/30000s", 1),
+        ("29.97", "3003/30000s", 3),
+        ("29.97", "1001/15000s", 2),
+        ("29.97", "3603600/1000s", 108000),
+        ("23.976", "1001/24000s", 1),
+        ("25", "3600s", 90000),
+        ("25", "1/25s", 1),
+        ("25", "100/2500s", 1),
+        ("59.94", "1001/60000s", 1),
+        ("24", "1s", 24),
+        ("ms", "1/1000s", 1),
+    ],
+)
+def test_rational_to_frame_number(framerate, value, expected):
+    """Rational times are converted to frame numbers."""
+    rate = get_rate(framerate)
+    assert rational_to_frame_number(rate, value) == expected
+    assert rationals_to_frame_numbers([value], framerate) == array("q", [expected])
+
+
+@pytest.mark.parametrize(
+    "framerate, value",
+    [("29.97", "1/30s"), ("25", "1/24s"), ("24", "1001/24000s"), ("30", "1/60s")],
+)
+def test_off_grid_values_raise(framerate, value):
+    """Values which are not on the frame grid raise an error."""
+    rate = get_rate(framerate)
+    with pytest.raises(ValueError) as cm:
+        rational_to_frame_number(rate, value)
+    assert str(cm.value) == f"{value!r} is not on the frame grid of {framerate} fps"
+
+    with pytest.raises(ValueError) as cm:
+        rationals_to_frame_numbers(["0s", value], framerate)
+    assert str(cm.value) == f"{value!r} is not on the frame grid of {framerate} fps"
+
+
+@pytest.mark.parametrize("value", ["3600", "1001/30000", "x/30000s", "1/0s", "1/-2s"])
+def test_rationals_to_frame_numbers_raises_for_invalid_values(value):
+    """An error is raised for invalid rational times in bulk."""
+    with pytest.raises(ValueError) as cm:
+        rationals_to_frame_numbers([value], "29.97")
+    assert str(cm.value) == f"Invalid rational time: {value!r}"
+
+
+@pytest.mark.parametrize(
+    "framerate, frame_number, expected",
+    [
+        ("29.97", 0, "0s"),
+        ("29.97", 1, "1001/30000s"),
+        ("29.97", 30, "30030/30000s"),
+        ("29.97", 30000, "1001s"),
+        ("23.976", 2, "2002/24000s"),
+        ("25", 90000, "3600s"),
+        ("25", 13, "13/25s"),
+        ("24", 12, "12/24s"),
+    ],
+)
+def test_frame_number_to_rational(framerate, frame_number, expected):
+    """Frame numbers are converted to rational times in the rate time base."""
+    assert frame_number_to_rational(get_rate(framerate), frame_number) == expected
+    assert frame_numbers_to_rationals([frame_number], framerate) == [expected]
+
+
+@pytest.mark.parametrize("framerate", ["23.976", "24", "25", "29.97", "59.94", "ms"])
+def test_bulk_round_trip(framerate):
+    """Frame numbers survive a round trip through rational times."""
+    frame_numbers = array("q", range(0, 200000, 7))
+    values = frame_numbers_to_rationals(frame_numbers, framerate)
+    assert rationals_to_frame_numbers(values, framerate) == frame_numbers
+
+
+def test_rational_to_timecode():
+    """Rational time offsets are converted to Timecode instances."""
+    tc = rational_to_timecode("3603600/1000s", "29.97")
+    assert repr(tc) == "01:00:03;18"
+    assert tc.drop_frame is True
+    assert timecode_to_rational(tc) == "108108000/30000s"
+
+    tc = rational_to_timecode("3603600/1000s", "29.97", force_non_drop_frame=True)
+    assert repr(tc) == "01:00:00:00"
+    assert timecode_to_rational(Timecode("25", "01:00:00:00")) == "3600s"
+
+    assert timecode_to_rational(Timecode("25", "00:00:00:00")) == "0s"
+    assert timecode_to_rational(Timecode("24000/1001", "00:00:01:00")) == (
+        "24024/24000s"
+    )
@@ -0,0 +1,87 @@
+#!-*- coding: utf-8 -*-
+import threading
+import time
+
+import pytest
+
+from timecode import Timecode
+from timecode.scan import follow_labels, scan_labels
+
+LOG = (
+    b"2024-01-01 playout start 01:00:00;00 clip A\n"
+    b"cue 01:00:10;02 -> 01:00:20:15 ok\n"
+    b"ignored 99:00:00:00 1:00:00:00 01:00:00:00:00 01:00:00:45\n"
+    b"fraction 00:00:01.50\n"
+)
+
+
+def test_scan_labels_bytes():
+    """Labels are found with their offsets and converted to frames."""
+    result = list(scan_labels(LOG, "29.97"))
+    assert [offset for offset, _ in result] == [
+        LOG.index(b"01:00:00;00"),
+        LOG.index(b"01:00:10;02"),
+        LOG.index(b"01:00:20:15"),
+        LOG.index(b"00:00:01.50"),
+    ]
+    assert [frames for _, frames in result] == [
+        Timecode("29.97", "01:00:00;00").frames,
+        Timecode("29.97", "01:00:10;02").frames,
+        Timecode("29.97", "01:00:20;15").frames,
+        Timecode("29.97", "00:00:01.50").frames,
+    ]
+
+
+@pytest.mark.parametrize("framerate", ["24", "25", "29.97", "59.94", "30"])
+def test_scan_labels_matches_timecode(framerate, tmp_path):
+    """The fast path gives the same frame counts with the Timecode class."""
+    labels = [repr(Timecode(framerate, frames=f)) for f in range(1, 200000, 97)]
+    path = tmp_path / "log.txt"
+    path.write_bytes("".join(f"frame {label} ok\n" for label in labels).encode())
+    result = list(scan_labels(path, framerate))
+    assert [frames for _, frames in result] == [
+        Timecode(framerate, label).frames for label in labels
+    ]
+
+
+def test_scan_labels_force_non_drop_frame():
+    """Drop frame rates can use the non drop frame calculation."""
+    ((_, frames),) = scan_labels(b"01:00:00:00", "29.97", force_non_drop_frame=True)
+    assert frames == 108001
+
+
+def test_scan_labels_start_and_end():
+    """The scanned range can be limited."""
+    start = LOG.index(b"cue")
+    end = LOG.index(b" -> ")
+    assert [offset for offset, _ in scan_labels(LOG, "29.97", start=start)][0] == (
+        start + 4
+    )
+    assert len(list(scan_labels(LOG, "29.97", start=start, end=end))) == 1
+
+
+def test_scan_labels_empty_file(tmp_path):
+    """Empty files yield nothing."""
+    path = tmp_path / "empty.log"
+    path.write_bytes(b"")
+    assert list(scan_labels(path, "25")) == []
+
+
+def test_follow_labels(tmp_path):
+    """Growing files are scanned line by line as they are written."""
+    path = tmp_path / "growing.log"
+    path.write_bytes(b"00:00:00:01 a\n00:00:00:02")
+
+    def append():
+        time.sleep(0.1)
+        with open(path, "ab") as f:
+            f.write(b" b\n00:00:00:03 c\n")
+
+    thread = threading.Thread(target=append)
+    thread.start()
+    result = list(follow_labels(path, "25", poll_interval=0.02, idle_timeout=0.5))
+    thread.join()
+    assert result == [(0, 2), (14, 3), (28, 4)]
+
+    # resume from the last offset
+    assert list(follow_labels(path, "25", offset=15, idle_timeout=0)) == [(28, 4)]
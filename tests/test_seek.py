@@ -0,0 +1,171 @@
+#!-*- coding: utf-8 -*-
+import struct
+
+import pytest
+
+from timecode import Timecode
+from timecode.seek import (
+    HEADER,
+    ByteRange,
+    SeekIndex,
+    SeekIndexBuilder,
+    read_quicktime_samples,
+)
+from timecode.sets import TimecodeSet
+
+
+def atom(kind, *children):
+    """A QuickTime atom."""
+    payload = b"".join(children)
+    return struct.pack(">I4s", 8 + len(payload), kind) + payload
+
+
+def track(handler, sizes, chunks, samples_per_chunk, co64=False):
+    """A QuickTime track with a sample table."""
+    hdlr = atom(b"hdlr", struct.pack(">II4s", 0, 0, handler), b"\x00" * 12)
+    stsz = atom(b"stsz", struct.pack(f">III{len(sizes)}I", 0, 0, len(sizes), *sizes))
+    stsc = atom(b"stsc", struct.pack(">IIIII", 0, 1, 1, samples_per_chunk, 1))
+    if co64:
+        chunk_atom = atom(
+            b"co64", struct.pack(f">II{len(chunks)}Q", 0, len(chunks), *chunks)
+        )
+    else:
+        chunk_atom = atom(
+            b"stco", struct.pack(f">II{len(chunks)}I", 0, len(chunks), *chunks)
+        )
+    stbl = atom(b"stbl", stsz, stsc, chunk_atom)
+    return atom(b"trak", atom(b"mdia", hdlr, atom(b"minf", stbl)))
+
+
+@pytest.fixture
+def movie(tmp_path):
+    """A QuickTime file with an audio and a video track after the media data."""
+    path = tmp_path / "A001C003.mov"
+    mdat = atom(b"mdat", b"\x00" * 1000)
+    # two frames per chunk, audio chunks in between
+    video = track(b"vide", [100, 110, 120, 130, 140, 150], [20, 300, 600], 2)
+    audio = track(b"soun", [50, 50], [250, 550], 1)
+    path.write_bytes(atom(b"ftyp", b"qt  ") + mdat + atom(b"moov", audio, video))
+    return path
+
+
+def test_read_quicktime_samples(movie, tmp_path):
+    """The offsets and the sizes of the frames of the video track."""
+    offsets, sizes = read_quicktime_samples(movie)
+    assert list(offsets) == [20, 120, 300, 420, 600, 740]
+    assert list(sizes) == [100, 110, 120, 130, 140, 150]
+
+    path = tmp_path / "large.mov"
+    video = track(b"vide", [10, 10], [1 << 33, (1 << 33) + 10], 1, co64=True)
+    path.write_bytes(atom(b"moov", video))
+    offsets, _ = read_quicktime_samples(path)
+    assert list(offsets) == [1 << 33, (1 << 33) + 10]
+
+
+@pytest.mark.parametrize(
+    "content, message",
+    [
+        (atom(b"mdat", b"\x00" * 10), "Not a QuickTime file, no moov atom"),
+        (
+            atom(b"moov", track(b"soun", [1], [0], 1)),
+            "No video track in the QuickTime file",
+        ),
+        (
+            atom(b"moov", track(b"vide", [1, 2, 3], [0], 1)),
+            "Invalid QuickTime sample table",
+        ),
+    ],
+)
+def test_read_quicktime_samples_invalid(tmp_path, content, message):
+    """The files without a complete video track."""
+    path = tmp_path / "invalid.mov"
+    path.write_bytes(content)
+    with pytest.raises(ValueError) as cm:
+        read_quicktime_samples(path)
+    assert str(cm.value) == message
+
+
+def test_quicktime_index(movie, tmp_path):
+    """The timecodes of the frames are mapped to byte ranges."""
+    builder = SeekIndexBuilder.from_quicktime(movie, "23.976", start="10:00:00:00")
+    path = tmp_path / "A001C003.tcseek"
+    builder.save(path)
+    assert path.stat().st_size == HEADER.size + 6 * 12
+
+    with SeekIndex.load(path) as index:
+        assert len(index) == 6
+        assert str(index.start) == "10:00:00:00"
+        assert not index.rate.drop_frame
+        assert index.locate(Timecode("23.976", "10:00:00:02")) == ByteRange(300, 120)
+        assert index.locate(index.start_frames + 4) == ByteRange(600, 140)
+        # the audio in between
+        byte_range = index.span(
+            Timecode("23.976", "10:00:00:01"), Timecode("23.976", "10:00:00:03")
+        )
+        assert byte_range == ByteRange(120, 430)
+        assert byte_range.end == 550
+
+        with pytest.raises(ValueError) as cm:
+            index.locate(Timecode("23.976", "10:00:00:06"))
+        assert str(cm.value) == "Timecode 10:00:00:06 is not in the seek index"
+        with pytest.raises(ValueError) as cm:
+            index.locate(Timecode("23.976", "09:59:59:23"))
+        assert str(cm.value) == "Timecode 09:59:59:23 is not in the seek index"
+        with pytest.raises(ValueError) as cm:
+            index.span(index.start + 3, index.start + 1)
+        assert str(cm.value) == (
+            "The end of a span should not be before its start, not "
+            "10:00:00:03-10:00:00:01"
+        )
+
+
+def test_frame_dump():
+    """A headerless dump of frames of the same size, across midnight."""
+    start = Timecode("29.97", "23:59:59;28")
+    index = SeekIndexBuilder.from_frame_size(
+        "29.97", 1000, 10, start=start, offset=64
+    ).build()
+    assert index.rate.drop_frame
+    assert index.locate(Timecode("29.97", "00:00:00;01")) == ByteRange(3064, 1000)
+    assert index.span(start, Timecode("29.97", "00:00:00;00")) == ByteRange(64, 3000)
+    tc_set = TimecodeSet("29.97", [(start.frames, start.frames), (1, 2)])
+    assert index.spans(tc_set) == [ByteRange(2064, 2000), ByteRange(64, 1000)]
+
+
+def test_add():
+    """The frames are recorded in file order."""
+    builder = SeekIndexBuilder("25", start=Timecode("25", "01:00:00:00"))
+    builder.add(0, 10)
+    builder.add_many([10, 30], [20, 5])
+    index = builder.build()
+    assert index.span(index.start, index.start + 2) == ByteRange(0, 35)
+
+    with pytest.raises(ValueError) as cm:
+        builder.add(34, 1)
+    assert str(cm.value) == (
+        "The frames of a seek index should be in file order, "
+        "the frame at 34 starts before 35"
+    )
+
+
+@pytest.mark.parametrize(
+    "content, message",
+    [
+        (b"TCSK", "Not a timecode seek index"),
+        (
+            HEADER.pack(b"TCSK", 2, 0, 24, 1, 1, 0),
+            "Unsupported seek index version: 2, expected 1",
+        ),
+        (
+            HEADER.pack(b"TCSK", 1, 0, 24, 1, 1, 2) + b"\x00" * 20,
+            "Truncated seek index of 2 frames, 52 bytes",
+        ),
+    ],
+)
+def test_load_invalid(tmp_path, content, message):
+    """The header and the size are checked."""
+    path = tmp_path / "index.tcseek"
+    path.write_bytes(content)
+    with pytest.raises(ValueError) as cm:
+        SeekIndex.load(path)
+    assert str(cm.value) == message
@@ -0,0 +1,127 @@
+#!-*- coding: utf-8 -*-
+import json
+import os
+import re
+
+import pytest
+
+from timecode import Timecode
+from timecode.sequences import ImageSequence, SequenceIndex
+from timecode.sets import Run, TimecodeSet
+
+
+@pytest.fixture
+def renders(tmp_path):
+    """A directory tree of image sequences."""
+    shot = tmp_path / "sh010"
+    plates = shot / "plates"
+    plates.mkdir(parents=True)
+    for frame in [1001, 1002, 1003, 1007, 1008]:
+        (shot / f"sh010.{frame}.exr").touch()
+    for frame in [99, 100, 101]:
+        (plates / f"plate_v002.{frame:04d}.dpx").touch()
+    (plates / "plate_v002.5.jpg").touch()
+    (shot / "notes.txt").touch()
+    return tmp_path
+
+
+def test_scan(renders):
+    """The files are grouped into sequences of runs."""
+    index = SequenceIndex.scan(renders, "24", start=Timecode("24", "01:00:00:00"))
+    assert len(index) == 3
+    shot = index.get(renders / "sh010", "sh010.", ".exr")
+    assert (shot.first, shot.last, len(shot)) == (1001, 1008, 5)
+    assert shot.padding == 4
+    assert shot.pattern == os.path.join(renders, "sh010", "sh010.####.exr")
+    assert list(shot.missing()) == [Run(1004, 1006)]
+    assert 1003 in shot
+    assert 1004 not in shot
+    assert repr(shot) == f"<ImageSequence {shot.pattern} 1001-1003,1007-1008>"
+
+    plate = index.get(renders / "sh010" / "plates", "plate_v002.", ".dpx")
+    assert (plate.first, plate.last, plate.padding) == (99, 101, 4)
+    jpg = index.get(renders / "sh010" / "plates", "plate_v002.", ".jpg")
+    assert (len(jpg), jpg.padding) == (1, 1)
+
+
+def test_not_recursive(renders):
+    """Only the files of the root directory."""
+    index = SequenceIndex.scan(renders / "sh010", "24", recursive=False)
+    assert [s.prefix for s in index] == ["sh010."]
+
+
+def test_timecodes(renders):
+    """The frame numbers are mapped to the timecodes through the start."""
+    index = SequenceIndex.scan(renders, "24", start=Timecode("24", "01:00:00:00"))
+    shot = index.get(renders / "sh010", "sh010.", ".exr")
+    assert str(shot.timecode(1001)) == "01:00:00:00"
+    assert str(shot.timecode(1007)) == "01:00:00:06"
+    assert shot.frame_number(Timecode("24", "01:00:00:02")) == 1003
+    assert shot.timecode_to_path(Timecode("24", "01:00:00:06")) == os.path.join(
+        renders, "sh010", "sh010.1007.exr"
+    )
+    assert shot.timecode_to_path(Timecode("24", "01:00:00:04")) is None
+
+    path = os.path.join(renders, "sh010", "plates", "plate_v002.0100.dpx")
+    assert str(index.path_to_timecode(path)) == "01:00:00:01"
+    assert (
+        index.path_to_timecode(os.path.join(renders, "sh010", "sh010.1004.exr")) is None
+    )
+    assert index.path_to_timecode(os.path.join(renders, "sh010", "notes.txt")) is None
+    assert index.find(os.path.join(renders, "sh010", "sh010.1008.exr")) == (shot, 1008)
+
+
+def test_start_frame(renders):
+    """The start timecode of a given frame number."""
+    index = SequenceIndex.scan(
+        renders / "sh010", "25", start="10:00:00:00", start_frame=1000, recursive=False
+    )
+    (shot,) = index
+    assert str(shot.timecode(1001)) == "10:00:00:01"
+
+
+def test_pattern(tmp_path):
+    """A custom compiled pattern."""
+    for frame in range(1, 4):
+        (tmp_path / f"frame_{frame}_left.png").touch()
+    pattern = re.compile(r"(?P<prefix>frame_)(?P<frame>\d+)(?P<suffix>_left\.png)")
+    index = SequenceIndex.scan(tmp_path, "24", pattern=pattern)
+    (sequence,) = index
+    assert (sequence.first, sequence.last) == (1, 3)
+    assert sequence.path(2) == os.path.join(tmp_path, "frame_2_left.png")
+
+
+def test_save_and_load(renders, tmp_path):
+    """The index is persisted as the runs."""
+    index = SequenceIndex.scan(
+        renders, "29.97", start="01:00:00:00", force_non_drop_frame=True
+    )
+    path = tmp_path / "index.json"
+    index.save(path)
+    loaded = SequenceIndex.load(path)
+    assert [repr(s) for s in loaded] == [repr(s) for s in index]
+    for original, copy in zip(index, loaded):
+        assert copy.rate == original.rate
+        assert copy.offset == original.offset
+        assert copy.frames == original.frames
+    shot = loaded.get(renders / "sh010", "sh010.", ".exr")
+    assert not shot.rate.drop_frame
+    assert str(shot.timecode(1001)) == "01:00:00:00"
+
+
+def test_load_invalid(tmp_path):
+    """The version of the saved index is checked."""
+    path = tmp_path / "index.json"
+    path.write_text(json.dumps({"version": 99}), encoding="utf-8")
+    with pytest.raises(ValueError) as cm:
+        SequenceIndex.load(path)
+    assert str(cm.value) == "Unsupported sequence index version: 99, expected 1"
+
+
+def test_empty_sequence():
+    """A sequence without frames has no first and last frame numbers."""
+    sequence = ImageSequence(
+        "renders", "shot.", ".exr", 4, frames=TimecodeSet("24"), offset=0
+    )
+    assert (sequence.first, sequence.last, len(sequence)) == (None, None, 0)
+    assert list(sequence.missing()) == []
@@ -0,0 +1,102 @@
+#!-*- coding: utf-8 -*-
+import pytest
+
+from timecode import Timecode
+from timecode.serialize import RUN_HEADER, decode_timecodes, encode_timecodes
+from timecode.timecode import _serial_attributes
+
+
+def test_round_trip():
+    """The runs of frame rates and flags are kept in order."""
+    fractional = Timecode("24", frames=36)
+    fractional.set_fractional(True)
+    timecodes = [
+        Timecode("29.97", frames=1),
+        Timecode("29.97", frames=500),
+        Timecode("29.97", frames=2, force_non_drop_frame=True),
+        Timecode("24", frames=3),
+        fractional,
+        Timecode("24", frames=4),
+        Timecode("12.5", frames=5),
+        Timecode("29.97", frames=6),
+    ]
+    data = encode_timecodes(timecodes)
+    assert len(data) == 7 * RUN_HEADER.size + len("12.5") + 8 * len(timecodes)
+    decoded = decode_timecodes(data)
+    assert [tc.__dict__ for tc in decoded] == [tc.__dict__ for tc in timecodes]
+    assert [str(tc) for tc in decoded] == [str(tc) for tc in timecodes]
+
+
+def test_bulk():
+    """The timecodes of a frame rate are a single run."""
+    timecodes = [Timecode("25", frames=i) for i in range(1, 1001)]
+    data = encode_timecodes(iter(timecodes))
+    assert len(data) == RUN_HEADER.size + 8000
+    decoded = decode_timecodes(data)
+    assert [tc.frames for tc in decoded] == list(range(1, 1001))
+    decoded[0].frames = 10
+    assert decoded[1].frames == 2
+    assert encode_timecodes([]) == b""
+    assert decode_timecodes(b"") == []
+
+
+@pytest.mark.parametrize(
+    "data, message",
+    [
+        (b"\x02\x00\x00", "Truncated encoded timecodes at byte 0"),
+        (
+            RUN_HEADER.pack(2, 0, 0, 2) + bytes(8),
+            "Truncated encoded timecodes at byte 8",
+        ),
+        (
+            RUN_HEADER.pack(2, 0, 0, 1) + bytes(8),
+            "Timecode.frames should be a positive integer bigger than zero, not 0",
+        ),
+        (RUN_HEADER.pack(300, 0, 0, 0), "Unknown frame rate id: 300"),
+        (
+            RUN_HEADER.pack(3, 1, 0, 1) + bytes([1]) + bytes(7),
+            "The frame rate 25 can not be drop frame",
+        ),
+        (
+            RUN_HEADER.pack(4, 16, 0, 1) + bytes([1]) + bytes(7),
+            "Unknown serialized timecode flags: 0x10",
+        ),
+    ],
+)
+def test_decode_invalid(data, message):
+    """The runs are checked."""
+    with pytest.raises(ValueError) as cm:
+        decode_timecodes(data)
+    assert str(cm.value) == message
+
+
+def test_shared_attributes_cache():
+    """The attributes of the frame rates are cached read only and bounded."""
+    attributes = _serial_attributes(2, 0)
+    with pytest.raises(TypeError):
+        attributes["_framerate"] = "25"
+    assert _serial_attributes.cache_info().maxsize is not None
+    for i in range(_serial_attributes.cache_info().maxsize + 10):
+        _serial_attributes(f"{i + 1}", 0)
+    cache_info = _serial_attributes.cache_info()
+    assert cache_info.currsize <= cache_info.maxsize
+    (tc,) = decode_timecodes(encode_timecodes([Timecode("24", frames=2)]))
+    assert tc.framerate == "24"
+
+
+def test_encode_invalid():
+    """The frame counts and the frame rate texts should fit in the format."""
+    with pytest.raises(ValueError) as cm:
+        encode_timecodes([Timecode("24", frames=1), Timecode("24", frames=2**64)])
+    assert str(cm.value) == (
+        f"Timecode.frames should be smaller than 2**64 to be serialized, not {2**64}"
+    )
+
+    framerate = "0" * 300 + "24"
+    with pytest.raises(ValueError) as cm:
+        encode_timecodes([Timecode(framerate, frames=1)])
+    assert str(cm.value) == (
+        "The frame rate text should be at most 255 bytes to be encoded, not 302"
+    )
+    tc = Timecode.from_bytes(Timecode(framerate, frames=5).to_bytes())
+    assert (tc.framerate, tc.frames) == (framerate, 5)
@@ -0,0 +1,153 @@
+#!-*- coding: utf-8 -*-
+import random
+from operator import and_, or_, sub, xor
+
+import pytest
+
+from timecode import Timecode
+from timecode.sets import Run, TimecodeSet
+
+
+def test_runs():
+    """Overlapping and adjacent runs are merged."""
+    tc_set = TimecodeSet("24", [(20, 30), (1, 5), (6, 8), (25, 40), (50, 50)])
+    assert list(tc_set.runs()) == [Run(1, 8), Run(20, 40), Run(50, 50)]
+    assert tc_set.run_count == 3
+    assert len(tc_set) == 30
+    assert Run(20, 40).count == 21
+
+    with pytest.raises(ValueError) as cm:
+        TimecodeSet("24", [(5, 4)])
+    assert str(cm.value) == (
+        "The last frame of a run should not be before the first one, not 5-4"
+    )
+
+
+def test_from_frames():
+    """The frames are sorted and repeats are ignored."""
+    tc_set = TimecodeSet.from_frames("25", [5, 3, 4, 4, 10, 1])
+    assert list(tc_set.runs()) == [Run(1, 1), Run(3, 5), Run(10, 10)]
+    assert list(tc_set) == [1, 3, 4, 5, 10]
+    assert not TimecodeSet.from_frames("25", [])
+
+
+def test_membership():
+    """The frame counts and the timecodes are members."""
+    tc_set = TimecodeSet.parse("24", "01:00:00:00-01:00:10:23")
+    assert Timecode("24", "01:00:05:00") in tc_set
+    assert Timecode("24", "01:00:11:00") not in tc_set
+    assert Timecode("24", "01:00:10:23").frames in tc_set
+    assert Timecode("24", "00:59:59:23").frames not in tc_set
+
+
+@pytest.mark.parametrize(
+    "framerate, value",
+    [
+        ("24", "01:00:00:00-01:00:10:23,01:00:20:00"),
+        ("29.97", "00:00:59;28-00:01:00;03"),
+        ("25", "00:00:00:00"),
+        ("25", ""),
+    ],
+)
+def test_parse_and_format(framerate, value):
+    """The compact string form."""
+    tc_set = TimecodeSet.parse(framerate, value)
+    assert str(tc_set) == value
+    assert repr(tc_set) == f"TimecodeSet({framerate!r}, {value!r})"
+
+
+def test_parse():
+    """Whitespace, repeated and unordered runs."""
+    tc_set = TimecodeSet.parse(
+        "24", " 01:00:20:00 , 01:00:00:00 - 01:00:10:23, 01:00:05:00-01:00:20:01,"
+    )
+    assert str(tc_set) == "01:00:00:00-01:00:20:01"
+
+    tc_set = TimecodeSet.parse("29.97", "00:00:59;29-00:01:00;02")
+    assert len(tc_set) == 2
+
+
+@pytest.mark.parametrize("value", ["01:00:00:00-xx", "01:00:00:10-01:00:00:00"])
+def test_parse_invalid(value):
+    """The runs should be made of valid labels in order."""
+    with pytest.raises(ValueError) as cm:
+        TimecodeSet.parse("24", value)
+    assert str(cm.value) == f"Invalid run: {value!r}"
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_set_operations(seed):
+    """The set operations match the ones of Python sets."""
+    rng = random.Random(seed)
+    left = {rng.randrange(1, 100) for _ in range(rng.randrange(60))}
+    right = {rng.randrange(1, 100) for _ in range(rng.randrange(60))}
+    left_set = TimecodeSet.from_frames("24", left)
+    right_set = TimecodeSet.from_frames("24", right)
+    for operator in (and_, or_, sub, xor):
+        result = operator(left_set, right_set)
+        assert result == TimecodeSet.from_frames("24", operator(left, right))
+    assert set(left_set.complement(1, 99)) == set(range(1, 100)) - left
+
+
+def test_named_operations():
+    """The named methods and the operators are the same."""
+    a = TimecodeSet("24", [(1, 10)])
+    b = TimecodeSet("24", [(5, 20)])
+    assert a.union(b) == TimecodeSet("24", [(1, 20)])
+    assert a.intersection(b) == TimecodeSet("24", [(5, 10)])
+    assert a.difference(b) == TimecodeSet("24", [(1, 4)])
+    assert a.symmetric_difference(b) == TimecodeSet("24", [(1, 4), (11, 20)])
+
+
+def test_different_rates():
+    """Sets of different frame rates can not be combined."""
+    with pytest.raises(ValueError) as cm:
+        TimecodeSet("24", [(1, 10)]) | TimecodeSet("25", [(1, 10)])
+    assert str(cm.value) == "Can not combine sets with different frame rates: 24 and 25"
+    assert TimecodeSet("24", [(1, 10)]) != TimecodeSet("25", [(1, 10)])
+
+
+def test_gaps_and_complement():
+    """The missing frames in a range."""
+    tc_set = TimecodeSet("24", [(10, 20), (30, 40), (45, 45)])
+    assert list(tc_set.gaps()) == [Run(21, 29), Run(41, 44)]
+    assert list(tc_set.gaps(1, 50)) == [
+        Run(1, 9),
+        Run(21, 29),
+        Run(41, 44),
+        Run(46, 50),
+    ]
+    assert list(tc_set.gaps(15, 35)) == [Run(21, 29)]
+    assert tc_set.complement(25, 26) == TimecodeSet("24", [(25, 26)])
+    assert not tc_set.complement(12, 18)
+    assert not tc_set.complement(30, 20)
+    assert list(TimecodeSet("24").gaps()) == []
+
+
+def test_add():
+    """Frames and runs are added in place."""
+    tc_set = TimecodeSet("24")
+    for frame in [5, 7, 6, 1, 10]:
+        tc_set.add(frame)
+    assert list(tc_set.runs()) == [Run(1, 1), Run(5, 7), Run(10, 10)]
+    tc_set.add(Timecode("24", frames=2))
+    tc_set.add_run(8, 9)
+    assert list(tc_set.runs()) == [Run(1, 2), Run(5, 10)]
+    tc_set.add_run(3, 4)
+    assert list(tc_set.runs()) == [Run(1, 10)]
+    tc_set.add_run(20, 30)
+    tc_set.add_run(15, 40)
+    assert list(tc_set.runs()) == [Run(1, 10), Run(15, 40)]
+
+    with pytest.raises(ValueError) as cm:
+        tc_set.add_run(5, 4)
+    assert str(cm.value) == (
+        "The last frame of a run should not be before the first one, not 5-4"
+    )
+
+
+def test_first_and_last():
+    """The first and the last frames."""
+    tc_set = TimecodeSet("24", [(10, 20), (30, 40)])
+    assert (tc_set.first, tc_set.last) == (10, 40)
+    assert (TimecodeSet("24").first, TimecodeSet("24").last) == (None, None)
@@ -0,0 +1,109 @@
+#!-*- coding: utf-8 -*-
+from array import array
+
+import pytest
+
+from timecode import (
+    Timecode,
+    merge_frames,
+    merge_timecodes,
+    sort_frames,
+    sorted_timecodes,
+)
+from timecode.sort import argsort
+
+
+def test_argsort_is_stable():
+    """Equal keys keep their input order."""
+    assert argsort([3, 1, 2, 1, 3, 0]) == array("q", [5, 1, 3, 2, 0, 4])
+    assert argsort([]) == array("q")
+
+
+def test_sort_frames():
+    """Frame counts are sorted to an array."""
+    assert sort_frames([5, 3, 1, 3]) == array("q", [1, 3, 3, 5])
+    assert sort_frames(iter([2, 1])) == array("q", [1, 2])
+    assert sort_frames((f for f in [5, 3, 1, 3]), indices=True) == array(
+        "q", [2, 1, 3, 0]
+    )
+
+
+def test_sorted_timecodes_single_rate():
+    """Timecodes are sorted by frames and equal ones keep their order."""
+    a = Timecode("25", "00:00:01:00")
+    b = Timecode("25", "00:00:00:10")
+    c = Timecode("25", "00:00:01:00")
+    d = Timecode("25", "00:00:00:00")
+    assert sorted_timecodes([a, b, c, d]) == sorted([a, b, c, d])
+    result = sorted_timecodes([a, b, c, d])
+    assert result[2] is a
+    assert result[3] is c
+    assert sorted_timecodes([a, b, c, d], indices=True) == array("q", [3, 1, 0, 2])
+
+
+def test_sorted_timecodes_groups_by_framerate():
+    """Frame rates are grouped in their order of appearance."""
+    tcs = [
+        Timecode("25", frames=100),
+        Timecode("29.97", frames=5),
+        Timecode("25", frames=1),
+        Timecode("29.97", frames=1000000),
+        Timecode("29.97", frames=1),
+    ]
+    assert sorted_timecodes(tcs, indices=True) == array("q", [2, 0, 4, 1, 3])
+    assert [tc.framerate for tc in sorted_timecodes(tcs)] == [
+        "25",
+        "25",
+        "29.97",
+        "29.97",
+        "29.97",
+    ]
+
+
+def test_sorted_timecodes_permutation_sorts_companion_columns():
+    """The index permutation can be used to sort other columns."""
+    tcs = [Timecode("24", frames=f) for f in [30, 10, 20]]
+    names = ["c", "a", "b"]
+    order = sorted_timecodes(tcs, indices=True)
+    assert [names[i] for i in order] == ["a", "b", "c"]
+    assert sorted_timecodes([]) == []
+
+
+def test_merge_frames():
+    """Sorted streams of frame counts are merged lazily and stably."""
+    assert list(merge_frames([1, 4, 9], iter([2, 4]), [])) == [1, 2, 4, 4, 9]
+    assert list(merge_frames([1, 4, 9], [2, 4], indices=True)) == [
+        (0, 0),
+        (1, 0),
+        (0, 1),
+        (1, 1),
+        (0, 2),
+    ]
+
+
+def test_merge_timecodes():
+    """Sorted streams of timecodes are merged lazily and stably."""
+    a = [Timecode("25", frames=f) for f in [1, 5, 7]]
+    b = [Timecode("25", frames=f) for f in [2, 5]]
+    merged = list(merge_timecodes(a, b))
+    assert [tc.frames for tc in merged] == [1, 2, 5, 5, 7]
+    assert merged[2] is a[1]
+    assert merged[3] is b[1]
+    assert list(merge_timecodes(a, b, indices=True)) == [
+        (0, 0),
+        (1, 0),
+        (0, 1),
+        (1, 1),
+        (0, 2),
+    ]
+
+
+def test_merge_timecodes_raises_for_mixed_framerates():
+    """Streams of different frame rates can not be merged."""
+    a = [Timecode("25", frames=1)]
+    b = [Timecode("24", frames=2)]
+    with pytest.raises(ValueError) as cm:
+        list(merge_timecodes(a, b))
+    assert (
+        str(cm.value) == "Can not merge timecodes with different frame rates: 25 and 24"
+    )
@@ -1,7 +1,11 @@
 #!-*- coding: utf-8 -*-
+import copy
+import pickle
+
 import pytest
 
-from timecode import Timecode, TimecodeError
+from timecode import Timecode, TimecodeError, get_rate
+from timecode.timecode import SERIAL_HEADER
 
 
 @pytest.mark.parametrize(
@@ -1158,3 +1162,118 @@ def test_generalized_ntsc_rational_formats(rational_str, int_framerate, is_drop)
     assert tc._ntsc_framerate is True
     assert tc._int_framerate == int_framerate
     assert tc.drop_frame is is_drop
+
+
+def _serialized_timecodes():
+    """Timecodes of all the serialized frame rates and flags."""
+    fractional = Timecode("24", "00:00:01:12")
+    fractional.set_fractional(True)
+    drop_frame_off = Timecode("29.97", frames=100)
+    drop_frame_off.drop_frame = False
+    return [
+        Timecode("29.97", "01:00:00;00"),
+        Timecode("29.97", "01:00:00:00", force_non_drop_frame=True),
+        Timecode("23.98", "10:00:00:00"),
+        Timecode("ms", "00:00:01.500"),
+        Timecode("frames", frames=12),
+        Timecode((25, 2), frames=30),
+        Timecode(24.0, frames=30),
+        fractional,
+        drop_frame_off,
+    ]
+
+
+@pytest.mark.parametrize("tc", _serialized_timecodes(), ids=repr)
+def test_pickle(tc):
+    """Timecodes are pickled to the frame rate id, the frames and the flags."""
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        restored = pickle.loads(pickle.dumps(tc, protocol))
+        assert restored.__dict__ == tc.__dict__
+        assert str(restored) == str(tc)
+    assert copy.copy(tc).__dict__ == tc.__dict__
+    assert len(pickle.dumps(tc)) < len(pickle.dumps(tc.__dict__)) / 3
+
+
+def test_pickle_shared_attributes():
+    """The attributes derived from the frame rate are not mutated."""
+    a, b = pickle.loads(pickle.dumps([Timecode("25", frames=1), Timecode("25", frames=2)]))
+    a.frames = 10
+    a.framerate = "24"
+    assert (b.frames, b.framerate) == (2, "25")
+    assert str(pickle.loads(pickle.dumps(Timecode("25", frames=2)))) == "00:00:00:01"
+
+
+class _Subclass(Timecode):
+    pass
+
+
+def test_pickle_subclass():
+    """The class and the other attributes of the subclasses are pickled."""
+    tc = _Subclass("25", "01:00:00:00")
+    tc.reel = "A001"
+    restored = pickle.loads(pickle.dumps(tc))
+    assert type(restored) is _Subclass
+    assert (str(restored), restored.reel) == ("01:00:00:00", "A001")
+
+
+@pytest.mark.parametrize("tc", _serialized_timecodes(), ids=repr)
+def test_to_bytes(tc):
+    """The binary form is 11 bytes for the common frame rates."""
+    data = tc.to_bytes()
+    restored = Timecode.from_bytes(data)
+    assert restored.__dict__ == tc.__dict__
+    if tc.framerate in ("23.98", "29.97", 1000, "frames", "24"):
+        assert len(data) == 11
+    else:
+        assert data.endswith(tc.framerate.encode())
+
+
+def test_from_bytes_invalid():
+    """The length, the frame rate id and the frames are checked."""
+    data = Timecode("25", frames=10).to_bytes()
+    for invalid, message in [
+        (data[:5], "Invalid serialized timecode of 5 bytes"),
+        (data + b"x", "Invalid serialized timecode of 12 bytes"),
+        (b"\xfe\x00" + data[2:], "Unknown frame rate id: 254"),
+        (data[:3] + bytes(8), (
+            "Timecode.frames should be a positive integer bigger than zero, not 0"
+        )),
+        (SERIAL_HEADER.pack(3, 1, 100), "The frame rate 25 can not be drop frame"),
+        (SERIAL_HEADER.pack(1, 1, 100), "The frame rate 23.98 can not be drop frame"),
+        (SERIAL_HEADER.pack(4, 9, 100), "Unknown serialized timecode flags: 0x9"),
+    ]:
+        with pytest.raises(ValueError) as cm:
+            Timecode.from_bytes(invalid)
+        assert str(cm.value) == message
+
+
+@pytest.mark.parametrize(
+    "framerate, force_non_drop_frame",
+    [
+        ("23.976", False),
+        ("24", False),
+        ("25", False),
+        ("29.97", False),
+        ("29.97", True),
+        ("59.94", True),
+        ("ms", False),
+        ("frames", False),
+    ],
+)
+def test_from_rate_equals_constructor(framerate, force_non_drop_frame):
+    """Timecode.from_rate() creates the same Timecode as the constructor."""
+    tc = Timecode(framerate, frames=10, force_non_drop_frame=force_non_drop_frame)
+    from_rate = Timecode.from_rate(get_rate(framerate, force_non_drop_frame), 10)
+    assert from_rate.__dict__ == tc.__dict__
+    assert from_rate.to_bytes() == tc.to_bytes()
+
+
+def test_to_bytes_too_many_frames():
+    """The frame count of a serialized Timecode is an uint64."""
+    with pytest.raises(ValueError) as cm:
+        Timecode("24", frames=2**70).to_bytes()
+    assert str(cm.value) == (
+        f"Timecode.frames should be smaller than 2**64 to be serialized, not {2**70}"
+    )
+    tc = Timecode("24", frames=2**64 - 1)
+    assert Timecode.from_bytes(tc.to_bytes()).frames == 2**64 - 1